@@ -9,14 +9,7 @@ import requests
 import yaml
 from tqdm import tqdm
 
-from embedchain.cache import (
-    Config,
-    ExactMatchEvaluation,
-    SearchDistanceEvaluation,
-    cache,
-    gptcache_data_manager,
-    gptcache_pre_function,
-)
+from embedchain.cache import AnswerCache
 from embedchain.client import Client
 from embedchain.config import AppConfig, CacheConfig, ChunkerConfig, Mem0Config
 from embedchain.core.db.database import get_session
@@ -101,6 +94,7 @@ class App(EmbedChain):
         self.id = None
         self.chunker = ChunkerConfig(**chunker) if chunker else None
         self.cache_config = cache_config
+        self.answer_cache = None
         self.memory_config = memory_config
 
         self.config = config or AppConfig()
@@ -153,20 +147,13 @@ class App(EmbedChain):
         self.db.set_collection_name(self.db.config.collection_name)
 
     def _init_cache(self):
-        if self.cache_config.similarity_eval_config.strategy == "exact":
-            similarity_eval_func = ExactMatchEvaluation()
-        else:
-            similarity_eval_func = SearchDistanceEvaluation(
-                max_distance=self.cache_config.similarity_eval_config.max_distance,
-                positive=self.cache_config.similarity_eval_config.positive,
-            )
-
-        cache.init(
-            pre_embedding_func=gptcache_pre_function,
-            embedding_func=self.embedding_model.to_embeddings,
-            data_manager=gptcache_data_manager(vector_dimension=self.embedding_model.vector_dimension),
-            similarity_evaluation=similarity_eval_func,
-            config=Config(**self.cache_config.init_config.as_dict()),
+        init_config = self.cache_config.init_config
+        self.answer_cache = AnswerCache(
+            embedding_fn=self.embedding_model.to_embeddings,
+            similarity_threshold=init_config.similarity_threshold,
+            exact_match=self.cache_config.similarity_eval_config.strategy == "exact",
+            max_size=getattr(init_config, "max_size", 1000),
+            ttl=getattr(init_config, "ttl", None),
         )
 
     def _init_client(self):
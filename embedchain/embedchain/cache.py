@@ -1,46 +1,161 @@
+import hashlib
 import logging
-import os  # noqa: F401
-from typing import Any
-
-from gptcache import cache  # noqa: F401
-from gptcache.adapter.adapter import adapt  # noqa: F401
-from gptcache.config import Config  # noqa: F401
-from gptcache.manager import get_data_manager
-from gptcache.manager.scalar_data.base import Answer
-from gptcache.manager.scalar_data.base import DataType as CacheDataType
-from gptcache.session import Session
-from gptcache.similarity_evaluation.distance import (  # noqa: F401
-    SearchDistanceEvaluation,
-)
-from gptcache.similarity_evaluation.exact_match import (  # noqa: F401
-    ExactMatchEvaluation,
-)
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def gptcache_pre_function(data: dict[str, Any], **params: dict[str, Any]):
-    return data["input_query"]
+class CacheKey:
+    """Lookup key of a query: its scope, normalized query embedding and the retrieved contexts."""
 
+    def __init__(self, scope: str, query: str, embedding: list[float], contexts: list[tuple[str, dict]]):
+        self.scope = scope
+        self.query = query
+        self.embedding = embedding
+        self.context_key = hashlib.sha256(
+            "\0".join(sorted(hashlib.sha256(text.encode()).hexdigest() for text, _ in contexts)).encode()
+        ).hexdigest()
+        self.doc_ids = {metadata["doc_id"] for _, metadata in contexts if metadata and metadata.get("doc_id")}
+        self.source_hashes = {metadata["hash"] for _, metadata in contexts if metadata and metadata.get("hash")}
 
-def gptcache_data_manager(vector_dimension):
-    return get_data_manager(cache_base="sqlite", vector_base="chromadb", max_size=1000, eviction="LRU")
 
+class _Entry:
+    def __init__(self, key: CacheKey, answer: str):
+        self.key = key
+        self.answer = answer
+        self.created_at = time.monotonic()
 
-def gptcache_data_convert(cache_data):
-    logger.info("[Cache] Cache hit, returning cache data...")
-    return cache_data
 
+class AnswerCache:
+    """
+    In-memory semantic cache of LLM answers.
 
-def gptcache_update_cache_callback(llm_data, update_cache_func, *args, **kwargs):
-    logger.info("[Cache] Cache missed, updating cache...")
-    update_cache_func(Answer(llm_data, CacheDataType.STR))
-    return llm_data
+    An answer is reused for a new query when it was produced in the same scope (app, session, LLM
+    settings and filters), from exactly the same retrieved contexts, for a query whose embedding is at
+    least `similarity_threshold` cosine-similar (or identical with `exact_match`). Keying on the
+    retrieved contexts keeps answers fresh when new data changes what retrieval returns; entries whose
+    contexts belong to a document that is changed or deleted are dropped through `invalidate`.
 
+    The least recently used entry is evicted once `max_size` entries are stored, and entries older
+    than `ttl` seconds are not served.
+    """
 
-def _gptcache_session_hit_func(cur_session_id: str, cache_session_ids: list, cache_questions: list, cache_answer: str):
-    return cur_session_id in cache_session_ids
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], list[float]],
+        similarity_threshold: float = 0.8,
+        exact_match: bool = False,
+        max_size: int = 1000,
+        ttl: Optional[float] = None,
+    ):
+        self.embedding_fn = embedding_fn
+        self.similarity_threshold = similarity_threshold
+        self.exact_match = exact_match
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # (scope, context key) -> entries, and entry id -> bucket in least recently used order
+        self._buckets: dict[tuple[str, str], dict[int, _Entry]] = {}
+        self._lru: OrderedDict[int, tuple[str, str]] = OrderedDict()
+        self._next_id = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
 
+    def key(self, scope: str, query: str, contexts: list[tuple[str, dict]]) -> CacheKey:
+        """Build the lookup key of `query`; embeds the query unless exact matching is used."""
+        embedding = [] if self.exact_match else _normalize(self.embedding_fn(query))
+        return CacheKey(scope, query, embedding, contexts)
 
-def get_gptcache_session(session_id: str):
-    return Session(name=session_id, check_hit_func=_gptcache_session_hit_func)
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Return the cached answer for `key`, or None on a miss."""
+        with self._lock:
+            bucket = self._buckets.get((key.scope, key.context_key), {})
+            best_id, best_score = None, -1.0
+            for entry_id, entry in list(bucket.items()):
+                if self.ttl is not None and time.monotonic() - entry.created_at > self.ttl:
+                    self._remove(entry_id)
+                    self._expirations += 1
+                    continue
+                score = self._similarity(key, entry.key)
+                if score >= self.similarity_threshold and score > best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._lru.move_to_end(best_id)
+            logger.info(f"[Cache] Cache hit (similarity {best_score:.3f}), returning cached answer")
+            return bucket[best_id].answer
+
+    def put(self, key: CacheKey, answer: str) -> None:
+        with self._lock:
+            bucket_key = (key.scope, key.context_key)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._buckets.setdefault(bucket_key, {})[entry_id] = _Entry(key, answer)
+            self._lru[entry_id] = bucket_key
+            while len(self._lru) > self.max_size:
+                self._remove(next(iter(self._lru)))
+                self._evictions += 1
+
+    def invalidate(self, doc_ids: Iterable[str] = (), source_hashes: Iterable[str] = ()) -> int:
+        """Drop the entries built from contexts of the given documents or sources; returns how many."""
+        doc_ids, source_hashes = set(doc_ids), set(source_hashes)
+        with self._lock:
+            stale = [
+                entry_id
+                for entry_id, bucket_key in self._lru.items()
+                if self._buckets[bucket_key][entry_id].key.doc_ids & doc_ids
+                or self._buckets[bucket_key][entry_id].key.source_hashes & source_hashes
+            ]
+            for entry_id in stale:
+                self._remove(entry_id)
+            self._invalidations += len(stale)
+        if stale:
+            logger.info(f"[Cache] Invalidated {len(stale)} cached answers")
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._lru)
+            self._buckets.clear()
+            self._lru.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._lru),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def _similarity(self, key: CacheKey, cached: CacheKey) -> float:
+        if self.exact_match:
+            return 1.0 if key.query == cached.query else 0.0
+        return sum(a * b for a, b in zip(key.embedding, cached.embedding))
+
+    def _remove(self, entry_id: int) -> None:
+        bucket_key = self._lru.pop(entry_id)
+        bucket = self._buckets[bucket_key]
+        del bucket[entry_id]
+        if not bucket:
+            del self._buckets[bucket_key]
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else list(vector)
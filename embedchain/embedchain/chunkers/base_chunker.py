@@ -1,6 +1,6 @@
 import hashlib
 import logging
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from embedchain.config.add_config import ChunkerConfig
 from embedchain.helpers.json_serializable import JSONSerializable
@@ -34,17 +34,49 @@ class BaseChunker(JSONSerializable):
         """
         documents = []
         chunk_ids = []
-        id_map = {}
+        metadatas = []
+        doc_id, chunks = self.iter_chunks(loader, src, app_id=app_id, config=config, **kwargs)
+        for chunk_id, chunk, metadata in chunks:
+            chunk_ids.append(chunk_id)
+            documents.append(chunk)
+            metadatas.append(metadata)
+        return {
+            "documents": documents,
+            "ids": chunk_ids,
+            "metadatas": metadatas,
+            "doc_id": doc_id,
+        }
+
+    def iter_chunks(
+        self,
+        loader,
+        src,
+        app_id=None,
+        config: Optional[ChunkerConfig] = None,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> tuple[str, Iterator[tuple[str, str, dict]]]:
+        """
+        Loads data and returns its doc_id together with a lazy iterator over its chunks.
+
+        The loader is called right away, so the doc_id is known before any chunk is created. Records
+        that the loader streams are only read and split as the iterator is consumed.
+
+        :return: doc_id and an iterator of (chunk id, chunk, metadata) tuples
+        """
         min_chunk_size = config.min_chunk_size if config is not None else 1
         logger.info(f"Skipping chunks smaller than {min_chunk_size} characters")
         data_result = loader.load_data(src, **kwargs)
-        data_records = data_result["data"]
         doc_id = data_result["doc_id"]
         # Prefix app_id in the document id if app_id is not None to
         # distinguish between different documents stored in the same
         # elasticsearch or opensearch index
         doc_id = f"{app_id}--{doc_id}" if app_id is not None else doc_id
-        metadatas = []
+        return doc_id, self._chunk_records(data_result["data"], src, doc_id, app_id, min_chunk_size)
+
+    def _chunk_records(
+        self, data_records, src, doc_id: str, app_id, min_chunk_size: int
+    ) -> Iterator[tuple[str, str, dict]]:
+        id_map = {}
         for data in data_records:
             content = data["content"]
 
@@ -63,15 +95,7 @@ class BaseChunker(JSONSerializable):
                 chunk_id = f"{app_id}--{chunk_id}" if app_id is not None else chunk_id
                 if id_map.get(chunk_id) is None and len(chunk) >= min_chunk_size:
                     id_map[chunk_id] = True
-                    chunk_ids.append(chunk_id)
-                    documents.append(chunk)
-                    metadatas.append(metadata)
-        return {
-            "documents": documents,
-            "ids": chunk_ids,
-            "metadatas": metadatas,
-            "doc_id": doc_id,
-        }
+                    yield chunk_id, chunk, metadata
 
     def get_chunks(self, content):
         """
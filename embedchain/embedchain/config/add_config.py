@@ -66,6 +66,11 @@ class AddConfig(BaseConfig):
         self,
         chunker: Optional[ChunkerConfig] = None,
         loader: Optional[LoaderConfig] = None,
+        sync_mode: str = "incremental",
+        batch_size: int = 2048,
+        embed_concurrency: int = 2,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
     ):
         """
         Initializes a configuration class instance for the `add` method.
@@ -74,6 +79,31 @@ class AddConfig(BaseConfig):
         :type chunker: Optional[ChunkerConfig], optional
         :param loader: Loader config, defaults to None
         :type loader: Optional[LoaderConfig], optional
+        :param sync_mode: How a changed source is re-ingested. "incremental" only embeds new chunks, deletes
+        vanished ones and re-tags unchanged ones; "replace" deletes the old document and embeds it again.
+        Vector databases without id-level updates always use "replace", defaults to "incremental"
+        :type sync_mode: str, optional
+        :param batch_size: Number of chunks embedded and written to the vector database at a time, defaults to 2048
+        :type batch_size: int, optional
+        :param embed_concurrency: Number of batches embedded at the same time, defaults to 2
+        :type embed_concurrency: int, optional
+        :param max_retries: How often embedding or writing a batch is retried before `add` fails, defaults to 3
+        :type max_retries: int, optional
+        :param retry_delay: Seconds to wait before the first retry, doubled for every further retry, defaults to 1.0
+        :type retry_delay: float, optional
         """
+        if sync_mode not in ("incremental", "replace"):
+            raise ValueError(f"sync_mode must be 'incremental' or 'replace', got '{sync_mode}'")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if embed_concurrency < 1:
+            raise ValueError("embed_concurrency must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
         self.loader = loader
         self.chunker = chunker
+        self.sync_mode = sync_mode
+        self.batch_size = batch_size
+        self.embed_concurrency = embed_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
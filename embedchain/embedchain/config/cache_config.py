@@ -7,15 +7,15 @@ from embedchain.helpers.json_serializable import register_deserializable
 @register_deserializable
 class CacheSimilarityEvalConfig(BaseConfig):
     """
-    This is the evaluator to compare two embeddings according to their distance computed in embedding retrieval stage.
-    In the retrieval stage, `search_result` is the distance used for approximate nearest neighbor search and have been
-    put into `cache_dict`. `max_distance` is used to bound this distance to make it between [0-`max_distance`].
-    `positive` is used to indicate this distance is directly proportional to the similarity of two entities.
-    If `positive` is set `False`, `max_distance` will be used to subtract this distance to get the final score.
+    Decides when a new query may reuse the cached answer of an earlier one. Both must have retrieved the same
+    contexts. With the `distance` strategy the cosine similarity of their embeddings must reach the
+    `similarity_threshold` of the cache config; with the `exact` strategy the query strings must be identical.
 
-    :param max_distance: the bound of maximum distance.
+    :param strategy: `distance` or `exact`, defaults to `distance`
+    :type strategy: str
+    :param max_distance: kept for compatibility with older configs, not used by the answer cache.
     :type max_distance: float
-    :param positive: if the larger distance indicates more similar of two entities, It is True. Otherwise, it is False.
+    :param positive: kept for compatibility with older configs, not used by the answer cache.
     :type positive: bool
     """
 
@@ -46,23 +46,33 @@ class CacheInitConfig(BaseConfig):
     """
     This is a cache init config. Used to initialize a cache.
 
-    :param similarity_threshold: a threshold ranged from 0 to 1 to filter search results with similarity score higher \
-     than the threshold. When it is 0, there is no hits. When it is 1, all search results will be returned as hits.
+    :param similarity_threshold: minimum cosine similarity, from 0 to 1, between a query and a cached query for the \
+     cached answer to be reused, default to 0.8
     :type similarity_threshold: float
-    :param auto_flush: it will be automatically flushed every time xx pieces of data are added, default to 20
+    :param auto_flush: kept for compatibility with older configs, the answer cache lives in memory, default to 20
     :type auto_flush: int
+    :param max_size: maximum number of cached answers, the least recently used one is evicted first, default to 1000
+    :type max_size: int
+    :param ttl: seconds after which a cached answer is no longer served, default to None (no expiry)
+    :type ttl: float
     """
 
     def __init__(
         self,
         similarity_threshold: Optional[float] = 0.8,
         auto_flush: Optional[int] = 20,
+        max_size: Optional[int] = 1000,
+        ttl: Optional[float] = None,
     ):
         if similarity_threshold < 0 or similarity_threshold > 1:
             raise ValueError(f"similarity_threshold {similarity_threshold} should be between 0 and 1")
+        if max_size < 1:
+            raise ValueError(f"max_size {max_size} should be at least 1")
 
         self.similarity_threshold = similarity_threshold
         self.auto_flush = auto_flush
+        self.max_size = max_size
+        self.ttl = ttl
 
     @staticmethod
     def from_config(config: Optional[dict[str, Any]]):
@@ -72,6 +82,8 @@ class CacheInitConfig(BaseConfig):
             return CacheInitConfig(
                 similarity_threshold=config.get("similarity_threshold", 0.8),
                 auto_flush=config.get("auto_flush", 20),
+                max_size=config.get("max_size", 1000),
+                ttl=config.get("ttl", None),
             )
 
 
@@ -92,5 +104,5 @@ class CacheConfig(BaseConfig):
         else:
             return CacheConfig(
                 similarity_eval_config=CacheSimilarityEvalConfig.from_config(config.get("similarity_evaluation", {})),
-                init_config=CacheInitConfig.from_config(config.get("init_config", {})),
+                init_config=CacheInitConfig.from_config(config.get("config", config.get("init_config", {}))),
             )
@@ -6,12 +6,7 @@ from typing import Any, Optional, Union
 from dotenv import load_dotenv
 from langchain.docstore.document import Document
 
-from embedchain.cache import (
-    adapt,
-    get_gptcache_session,
-    gptcache_data_convert,
-    gptcache_update_cache_callback,
-)
+from embedchain.cache import CacheKey
 from embedchain.chunkers.base_chunker import BaseChunker
 from embedchain.config import AddConfig, BaseLlmConfig, ChunkerConfig
 from embedchain.config.base_app_config import BaseAppConfig
@@ -27,6 +22,7 @@ from embedchain.models.data_type import (
     IndirectDataType,
     SpecialDataType,
 )
+from embedchain.utils.ingestion import IngestionPipeline
 from embedchain.utils.misc import detect_datatype, is_valid_json_string
 from embedchain.vectordb.base import BaseVectorDB
 
@@ -62,6 +58,7 @@ class EmbedChain(JSONSerializable):
         """
         self.config = config
         self.cache_config = None
+        self.answer_cache = None
         self.memory_config = None
         self.mem0_memory = None
         # Llm
@@ -255,6 +252,9 @@ class EmbedChain(JSONSerializable):
             if chunker.data_type == DataType.JSON and is_valid_json_string(src):
                 url = hashlib.sha256((src).encode("utf-8")).hexdigest()
                 where = {"url": url}
+            # Directory chunks carry the url of their file, the directory itself is tagged separately
+            if chunker.data_type == DataType.DIRECTORY:
+                where = {"directory": src}
 
             if self.config.id is not None:
                 where.update({"app_id": self.config.id})
@@ -327,23 +327,51 @@ class EmbedChain(JSONSerializable):
         """
         existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src)
         app_id = self.config.id if self.config is not None else None
+        # Incremental sync keeps the stored chunks that did not change instead of embedding the document again
+        incremental = (
+            getattr(add_config, "sync_mode", "incremental") == "incremental"
+            and not dry_run
+            and self._supports_incremental_sync()
+        )
 
-        # Create chunks
-        embeddings_data = chunker.create_chunks(loader, src, app_id=app_id, config=add_config.chunker, **kwargs)
-        # spread chunking results
-        documents = embeddings_data["documents"]
-        metadatas = embeddings_data["metadatas"]
-        ids = embeddings_data["ids"]
-        new_doc_id = embeddings_data["doc_id"]
+        # A directory loader leaves out the files whose chunks are already stored, see `_kept_file_chunks`
+        stored_doc = None
+        load_kwargs = kwargs
+        if existing_doc_id and incremental and hasattr(loader, "skipped_files"):
+            stored_doc = self.db.get(where={"doc_id": existing_doc_id})
+            stored_files = {m["url"]: m["file_hash"] for m in stored_doc["metadatas"] if m and "file_hash" in m}
+            load_kwargs = {**kwargs, "stored_files": stored_files}
+
+        # Create chunks. They are created lazily as the ingestion pipeline consumes them.
+        new_doc_id, chunks = chunker.iter_chunks(loader, src, app_id=app_id, config=add_config.chunker, **load_kwargs)
 
         if existing_doc_id and existing_doc_id == new_doc_id:
             logger.info("Doc content has not changed. Skipping creating chunks and embeddings")
             return [], [], [], 0
 
+        chunks = (
+            (chunk_id, chunk, self._prepare_chunk_metadata(m, source_hash, metadata)) for chunk_id, chunk, m in chunks
+        )
+
         # this means that doc content has changed.
+        sync = None
         if existing_doc_id and existing_doc_id != new_doc_id:
-            logger.info("Doc content has changed. Recomputing chunks and embeddings intelligently.")
-            self.db.delete({"doc_id": existing_doc_id})
+            if incremental:
+                # The sync needs to know every chunk of the new version. It runs after the new chunks are
+                # written, so the stored chunks keep the old doc_id until the new version is complete.
+                chunks = list(chunks)
+                kept = []
+                if stored_doc is not None:
+                    kept = self._kept_file_chunks(stored_doc, loader.skipped_files, new_doc_id, source_hash, metadata)
+                sync = (
+                    [chunk_id for chunk_id, _, _ in chunks] + [chunk_id for chunk_id, _ in kept],
+                    [m for _, _, m in chunks] + [m for _, m in kept],
+                )
+            else:
+                logger.info("Doc content has changed. Recomputing chunks and embeddings.")
+                self.db.delete({"doc_id": existing_doc_id})
+                if not dry_run:
+                    self._invalidate_cached_answers(doc_ids=[existing_doc_id])
 
         # get existing ids, and discard doc if any common id exist.
         where = {"url": src}
@@ -355,74 +383,131 @@ class EmbedChain(JSONSerializable):
         if chunker.data_type == DataType.QNA_PAIR:
             where = {"question": src[0]}
 
+        if chunker.data_type == DataType.DIRECTORY:
+            where = {"directory": src}
+
         if self.config.id is not None:
             where["app_id"] = self.config.id
 
-        db_result = self.db.get(ids=ids, where=where)  # optional filter
-        existing_ids = set(db_result["ids"])
-        if len(existing_ids):
-            data_dict = {id: (doc, meta) for id, doc, meta in zip(ids, documents, metadatas)}
-            data_dict = {id: value for id, value in data_dict.items() if id not in existing_ids}
-
-            if not data_dict:
-                src_copy = src
-                if len(src_copy) > 50:
-                    src_copy = src[:50] + "..."
-                logger.info(f"All data from {src_copy} already exists in the database.")
-                # Make sure to return a matching return type
-                return [], [], [], 0
-
-            ids = list(data_dict.keys())
-            documents, metadatas = zip(*data_dict.values())
-
-        # Loop though all metadatas and add extras.
-        new_metadatas = []
-        for m in metadatas:
-            # Add app id in metadatas so that they can be queried on later
-            if self.config.id:
-                m["app_id"] = self.config.id
-
-            # Add hashed source
-            m["hash"] = source_hash
-
-            # Note: Metadata is the function argument
-            if metadata:
-                # Spread whatever is in metadata into the new object.
-                m.update(metadata)
-
-            new_metadatas.append(m)
-        metadatas = new_metadatas
+        def existing_ids(ids: list[str]) -> set[str]:
+            return set(self.db.get(ids=ids, where=where)["ids"])  # optional filter
 
         if dry_run:
-            return list(documents), metadatas, ids, 0
-
-        # Count before, to calculate a delta in the end.
-        chunks_before_addition = self.db.count()
+            chunks = list(chunks)
+            stored = existing_ids([chunk_id for chunk_id, _, _ in chunks]) if chunks else set()
+            chunks = [chunk for chunk in chunks if chunk[0] not in stored]
+            if stored and not chunks:
+                self._log_source_exists(src)
+            return [chunk for _, chunk, _ in chunks], [m for _, _, m in chunks], [id for id, _, _ in chunks], 0
+
+        pipeline = IngestionPipeline(
+            self.db,
+            batch_size=getattr(add_config, "batch_size", 2048),
+            embed_concurrency=getattr(add_config, "embed_concurrency", 2),
+            max_retries=getattr(add_config, "max_retries", 3),
+            retry_delay=getattr(add_config, "retry_delay", 1.0),
+        )
+        documents, metadatas, ids, skipped = pipeline.run(chunks, existing_ids=existing_ids, **kwargs)
+        if sync is not None:
+            try:
+                vanished = self._sync_changed_doc(existing_doc_id, *sync)
+            except Exception:
+                # No stored chunk was deleted yet, so without the new chunks the stored ones still form the
+                # previous version of the document
+                pipeline.rollback(ids)
+                raise
+            if vanished:
+                # The new version is complete at this point, so it must not be rolled back if this fails
+                self.db.delete_ids(vanished)
+            self._invalidate_cached_answers(doc_ids=[existing_doc_id])
+        if skipped and not ids:
+            self._log_source_exists(src)
+            # Make sure to return a matching return type
+            return [], [], [], 0
 
-        # Filter out empty documents and ensure they meet the API requirements
-        valid_documents = [doc for doc in documents if doc and isinstance(doc, str)]
+        count_new_chunks = len(ids)
+        logger.info(
+            f"Successfully saved {str(src)[:100]} ({chunker.data_type}). New chunks count: {count_new_chunks} "
+            f"(embedding {pipeline.stats['embed_seconds']:.1f}s, writing {pipeline.stats['write_seconds']:.1f}s, "
+            f"total {pipeline.stats['total_seconds']:.1f}s)"
+        )
 
-        documents = valid_documents
+        return documents, metadatas, ids, count_new_chunks
 
-        # Chunk documents into batches of 2048 and handle each batch
-        # helps wigth large loads of embeddings  that hit OpenAI limits
-        document_batches = [documents[i : i + 2048] for i in range(0, len(documents), 2048)]
-        metadata_batches = [metadatas[i : i + 2048] for i in range(0, len(metadatas), 2048)]
-        id_batches = [ids[i : i + 2048] for i in range(0, len(ids), 2048)]
-        for batch_docs, batch_meta, batch_ids in zip(document_batches, metadata_batches, id_batches):
-            try:
-                # Add only valid batches
-                if batch_docs:
-                    self.db.add(documents=batch_docs, metadatas=batch_meta, ids=batch_ids, **kwargs)
-            except Exception as e:
-                logger.info(f"Failed to add batch due to a bad request: {e}")
-                # Handle the error, e.g., by logging, retrying, or skipping
-                pass
+    @staticmethod
+    def _log_source_exists(src: Any) -> None:
+        src_copy = src
+        if len(src_copy) > 50:
+            src_copy = src[:50] + "..."
+        logger.info(f"All data from {src_copy} already exists in the database.")
+
+    def _prepare_chunk_metadata(
+        self, m: dict, source_hash: Optional[str], metadata: Optional[dict[str, Any]]
+    ) -> dict:
+        """Add the app id, source hash and user metadata to the metadata of a chunk."""
+        # Add app id in metadatas so that they can be queried on later
+        if self.config.id:
+            m["app_id"] = self.config.id
+
+        # Add hashed source
+        m["hash"] = source_hash
+
+        # Note: Metadata is the function argument
+        if metadata:
+            # Spread whatever is in metadata into the new object.
+            m.update(metadata)
+        return m
+
+    def _kept_file_chunks(
+        self,
+        stored: dict,
+        skipped_files: list[str],
+        new_doc_id: str,
+        source_hash: Optional[str],
+        metadata: Optional[dict[str, Any]],
+    ) -> list[tuple[str, dict]]:
+        """
+        Return the stored chunks of the files a directory loader skipped because they did not change,
+        with their metadata moved to the new version of the document.
+        """
+        skipped = set(skipped_files)
+        kept = []
+        for chunk_id, m in zip(stored["ids"], stored["metadatas"]):
+            if m and m.get("url") in skipped:
+                m = self._prepare_chunk_metadata({**m, "doc_id": new_doc_id}, source_hash, metadata)
+                kept.append((chunk_id, m))
+        return kept
+
+    def _supports_incremental_sync(self) -> bool:
+        """Whether the vector database can delete chunks and update their metadata by id."""
+        db_type = type(self.db)
+        return (
+            db_type.delete_ids is not BaseVectorDB.delete_ids
+            and db_type.update_metadatas is not BaseVectorDB.update_metadatas
+        )
 
-        count_new_chunks = self.db.count() - chunks_before_addition
-        logger.info(f"Successfully saved {str(src)[:100]} ({chunker.data_type}). New chunks count: {count_new_chunks}")
+    def _sync_changed_doc(self, existing_doc_id: str, ids: list[str], metadatas: list[dict]) -> list[str]:
+        """
+        Bring the stored chunks of a changed document in line with its new chunks without re-embedding it.
 
-        return list(documents), metadatas, ids, count_new_chunks
+        Chunk ids are content hashes, so a chunk whose id is already stored has not changed: it only gets
+        the new metadata (and with it the new doc_id). New chunks must already be written by the caller.
+        Returns the ids of the stored chunks that are no longer part of the document; the caller deletes
+        them last, once the new version is complete.
+        """
+        stored_ids = set(self.db.get(where={"doc_id": existing_doc_id})["ids"])
+        new_ids = set(ids)
+        unchanged = [(id, m) for id, m in zip(ids, metadatas) if id in stored_ids]
+        vanished = [id for id in stored_ids if id not in new_ids]
+        if unchanged:
+            unchanged_ids, unchanged_metadatas = zip(*unchanged)
+            self.db.update_metadatas(list(unchanged_ids), list(unchanged_metadatas))
+
+        logger.info(
+            f"Doc content has changed. Kept {len(unchanged)} chunks, deleting {len(vanished)} and "
+            f"embedded {len(new_ids) - len(unchanged)} new ones."
+        )
+        return vanished
 
     @staticmethod
     def _format_result(results):
@@ -514,35 +599,23 @@ class EmbedChain(JSONSerializable):
         tuple[str, list[tuple[str,str,str]]] and if token_usage is true then
         tuple[str, list[tuple[str,str,str]], dict[str, Any]]
         """
+        use_cache = self.answer_cache is not None and not dry_run
         contexts = self._retrieve_from_database(
-            input_query=input_query, config=config, where=where, citations=citations, **kwargs
+            input_query=input_query, config=config, where=where, citations=citations or use_cache, **kwargs
         )
+        cache_key = None
+        if use_cache:
+            cache_key = self.answer_cache.key(self._cache_scope("query", config, where), input_query, contexts)
+            if not citations:
+                contexts = [context for context, _ in contexts]
         if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
             contexts_data_for_llm_query = list(map(lambda x: x[0], contexts))
         else:
             contexts_data_for_llm_query = contexts
 
-        if self.cache_config is not None:
-            logger.info("Cache enabled. Checking cache...")
-            answer = adapt(
-                llm_handler=self.llm.query,
-                cache_data_convert=gptcache_data_convert,
-                update_cache_callback=gptcache_update_cache_callback,
-                session=get_gptcache_session(session_id=self.config.id),
-                input_query=input_query,
-                contexts=contexts_data_for_llm_query,
-                config=config,
-                dry_run=dry_run,
-            )
-        else:
-            if self.llm.config.token_usage:
-                answer, token_info = self.llm.query(
-                    input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
-                )
-            else:
-                answer = self.llm.query(
-                    input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
-                )
+        answer, token_info = self._get_llm_answer(
+            cache_key, input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
+        )
 
         # Send anonymous telemetry
         if self.config.collect_metrics:
@@ -600,9 +673,13 @@ class EmbedChain(JSONSerializable):
         tuple[str, list[tuple[str,str,str]]] and if token_usage is true then
         tuple[str, list[tuple[str,str,str]], dict[str, Any]]
         """
+        use_cache = self.answer_cache is not None and not dry_run
         contexts = self._retrieve_from_database(
-            input_query=input_query, config=config, where=where, citations=citations, **kwargs
+            input_query=input_query, config=config, where=where, citations=citations or use_cache, **kwargs
         )
+        retrieved_contexts = contexts
+        if use_cache and not citations:
+            contexts = [context for context, _ in contexts]
         if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
             contexts_data_for_llm_query = list(map(lambda x: x[0], contexts))
         else:
@@ -617,37 +694,18 @@ class EmbedChain(JSONSerializable):
         # Update the history beforehand so that we can handle multiple chat sessions in the same python session
         self.llm.update_history(app_id=self.config.id, session_id=session_id)
 
-        if self.cache_config is not None:
-            logger.debug("Cache enabled. Checking cache...")
-            cache_id = f"{session_id}--{self.config.id}"
-            answer = adapt(
-                llm_handler=self.llm.chat,
-                cache_data_convert=gptcache_data_convert,
-                update_cache_callback=gptcache_update_cache_callback,
-                session=get_gptcache_session(session_id=cache_id),
-                input_query=input_query,
-                contexts=contexts_data_for_llm_query,
-                config=config,
-                dry_run=dry_run,
-            )
-        else:
-            logger.debug("Cache disabled. Running chat without cache.")
-            if self.llm.config.token_usage:
-                answer, token_info = self.llm.query(
-                    input_query=input_query,
-                    contexts=contexts_data_for_llm_query,
-                    config=config,
-                    dry_run=dry_run,
-                    memories=memories,
-                )
-            else:
-                answer = self.llm.query(
-                    input_query=input_query,
-                    contexts=contexts_data_for_llm_query,
-                    config=config,
-                    dry_run=dry_run,
-                    memories=memories,
-                )
+        cache_key = None
+        if use_cache:
+            scope = self._cache_scope("chat", config, where, session_id=session_id, memories=memories)
+            cache_key = self.answer_cache.key(scope, input_query, retrieved_contexts)
+        answer, token_info = self._get_llm_answer(
+            cache_key,
+            input_query=input_query,
+            contexts=contexts_data_for_llm_query,
+            config=config,
+            dry_run=dry_run,
+            memories=memories,
+        )
 
         # Add to Mem0 memory if enabled
         # Adding answer here because it would be much useful than input question itself
@@ -673,6 +731,65 @@ class EmbedChain(JSONSerializable):
         )
         return answer
 
+    def _get_llm_answer(self, cache_key: Optional[CacheKey], **llm_kwargs) -> tuple[Any, Optional[dict[str, Any]]]:
+        """
+        Answer from the answer cache if possible, otherwise ask the LLM and cache its answer.
+
+        :return: the answer and, if the LLM reports token usage, its token info
+        """
+        if cache_key is not None:
+            answer = self.answer_cache.get(cache_key)
+            if answer is not None:
+                token_info = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "total_cost": 0.0}
+                return answer, token_info if self.llm.config.token_usage else None
+
+        token_info = None
+        if self.llm.config.token_usage:
+            answer, token_info = self.llm.query(**llm_kwargs)
+        else:
+            answer = self.llm.query(**llm_kwargs)
+
+        # Streamed answers are generators and are not cached
+        if cache_key is not None and isinstance(answer, str):
+            self.answer_cache.put(cache_key, answer)
+        return answer, token_info
+
+    def _cache_scope(
+        self,
+        method: str,
+        config: Optional[BaseLlmConfig],
+        where: Optional[dict],
+        session_id: Optional[str] = None,
+        memories: Any = None,
+    ) -> str:
+        """
+        Everything besides the query and its contexts that the answer depends on.
+
+        This includes the chat history the LLM puts into the prompt, which `chat` loads for the session
+        beforehand, so a repeated question in a conversation that moved on is not answered from the cache.
+        """
+        query_config = config or self.llm.config
+        prompt = getattr(query_config, "prompt", None)
+        llm_settings = {
+            key: getattr(query_config, key, None)
+            for key in ("model", "temperature", "max_tokens", "top_p", "system_prompt", "number_documents")
+        }
+        llm_settings["prompt"] = getattr(prompt, "template", prompt)
+        scope = {
+            "app_id": self.config.id,
+            "method": method,
+            "session_id": session_id,
+            "where": where,
+            "llm": llm_settings,
+            "memories": memories,
+            "history": hashlib.sha256(json.dumps(self.llm.history, default=str).encode()).hexdigest(),
+        }
+        return json.dumps(scope, sort_keys=True, default=str)
+
+    def _invalidate_cached_answers(self, doc_ids=(), source_hashes=()) -> None:
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate(doc_ids=doc_ids, source_hashes=source_hashes)
+
     def search(self, query, num_documents=3, where=None, raw_filter=None, namespace=None):
         """
         Search for similar documents related to the query in the vector database.
@@ -740,6 +857,8 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.reset()
+        if self.answer_cache is not None:
+            self.answer_cache.clear()
         self.delete_all_chat_history(app_id=self.config.id)
         # Send anonymous telemetry
         if self.config.collect_metrics:
@@ -783,6 +902,7 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.delete(where={"hash": source_id})
+        self._invalidate_cached_answers(source_hashes=[source_id])
         logger.info(f"Successfully deleted {source_id}")
         # Send anonymous telemetry
         if self.config.collect_metrics:
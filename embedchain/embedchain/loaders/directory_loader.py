@@ -1,7 +1,12 @@
 import hashlib
+import json
 import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from embedchain.config import AddConfig
 from embedchain.data_formatter.data_formatter import DataFormatter
@@ -12,52 +17,235 @@ from embedchain.utils.misc import detect_datatype
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _predict_loader(file_path: str) -> tuple[BaseLoader, Optional[str]]:
+    """Return the loader for a file based on its detected data type, and an error if detection failed."""
+    try:
+        data_type = detect_datatype(file_path)
+        config = AddConfig()
+        loader = DataFormatter(data_type=data_type, config=config)._get_loader(
+            data_type=data_type, config=config.loader, loader=None
+        )
+        return loader, None
+    except Exception as e:
+        return TextFileLoader(), f"Error processing {file_path}: {e}"
+
+
+def _load_file(file_path: str) -> tuple[list[dict], Optional[str]]:
+    """Parse a single file. Runs in a worker process, so it only takes and returns picklable values."""
+    loader, error = _predict_loader(file_path)
+    return list(loader.load_data(file_path)["data"]), error
+
+
+def _hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 
 @register_deserializable
 class DirectoryLoader(BaseLoader):
-    """Load data from a directory."""
+    """
+    Load data from a directory.
+
+    Files are parsed in a process pool and their records are streamed to the chunker as they
+    arrive, so the whole tree never has to be held in memory. With `cache_dir` set, a manifest of
+    every file's path, mtime, size and content hash is kept together with the parsed records, one
+    per directory; files that did not change since the last run are served from that cache instead
+    of being parsed again. Files whose content hash matches `stored_files` (the hashes the vector
+    database already holds chunks for) are not yielded at all and are listed in `skipped_files`.
+
+    Config keys:
+        recursive (bool): Include subdirectories, defaults to True.
+        extensions (list[str]): Only load files with these suffixes, e.g. [".txt"], defaults to all files.
+        max_workers (int): Number of parser processes, defaults to the number of CPUs.
+        cache_dir (str): Directory for the manifest and parsed records, defaults to None (no cache).
+    """
 
     def __init__(self, config: Optional[dict[str, Any]] = None):
         super().__init__()
         config = config or {}
         self.recursive = config.get("recursive", True)
         self.extensions = config.get("extensions", None)
+        self.max_workers = config.get("max_workers") or os.cpu_count() or 1
+        self.cache_dir = config.get("cache_dir", None)
         self.errors = []
+        self.skipped_files = []
 
-    def load_data(self, path: str):
+    def load_data(self, path: str, stored_files: Optional[dict[str, str]] = None):
         directory_path = Path(path)
         if not directory_path.is_dir():
             raise ValueError(f"Invalid path: {path}")
 
         logger.info(f"Loading data from directory: {path}")
-        data_list = self._process_directory(directory_path)
-        doc_id = hashlib.sha256((str(data_list) + str(directory_path)).encode()).hexdigest()
+        cache_root = self._cache_root(directory_path)
+        manifest = self._read_manifest(cache_root)
+        files = self._scan_directory(directory_path, manifest)
+        doc_id = hashlib.sha256(
+            (json.dumps([[str(file_path), entry["sha256"]] for file_path, entry in files]) + str(directory_path)).encode()
+        ).hexdigest()
 
-        for error in self.errors:
-            logger.warning(error)
+        stored_files = stored_files or {}
+        self.skipped_files = [
+            str(file_path) for file_path, entry in files if stored_files.get(str(file_path)) == entry["sha256"]
+        ]
+        skipped = set(self.skipped_files)
+        to_load = [(file_path, entry) for file_path, entry in files if str(file_path) not in skipped]
+        return {"doc_id": doc_id, "data": self._stream_records(path, cache_root, files, to_load, manifest)}
 
-        return {"doc_id": doc_id, "data": data_list}
+    def _scan_directory(self, directory_path: Path, manifest: dict) -> list[tuple[Path, dict]]:
+        """
+        List the files to load with their manifest entries.
 
-    def _process_directory(self, directory_path: Path):
-        data_list = []
-        for file_path in directory_path.rglob("*") if self.recursive else directory_path.glob("*"):
+        A file's content hash is taken from the previous manifest when its mtime and size are
+        unchanged, otherwise the file is hashed.
+        """
+        files = []
+        paths = directory_path.rglob("*") if self.recursive else directory_path.glob("*")
+        for file_path in sorted(paths):
             # don't include dotfiles
             if file_path.name.startswith("."):
                 continue
             if file_path.is_file() and (not self.extensions or any(file_path.suffix == ext for ext in self.extensions)):
-                loader = self._predict_loader(file_path)
-                data_list.extend(loader.load_data(str(file_path))["data"])
+                stat = file_path.stat()
+                previous = manifest.get(str(file_path))
+                if previous and previous["mtime"] == stat.st_mtime and previous["size"] == stat.st_size:
+                    sha256 = previous["sha256"]
+                else:
+                    sha256 = _hash_file(file_path)
+                files.append((file_path, {"mtime": stat.st_mtime, "size": stat.st_size, "sha256": sha256}))
             elif file_path.is_dir():
                 logger.info(f"Loading data from directory: {file_path}")
-        return data_list
+        return files
+
+    def _stream_records(
+        self,
+        path: str,
+        cache_root: Optional[Path],
+        files: list[tuple[Path, dict]],
+        to_load: list[tuple[Path, dict]],
+        manifest: dict,
+    ) -> Iterator[dict]:
+        """Yield the records of the files to load, parsing only the files whose content is not cached."""
+        to_parse = []
+        for file_path, entry in to_load:
+            records = self._read_cached_records(cache_root, file_path, entry, manifest)
+            if records is None:
+                to_parse.append((file_path, entry))
+            else:
+                yield from self._tag_records(path, entry, records)
+        logger.info(f"Parsing {len(to_parse)} of {len(files)} files in {path} ({len(files) - len(to_load)} skipped)")
+
+        for (file_path, entry), (records, error) in self._parse_files(to_parse):
+            if error:
+                self.errors.append(error)
+                logger.warning(error)
+            self._write_cached_records(cache_root, file_path, entry, records)
+            yield from self._tag_records(path, entry, records)
+
+        self._write_manifest(cache_root, files)
+
+    def _parse_files(self, files: list[tuple[Path, dict]]) -> Iterator[tuple[tuple[Path, dict], tuple]]:
+        """Parse files in a process pool, yielding results in order with a bounded number in flight."""
+        if self.max_workers <= 1 or len(files) <= 1:
+            for file in files:
+                yield file, _load_file(str(file[0]))
+            return
+
+        # Forking a process that runs other threads (e.g. the embedding pool) can deadlock the workers
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=mp_context) as executor:
+            pending = deque()
+            for file in files:
+                pending.append((file, executor.submit(_load_file, str(file[0]))))
+                if len(pending) >= 4 * self.max_workers:
+                    done_file, future = pending.popleft()
+                    yield done_file, future.result()
+            while pending:
+                done_file, future = pending.popleft()
+                yield done_file, future.result()
+
+    @staticmethod
+    def _tag_records(path: str, entry: dict, records: list[dict]) -> Iterator[dict]:
+        for record in records:
+            # Lets a re-add of the same directory find the chunks stored for it, and the files they came from
+            record["meta_data"]["directory"] = path
+            record["meta_data"]["file_hash"] = entry["sha256"]
+            yield record
+
+    def _cache_root(self, directory_path: Path) -> Optional[Path]:
+        """Return the cache directory of a loaded directory, so several directories can share a `cache_dir`."""
+        if not self.cache_dir:
+            return None
+        return Path(self.cache_dir) / hashlib.sha256(str(directory_path.resolve()).encode()).hexdigest()
+
+    @staticmethod
+    def _records_path(cache_root: Path, file_path: Path, entry: dict) -> Path:
+        key = hashlib.sha256(f"{file_path}\0{entry['sha256']}".encode()).hexdigest()
+        return cache_root / "records" / f"{key}.json"
+
+    @staticmethod
+    def _read_manifest(cache_root: Optional[Path]) -> dict:
+        if cache_root is None:
+            return {}
+        manifest_path = cache_root / "manifest.json"
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable directory manifest {manifest_path}: {e}")
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    def _write_manifest(self, cache_root: Optional[Path], files: list[tuple[Path, dict]]) -> None:
+        if cache_root is None:
+            return
+        manifest_path = cache_root / "manifest.json"
+        entries = {str(file_path): entry for file_path, entry in files}
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": entries}, f)
+        os.replace(tmp_path, manifest_path)
+
+        # Drop the parsed records of files that changed or disappeared
+        keep = {self._records_path(cache_root, file_path, entry).name for file_path, entry in files}
+        for records_path in (cache_root / "records").glob("*.json"):
+            if records_path.name not in keep:
+                records_path.unlink(missing_ok=True)
+
+    def _read_cached_records(
+        self, cache_root: Optional[Path], file_path: Path, entry: dict, manifest: dict
+    ) -> Optional[list[dict]]:
+        previous = manifest.get(str(file_path))
+        if cache_root is None or previous is None or previous["sha256"] != entry["sha256"]:
+            return None
+        try:
+            with open(self._records_path(cache_root, file_path, entry)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
 
-    def _predict_loader(self, file_path: Path) -> BaseLoader:
+    def _write_cached_records(
+        self, cache_root: Optional[Path], file_path: Path, entry: dict, records: list[dict]
+    ) -> None:
+        if cache_root is None:
+            return
+        records_path = self._records_path(cache_root, file_path, entry)
+        records_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            data_type = detect_datatype(str(file_path))
-            config = AddConfig()
-            return DataFormatter(data_type=data_type, config=config)._get_loader(
-                data_type=data_type, config=config.loader, loader=None
-            )
-        except Exception as e:
-            self.errors.append(f"Error processing {file_path}: {e}")
-            return TextFileLoader()
+            with open(records_path, "w") as f:
+                json.dump(records, f)
+        except (TypeError, ValueError) as e:
+            # Records that are not JSON serializable are parsed again next time
+            records_path.unlink(missing_ok=True)
+            logger.debug(f"Not caching records of {file_path}: {e}")
@@ -1,8 +1,7 @@
 import hashlib
 import logging
-from urllib.parse import urljoin, urlparse
-
-import requests
+from typing import Any, Optional
+from urllib.parse import urldefrag, urljoin, urlparse
 
 try:
     from bs4 import BeautifulSoup
@@ -14,53 +13,74 @@ except ImportError:
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.utils.crawler import AsyncCrawler, CrawledPage
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_PAGES = 1000
+
 
 @register_deserializable
 class DocsSiteLoader(BaseLoader):
-    def __init__(self):
+    """
+    Load every page below a documentation site's start URL.
+
+    Pages are crawled concurrently with `AsyncCrawler` and each page is fetched once for both its
+    links and its content. Only links on the start URL's scheme and host are followed, and the crawl
+    stops after `max_pages` pages (defaults to 1000, None for no limit). The rest of `config` is passed
+    to `AsyncCrawler`, e.g. `{"max_per_host": 4, "delay": 0.1, "cache_dir": ".cache/docs"}`.
+    """
+
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        super().__init__()
+        config = dict(config or {})
+        self.max_pages = config.pop("max_pages", DEFAULT_MAX_PAGES)
+        self.crawler = AsyncCrawler(**config)
         self.visited_links = set()
 
-    def _get_child_links_recursive(self, url):
-        if url in self.visited_links:
-            return
-
+    @staticmethod
+    def _get_child_links(url: str, html: str) -> set[str]:
+        """Links on the page at `url` that point below its own path on the same scheme and host."""
         parsed_url = urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        current_path = parsed_url.path
-
-        response = requests.get(url)
-        if response.status_code != 200:
-            logger.info(f"Failed to fetch the website: {response.status_code}")
-            return
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        all_links = (link.get("href") for link in soup.find_all("a", href=True))
-
-        child_links = (link for link in all_links if link.startswith(current_path) and link != current_path)
-
-        absolute_paths = set(urljoin(base_url, link) for link in child_links)
+        current_path = parsed_url.path or "/"
+
+        soup = BeautifulSoup(html, "html.parser")
+        child_links = set()
+        for link in soup.find_all("a", href=True):
+            # Resolves relative and scheme-relative (//host/path) links, and drops #fragments
+            link = urldefrag(urljoin(url, link.get("href").strip())).url
+            parsed_link = urlparse(link)
+            if (parsed_link.scheme, parsed_link.netloc) != (parsed_url.scheme, parsed_url.netloc):
+                continue
+            if parsed_link.path.startswith(current_path) and parsed_link.path != current_path:
+                child_links.add(link)
+        return child_links
+
+    def _crawl(self, url: str) -> dict[str, list]:
+        """Crawl the site from `url`, collecting child links into `visited_links`; returns records by URL."""
+        self.visited_links = set()
+        seed = urlparse(url)
 
-        self.visited_links.update(absolute_paths)
+        def discover(page: CrawledPage) -> set[str]:
+            links = {
+                link
+                for link in self._get_child_links(page.url, page.text)
+                if (urlparse(link).scheme, urlparse(link).netloc) == (seed.scheme, seed.netloc)
+            }
+            self.visited_links.update(links)
+            return links
 
-        [self._get_child_links_recursive(link) for link in absolute_paths if link not in self.visited_links]
-
-    def _get_all_urls(self, url):
-        self.visited_links = set()
-        self._get_child_links_recursive(url)
-        urls = [link for link in self.visited_links if urlparse(link).netloc == urlparse(url).netloc]
-        return urls
+        records = {}
+        for page in self.crawler.stream([url], discover=discover, max_pages=self.max_pages):
+            if not page.ok:
+                logger.info(f"Failed to fetch the website: {page.status_code}")
+                continue
+            records[page.url] = self._parse_page(page.url, page.content)
+        return records
 
     @staticmethod
-    def _load_data_from_url(url: str) -> list:
-        response = requests.get(url)
-        if response.status_code != 200:
-            logger.info(f"Failed to fetch the website: {response.status_code}")
-            return []
-
-        soup = BeautifulSoup(response.content, "html.parser")
+    def _parse_page(url: str, html: bytes) -> list:
+        soup = BeautifulSoup(html, "html.parser")
         selectors = [
             "article.bd-article",
             'article[role="main"]',
@@ -108,10 +128,9 @@ class DocsSiteLoader(BaseLoader):
         return output
 
     def load_data(self, url):
-        all_urls = self._get_all_urls(url)
-        output = []
-        for u in all_urls:
-            output.extend(self._load_data_from_url(u))
+        pages = self._crawl(url)
+        all_urls = sorted(link for link in self.visited_links if urlparse(link).netloc == urlparse(url).netloc)
+        output = [record for link in all_urls for record in pages.get(link, [])]
         doc_id = hashlib.sha256((" ".join(all_urls) + url).encode()).hexdigest()
         return {
             "doc_id": doc_id,
@@ -58,7 +58,8 @@ class DropboxLoader(BaseLoader):
                 self._download_folder(f"{path}/{entry.name}", local_path)
 
         dir_loader = DirectoryLoader()
-        data = dir_loader.load_data(root_dir)["data"]
+        # Read everything before the downloaded files are removed
+        data = list(dir_loader.load_data(root_dir)["data"])
 
         # Clean up
         self._clean_directory(root_dir)
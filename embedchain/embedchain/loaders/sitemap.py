@@ -1,10 +1,10 @@
-import concurrent.futures
 import hashlib
 import logging
 import os
+from collections.abc import Iterator
+from typing import Any, Optional
 from urllib.parse import urlparse
 
-import requests
 from tqdm import tqdm
 
 try:
@@ -18,6 +18,7 @@ except ImportError:
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
 from embedchain.loaders.web_page import WebPageLoader
+from embedchain.utils.crawler import AsyncCrawler
 
 logger = logging.getLogger(__name__)
 
@@ -28,23 +29,24 @@ class SitemapLoader(BaseLoader):
     This method takes a sitemap URL or local file path as input and retrieves
     all the URLs to use the WebPageLoader to load content
     of each page.
+
+    Pages are fetched concurrently with `AsyncCrawler` and their records are streamed to the chunker
+    as they arrive. `config` is passed to `AsyncCrawler`, e.g. `{"max_per_host": 4, "cache_dir": ".cache/site"}`.
     """
 
-    def load_data(self, sitemap_source):
-        output = []
-        web_page_loader = WebPageLoader()
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",  # noqa:E501
-        }
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        super().__init__()
+        self.crawler = AsyncCrawler(**(config or {}))
 
+    def load_data(self, sitemap_source):
         if urlparse(sitemap_source).scheme in ("http", "https"):
-            try:
-                response = requests.get(sitemap_source, headers=headers)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "xml")
-            except requests.RequestException as e:
-                logger.error(f"Error fetching sitemap from URL: {e}")
+            pages = self.crawler.fetch_all([sitemap_source])
+            page = pages.get(sitemap_source)
+            if page is None or not page.ok:
+                status = page.status_code if page is not None else "request failed"
+                logger.error(f"Error fetching sitemap from URL: {status}")
                 return
+            soup = BeautifulSoup(page.content, "xml")
         elif os.path.isfile(sitemap_source):
             with open(sitemap_source, "r") as file:
                 soup = BeautifulSoup(file, "xml")
@@ -56,24 +58,16 @@ class SitemapLoader(BaseLoader):
             links = [link.text for link in soup.find_all("loc")]
 
         doc_id = hashlib.sha256((" ".join(links) + sitemap_source).encode()).hexdigest()
+        return {"doc_id": doc_id, "data": self._stream_pages(links)}
 
-        def load_web_page(link):
+    def _stream_pages(self, links: list[str]) -> Iterator[dict]:
+        for page in tqdm(self.crawler.stream(links), total=len(links), desc="Loading pages"):
+            if not page.ok:
+                logger.error(f"Error loading page {page.url}: {page.status_code}")
+                continue
             try:
-                loader_data = web_page_loader.load_data(link)
-                return loader_data.get("data")
+                content = WebPageLoader._get_clean_content(page.content, page.url)
             except ParserRejectedMarkup as e:
-                logger.error(f"Failed to parse {link}: {e}")
-            return None
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_link = {executor.submit(load_web_page, link): link for link in links}
-            for future in tqdm(concurrent.futures.as_completed(future_to_link), total=len(links), desc="Loading pages"):
-                link = future_to_link[future]
-                try:
-                    data = future.result()
-                    if data:
-                        output.extend(data)
-                except Exception as e:
-                    logger.error(f"Error loading page {link}: {e}")
-
-        return {"doc_id": doc_id, "data": output}
+                logger.error(f"Failed to parse {page.url}: {e}")
+                continue
+            yield {"content": content, "meta_data": {"url": page.url}}
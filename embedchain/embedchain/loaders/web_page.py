@@ -13,6 +13,7 @@ except ImportError:
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.utils.crawler import AsyncCrawler
 from embedchain.utils.misc import clean_string
 
 logger = logging.getLogger(__name__)
@@ -37,14 +38,14 @@ class WebPageLoader(BaseLoader):
         data = response.content
         reference_links = self.fetch_reference_links(response)
         if all_references:
-            for i in reference_links:
-                try:
-                    response = self._session.get(i, headers=headers, timeout=30)
-                    response.raise_for_status()
-                    data += response.content
-                except Exception as e:
-                    logging.error(f"Failed to add URL {url}: {e}")
+            # Fetched concurrently, appended in the order they appear on the page
+            pages = AsyncCrawler(headers=headers).fetch_all(reference_links)
+            for link in reference_links:
+                page = pages.get(link)
+                if page is None or not page.ok:
+                    logging.error(f"Failed to add URL {link}: {page.status_code if page else 'request failed'}")
                     continue
+                data += page.content
 
         content = self._get_clean_content(data, url)
 
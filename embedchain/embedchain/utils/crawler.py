@@ -0,0 +1,286 @@
+import asyncio
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36"
+)
+
+
+class CrawledPage:
+    """A fetched page. `from_cache` is set when the server answered 304 and the cached body was used."""
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: dict, from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+class HttpCache:
+    """
+    On-disk cache of response bodies with their ETag and Last-Modified validators.
+
+    Each URL is stored as `<sha256>.json` (validators) next to `<sha256>.body` (raw content).
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, url: str) -> Optional[tuple[dict, bytes]]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, headers: httpx.Headers, content: bytes) -> None:
+        validators = {key: headers[key] for key in ("etag", "last-modified") if key in headers}
+        if not validators:
+            return
+        meta_path, body_path = self._paths(url)
+        body_path.write_bytes(content)
+        with open(meta_path, "w") as f:
+            json.dump({**validators, "content-type": headers.get("content-type")}, f)
+
+    @staticmethod
+    def conditional_headers(meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last-modified"):
+            headers["If-Modified-Since"] = meta["last-modified"]
+        return headers
+
+
+class AsyncCrawler:
+    """
+    Concurrent HTTP fetcher shared by the web loaders.
+
+    All requests go through one pooled `httpx.AsyncClient`, so connections to a host are kept alive
+    and reused. At most `max_connections` requests run at a time and at most `max_per_host` per
+    host; requests to the same host start at least `delay` seconds apart. With `cache_dir` set,
+    responses carrying an ETag or Last-Modified header are cached on disk and revalidated with a
+    conditional request the next time, so unchanged pages cost a 304 without a body.
+
+    The loaders are synchronous, so `stream` and `fetch_all` run the crawl on an event loop in a
+    background thread and hand pages back through a bounded queue as they arrive.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_per_host: int = 8,
+        delay: float = 0.0,
+        timeout: float = 30.0,
+        cache_dir: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.delay = delay
+        self.timeout = timeout
+        self.cache = HttpCache(cache_dir) if cache_dir else None
+        self.headers = {"User-Agent": DEFAULT_USER_AGENT, **(headers or {})}
+        self.transport = transport
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_last_request: dict[str, float] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "errors": 0}
+
+    def _make_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=self.transport,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+        )
+
+    async def _wait_for_turn(self, host: str) -> None:
+        if self.delay <= 0:
+            return
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._host_last_request.get(host, 0.0) + self.delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+
+    async def fetch(self, client: httpx.AsyncClient, url: str) -> CrawledPage:
+        """Fetch a single URL, revalidating a cached copy if there is one."""
+        host = urlparse(url).netloc
+        limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        cached = self.cache.get(url) if self.cache else None
+        headers = HttpCache.conditional_headers(cached[0]) if cached else {}
+
+        async with limit:
+            await self._wait_for_turn(host)
+            self.stats["requests"] += 1
+            response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached:
+            self.stats["not_modified"] += 1
+            meta, content = cached
+            return CrawledPage(url, 200, content, {"content-type": meta.get("content-type")}, from_cache=True)
+        if response.is_success and self.cache:
+            self.cache.put(url, response.headers, response.content)
+        return CrawledPage(url, response.status_code, response.content, dict(response.headers))
+
+    async def crawl(
+        self,
+        seeds: Iterable[str],
+        discover: Optional[Callable[[CrawledPage], Iterable[str]]] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[CrawledPage]:
+        """
+        Fetch `seeds` and, if `discover` is given, every new URL it returns for a fetched page.
+
+        Pages are yielded in completion order. Each URL is fetched at most once. Request errors are
+        logged and skipped.
+        """
+        # Semaphores and locks belong to the event loop of this crawl
+        self._host_limits, self._host_locks = {}, {}
+        seen: set[str] = set()
+        frontier: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_connections)
+        scheduled = 0
+
+        def schedule(url: str) -> None:
+            nonlocal scheduled
+            if url in seen or (max_pages is not None and scheduled >= max_pages):
+                return
+            seen.add(url)
+            scheduled += 1
+            frontier.put_nowait(url)
+
+        for url in seeds:
+            schedule(url)
+
+        async def worker(client: httpx.AsyncClient) -> None:
+            while True:
+                url = await frontier.get()
+                try:
+                    page = await self.fetch(client, url)
+                    if discover is not None and page.ok:
+                        for link in discover(page):
+                            schedule(link)
+                    await results.put(page)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"Error fetching {url}: {e}")
+                finally:
+                    frontier.task_done()
+
+        async def finish() -> None:
+            await frontier.join()
+            await results.put(None)
+
+        client = self._make_client()
+        try:
+            workers = [asyncio.create_task(worker(client)) for _ in range(self.max_connections)]
+            finisher = asyncio.create_task(finish())
+            try:
+                while True:
+                    page = await results.get()
+                    if page is None:
+                        break
+                    yield page
+            finally:
+                finisher.cancel()
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(finisher, *workers, return_exceptions=True)
+        finally:
+            await client.aclose()
+
+    def stream(
+        self,
+        seeds: Iterable[str],
+        discover: Optional[Callable[[CrawledPage], Iterable[str]]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[CrawledPage]:
+        """Synchronous version of `crawl`; safe to call while another event loop is running."""
+        return _iterate_in_thread(lambda: self.crawl(seeds, discover=discover, max_pages=max_pages))
+
+    def fetch_all(self, urls: Iterable[str]) -> dict[str, CrawledPage]:
+        """Fetch `urls` concurrently and return the pages by URL."""
+        return {page.url: page for page in self.stream(urls)}
+
+
+def _iterate_in_thread(make_iterator: Callable[[], AsyncIterator[Any]], buffer: int = 64) -> Iterator[Any]:
+    """Drive an async iterator on a private event loop in a daemon thread and yield its items."""
+    items: queue.Queue = queue.Queue(maxsize=buffer)
+    done = object()
+    stop = threading.Event()
+
+    def run() -> None:
+        async def consume() -> None:
+            iterator = make_iterator()
+            try:
+                async for item in iterator:
+                    while not stop.is_set():
+                        try:
+                            items.put_nowait(item)
+                            break
+                        except queue.Full:
+                            # The consumer is behind; keep the loop running while waiting for room
+                            await asyncio.sleep(0.01)
+                    if stop.is_set():
+                        break
+            finally:
+                await iterator.aclose()
+
+        try:
+            asyncio.run(consume())
+            items.put(done)
+        except BaseException as e:
+            items.put(e)
+
+    thread = threading.Thread(target=run, name="embedchain-crawler", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock the producer if it is waiting on a full queue, then let it shut down
+        while thread.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
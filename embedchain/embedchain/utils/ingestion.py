@@ -0,0 +1,206 @@
+import inspect
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+from embedchain.vectordb.base import BaseVectorDB
+
+logger = logging.getLogger(__name__)
+
+Chunk = tuple[str, str, dict]
+
+
+class IngestionPipeline:
+    """
+    Embeds chunks and writes them to a vector database in overlapping stages.
+
+    Loading and chunking run in a background thread that fills a bounded queue of batches. Up to
+    `embed_concurrency` batches are embedded at the same time in a thread pool while the calling
+    thread writes the batches that are already embedded, so the embedding of the next batches
+    overlaps with the write of the current one and the wall time of a large ingest approaches the
+    time of its slowest stage. All vector database calls are made from the calling thread.
+
+    A batch whose embedding or write fails is retried `max_retries` times with exponential backoff;
+    if it still fails, the batches already written by the run are deleted again and `run` raises, so
+    a failed run leaves no partial document behind.
+
+    Vector databases whose `add` does not accept precomputed `embeddings` embed inside `add`; their
+    batches are still loaded and chunked in the background, but embedding is not overlapped.
+    """
+
+    def __init__(
+        self,
+        db: BaseVectorDB,
+        batch_size: int = 2048,
+        embed_concurrency: int = 2,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        queue_size: int = 2,
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.embed_concurrency = embed_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.queue_size = queue_size
+        self.precompute_embeddings = "embeddings" in inspect.signature(db.add).parameters
+        self._stats_lock = threading.Lock()
+        self.stats = {"batches": 0, "retries": 0, "embed_seconds": 0.0, "write_seconds": 0.0, "total_seconds": 0.0}
+
+    def run(
+        self,
+        chunks: Iterable[Chunk],
+        existing_ids: Optional[Callable[[list[str]], set[str]]] = None,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> tuple[list[str], list[dict], list[str], int]:
+        """
+        Embed and store `chunks`, given as (id, document, metadata) tuples.
+
+        :param chunks: Chunks to store, consumed lazily.
+        :param existing_ids: Called with the ids of every batch before it is embedded; returns the ids
+        that are already stored, which are skipped.
+        :param kwargs: Passed on to the `add` method of the vector database.
+        :return: documents, metadatas and ids that were written, and the number of chunks skipped
+        because they were already stored.
+        :raises Exception: if a batch cannot be embedded or written, after the chunks written so far
+        were rolled back.
+        """
+        started = time.perf_counter()
+        written: list[Chunk] = []
+        skipped = 0
+        executor = ThreadPoolExecutor(max_workers=self.embed_concurrency, thread_name_prefix="embedchain-embed")
+        pending: deque[tuple[list[Chunk], Optional[Future]]] = deque()
+        batches = _prefetch(self._batches(chunks), self.queue_size)
+        try:
+            for batch in batches:
+                if existing_ids is not None:
+                    stored = existing_ids([chunk_id for chunk_id, _, _ in batch])
+                    skipped += sum(1 for chunk_id, _, _ in batch if chunk_id in stored)
+                    batch = [chunk for chunk in batch if chunk[0] not in stored]
+                if not batch:
+                    continue
+                future = executor.submit(self._embed, batch) if self.precompute_embeddings else None
+                pending.append((batch, future))
+                # Keep `embed_concurrency` batches embedding while the oldest one is written
+                if len(pending) > self.embed_concurrency:
+                    written.extend(self._write(*pending.popleft(), **kwargs))
+            while pending:
+                written.extend(self._write(*pending.popleft(), **kwargs))
+        except BaseException:
+            self.rollback([chunk_id for chunk_id, _, _ in written])
+            raise
+        finally:
+            batches.close()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.stats["total_seconds"] += time.perf_counter() - started
+
+        ids = [chunk_id for chunk_id, _, _ in written]
+        documents = [doc for _, doc, _ in written]
+        metadatas = [metadata for _, _, metadata in written]
+        return documents, metadatas, ids, skipped
+
+    def rollback(self, ids: list[str]) -> None:
+        """Delete chunks written by a run, logging instead of raising if they cannot be deleted."""
+        if not ids:
+            return
+        try:
+            self.db.delete_ids(ids)
+            logger.info(f"Rolled back {len(ids)} chunks of a failed ingest")
+        except Exception as e:
+            logger.warning(f"Could not roll back {len(ids)} chunks of a failed ingest: {e}")
+
+    def _batches(self, chunks: Iterable[Chunk]) -> Iterator[list[Chunk]]:
+        batch = []
+        for chunk in chunks:
+            # Filter out empty documents and ensure they meet the API requirements
+            if not chunk[1] or not isinstance(chunk[1], str):
+                continue
+            batch.append(chunk)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _embed(self, batch: list[Chunk]) -> list[list[float]]:
+        started = time.perf_counter()
+        embeddings = self._retry("embed", lambda: self.db.embedder.embedding_fn([doc for _, doc, _ in batch]))
+        with self._stats_lock:
+            self.stats["embed_seconds"] += time.perf_counter() - started
+        return embeddings
+
+    def _write(self, batch: list[Chunk], future: Optional[Future], **kwargs) -> list[Chunk]:
+        add_kwargs = dict(kwargs)
+        if future is not None:
+            add_kwargs["embeddings"] = future.result()
+        started = time.perf_counter()
+        self._retry(
+            "write",
+            lambda: self.db.add(
+                documents=[doc for _, doc, _ in batch],
+                metadatas=[metadata for _, _, metadata in batch],
+                ids=[chunk_id for chunk_id, _, _ in batch],
+                **add_kwargs,
+            ),
+        )
+        with self._stats_lock:
+            self.stats["write_seconds"] += time.perf_counter() - started
+            self.stats["batches"] += 1
+        return batch
+
+    def _retry(self, stage: str, fn: Callable[[], Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise RuntimeError(f"Failed to {stage} a batch of chunks after {attempt + 1} attempts: {e}") from e
+                delay = self.retry_delay * 2**attempt
+                with self._stats_lock:
+                    self.stats["retries"] += 1
+                logger.warning(f"Failed to {stage} a batch of chunks, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+
+def _prefetch(iterator: Iterator[Any], maxsize: int) -> Iterator[Any]:
+    """Consume `iterator` in a background thread, keeping up to `maxsize` items ready in a queue."""
+    items: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run() -> None:
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as e:
+            put(e)
+
+    thread = threading.Thread(target=run, name="embedchain-chunker", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # The thread exits at its next item; it is not joined so that a slow loader cannot delay errors
+        stop.set()
@@ -522,6 +522,8 @@ def validate_config(config_data):
                 Optional("config"): {
                     Optional("similarity_threshold"): float,
                     Optional("auto_flush"): int,
+                    Optional("max_size"): int,
+                    Optional("ttl"): Or(int, float),
                 },
             },
             Optional("memory"): {
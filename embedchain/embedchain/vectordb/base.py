@@ -80,3 +80,23 @@ class BaseVectorDB(JSONSerializable):
         """Delete from database."""
 
         raise NotImplementedError
+
+    def delete_ids(self, ids: list[str]):
+        """
+        Delete chunks by id.
+
+        :param ids: ids of the chunks to delete
+        :type ids: list[str]
+        """
+        raise NotImplementedError
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        """
+        Replace the metadata of existing chunks without re-embedding them.
+
+        :param ids: ids of the chunks to update
+        :type ids: list[str]
+        :param metadatas: new metadata, one per id
+        :type metadatas: list[dict]
+        """
+        raise NotImplementedError
@@ -136,6 +136,7 @@ class ChromaDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
         **kwargs: Optional[dict[str, Any]],
     ) -> Any:
         """
@@ -147,6 +148,8 @@ class ChromaDB(BaseVectorDB):
         :type metadatas: list[object]
         :param ids: ids
         :type ids: list[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[list[list[float]]], optional
         """
         size = len(documents)
         if len(documents) != size or len(metadatas) != size or len(ids) != size:
@@ -160,6 +163,7 @@ class ChromaDB(BaseVectorDB):
                 documents=documents[i : i + self.batch_size],
                 metadatas=metadatas[i : i + self.batch_size],
                 ids=ids[i : i + self.batch_size],
+                embeddings=embeddings[i : i + self.batch_size] if embeddings is not None else None,
             )
         self.config
 
@@ -267,6 +271,14 @@ class ChromaDB(BaseVectorDB):
     def delete(self, where):
         return self.collection.delete(where=self._generate_where_clause(where))
 
+    def delete_ids(self, ids: list[str]):
+        for i in range(0, len(ids), self.batch_size):
+            self.collection.delete(ids=ids[i : i + self.batch_size])
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        for i in range(0, len(ids), self.batch_size):
+            self.collection.update(ids=ids[i : i + self.batch_size], metadatas=metadatas[i : i + self.batch_size])
+
     def reset(self):
         """
         Resets the database. Deletes all embeddings irreversibly.
@@ -124,6 +124,7 @@ class ElasticsearchDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
         **kwargs: Optional[dict[str, any]],
     ) -> Any:
         """
@@ -134,9 +135,12 @@ class ElasticsearchDB(BaseVectorDB):
         :type metadatas: list[object]
         :param ids: ids of docs
         :type ids: list[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[list[list[float]]], optional
         """
 
-        embeddings = self.embedder.embedding_fn(documents)
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
 
         for chunk in chunks(
             list(zip(ids, documents, metadatas, embeddings)),
@@ -171,6 +171,7 @@ class LanceDB(BaseVectorDB):
         documents: List[str],
         metadatas: List[object],
         ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
     ) -> Any:
         """
         Add vectors to lancedb database
@@ -181,6 +182,8 @@ class LanceDB(BaseVectorDB):
         :type metadatas: List[object]
         :param ids: ids
         :type ids: List[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[List[List[float]]], optional
         """
         data = []
         to_ingest = list(zip(documents, metadatas, ids))
@@ -193,10 +196,12 @@ class LanceDB(BaseVectorDB):
                 temp["id"] = id
                 data.append(temp)
         else:
-            for doc, meta, id in to_ingest:
+            if embeddings is None:
+                embeddings = [self.embedder.embedding_fn([doc])[0] for doc in documents]
+            for (doc, meta, id), embedding in zip(to_ingest, embeddings):
                 temp = {}
                 temp["doc"] = doc
-                temp["vector"] = self.embedder.embedding_fn([doc])[0]
+                temp["vector"] = embedding
                 temp["metadata"] = str(meta)
                 temp["id"] = id
                 data.append(temp)
@@ -115,10 +115,18 @@ class OpenSearchDB(BaseVectorDB):
             result["metadatas"].append({"doc_id": doc_id})
         return result
 
-    def add(self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]):
-        """Adds documents to the opensearch index"""
-
-        embeddings = self.embedder.embedding_fn(documents)
+    def add(
+        self,
+        documents: list[str],
+        metadatas: list[object],
+        ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
+        **kwargs: Optional[dict[str, any]],
+    ):
+        """Adds documents to the opensearch index, embedding them unless `embeddings` are given"""
+
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
         for batch_start in tqdm(range(0, len(documents), self.batch_size), desc="Inserting batches in opensearch"):
             batch_end = batch_start + self.batch_size
             batch_documents = documents[batch_start:batch_end]
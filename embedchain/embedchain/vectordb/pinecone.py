@@ -116,6 +116,7 @@ class PineconeDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
         **kwargs: Optional[dict[str, any]],
     ):
         """add data in vector database
@@ -126,9 +127,12 @@ class PineconeDB(BaseVectorDB):
         :type metadatas: list[object]
         :param ids: ids of docs
         :type ids: list[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[list[list[float]]], optional
         """
         docs = []
-        embeddings = self.embedder.embedding_fn(documents)
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
         for id, text, metadata, embedding in zip(ids, documents, metadatas, embeddings):
             # Insert sparse vectors as well if the user wants to do the hybrid search
             sparse_vector_dict = (
@@ -128,6 +128,7 @@ class QdrantDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
         **kwargs: Optional[dict[str, any]],
     ):
         """add data in vector database
@@ -137,8 +138,11 @@ class QdrantDB(BaseVectorDB):
         :type metadatas: list[object]
         :param ids: ids of docs
         :type ids: list[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[list[list[float]]], optional
         """
-        embeddings = self.embedder.embedding_fn(documents)
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
 
         payloads = []
         qdrant_ids = []
@@ -251,3 +255,31 @@ class QdrantDB(BaseVectorDB):
     def delete(self, where: dict):
         db_filter = self._generate_query(where)
         self.client.delete(collection_name=self.collection_name, points_selector=db_filter)
+
+    def delete_ids(self, ids: list[str]):
+        for i in range(0, len(ids), self.batch_size):
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=ids[i : i + self.batch_size]),
+            )
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        for i in range(0, len(ids), self.batch_size):
+            batch = list(zip(ids[i : i + self.batch_size], metadatas[i : i + self.batch_size]))
+            points = self.client.retrieve(
+                collection_name=self.collection_name, ids=[id for id, _ in batch], with_payload=True
+            )
+            texts = {point.payload["identifier"]: point.payload.get("text") for point in points}
+            operations = [
+                # Replaces the stored payload, keeping the "text" key that `add` also puts into the metadata
+                models.OverwritePayloadOperation(
+                    overwrite_payload=models.SetPayload(
+                        payload={"identifier": id, "text": texts[id], "metadata": {**metadata, "text": texts[id]}},
+                        points=[id],
+                    )
+                )
+                for id, metadata in batch
+                if id in texts
+            ]
+            if operations:
+                self.client.batch_update_points(collection_name=self.collection_name, update_operations=operations)
@@ -187,7 +187,14 @@ class WeaviateDB(BaseVectorDB):
 
         return {"ids": existing_ids, "metadatas": metadatas}
 
-    def add(self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]):
+    def add(
+        self,
+        documents: list[str],
+        metadatas: list[object],
+        ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
+        **kwargs: Optional[dict[str, any]],
+    ):
         """add data in vector database
         :param documents: list of texts to add
         :type documents: list[str]
@@ -195,8 +202,11 @@ class WeaviateDB(BaseVectorDB):
         :type metadatas: list[object]
         :param ids: ids of docs
         :type ids: list[str]
+        :param embeddings: Precomputed embeddings of the documents, computed with the embedder if not given
+        :type embeddings: Optional[list[list[float]]], optional
         """
-        embeddings = self.embedder.embedding_fn(documents)
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
         self.client.batch.configure(batch_size=self.batch_size, timeout_retries=3)  # Configure batch
         with self.client.batch as batch:  # Initialize a batch process
             for id, text, metadata, embedding in zip(ids, documents, metadatas, embeddings):
@@ -130,10 +130,12 @@ class ZillizVectorDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
+        embeddings: Optional[list[list[float]]] = None,
         **kwargs: Optional[dict[str, any]],
     ):
-        """Add to database"""
-        embeddings = self.embedder.embedding_fn(documents)
+        """Add to database, embedding the documents unless `embeddings` are given"""
+        if embeddings is None:
+            embeddings = self.embedder.embedding_fn(documents)
 
         for id, doc, metadata, embedding in zip(ids, documents, metadatas, embeddings):
             data = {"id": id, "text": doc, "embeddings": embedding, "metadata": metadata}
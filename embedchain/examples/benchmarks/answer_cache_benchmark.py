@@ -0,0 +1,108 @@
+"""
+Benchmark the answer cache on an FAQ-style query workload.
+
+A handful of FAQ documents are added to a local Chroma database and `--queries` queries are drawn
+from a skewed distribution over the FAQ questions, as real traffic tends to be. The run is done
+without and with the answer cache. A stand-in LLM sleeps for a fixed time per answer, so the numbers
+show how many LLM calls the cache saves. Halfway through, one FAQ is edited and re-added to show that
+its cached answers are invalidated.
+
+Usage:
+    python examples/benchmarks/answer_cache_benchmark.py --queries 500 --llm-latency-ms 300
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stand-in")
+
+from embedchain import App  # noqa: E402
+from embedchain.config import AppConfig, CacheConfig, ChromaDbConfig  # noqa: E402
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc  # noqa: E402
+from embedchain.vectordb.chroma import ChromaDB  # noqa: E402
+
+EMBEDDING_DIMS = 16
+FAQ = {
+    "refunds": ("how do refunds work", "Refunds are accepted within 30 days of purchase."),
+    "shipping": ("how long does shipping take", "Orders ship within two business days."),
+    "password": ("how do i reset my password", "Use the reset link on the login page."),
+    "support": ("how do i contact support", "Support is available by email around the clock."),
+    "invoices": ("where can i find my invoices", "Invoices are listed under billing in your account."),
+}
+
+
+def make_embedder() -> BaseEmbedder:
+    def embed(texts):
+        return [[byte / 255 for byte in hashlib.sha256(text.encode()).digest()[:EMBEDDING_DIMS]] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embed))
+    embedder.set_vector_dimension(EMBEDDING_DIMS)
+    return embedder
+
+
+def run(workdir: str, queries: list[str], llm_latency: float, use_cache: bool):
+    db = ChromaDB(config=ChromaDbConfig(dir=os.path.join(workdir, f"db-{use_cache}"), allow_reset=True))
+    app = App(
+        config=AppConfig(collect_metrics=False),
+        db=db,
+        embedding_model=make_embedder(),
+        cache_config=CacheConfig() if use_cache else None,
+    )
+    llm_calls = 0
+
+    def answer(**kwargs):
+        nonlocal llm_calls
+        llm_calls += 1
+        time.sleep(llm_latency)
+        return kwargs["contexts"][0]
+
+    app.llm.query = answer
+    paths = {}
+    for name, (_, text) in FAQ.items():
+        paths[name] = os.path.join(workdir, f"{name}-{use_cache}.txt")
+        with open(paths[name], "w") as f:
+            f.write(text)
+        app.add(paths[name], data_type="text_file")
+
+    started = time.perf_counter()
+    for idx, query in enumerate(queries):
+        if idx == len(queries) // 2:
+            with open(paths["refunds"], "w") as f:
+                f.write("Refunds are accepted within 14 days of purchase.")
+            app.add(paths["refunds"], data_type="text_file")
+        app.query(query)
+    elapsed = time.perf_counter() - started
+    stats = app.answer_cache.stats() if use_cache else None
+    app.db.reset()
+    return elapsed, llm_calls, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    args = parser.parse_args()
+
+    questions = [question for question, _ in FAQ.values()]
+    weights = [1 / (rank + 1) for rank in range(len(questions))]
+    queries = random.Random(0).choices(questions, weights=weights, k=args.queries)
+
+    print(f"{'cache':<6} {'time (s)':>9} {'llm calls':>10} {'queries/s':>10} {'hit rate':>9} {'invalidated':>12}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for use_cache in (False, True):
+            elapsed, llm_calls, stats = run(workdir, queries, args.llm_latency_ms / 1000, use_cache)
+            hit_rate = f"{stats['hit_rate']:.1%}" if stats else "-"
+            invalidated = stats["invalidations"] if stats else "-"
+            print(
+                f"{'on' if use_cache else 'off':<6} {elapsed:>9.2f} {llm_calls:>10} {len(queries) / elapsed:>10.1f} "
+                f"{hit_rate:>9} {invalidated:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark fetching a docs site with the shared async crawler.
+
+A local HTTP server serves `--pages` pages, each after a fixed artificial latency to imitate a remote
+site. The pages are fetched one by one with `requests`, as the web loaders used to do, then with
+`AsyncCrawler`, and finally again with `AsyncCrawler` and a warm on-disk cache, where every page is
+revalidated with a conditional request that the server answers with 304.
+
+Usage:
+    python examples/benchmarks/crawler_benchmark.py --pages 200 --latency-ms 50 --max-per-host 16
+"""
+
+import argparse
+import hashlib
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from embedchain.utils.crawler import AsyncCrawler
+
+
+def make_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = f"<html><body><h1>{self.path}</h1>{'<p>Lorem ipsum dolor sit amet.</p>' * 200}</body></html>"
+            body = body.encode()
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def report(name: str, pages: int, elapsed: float) -> None:
+    print(f"{name:<28} pages={pages:>5} time={elapsed:>7.2f}s pages/s={pages / elapsed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--max-per-host", type=int, default=16)
+    args = parser.parse_args()
+
+    server = make_server(args.latency_ms / 1000)
+    urls = [f"http://127.0.0.1:{server.server_port}/page{idx}" for idx in range(args.pages)]
+
+    started = time.perf_counter()
+    for url in urls:
+        requests.get(url, timeout=30).raise_for_status()
+    report("serial requests", len(urls), time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        crawler = AsyncCrawler(max_connections=args.max_per_host, max_per_host=args.max_per_host, cache_dir=cache_dir)
+        started = time.perf_counter()
+        pages = crawler.fetch_all(urls)
+        report("AsyncCrawler", len(pages), time.perf_counter() - started)
+
+        crawler = AsyncCrawler(max_connections=args.max_per_host, max_per_host=args.max_per_host, cache_dir=cache_dir)
+        started = time.perf_counter()
+        pages = crawler.fetch_all(urls)
+        report("AsyncCrawler (warm cache)", len(pages), time.perf_counter() - started)
+        print(f"not modified: {crawler.stats['not_modified']} of {crawler.stats['requests']} requests")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
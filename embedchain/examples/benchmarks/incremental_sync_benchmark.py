@@ -0,0 +1,84 @@
+"""
+Benchmark re-adding a large document after a one-paragraph edit.
+
+A text file the size of a ~500 page book is added to a local Chroma database, one paragraph is
+edited, and the file is added again with `sync_mode="replace"` (delete and re-embed everything) and
+with `sync_mode="incremental"` (embed only the changed chunks). A stand-in embedder sleeps for a
+fixed time per embedded chunk, so the numbers show how much embedding work each mode does rather
+than the speed of a specific provider.
+
+Usage:
+    python examples/benchmarks/incremental_sync_benchmark.py --paragraphs 5000 --embed-latency-ms 1
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from embedchain import App
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.vectordb.chroma import ChromaDB
+
+EMBEDDING_DIMS = 16
+
+
+class CountingEmbedder(BaseEmbedder):
+    """Hash-based embeddings that cost `latency` seconds per chunk."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.embedded = 0
+        self.set_embedding_fn(EmbeddingFunc(self._embed))
+        self.set_vector_dimension(EMBEDDING_DIMS)
+
+    def _embed(self, texts):
+        self.embedded += len(texts)
+        time.sleep(self.latency * len(texts))
+        return [[byte / 255 for byte in hashlib.sha256(text.encode()).digest()[:EMBEDDING_DIMS]] for text in texts]
+
+
+def write_document(path: str, paragraphs: int, edited: bool):
+    lines = [f"Paragraph {idx}: the quick brown fox jumps over the lazy dog {idx} times." for idx in range(paragraphs)]
+    if edited:
+        lines[paragraphs // 2] = "This paragraph was edited after the first ingestion."
+    with open(path, "w") as f:
+        f.write("\n\n".join(lines))
+
+
+def run(sync_mode: str, paragraphs: int, latency: float):
+    with tempfile.TemporaryDirectory() as tmp:
+        embedder = CountingEmbedder(latency)
+        db = ChromaDB(config=ChromaDbConfig(dir=os.path.join(tmp, "db"), allow_reset=True))
+        app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+        add_config = AddConfig(chunker=ChunkerConfig(chunk_size=100, chunk_overlap=0), sync_mode=sync_mode)
+        path = os.path.join(tmp, "book.txt")
+
+        write_document(path, paragraphs, edited=False)
+        app.add(path, data_type="text_file", config=add_config)
+
+        write_document(path, paragraphs, edited=True)
+        embedder.embedded = 0
+        started = time.perf_counter()
+        app.add(path, data_type="text_file", config=add_config)
+        elapsed = time.perf_counter() - started
+        return elapsed, embedder.embedded, app.db.count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--embed-latency-ms", type=float, default=1.0, help="Stand-in embedding cost per chunk")
+    args = parser.parse_args()
+
+    print(f"{'sync_mode':<12} {'re-add (s)':>10} {'embedded':>10} {'chunks':>8}")
+    for sync_mode in ("replace", "incremental"):
+        elapsed, embedded, chunks = run(sync_mode, args.paragraphs, args.embed_latency_ms / 1000)
+        print(f"{sync_mode:<12} {elapsed:>10.2f} {embedded:>10} {chunks:>8}")
+
+
+if __name__ == "__main__":
+    main()
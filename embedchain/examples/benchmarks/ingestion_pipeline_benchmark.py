@@ -0,0 +1,118 @@
+"""
+Benchmark the pipelined ingestion of a large source into a local Chroma database.
+
+A text file the size of a ~500 page book is chunked and stored twice: once the way `add()` used to
+do it, one batch at a time with the embedding computed inside the vector database write, and once
+with `IngestionPipeline`, where loading, embedding and writing overlap. A stand-in embedder sleeps
+for a fixed time per batch and per chunk to imitate a remote embedding API, and the database write
+gets a fixed extra latency to imitate a remote vector database.
+
+Usage:
+    python examples/benchmarks/ingestion_pipeline_benchmark.py --paragraphs 5000 --batch-size 256
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from embedchain.chunkers.text import TextChunker
+from embedchain.config import ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.loaders.local_text import LocalTextLoader
+from embedchain.models.data_type import DataType
+from embedchain.utils.ingestion import IngestionPipeline
+from embedchain.vectordb.chroma import ChromaDB
+
+EMBEDDING_DIMS = 16
+
+
+class StandInEmbedder(BaseEmbedder):
+    """Hash-based embeddings that cost `batch_latency` per call plus `chunk_latency` per chunk."""
+
+    def __init__(self, batch_latency: float, chunk_latency: float):
+        super().__init__()
+        self.batch_latency = batch_latency
+        self.chunk_latency = chunk_latency
+        self.set_embedding_fn(EmbeddingFunc(self._embed))
+        self.set_vector_dimension(EMBEDDING_DIMS)
+
+    def _embed(self, texts):
+        time.sleep(self.batch_latency + self.chunk_latency * len(texts))
+        return [[byte / 255 for byte in hashlib.sha256(text.encode()).digest()[:EMBEDDING_DIMS]] for text in texts]
+
+
+class RemoteChromaDB(ChromaDB):
+    """Chroma with a fixed extra latency per write, like a vector database behind a network."""
+
+    write_latency = 0.0
+
+    def add(self, documents, metadatas, ids, embeddings=None, **kwargs):
+        time.sleep(self.write_latency)
+        return super().add(documents, metadatas, ids, embeddings=embeddings, **kwargs)
+
+
+def make_db(path: str, embedder: BaseEmbedder, write_latency: float) -> RemoteChromaDB:
+    db = RemoteChromaDB(config=ChromaDbConfig(dir=path, allow_reset=True, batch_size=100000))
+    db.write_latency = write_latency
+    db._set_embedder(embedder)
+    db._initialize()
+    return db
+
+
+def chunk_source(text: str):
+    chunker = TextChunker(config=ChunkerConfig(chunk_size=100, chunk_overlap=0))
+    chunker.set_data_type(DataType.TEXT)
+    return chunker.iter_chunks(LocalTextLoader(), text)[1]
+
+
+def run_sequential(db: ChromaDB, text: str, batch_size: int) -> int:
+    chunks = list(chunk_source(text))
+    for i in range(0, len(chunks), batch_size):
+        batch = chunks[i : i + batch_size]
+        db.add(
+            documents=[doc for _, doc, _ in batch],
+            metadatas=[metadata for _, _, metadata in batch],
+            ids=[chunk_id for chunk_id, _, _ in batch],
+        )
+    return len(chunks)
+
+
+def run_pipelined(db: ChromaDB, text: str, batch_size: int, embed_concurrency: int) -> int:
+    pipeline = IngestionPipeline(db, batch_size=batch_size, embed_concurrency=embed_concurrency)
+    _, _, ids, _ = pipeline.run(chunk_source(text))
+    return len(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--embed-concurrency", type=int, default=2)
+    parser.add_argument("--embed-batch-latency-ms", type=float, default=150.0)
+    parser.add_argument("--embed-chunk-latency-ms", type=float, default=0.5)
+    parser.add_argument("--write-latency-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    text = "\n\n".join(
+        f"Paragraph {idx}: the quick brown fox jumps over the lazy dog {idx} times." for idx in range(args.paragraphs)
+    )
+    embedder = StandInEmbedder(args.embed_batch_latency_ms / 1000, args.embed_chunk_latency_ms / 1000)
+
+    print(f"{'mode':<12} {'time (s)':>9} {'chunks':>8} {'chunks/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("sequential", "pipelined"):
+            db = make_db(os.path.join(tmp, mode), embedder, args.write_latency_ms / 1000)
+            started = time.perf_counter()
+            if mode == "sequential":
+                chunks = run_sequential(db, text, args.batch_size)
+            else:
+                chunks = run_pipelined(db, text, args.batch_size, args.embed_concurrency)
+            elapsed = time.perf_counter() - started
+            assert db.count() == chunks
+            print(f"{mode:<12} {elapsed:>9.2f} {chunks:>8} {chunks / elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
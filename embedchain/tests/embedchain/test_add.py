@@ -12,7 +12,10 @@ os.environ["OPENAI_API_KEY"] = "test_key"
 @pytest.fixture
 def app(mocker):
     mocker.patch("chromadb.api.models.Collection.Collection.add")
-    return App(config=AppConfig(collect_metrics=False))
+    app = App(config=AppConfig(collect_metrics=False))
+    # Chunks are embedded before they are written to the database
+    mocker.patch.object(app.embedding_model, "embedding_fn", side_effect=lambda texts: [[0.0, 0.0, 0.0] for _ in texts])
+    return app
 
 
 def test_add(app):
@@ -73,3 +73,149 @@ def test_add_with_incorrect_content(app_instance, mocker):
 
     with pytest.raises(TypeError):
         app_instance.add(content, data_type="json")
+
+
+def _fake_embedder(embedded):
+    from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+
+    def embed(texts):
+        embedded.extend(texts)
+        return [[float(len(text)), float(sum(map(ord, text)) % 97), 1.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embed))
+    embedder.set_vector_dimension(3)
+    return embedder
+
+
+@pytest.mark.parametrize("sync_mode", ["incremental", "replace"])
+def test_readd_changed_file(tmp_path, sync_mode):
+    from embedchain.config import AddConfig, ChunkerConfig
+
+    embedded = []
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=_fake_embedder(embedded))
+    add_config = AddConfig(chunker=ChunkerConfig(chunk_size=40, chunk_overlap=0, min_chunk_size=1), sync_mode=sync_mode)
+
+    paragraphs = [f"Paragraph number {idx} of the document." for idx in range(10)]
+    path = tmp_path / "doc.txt"
+    path.write_text("\n\n".join(paragraphs))
+    app.add(str(path), data_type="text_file", config=add_config)
+    assert app.db.count() == 10
+
+    embedded.clear()
+    paragraphs[3] = "Paragraph three was rewritten."
+    path.write_text("\n\n".join(paragraphs))
+    app.add(str(path), data_type="text_file", config=add_config, metadata={"version": 2})
+
+    stored = app.db.get()
+    assert sorted(stored["documents"]) == sorted(paragraphs)
+    assert len({meta["doc_id"] for meta in stored["metadatas"]}) == 1
+    assert all(meta["version"] == 2 for meta in stored["metadatas"])
+    if sync_mode == "incremental":
+        assert embedded == ["Paragraph three was rewritten."]
+    else:
+        assert sorted(embedded) == sorted(paragraphs)
+    app.db.reset()
+
+
+def test_readd_changed_file_after_failed_write(tmp_path, mocker):
+    from embedchain.config import AddConfig, ChunkerConfig
+
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=_fake_embedder([]))
+    add_config = AddConfig(
+        chunker=ChunkerConfig(chunk_size=40, chunk_overlap=0, min_chunk_size=1), batch_size=2, max_retries=0
+    )
+
+    paragraphs = [f"Paragraph number {idx} of the document." for idx in range(10)]
+    path = tmp_path / "doc.txt"
+    path.write_text("\n\n".join(paragraphs))
+    app.add(str(path), data_type="text_file", config=add_config)
+
+    paragraphs[2:6] = [f"Paragraph {idx} was rewritten." for idx in range(2, 6)]
+    path.write_text("\n\n".join(paragraphs))
+    add = db.add
+    calls = []
+
+    def add_failing_second_batch(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise ConnectionError("connection reset")
+        return add(*args, **kwargs)
+
+    mocker.patch.object(db, "add", side_effect=add_failing_second_batch)
+    with pytest.raises(RuntimeError):
+        app.add(str(path), data_type="text_file", config=add_config)
+    # The first batch of new chunks is rolled back, the previous version stays as it was
+    assert app.db.count() == 10
+
+    app.add(str(path), data_type="text_file", config=add_config)
+
+    stored = app.db.get()
+    assert sorted(stored["documents"]) == sorted(paragraphs)
+    assert len({meta["doc_id"] for meta in stored["metadatas"]}) == 1
+    app.db.reset()
+
+
+def test_readd_changed_file_after_failed_metadata_update(tmp_path, mocker):
+    from embedchain.config import AddConfig, ChunkerConfig
+
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=_fake_embedder([]))
+    add_config = AddConfig(
+        chunker=ChunkerConfig(chunk_size=40, chunk_overlap=0, min_chunk_size=1), batch_size=2, max_retries=0
+    )
+
+    paragraphs = [f"Paragraph number {idx} of the document." for idx in range(10)]
+    path = tmp_path / "doc.txt"
+    path.write_text("\n\n".join(paragraphs))
+    app.add(str(path), data_type="text_file", config=add_config)
+    previous = app.db.get()
+
+    paragraphs[2:6] = [f"Paragraph {idx} was rewritten." for idx in range(2, 6)]
+    path.write_text("\n\n".join(paragraphs))
+    mocker.patch.object(db, "update_metadatas", side_effect=ConnectionError("connection reset"))
+    with pytest.raises(ConnectionError):
+        app.add(str(path), data_type="text_file", config=add_config)
+    # The new chunks are rolled back and the chunks that vanished from the file are still stored
+    stored = app.db.get()
+    assert sorted(stored["documents"]) == sorted(previous["documents"])
+    assert {meta["doc_id"] for meta in stored["metadatas"]} == {meta["doc_id"] for meta in previous["metadatas"]}
+
+    mocker.stopall()
+    app.add(str(path), data_type="text_file", config=add_config)
+
+    stored = app.db.get()
+    assert sorted(stored["documents"]) == sorted(paragraphs)
+    assert len({meta["doc_id"] for meta in stored["metadatas"]}) == 1
+    app.db.reset()
+
+
+def test_readd_changed_directory(tmp_path):
+    from embedchain.loaders.directory_loader import DirectoryLoader
+
+    embedded = []
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=_fake_embedder(embedded))
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("a", "b", "c"):
+        (docs / f"{name}.txt").write_text(f"The contents of file {name}.")
+    loader = DirectoryLoader(config={"max_workers": 1, "cache_dir": str(tmp_path / "cache")})
+
+    app.add(str(docs), data_type="directory", loader=loader)
+    assert app.db.count() == 3
+
+    embedded.clear()
+    (docs / "b.txt").write_text("File b was edited.")
+    (docs / "c.txt").unlink()
+    app.add(str(docs), data_type="directory", loader=loader)
+
+    assert embedded == ["File b was edited."]
+    # File a did not change, so it was neither parsed nor chunked again, only moved to the new doc_id
+    assert loader.skipped_files == [str(docs / "a.txt")]
+    stored = app.db.get()
+    assert sorted(stored["documents"]) == ["File b was edited.", "The contents of file a."]
+    assert len({meta["doc_id"] for meta in stored["metadatas"]}) == 1
+    app.db.reset()
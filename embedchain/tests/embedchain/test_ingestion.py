@@ -0,0 +1,153 @@
+import time
+
+import pytest
+
+from embedchain.utils.ingestion import IngestionPipeline
+
+
+class FakeEmbedder:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+
+    def embedding_fn(self, texts):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("rate limited")
+        return [[float(len(text))] for text in texts]
+
+
+class FakeDB:
+    def __init__(self, embedder, failures=0):
+        self.embedder = embedder
+        self.failures = failures
+        self.batches = []
+
+    def add(self, documents, metadatas, ids, embeddings=None, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection reset")
+        self.batches.append({"documents": documents, "ids": ids, "embeddings": embeddings, "kwargs": kwargs})
+
+    def delete_ids(self, ids):
+        self.batches = [batch for batch in self.batches if not set(batch["ids"]) & set(ids)]
+
+
+class LegacyDB(FakeDB):
+    def add(self, documents, metadatas, ids, **kwargs):
+        super().add(documents, metadatas, ids, **kwargs)
+
+
+def make_chunks(count):
+    return [(f"id-{idx}", f"chunk {idx}", {"idx": idx}) for idx in range(count)]
+
+
+def test_writes_all_chunks_in_batches():
+    db = FakeDB(FakeEmbedder())
+    pipeline = IngestionPipeline(db, batch_size=4, embed_concurrency=2)
+
+    documents, metadatas, ids, skipped = pipeline.run(iter(make_chunks(10)), foo="bar")
+
+    assert ids == [f"id-{idx}" for idx in range(10)]
+    assert documents == [f"chunk {idx}" for idx in range(10)]
+    assert [m["idx"] for m in metadatas] == list(range(10))
+    assert skipped == 0
+    assert [len(batch["ids"]) for batch in db.batches] == [4, 4, 2]
+    assert db.batches[0]["embeddings"] == [[7.0]] * 4
+    assert db.batches[0]["kwargs"] == {"foo": "bar"}
+
+
+def test_embedding_overlaps_with_writes():
+    embedder = FakeEmbedder()
+    db = FakeDB(embedder)
+    overlapped = []
+    add = db.add
+
+    def slow_add(documents, metadatas, ids, embeddings=None, **kwargs):
+        # The next batch is embedded while this one is being written
+        if not db.batches:
+            overlapped.append(_wait_for(lambda: embedder.calls >= 2))
+        add(documents, metadatas, ids, embeddings=embeddings, **kwargs)
+
+    db.add = slow_add
+    IngestionPipeline(db, batch_size=2, embed_concurrency=1).run(make_chunks(6))
+
+    assert overlapped == [True]
+    assert len(db.batches) == 3
+
+
+def test_skips_stored_and_empty_chunks():
+    db = FakeDB(FakeEmbedder())
+    chunks = make_chunks(6) + [("id-empty", "", {})]
+
+    _, _, ids, skipped = IngestionPipeline(db, batch_size=3).run(
+        chunks, existing_ids=lambda batch_ids: {"id-1", "id-4"} & set(batch_ids)
+    )
+
+    assert ids == ["id-0", "id-2", "id-3", "id-5"]
+    assert skipped == 2
+
+
+def test_retries_failed_batches():
+    embedder = FakeEmbedder(failures=2)
+    db = FakeDB(embedder, failures=1)
+    pipeline = IngestionPipeline(db, batch_size=10, max_retries=3, retry_delay=0)
+
+    _, _, ids, _ = pipeline.run(make_chunks(5))
+
+    assert len(ids) == 5
+    assert embedder.calls == 3
+    assert pipeline.stats["retries"] == 3
+
+
+def test_raises_when_retries_are_exhausted():
+    db = FakeDB(FakeEmbedder(failures=10))
+
+    with pytest.raises(RuntimeError, match="Failed to embed a batch of chunks after 2 attempts"):
+        IngestionPipeline(db, batch_size=2, max_retries=1, retry_delay=0).run(make_chunks(6))
+    assert db.batches == []
+
+
+def test_written_batches_are_rolled_back_on_failure():
+    db = FakeDB(FakeEmbedder())
+    add = db.add
+
+    def failing_add(documents, metadatas, ids, embeddings=None, **kwargs):
+        if len(db.batches) == 2:
+            raise ConnectionError("connection reset")
+        add(documents, metadatas, ids, embeddings=embeddings, **kwargs)
+
+    db.add = failing_add
+    with pytest.raises(RuntimeError, match="Failed to write a batch of chunks"):
+        IngestionPipeline(db, batch_size=2, max_retries=0).run(make_chunks(6))
+    assert db.batches == []
+
+
+def test_loader_errors_are_raised():
+    def chunks():
+        yield from make_chunks(3)
+        raise ValueError("broken file")
+
+    with pytest.raises(ValueError, match="broken file"):
+        IngestionPipeline(FakeDB(FakeEmbedder()), batch_size=2).run(chunks())
+
+
+def test_databases_without_precomputed_embeddings_embed_themselves():
+    embedder = FakeEmbedder()
+    db = LegacyDB(embedder)
+
+    _, _, ids, _ = IngestionPipeline(db, batch_size=2).run(make_chunks(3))
+
+    assert len(ids) == 3
+    assert embedder.calls == 0
+    assert "embeddings" not in db.batches[0]["kwargs"]
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
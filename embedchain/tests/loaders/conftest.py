@@ -0,0 +1,93 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+
+class FixtureSite:
+    """Pages served by a local HTTP server, with a log of the requests it received."""
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+        self.latency = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.base_url = None
+
+    def add(self, path, body, status=200, etag=None, content_type="text/html"):
+        self.pages[path] = (status, body.encode() if isinstance(body, str) else body, etag, content_type)
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+
+@pytest.fixture
+def fixture_site():
+    site = FixtureSite()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with site.lock:
+                site.requests.append((self.path, dict(self.headers), time.monotonic(), self.client_address[1]))
+                site.in_flight += 1
+                site.max_in_flight = max(site.max_in_flight, site.in_flight)
+            try:
+                time.sleep(site.latency)
+                status, body, etag, content_type = site.pages.get(self.path, (404, b"not found", None, "text/plain"))
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with site.lock:
+                    site.in_flight -= 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+class MockedResponses:
+    """Canned responses by URL, served to httpx through a MockTransport."""
+
+    def __init__(self):
+        self.routes = {}
+        self.transport = httpx.MockTransport(self._handle)
+
+    def get(self, url, body="", status=200, content_type="text/plain"):
+        self.routes[url] = (status, body, content_type)
+
+    def _handle(self, request):
+        url = str(request.url)
+        if url not in self.routes:
+            raise httpx.ConnectError(f"No response registered for {url}", request=request)
+        status, body, content_type = self.routes[url]
+        return httpx.Response(status, content=body.encode(), headers={"Content-Type": content_type})
+
+
+@pytest.fixture
+def mocked_responses():
+    return MockedResponses()
@@ -0,0 +1,106 @@
+import pytest
+
+from embedchain.loaders.sitemap import SitemapLoader
+from embedchain.utils.crawler import AsyncCrawler
+
+
+def test_stream_fetches_all_pages(fixture_site):
+    for idx in range(10):
+        fixture_site.add(f"/page{idx}", f"page {idx}")
+
+    pages = list(AsyncCrawler().stream(fixture_site.url(f"/page{idx}") for idx in range(10)))
+
+    assert sorted(page.text for page in pages) == sorted(f"page {idx}" for idx in range(10))
+    assert all(page.ok and not page.from_cache for page in pages)
+
+
+def test_per_host_concurrency_limit(fixture_site):
+    fixture_site.latency = 0.05
+    for idx in range(12):
+        fixture_site.add(f"/page{idx}", "ok")
+
+    AsyncCrawler(max_connections=12, max_per_host=3).fetch_all(fixture_site.url(f"/page{idx}") for idx in range(12))
+
+    assert len(fixture_site.requests) == 12
+    assert fixture_site.max_in_flight <= 3
+
+
+def test_connections_are_reused(fixture_site):
+    for idx in range(5):
+        fixture_site.add(f"/page{idx}", "ok")
+
+    AsyncCrawler(max_connections=1).fetch_all(fixture_site.url(f"/page{idx}") for idx in range(5))
+
+    assert len({request[3] for request in fixture_site.requests}) == 1
+
+
+def test_politeness_delay(fixture_site):
+    for idx in range(4):
+        fixture_site.add(f"/page{idx}", "ok")
+
+    AsyncCrawler(delay=0.05).fetch_all(fixture_site.url(f"/page{idx}") for idx in range(4))
+
+    starts = sorted(request[2] for request in fixture_site.requests)
+    assert all(later - earlier >= 0.04 for earlier, later in zip(starts, starts[1:]))
+
+
+def test_conditional_requests_use_the_disk_cache(fixture_site, tmp_path):
+    fixture_site.add("/page", "cached body", etag='"v1"')
+    url = fixture_site.url("/page")
+
+    first = AsyncCrawler(cache_dir=str(tmp_path)).fetch_all([url])[url]
+    crawler = AsyncCrawler(cache_dir=str(tmp_path))
+    second = crawler.fetch_all([url])[url]
+
+    assert not first.from_cache
+    assert second.from_cache and second.status_code == 200 and second.text == "cached body"
+    assert fixture_site.requests[1][1].get("If-None-Match") == '"v1"'
+    assert crawler.stats["not_modified"] == 1
+
+
+def test_discover_and_max_pages(fixture_site):
+    for idx in range(10):
+        fixture_site.add(f"/page{idx}", f"/page{idx + 1}")
+
+    def discover(page):
+        return [fixture_site.url(page.text)]
+
+    pages = list(AsyncCrawler().stream([fixture_site.url("/page0")], discover=discover, max_pages=4))
+
+    assert sorted(page.url for page in pages) == [fixture_site.url(f"/page{idx}") for idx in range(4)]
+
+
+def test_stream_can_be_abandoned(fixture_site):
+    for idx in range(50):
+        fixture_site.add(f"/page{idx}", "ok")
+
+    stream = AsyncCrawler().stream(fixture_site.url(f"/page{idx}") for idx in range(50))
+    next(stream)
+    stream.close()
+
+
+def test_request_errors_are_skipped(fixture_site):
+    fixture_site.add("/page", "ok")
+    crawler = AsyncCrawler(timeout=1)
+
+    pages = crawler.fetch_all([fixture_site.url("/page"), "http://127.0.0.1:1/unreachable"])
+
+    assert list(pages) == [fixture_site.url("/page")]
+    assert crawler.stats["errors"] == 1
+
+
+def test_sitemap_loader_streams_pages(fixture_site):
+    # The sitemap is parsed with BeautifulSoup's "xml" builder, which needs lxml
+    pytest.importorskip("lxml")
+    for idx in range(3):
+        fixture_site.add(f"/page{idx}", f"<html><body><p>Page number {idx}</p></body></html>")
+    fixture_site.add("/missing-page", "gone", status=404)
+    locs = "".join(f"<url><loc>{fixture_site.url(path)}</loc></url>" for path in ("/page0", "/page1", "/page2", "/missing-page"))
+    fixture_site.add("/sitemap.xml", f'<?xml version="1.0"?><urlset>{locs}</urlset>', content_type="application/xml")
+
+    result = SitemapLoader().load_data(fixture_site.url("/sitemap.xml"))
+
+    assert not isinstance(result["data"], list)
+    records = list(result["data"])
+    assert sorted(record["content"] for record in records) == [f"Page number {idx}" for idx in range(3)]
+    assert sorted(record["meta_data"]["url"] for record in records) == [fixture_site.url(f"/page{idx}") for idx in range(3)]
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from embedchain.loaders import directory_loader
+from embedchain.loaders.directory_loader import DirectoryLoader
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "nested").mkdir(parents=True)
+    (docs / "a.txt").write_text("alpha")
+    (docs / "b.txt").write_text("beta")
+    (docs / "nested" / "c.txt").write_text("gamma")
+    (docs / ".hidden.txt").write_text("hidden")
+    return docs
+
+
+def _contents(result):
+    return sorted(record["content"] for record in result["data"])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_data(docs_dir, max_workers):
+    result = DirectoryLoader(config={"max_workers": max_workers}).load_data(str(docs_dir))
+
+    records = list(result["data"])
+    assert sorted(record["content"] for record in records) == ["alpha", "beta", "gamma"]
+    assert all(record["meta_data"]["directory"] == str(docs_dir) for record in records)
+
+
+def test_load_data_non_recursive_with_extensions(docs_dir):
+    (docs_dir / "d.md").write_text("delta")
+    loader = DirectoryLoader(config={"recursive": False, "extensions": [".txt"], "max_workers": 1})
+
+    assert _contents(loader.load_data(str(docs_dir))) == ["alpha", "beta"]
+
+
+def test_load_data_invalid_path(tmp_path):
+    with pytest.raises(ValueError):
+        DirectoryLoader().load_data(str(tmp_path / "missing"))
+
+
+def test_manifest_skips_unchanged_files(docs_dir, tmp_path, mocker):
+    config = {"max_workers": 1, "cache_dir": str(tmp_path / "cache")}
+    first = DirectoryLoader(config=config).load_data(str(docs_dir))
+    assert _contents(first) == ["alpha", "beta", "gamma"]
+
+    parsed = mocker.spy(directory_loader, "_load_file")
+    unchanged = DirectoryLoader(config=config).load_data(str(docs_dir))
+    assert _contents(unchanged) == ["alpha", "beta", "gamma"]
+    assert unchanged["doc_id"] == first["doc_id"]
+    assert parsed.call_count == 0
+
+    (docs_dir / "b.txt").write_text("beta, edited")
+    # A touched file with the same content is not parsed again either
+    os.utime(docs_dir / "a.txt", (0, 0))
+    changed = DirectoryLoader(config=config).load_data(str(docs_dir))
+    assert _contents(changed) == ["alpha", "beta, edited", "gamma"]
+    assert changed["doc_id"] != first["doc_id"]
+    assert [call.args[0] for call in parsed.call_args_list] == [str(docs_dir / "b.txt")]
+    assert len(list((tmp_path / "cache").glob("*/records/*.json"))) == 3
+
+
+def test_manifest_is_kept_per_directory(docs_dir, tmp_path, mocker):
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    (other_dir / "e.txt").write_text("epsilon")
+    config = {"max_workers": 1, "cache_dir": str(tmp_path / "cache")}
+    _contents(DirectoryLoader(config=config).load_data(str(docs_dir)))
+    _contents(DirectoryLoader(config=config).load_data(str(other_dir)))
+
+    parsed = mocker.spy(directory_loader, "_load_file")
+    assert _contents(DirectoryLoader(config=config).load_data(str(docs_dir))) == ["alpha", "beta", "gamma"]
+    assert _contents(DirectoryLoader(config=config).load_data(str(other_dir))) == ["epsilon"]
+    assert parsed.call_count == 0
+
+
+def test_stored_files_are_skipped(docs_dir):
+    loader = DirectoryLoader(config={"max_workers": 1})
+    first = list(loader.load_data(str(docs_dir))["data"])
+    stored_files = {record["meta_data"]["url"]: record["meta_data"]["file_hash"] for record in first}
+
+    (docs_dir / "b.txt").write_text("beta, edited")
+    result = loader.load_data(str(docs_dir), stored_files=stored_files)
+
+    assert _contents(result) == ["beta, edited"]
+    assert loader.skipped_files == [str(docs_dir / "a.txt"), str(docs_dir / "nested" / "c.txt")]
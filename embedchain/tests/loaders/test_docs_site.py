@@ -1,75 +1,96 @@
 import hashlib
-from unittest.mock import Mock, patch
 
 import pytest
-from requests import Response
 
 from embedchain.loaders.docs_site_loader import DocsSiteLoader
 
 
-@pytest.fixture
-def mock_requests_get():
-    with patch("requests.get") as mock_get:
-        yield mock_get
-
-
 @pytest.fixture
 def docs_site_loader():
     return DocsSiteLoader()
 
 
-def test_get_child_links_recursive(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.text = """
+def test_get_child_links_recursive(fixture_site, docs_site_loader):
+    html = """
         <html>
             <a href="/page1">Page 1</a>
             <a href="/page2">Page 2</a>
         </html>
     """
-    mock_requests_get.return_value = mock_response
+    for path in ("/", "/page1", "/page2"):
+        fixture_site.add(path, html)
 
-    docs_site_loader._get_child_links_recursive("https://example.com")
+    docs_site_loader._crawl(fixture_site.url("/"))
 
     assert len(docs_site_loader.visited_links) == 2
-    assert "https://example.com/page1" in docs_site_loader.visited_links
-    assert "https://example.com/page2" in docs_site_loader.visited_links
+    assert fixture_site.url("/page1") in docs_site_loader.visited_links
+    assert fixture_site.url("/page2") in docs_site_loader.visited_links
 
 
-def test_get_child_links_recursive_status_not_200(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_requests_get.return_value = mock_response
+def test_get_child_links_recursive_status_not_200(fixture_site, docs_site_loader):
+    fixture_site.add("/", "<html></html>", status=404)
 
-    docs_site_loader._get_child_links_recursive("https://example.com")
+    docs_site_loader._crawl(fixture_site.url("/"))
 
     assert len(docs_site_loader.visited_links) == 0
 
 
-def test_get_all_urls(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.text = """
+def test_get_child_links():
+    html = """
         <html>
             <a href="/page1">Page 1</a>
             <a href="/page2">Page 2</a>
             <a href="https://example.com/external">External</a>
         </html>
     """
-    mock_requests_get.return_value = mock_response
 
-    all_urls = docs_site_loader._get_all_urls("https://example.com")
+    links = DocsSiteLoader._get_child_links("https://example.com", html)
+
+    assert links == {"https://example.com/page1", "https://example.com/page2", "https://example.com/external"}
+
+
+def test_get_child_links_stay_on_the_start_host():
+    html = """
+        <html>
+            <a href="/docs/page1#intro">Page 1</a>
+            <a href="page2">Page 2</a>
+            <a href="/blog">Blog</a>
+            <a href="//other.com/docs/page3">Scheme-relative</a>
+            <a href="https://other.com/docs/page4">Other host</a>
+            <a href="http://example.com/docs/page5">Other scheme</a>
+        </html>
+    """
+
+    links = DocsSiteLoader._get_child_links("https://example.com/docs/", html)
+
+    assert links == {"https://example.com/docs/page1", "https://example.com/docs/page2"}
 
-    assert len(all_urls) == 3
-    assert "https://example.com/page1" in all_urls
-    assert "https://example.com/page2" in all_urls
-    assert "https://example.com/external" in all_urls
 
+def test_crawl_stops_after_max_pages(fixture_site):
+    fixture_site.add("/", "".join(f'<a href="/page{idx}">Page {idx}</a>' for idx in range(10)))
+    for idx in range(10):
+        fixture_site.add(f"/page{idx}", f"<main>Page {idx}</main>")
 
-def test_load_data_from_url(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.content = """
+    data = DocsSiteLoader(config={"max_pages": 4}).load_data(fixture_site.url("/"))
+
+    assert len(fixture_site.requests) == 4
+    assert len(data["data"]) == 3
+
+
+def test_each_page_is_fetched_once(fixture_site, docs_site_loader):
+    fixture_site.add("/docs", '<a href="/docs/a">A</a><a href="/docs/b">B</a>')
+    fixture_site.add("/docs/a", '<main>A</main><a href="/docs/a/deep">Deep</a>')
+    fixture_site.add("/docs/b", "<main>B</main>")
+    fixture_site.add("/docs/a/deep", "<main>Deep</main>")
+
+    data = docs_site_loader.load_data(fixture_site.url("/docs"))
+
+    assert sorted(record["content"] for record in data["data"]) == ["A", "B", "Deep"]
+    assert sorted(request[0] for request in fixture_site.requests) == ["/docs", "/docs/a", "/docs/a/deep", "/docs/b"]
+
+
+def test_parse_page():
+    html = """
         <html>
             <nav>
                 <h1>Navigation</h1>
@@ -79,52 +100,37 @@ def test_load_data_from_url(mock_requests_get, docs_site_loader):
             </article>
         </html>
     """.encode()
-    mock_requests_get.return_value = mock_response
 
-    data = docs_site_loader._load_data_from_url("https://example.com/page1")
+    data = DocsSiteLoader._parse_page("https://example.com/page1", html)
 
     assert len(data) == 1
     assert data[0]["content"] == "Article Content"
     assert data[0]["meta_data"]["url"] == "https://example.com/page1"
 
 
-def test_load_data_from_url_status_not_200(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_requests_get.return_value = mock_response
-
-    data = docs_site_loader._load_data_from_url("https://example.com/page1")
-
-    assert data == []
-    assert len(data) == 0
-
-
-def test_load_data(mock_requests_get, docs_site_loader):
-    mock_response = Response()
-    mock_response.status_code = 200
-    mock_response._content = """
+def test_load_data(fixture_site, docs_site_loader):
+    html = """
         <html>
             <a href="/page1">Page 1</a>
             <a href="/page2">Page 2</a>
-        """.encode()
-    mock_requests_get.return_value = mock_response
+        """
+    for path in ("/", "/page1", "/page2"):
+        fixture_site.add(path, html)
 
-    url = "https://example.com"
+    url = fixture_site.url("/")
     data = docs_site_loader.load_data(url)
-    expected_doc_id = hashlib.sha256((" ".join(docs_site_loader.visited_links) + url).encode()).hexdigest()
+    expected_doc_id = hashlib.sha256((" ".join(sorted(docs_site_loader.visited_links)) + url).encode()).hexdigest()
 
     assert len(data["data"]) == 2
     assert data["doc_id"] == expected_doc_id
 
 
-def test_if_response_status_not_200(mock_requests_get, docs_site_loader):
-    mock_response = Response()
-    mock_response.status_code = 404
-    mock_requests_get.return_value = mock_response
+def test_if_response_status_not_200(fixture_site, docs_site_loader):
+    fixture_site.add("/", "<html></html>", status=404)
 
-    url = "https://example.com"
+    url = fixture_site.url("/")
     data = docs_site_loader.load_data(url)
-    expected_doc_id = hashlib.sha256((" ".join(docs_site_loader.visited_links) + url).encode()).hexdigest()
+    expected_doc_id = hashlib.sha256((" ".join(sorted(docs_site_loader.visited_links)) + url).encode()).hexdigest()
 
     assert len(data["data"]) == 0
     assert data["doc_id"] == expected_doc_id
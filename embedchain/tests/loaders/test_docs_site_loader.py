@@ -1,5 +1,4 @@
 import pytest
-import responses
 from bs4 import BeautifulSoup
 
 
@@ -206,13 +205,7 @@ def test_load_data_fails_to_fetch_website(loader, mocked_responses, mocker):
 
 
 @pytest.fixture
-def loader():
+def loader(mocked_responses):
     from embedchain.loaders.docs_site_loader import DocsSiteLoader
 
-    return DocsSiteLoader()
-
-
-@pytest.fixture
-def mocked_responses():
-    with responses.RequestsMock() as rsps:
-        yield rsps
+    return DocsSiteLoader(config={"transport": mocked_responses.transport})
@@ -0,0 +1,142 @@
+import os
+import time
+
+import pytest
+
+from embedchain import App
+from embedchain.cache import AnswerCache
+from embedchain.config import AppConfig, CacheConfig, ChromaDbConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.vectordb.chroma import ChromaDB
+
+os.environ["OPENAI_API_KEY"] = "test-api-key"
+
+VECTORS = {
+    "what is the refund policy": [1.0, 0.0, 0.0],
+    "what's the refund policy?": [0.95, 0.05, 0.0],
+    "how do i reset my password": [0.0, 1.0, 0.0],
+}
+CONTEXTS = [("Refunds are accepted within 30 days.", {"doc_id": "doc-1", "hash": "source-1"})]
+
+
+def make_cache(**kwargs):
+    return AnswerCache(embedding_fn=lambda query: VECTORS[query], **kwargs)
+
+
+def test_similar_query_with_same_contexts_hits():
+    cache = make_cache(similarity_threshold=0.9)
+    cache.put(cache.key("scope", "what is the refund policy", CONTEXTS), "30 days")
+
+    assert cache.get(cache.key("scope", "what's the refund policy?", CONTEXTS)) == "30 days"
+    assert cache.get(cache.key("scope", "how do i reset my password", CONTEXTS)) is None
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_different_contexts_or_scope_miss():
+    cache = make_cache()
+    cache.put(cache.key("scope", "what is the refund policy", CONTEXTS), "30 days")
+
+    other_contexts = CONTEXTS + [("Refunds of sale items are not accepted.", {"doc_id": "doc-2"})]
+    assert cache.get(cache.key("scope", "what is the refund policy", other_contexts)) is None
+    assert cache.get(cache.key("other-scope", "what is the refund policy", CONTEXTS)) is None
+
+
+def test_exact_match_strategy():
+    cache = AnswerCache(embedding_fn=None, exact_match=True)
+    cache.put(cache.key("scope", "what is the refund policy", CONTEXTS), "30 days")
+
+    assert cache.get(cache.key("scope", "what is the refund policy", CONTEXTS)) == "30 days"
+    assert cache.get(cache.key("scope", "what's the refund policy?", CONTEXTS)) is None
+
+
+def test_invalidate_by_doc_id_and_source_hash():
+    cache = make_cache()
+    cache.put(cache.key("scope", "what is the refund policy", CONTEXTS), "30 days")
+    cache.put(cache.key("scope", "how do i reset my password", [("Use the reset link.", {"doc_id": "doc-2"})]), "link")
+
+    assert cache.invalidate(doc_ids=["doc-1"]) == 1
+    assert cache.invalidate(source_hashes=["source-1"]) == 0
+    assert cache.stats()["size"] == 1
+
+
+def test_max_size_evicts_least_recently_used():
+    cache = make_cache(max_size=2)
+    refund = cache.key("scope", "what is the refund policy", CONTEXTS)
+    cache.put(refund, "30 days")
+    cache.put(cache.key("scope-2", "what is the refund policy", CONTEXTS), "30 days")
+    cache.get(refund)
+    cache.put(cache.key("scope-3", "what is the refund policy", CONTEXTS), "30 days")
+
+    assert cache.get(refund) == "30 days"
+    assert cache.get(cache.key("scope-2", "what is the refund policy", CONTEXTS)) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expires_entries():
+    cache = make_cache(ttl=0.01)
+    cache.put(cache.key("scope", "what is the refund policy", CONTEXTS), "30 days")
+    time.sleep(0.02)
+
+    assert cache.get(cache.key("scope", "what is the refund policy", CONTEXTS)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.fixture
+def cached_app(tmp_path, mocker):
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(
+        EmbeddingFunc(lambda texts: [[float(len(text)), float(sum(map(ord, text)) % 97), 1.0] for text in texts])
+    )
+    embedder.set_vector_dimension(3)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder, cache_config=CacheConfig())
+    llm_query = mocker.patch.object(app.llm, "query", side_effect=lambda **kwargs: f"answer {llm_query.call_count}")
+    yield app, llm_query
+    app.db.reset()
+
+
+def test_app_serves_repeated_queries_from_cache(cached_app, tmp_path):
+    app, llm_query = cached_app
+    path = tmp_path / "faq.txt"
+    path.write_text("Refunds are accepted within 30 days.")
+    app.add(str(path), data_type="text_file")
+
+    first = app.query("what is the refund policy")
+    second, contexts = app.query("what is the refund policy", citations=True)
+
+    assert first == second == "answer 1"
+    assert llm_query.call_count == 1
+    assert contexts[0][0] == "Refunds are accepted within 30 days."
+    assert app.answer_cache.stats()["hits"] == 1
+
+
+def test_chat_answers_depend_on_the_session_history(cached_app, tmp_path, mocker):
+    app, llm_query = cached_app
+    mocker.patch.object(app.llm, "add_history")
+    history = mocker.patch.object(app.llm.memory, "get", return_value=[])
+    path = tmp_path / "faq.txt"
+    path.write_text("Refunds are accepted within 30 days.")
+    app.add(str(path), data_type="text_file")
+
+    assert app.chat("and for sale items?") == "answer 1"
+    assert app.chat("and for sale items?") == "answer 1"
+
+    history.return_value = ["human: what is the refund policy", "ai: 30 days"]
+    assert app.chat("and for sale items?") == "answer 2"
+    assert llm_query.call_count == 2
+
+
+def test_app_invalidates_answers_when_data_changes(cached_app, tmp_path):
+    app, llm_query = cached_app
+    path = tmp_path / "faq.txt"
+    path.write_text("Refunds are accepted within 30 days.")
+    source_hash = app.add(str(path), data_type="text_file")
+    app.query("what is the refund policy")
+
+    path.write_text("Refunds are accepted within 14 days.")
+    app.add(str(path), data_type="text_file")
+    assert app.answer_cache.stats()["size"] == 0
+    assert app.query("what is the refund policy") == "answer 2"
+
+    app.delete(source_hash)
+    assert app.answer_cache.stats()["size"] == 0
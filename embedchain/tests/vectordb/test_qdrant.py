@@ -2,6 +2,7 @@ import unittest
 import uuid
 
 from mock import patch
+from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Batch
 
@@ -162,6 +163,27 @@ class TestQdrantDB(unittest.TestCase):
             collection_name="embedchain-store-1536"
         )
 
+    @patch("embedchain.vectordb.qdrant.QdrantClient", side_effect=lambda **kwargs: QdrantClient(":memory:"))
+    def test_update_metadatas_replaces_metadata(self, qdrant_client_mock):
+        # Set the embedder
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(mock_embedding_fn)
+
+        # Create a Qdrant instance backed by an in-memory Qdrant
+        db = QdrantDB()
+        app_config = AppConfig(collect_metrics=False)
+        App(config=app_config, db=db, embedding_model=embedder)
+
+        chunk_id = str(uuid.uuid4())
+        db.add(documents=["chunk text"], metadatas=[{"doc_id": "old", "version": 1}], ids=[chunk_id])
+        db.update_metadatas([chunk_id], [{"doc_id": "new"}])
+
+        self.assertEqual(db.get(ids=[chunk_id])["metadatas"], [{"doc_id": "new", "text": "chunk text"}])
+        point = db.client.retrieve(collection_name=db.collection_name, ids=[chunk_id])[0]
+        self.assertEqual(point.payload["text"], "chunk text")
+        self.assertEqual(point.payload["identifier"], chunk_id)
+
 
 if __name__ == "__main__":
     unittest.main()
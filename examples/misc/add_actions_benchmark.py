@@ -0,0 +1,143 @@
+"""
+Benchmark how long `Memory.add` takes to apply a large consolidation.
+
+The LLM is scripted to extract `--facts` facts and to answer with one ADD, UPDATE or DELETE event
+per fact, and the embedder and vector store are simulated with a fixed network latency, so the run
+needs no API keys or servers. Every vector store call counts as one round trip.
+
+Usage:
+    python examples/misc/add_actions_benchmark.py --facts 10 50 100
+    python examples/misc/add_actions_benchmark.py --embed-ms 30 --store-ms 10 --max-workers 16
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from mem0 import Memory
+from mem0.embeddings.base import EmbeddingBase
+from mem0.vector_stores.base import VectorStoreBase
+
+
+class Record:
+    def __init__(self, idx: int):
+        self.id = f"mem-{idx}"
+        self.score = 0.9
+        self.payload = {"data": f"memory {idx}", "user_id": "alice"}
+
+
+class ScriptedLLM:
+    def __init__(self, facts: int):
+        self.facts = facts
+
+    def generate_response(self, messages, response_format=None, **kwargs):
+        # Fact extraction sends a system and a user message, the update decision a single user message
+        if len(messages) == 1:
+            events = ("ADD", "UPDATE", "DELETE")
+            actions = [
+                {"id": str(idx), "text": f"fact {idx}", "event": events[idx % 3], "old_memory": f"memory {idx}"}
+                for idx in range(self.facts)
+            ]
+            return json.dumps({"memory": actions})
+        return json.dumps({"facts": [f"fact {idx}" for idx in range(self.facts)]})
+
+
+class SimulatedEmbedder(EmbeddingBase):
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, text, memory_action=None):
+        time.sleep(self.latency)
+        return [0.1, 0.2, 0.3]
+
+
+class SimulatedVectorStore(VectorStoreBase):
+    def __init__(self, latency: float, records: int):
+        self.latency = latency
+        self.records = records
+        self.round_trips = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        time.sleep(self.latency)
+
+    def search(self, query, vectors, limit=5, filters=None):
+        self._round_trip()
+        idx = int(query.split()[-1])
+        return [Record(idx)]
+
+    def insert(self, vectors, payloads=None, ids=None):
+        self._round_trip()
+
+    def delete(self, vector_id):
+        self._round_trip()
+
+    def update(self, vector_id, vector=None, payload=None):
+        self._round_trip()
+
+    def get(self, vector_id):
+        self._round_trip()
+        return Record(int(vector_id.split("-")[-1]))
+
+    def batch_get(self, vector_ids):
+        self._round_trip()
+        return [Record(int(vector_id.split("-")[-1])) for vector_id in vector_ids]
+
+    def batch_update(self, vector_ids, vectors=None, payloads=None):
+        self._round_trip()
+
+    def batch_delete(self, vector_ids):
+        self._round_trip()
+
+    def create_col(self, name, vector_size, distance):
+        pass
+
+    def list_cols(self):
+        return []
+
+    def delete_col(self):
+        pass
+
+    def col_info(self):
+        return {}
+
+    def list(self, filters=None, limit=None):
+        return [[]]
+
+    def reset(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--facts", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--embed-ms", type=float, default=50.0, help="Simulated embedding latency")
+    parser.add_argument("--store-ms", type=float, default=20.0, help="Simulated vector store latency")
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {
+            "vector_store": {"provider": "qdrant", "config": {"path": os.path.join(tmp_dir, "qdrant")}},
+            "history_db_path": os.path.join(tmp_dir, "history.db"),
+            "max_workers": args.max_workers,
+        }
+        memory = Memory.from_config(config)
+        memory.embedding_model = SimulatedEmbedder(args.embed_ms / 1000)
+
+        print(f"{'facts':>6} {'seconds':>9} {'store round trips':>18}")
+        for facts in args.facts:
+            memory.llm = ScriptedLLM(facts)
+            memory.vector_store = SimulatedVectorStore(args.store_ms / 1000, facts)
+            began = time.perf_counter()
+            memory.add("I changed a lot of things about myself", user_id="alice")
+            elapsed = time.perf_counter() - began
+            print(f"{facts:>6} {elapsed:>9.2f} {memory.vector_store.round_trips:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark `Memory.add_many` against calling `Memory.add` once per conversation.
+
+The LLM, embedder and vector store are simulated with a fixed network latency, so the run needs no API
+keys or servers. Every conversation yields `--facts` facts that the scripted LLM decides to ADD. The
+embedder and vector store answer a batch call with the same latency as a single one, like a remote API.
+
+Usage:
+    python examples/misc/add_many_benchmark.py --conversations 200 --users 50
+    python examples/misc/add_many_benchmark.py --llm-ms 500 --concurrency 32
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from mem0 import Memory
+from mem0.embeddings.base import EmbeddingBase
+from mem0.vector_stores.base import VectorStoreBase
+
+
+class ScriptedLLM:
+    def __init__(self, latency: float, facts: int):
+        self.latency = latency
+        self.facts = facts
+
+    def generate_response(self, messages, response_format=None, **kwargs):
+        time.sleep(self.latency)
+        # Fact extraction sends a system and a user message, the update decision a single user message
+        if len(messages) == 2:
+            return json.dumps({"facts": [f"fact {idx}" for idx in range(self.facts)]})
+        return json.dumps({"memory": [{"text": f"fact {idx}", "event": "ADD"} for idx in range(self.facts)]})
+
+
+class SimulatedEmbedder(EmbeddingBase):
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, text, memory_action=None):
+        time.sleep(self.latency)
+        return [0.1, 0.2, 0.3]
+
+    def embed_batch(self, texts, memory_action=None):
+        time.sleep(self.latency)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+
+class SimulatedVectorStore(VectorStoreBase):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def search(self, query, vectors, limit=5, filters=None):
+        time.sleep(self.latency)
+        return []
+
+    def batch_search(self, queries, vectors, limit=5, filters=None):
+        time.sleep(self.latency)
+        return [[] for _ in queries]
+
+    def insert(self, vectors, payloads=None, ids=None):
+        time.sleep(self.latency)
+
+    def create_col(self, name, vector_size, distance):
+        pass
+
+    def delete(self, vector_id):
+        pass
+
+    def update(self, vector_id, vector=None, payload=None):
+        pass
+
+    def get(self, vector_id):
+        return None
+
+    def list_cols(self):
+        return []
+
+    def delete_col(self):
+        pass
+
+    def col_info(self):
+        return {}
+
+    def list(self, filters=None, limit=None):
+        return [[]]
+
+    def reset(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=200)
+    parser.add_argument("--users", type=int, default=50, help="Conversations are spread over this many users")
+    parser.add_argument("--facts", type=int, default=5, help="Facts extracted per conversation")
+    parser.add_argument("--llm-ms", type=float, default=300.0, help="Simulated LLM latency")
+    parser.add_argument("--embed-ms", type=float, default=50.0, help="Simulated embedding latency")
+    parser.add_argument("--store-ms", type=float, default=20.0, help="Simulated vector store latency")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    conversations = [
+        {"id": str(idx), "messages": f"conversation {idx}", "user_id": f"user-{idx % args.users}"}
+        for idx in range(args.conversations)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {
+            "vector_store": {"provider": "qdrant", "config": {"path": os.path.join(tmp_dir, "qdrant")}},
+            "history_db_path": os.path.join(tmp_dir, "history.db"),
+        }
+        memory = Memory.from_config(config)
+        memory.llm = ScriptedLLM(args.llm_ms / 1000, args.facts)
+        memory.embedding_model = SimulatedEmbedder(args.embed_ms / 1000)
+        memory.vector_store = SimulatedVectorStore(args.store_ms / 1000)
+
+        began = time.perf_counter()
+        for conversation in conversations:
+            memory.add(conversation["messages"], user_id=conversation["user_id"])
+        loop_seconds = time.perf_counter() - began
+
+        report = memory.add_many(conversations, concurrency=args.concurrency)
+
+    print(f"{'method':>10} {'seconds':>9} {'conversations/s':>16}")
+    print(f"{'add loop':>10} {loop_seconds:>9.2f} {args.conversations / loop_seconds:>16.1f}")
+    print(f"{'add_many':>10} {report['seconds']:>9.2f} {report['conversations_per_second']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
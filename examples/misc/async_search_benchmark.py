@@ -0,0 +1,140 @@
+"""
+Benchmark `AsyncMemory.search` with native async providers against the thread fallback.
+
+The embedder and vector store are simulated with a fixed network latency so that the run needs no
+API keys or servers: the sync methods block in `time.sleep` like a blocking client, the async
+methods await `asyncio.sleep` like a native asyncio client. Each concurrency level runs once with
+the providers' async clients turned off (every call goes through `asyncio.to_thread`) and once with
+them on.
+
+Usage:
+    python examples/misc/async_search_benchmark.py --concurrency 10 100 1000 5000
+    python examples/misc/async_search_benchmark.py --embed-ms 30 --search-ms 10
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from mem0 import AsyncMemory
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
+
+
+class Hit:
+    def __init__(self, idx: int):
+        self.id = f"mem-{idx}"
+        self.score = 0.9
+        self.payload = {"data": f"memory {idx}", "user_id": "alice"}
+
+
+class SimulatedEmbedder(EmbeddingBase, AsyncEmbeddingBase):
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, text, memory_action=None):
+        time.sleep(self.latency)
+        return [0.1, 0.2, 0.3]
+
+    async def aembed(self, text, memory_action=None):
+        await asyncio.sleep(self.latency)
+        return [0.1, 0.2, 0.3]
+
+
+class SimulatedVectorStore(VectorStoreBase, AsyncVectorStoreBase):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def search(self, query, vectors, limit=5, filters=None):
+        time.sleep(self.latency)
+        return [Hit(idx) for idx in range(limit)]
+
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        await asyncio.sleep(self.latency)
+        return [Hit(idx) for idx in range(limit)]
+
+    def create_col(self, name, vector_size, distance):
+        pass
+
+    def insert(self, vectors, payloads=None, ids=None):
+        pass
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        pass
+
+    def delete(self, vector_id):
+        pass
+
+    async def adelete(self, vector_id):
+        pass
+
+    def update(self, vector_id, vector=None, payload=None):
+        pass
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        pass
+
+    def get(self, vector_id):
+        return None
+
+    async def aget(self, vector_id):
+        return None
+
+    def list_cols(self):
+        return []
+
+    def delete_col(self):
+        pass
+
+    def col_info(self):
+        return {}
+
+    def list(self, filters=None, limit=None):
+        return [[]]
+
+    async def alist(self, filters=None, limit=None):
+        return [[]]
+
+    def reset(self):
+        pass
+
+
+async def run_level(memory: AsyncMemory, concurrency: int) -> float:
+    """Issue `concurrency` searches at once; return the wall time until all of them finished."""
+    began = time.perf_counter()
+    await asyncio.gather(*(memory.search(f"query {idx}", user_id="alice", limit=5) for idx in range(concurrency)))
+    return time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--embed-ms", type=float, default=50.0, help="Simulated embedding latency")
+    parser.add_argument("--search-ms", type=float, default=20.0, help="Simulated vector search latency")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {
+            "vector_store": {"provider": "qdrant", "config": {"path": os.path.join(tmp_dir, "qdrant")}},
+            "history_db_path": os.path.join(tmp_dir, "history.db"),
+        }
+        memory = asyncio.run(AsyncMemory.from_config(config))
+        memory.embedding_model = SimulatedEmbedder(args.embed_ms / 1000)
+        memory.vector_store = SimulatedVectorStore(args.search_ms / 1000)
+
+        print(f"{'searches':>9} {'mode':>8} {'seconds':>9} {'searches/s':>11}")
+        for concurrency in args.concurrency:
+            for native in (False, True):
+                memory.embedding_model.native_async = native
+                memory.vector_store.native_async = native
+                elapsed = asyncio.run(run_level(memory, concurrency))
+                mode = "native" if native else "threads"
+                print(f"{concurrency:>9} {mode:>8} {elapsed:>9.2f} {concurrency / elapsed:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark micro-batching for local embedding models under concurrent load.
+
+Every thread embeds its own texts one `embed` call at a time, the way concurrent `Memory.search`
+requests do. Each concurrency level runs once with micro-batching off and once with it on.
+
+Usage:
+    python examples/misc/embedding_batching_benchmark.py --provider huggingface --concurrency 1 4 16 64
+    python examples/misc/embedding_batching_benchmark.py --provider fastembed --wait-ms 5 --batch-size 64
+"""
+
+import argparse
+import threading
+import time
+
+from mem0.utils.factory import EmbedderFactory
+
+SAMPLE_TEXTS = [
+    "I like to go hiking on weekends",
+    "My favourite food is spicy ramen",
+    "The meeting with the design team moved to Thursday",
+    "Remind me to renew my passport before March",
+    "I am allergic to peanuts",
+    "Our quarterly revenue target is 2 million dollars",
+    "My daughter starts school in September",
+    "I prefer aisle seats on long flights",
+]
+
+
+def run_level(embedder, concurrency: int, calls_per_thread: int) -> float:
+    """Run `concurrency` threads that each embed `calls_per_thread` texts; return the wall time."""
+    start = threading.Barrier(concurrency + 1)
+
+    def worker(offset: int):
+        start.wait()
+        for i in range(calls_per_thread):
+            embedder.embed(SAMPLE_TEXTS[(offset + i) % len(SAMPLE_TEXTS)], "search")
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", choices=["huggingface", "fastembed"], default="huggingface")
+    parser.add_argument("--model", default=None, help="Model name, defaults to the provider default")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--calls-per-thread", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=32, help="micro_batch_size")
+    parser.add_argument("--wait-ms", type=float, default=5.0, help="micro_batch_wait_ms")
+    args = parser.parse_args()
+
+    print(
+        f"{'threads':>8} {'mode':>9} {'calls/s':>10} {'avg batch':>10} {'items/s':>10} "
+        f"{'avg wait ms':>12} {'max wait ms':>12}"
+    )
+    for concurrency in args.concurrency:
+        for wait_ms in (None, args.wait_ms):
+            config = {"model": args.model, "micro_batch_size": args.batch_size, "micro_batch_wait_ms": wait_ms}
+            embedder = EmbedderFactory.create(args.provider, config, None)
+            embedder.embed(SAMPLE_TEXTS[0], "search")  # warm up the model outside the timed section
+            if embedder.batching_stats() is not None:
+                embedder._batcher.reset_stats()
+
+            elapsed = run_level(embedder, concurrency, args.calls_per_thread)
+            calls_per_second = concurrency * args.calls_per_thread / elapsed
+            stats = embedder.batching_stats()
+            if stats is None:
+                print(f"{concurrency:>8} {'unbatched':>9} {calls_per_second:>10.1f}")
+            else:
+                print(
+                    f"{concurrency:>8} {'batched':>9} {calls_per_second:>10.1f} {stats['avg_batch_size']:>10.1f} "
+                    f"{stats['items_per_second']:>10.1f} {stats['avg_queue_wait_ms']:>12.2f} "
+                    f"{stats['max_queue_wait_ms']:>12.2f}"
+                )
+                embedder._batcher.close()
+
+
+if __name__ == "__main__":
+    main()
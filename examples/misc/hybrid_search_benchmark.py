@@ -0,0 +1,94 @@
+"""
+Benchmark the latency `enable_hybrid_search` adds to `Memory.search`.
+
+A local Qdrant collection and the BM25 lexical index are filled with `--memories` synthetic memories,
+embedded by a hashing bag-of-words embedder so the run needs no API keys or servers. The same queries
+are then timed with the lexical index off (vector search only) and on (vector + BM25 fused by RRF).
+
+Usage:
+    python examples/misc/hybrid_search_benchmark.py --memories 1000 10000
+    python examples/misc/hybrid_search_benchmark.py --queries 500 --limit 20
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+from mem0 import Memory
+from mem0.embeddings.base import EmbeddingBase
+
+DIMS = 256
+WORDS = [f"w{idx}" for idx in range(5000)]
+
+
+class HashingEmbedder(EmbeddingBase):
+    def embed(self, text, memory_action=None):
+        vector = [0.0] * DIMS
+        for word in text.lower().split():
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % DIMS] += 1.0
+        norm = sum(value * value for value in vector) ** 0.5 or 1.0
+        return [value / norm for value in vector]
+
+
+def fill(memory: Memory, texts):
+    ids = [str(uuid.uuid4()) for _ in texts]
+    payloads = [{"data": text, "user_id": "alice", "hash": hashlib.md5(text.encode()).hexdigest()} for text in texts]
+    vectors = [memory.embedding_model.embed(text) for text in texts]
+    for start in range(0, len(texts), 1000):
+        memory.vector_store.insert(
+            vectors=vectors[start : start + 1000], payloads=payloads[start : start + 1000], ids=ids[start : start + 1000]
+        )
+    for memory_id, payload in zip(ids, payloads):
+        memory.lexical_index.upsert(memory_id, payload["data"], payload)
+
+
+def time_searches(memory: Memory, queries, limit):
+    latencies = []
+    for query in queries:
+        began = time.perf_counter()
+        memory.search(query, user_id="alice", limit=limit)
+        latencies.append((time.perf_counter() - began) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    rng = random.Random(0)
+    print(f"{'memories':>9} {'mode':>7} {'p50 ms':>8} {'p95 ms':>8}")
+    for count in args.memories:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = {
+                "vector_store": {
+                    "provider": "qdrant",
+                    "config": {"path": os.path.join(tmp_dir, "qdrant"), "embedding_model_dims": DIMS},
+                },
+                "history_db_path": os.path.join(tmp_dir, "history.db"),
+                "enable_hybrid_search": True,
+            }
+            memory = Memory.from_config(config)
+            memory.embedding_model = HashingEmbedder()
+            fill(memory, [" ".join(rng.choices(WORDS, k=12)) for _ in range(count)])
+            queries = [" ".join(rng.choices(WORDS, k=3)) for _ in range(args.queries)]
+
+            lexical_index = memory.lexical_index
+            for mode in ("vector", "hybrid"):
+                memory.lexical_index = lexical_index if mode == "hybrid" else None
+                time_searches(memory, queries[:10], args.limit)
+                p50, p95 = time_searches(memory, queries, args.limit)
+                print(f"{count:>9} {mode:>7} {p50:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,18 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    enable_hybrid_search: bool = Field(
+        description="Maintain a BM25 lexical index next to the history database and fuse it with vector search results",
+        default=False,
+    )
+    max_workers: int = Field(
+        description="Threads that Memory shares across calls for concurrent embedding and vector store requests",
+        default=8,
+    )
+    skip_duplicate_memories: bool = Field(
+        description="Skip adding a memory whose text hash matches a memory already stored in the same session scope",
+        default=False,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -40,6 +40,9 @@ class BaseEmbedderConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = None,
+        # Local model (HuggingFace / FastEmbed) specific
+        micro_batch_size: int = 32,
+        micro_batch_wait_ms: Optional[float] = None,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -72,6 +75,11 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param micro_batch_size: Maximum number of texts a local model embeds in one forward pass, defaults to 32
+        :type micro_batch_size: int, optional
+        :param micro_batch_wait_ms: If set, concurrent embed calls to a local model are pooled for up to this many
+            milliseconds (or until micro_batch_size texts are waiting) and embedded together, defaults to None
+        :type micro_batch_wait_ms: Optional[float], optional
         """
 
         self.model = model
@@ -108,3 +116,7 @@ class BaseEmbedderConfig(ABC):
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region or os.environ.get("AWS_REGION") or "us-west-2"
 
+        # Local model specific
+        self.micro_batch_size = micro_batch_size
+        self.micro_batch_wait_ms = micro_batch_wait_ms
+
@@ -15,3 +15,9 @@ class BaseRerankerConfig(BaseModel):
     model: Optional[str] = Field(default=None, description="The reranker model to use")
     api_key: Optional[str] = Field(default=None, description="The API key for the reranker service")
     top_k: Optional[int] = Field(default=None, description="Maximum number of documents to return after reranking")
+    rerank_top_n: Optional[int] = Field(
+        default=None, description="Only pass the N highest-scoring search results to the reranker (None = all)"
+    )
+    score_cache_size: int = Field(
+        default=10000, description="Number of (query, memory) relevance scores to cache, 0 disables the cache"
+    )
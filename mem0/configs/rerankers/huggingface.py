@@ -13,5 +13,10 @@ class HuggingFaceRerankerConfig(BaseRerankerConfig):
     model: Optional[str] = Field(default="BAAI/bge-reranker-base", description="The HuggingFace model to use for reranking")
     device: Optional[str] = Field(default=None, description="Device to run the model on ('cpu', 'cuda', etc.)")
     batch_size: int = Field(default=32, description="Batch size for processing documents")
+    micro_batch_wait_ms: Optional[float] = Field(
+        default=None,
+        description="If set, pairs from concurrent searches are pooled for up to this many milliseconds "
+        "(or until batch_size pairs are waiting) and scored in one forward pass",
+    )
     max_length: int = Field(default=512, description="Maximum length for tokenization")
     normalize: bool = Field(default=True, description="Whether to normalize scores")
@@ -13,4 +13,9 @@ class SentenceTransformerRerankerConfig(BaseRerankerConfig):
     model: Optional[str] = Field(default="cross-encoder/ms-marco-MiniLM-L-6-v2", description="The cross-encoder model name to use")
     device: Optional[str] = Field(default=None, description="Device to run the model on ('cpu', 'cuda', etc.)")
     batch_size: int = Field(default=32, description="Batch size for processing documents")
+    micro_batch_wait_ms: Optional[float] = Field(
+        default=None,
+        description="If set, pairs from concurrent searches are pooled for up to this many milliseconds "
+        "(or until batch_size pairs are waiting) and scored in one forward pass",
+    )
     show_progress_bar: bool = Field(default=False, description="Whether to show progress bar during processing")
@@ -4,13 +4,17 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class QdrantConfig(BaseModel):
-    from qdrant_client import QdrantClient
+    from qdrant_client import AsyncQdrantClient, QdrantClient
 
     QdrantClient: ClassVar[type] = QdrantClient
+    AsyncQdrantClient: ClassVar[type] = AsyncQdrantClient
 
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding model")
     client: Optional[QdrantClient] = Field(None, description="Existing Qdrant client instance")
+    async_client: Optional[AsyncQdrantClient] = Field(
+        None, description="Existing async Qdrant client instance used by AsyncMemory"
+    )
     host: Optional[str] = Field(None, description="Host address for Qdrant server")
     port: Optional[int] = Field(None, description="Port for Qdrant server")
     path: Optional[str] = Field("/tmp/qdrant", description="Path for local Qdrant database")
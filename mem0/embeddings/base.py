@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
+
+import numpy as np
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 
@@ -11,6 +13,9 @@ class EmbeddingBase(ABC):
     :type config: Optional[BaseEmbedderConfig], optional
     """
 
+    # Set by local-model embedders when `micro_batch_wait_ms` is configured
+    _batcher = None
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         if config is None:
             self.config = BaseEmbedderConfig()
@@ -29,3 +34,79 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_array(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None) -> np.ndarray:
+        """
+        Get the embedding for the given text as a float32 numpy array.
+
+        Providers that produce arrays natively override this to skip the intermediate Python list.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: The embedding vector.
+        """
+        return np.asarray(self.embed(text, memory_action), dtype=np.float32)
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None) -> list:
+        """
+        Get the embeddings for several texts.
+
+        Falls back to one `embed` call per text; providers whose API takes many inputs per request override it.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of `texts`.
+        """
+        return [self.embed(text, memory_action) for text in texts]
+
+    def batching_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Get throughput and queue-wait metrics of the micro-batching queue.
+
+        Returns:
+            dict: Metrics from `MicroBatcher.stats`, or None if this embedder does not micro-batch.
+        """
+        if self._batcher is None:
+            return None
+        return self._batcher.stats()
+
+
+class AsyncEmbeddingBase(ABC):
+    """
+    Optional interface of embedders with a native asyncio client.
+
+    `AsyncMemory` awaits these methods instead of running `embed` in a worker thread, so the number of
+    embeddings in flight is not bounded by the default thread pool.
+    """
+
+    # Providers whose async client cannot be built for the current configuration turn this off
+    native_async = True
+
+    @abstractmethod
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        pass
+
+    async def aembed_array(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None) -> np.ndarray:
+        """
+        Asynchronously get the embedding for the given text as a float32 numpy array.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: The embedding vector.
+        """
+        return np.asarray(await self.aembed(text, memory_action), dtype=np.float32)
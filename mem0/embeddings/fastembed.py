@@ -1,7 +1,8 @@
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 from mem0.embeddings.base import EmbeddingBase
 from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.utils.batching import MicroBatcher
 
 try:
     from fastembed import TextEmbedding
@@ -15,6 +16,19 @@ class FastEmbedEmbedding(EmbeddingBase):
         self.config.model = self.config.model or "thenlper/gte-large"
         self.dense_model = TextEmbedding(model_name = self.config.model)
 
+        # Optionally share forward passes between concurrent embed calls
+        if self.config.micro_batch_wait_ms is not None:
+            self._batcher = MicroBatcher(
+                self._embed_batch,
+                max_batch_size=self.config.micro_batch_size,
+                max_wait_ms=self.config.micro_batch_wait_ms,
+                name="mem0-fastembed-embedder",
+            )
+
+    def _embed_batch(self, texts: List[str]) -> list:
+        """Embed several texts with a single pass through the ONNX runtime."""
+        return list(self.dense_model.embed(texts, batch_size=self.config.micro_batch_size))
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Convert the text to embeddings using FastEmbed running in the Onnx runtime
@@ -25,5 +39,7 @@ class FastEmbedEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         text = text.replace("\n", " ")
+        if self._batcher is not None:
+            return self._batcher.submit([text])[0]
         embeddings = list(self.dense_model.embed(text))
         return embeddings[0]
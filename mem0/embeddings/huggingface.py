@@ -1,11 +1,13 @@
 import logging
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
+import numpy as np
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.batching import MicroBatcher
 
 logging.getLogger("transformers").setLevel(logging.WARNING)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
@@ -26,6 +28,24 @@ class HuggingFaceEmbedding(EmbeddingBase):
 
             self.config.embedding_dims = self.config.embedding_dims or self.model.get_sentence_embedding_dimension()
 
+            # Optionally share forward passes between concurrent embed calls
+            if self.config.micro_batch_wait_ms is not None:
+                self._batcher = MicroBatcher(
+                    self._embed_batch,
+                    max_batch_size=self.config.micro_batch_size,
+                    max_wait_ms=self.config.micro_batch_wait_ms,
+                    name="mem0-huggingface-embedder",
+                )
+
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed several texts with a single forward pass of the local model, returning one row view per text."""
+        return list(self.model.encode(texts, convert_to_numpy=True, batch_size=self.config.micro_batch_size))
+
+    def _encode(self, text: str) -> np.ndarray:
+        if self._batcher is not None:
+            return self._batcher.submit([text])[0]
+        return self.model.encode(text, convert_to_numpy=True)
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Get the embedding for the given text using Hugging Face.
@@ -41,4 +61,32 @@ class HuggingFaceEmbedding(EmbeddingBase):
                 input=text, model=self.config.model, **self.config.model_kwargs
             ).data[0].embedding
         else:
-            return self.model.encode(text, convert_to_numpy=True).tolist()
+            return self._encode(text).tolist()
+
+    def embed_array(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None) -> np.ndarray:
+        """
+        Get the embedding for the given text as a float32 numpy array, without converting it to a list.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: The embedding vector.
+        """
+        if self.config.huggingface_base_url:
+            return super().embed_array(text, memory_action)
+        return np.asarray(self._encode(text), dtype=np.float32)
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None) -> list:
+        """
+        Get the embeddings for several texts, with one forward pass of the local model per batch.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of `texts`.
+        """
+        if self.config.huggingface_base_url or not texts:
+            return super().embed_batch(texts, memory_action)
+        return [row.tolist() for row in self._embed_batch(list(texts))]
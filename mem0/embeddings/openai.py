@@ -1,14 +1,19 @@
+import base64
 import os
 import warnings
 from typing import Literal, Optional
 
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
-from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
 
+# Maximum number of inputs the embeddings endpoint accepts per request
+EMBED_BATCH_SIZE = 2048
 
-class OpenAIEmbedding(EmbeddingBase):
+
+class OpenAIEmbedding(EmbeddingBase, AsyncEmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -30,6 +35,15 @@ class OpenAIEmbedding(EmbeddingBase):
             )
 
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._client_kwargs = {"api_key": api_key, "base_url": base_url}
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async client for `AsyncMemory`, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -47,3 +61,83 @@ class OpenAIEmbedding(EmbeddingBase):
             .data[0]
             .embedding
         )
+
+    def embed_array(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None) -> np.ndarray:
+        """
+        Get the embedding for the given text using OpenAI as a float32 numpy array.
+
+        The embedding is requested base64-encoded and decoded straight into the array, instead of
+        letting the client expand it into a list of Python floats first.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        encoded = (
+            self.client.embeddings.create(
+                input=[text],
+                model=self.config.model,
+                dimensions=self.config.embedding_dims,
+                encoding_format="base64",
+            )
+            .data[0]
+            .embedding
+        )
+        return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None) -> list:
+        """
+        Get the embeddings for several texts using OpenAI, with one request per `EMBED_BATCH_SIZE` texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of `texts`.
+        """
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            inputs = [text.replace("\n", " ") for text in texts[start : start + EMBED_BATCH_SIZE]]
+            response = self.client.embeddings.create(
+                input=inputs, model=self.config.model, dimensions=self.config.embedding_dims
+            )
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+        return embeddings
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text using OpenAI.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(
+            input=[text], model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return response.data[0].embedding
+
+    async def aembed_array(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None) -> np.ndarray:
+        """
+        Asynchronously get the embedding for the given text using OpenAI as a float32 numpy array.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(
+            input=[text],
+            model=self.config.model,
+            dimensions=self.config.embedding_dims,
+            encoding_format="base64",
+        )
+        return np.frombuffer(base64.b64decode(response.data[0].embedding), dtype=np.float32)
@@ -8,10 +8,10 @@ except ImportError:
 
 from mem0.configs.llms.anthropic import AnthropicConfig
 from mem0.configs.llms.base import BaseLlmConfig
-from mem0.llms.base import LLMBase
+from mem0.llms.base import AsyncLLMBase, LLMBase
 
 
-class AnthropicLLM(LLMBase):
+class AnthropicLLM(LLMBase, AsyncLLMBase):
     def __init__(self, config: Optional[Union[BaseLlmConfig, AnthropicConfig, Dict]] = None):
         # Convert to AnthropicConfig if needed
         if config is None:
@@ -37,30 +37,18 @@ class AnthropicLLM(LLMBase):
         if not self.config.model:
             self.config.model = "claude-3-5-sonnet-20240620"
 
-        api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self._api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.client = anthropic.Anthropic(api_key=self._api_key)
+        self._async_client = None
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a response based on the given messages using Anthropic.
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """Async client for `AsyncMemory`, created on first use."""
+        if self._async_client is None:
+            self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key)
+        return self._async_client
 
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional Anthropic-specific parameters.
-
-        Returns:
-            str: The generated response.
-        """
+    def _build_params(self, messages, tools, tool_choice, **kwargs) -> Dict:
         # Separate system message from other messages
         system_message = ""
         filtered_messages = []
@@ -82,6 +70,54 @@ class AnthropicLLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using Anthropic.
 
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Anthropic-specific parameters.
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._build_params(messages, tools, tool_choice, **kwargs)
         response = self.client.messages.create(**params)
         return response.content[0].text
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Asynchronously generate a response based on the given messages using Anthropic.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Anthropic-specific parameters.
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._build_params(messages, tools, tool_choice, **kwargs)
+        response = await self.async_client.messages.create(**params)
+        return response.content[0].text
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import cached_agenerate_response, cached_generate_response
 
 
 class LLMBase(ABC):
@@ -10,6 +11,16 @@ class LLMBase(ABC):
     Handles common functionality and delegates provider-specific logic to subclasses.
     """
 
+    # Optional `LLMResponseCache`; when set, temperature-0 and `cacheable=True` calls are served from it
+    response_cache = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "generate_response" in cls.__dict__:
+            cls.generate_response = cached_generate_response(cls.__dict__["generate_response"])
+        if "agenerate_response" in cls.__dict__:
+            cls.agenerate_response = cached_agenerate_response(cls.__dict__["agenerate_response"])
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, Dict]] = None):
         """Initialize a base LLM class
 
@@ -112,6 +123,10 @@ class LLMBase(ABC):
         """
         pass
 
+    def cache_stats(self) -> Optional[Dict]:
+        """Return the hit ratio and estimated tokens saved by the response cache, or None without one."""
+        return self.response_cache.stats() if self.response_cache is not None else None
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
@@ -129,3 +144,32 @@ class LLMBase(ABC):
         params.update(kwargs)
 
         return params
+
+
+class AsyncLLMBase(ABC):
+    """
+    Optional interface of LLM providers with a native asyncio client.
+
+    `AsyncMemory` awaits `agenerate_response` instead of running `generate_response` in a worker thread.
+    """
+
+    # Providers whose async client cannot be built for the current configuration turn this off
+    native_async = True
+
+    @abstractmethod
+    async def agenerate_response(
+        self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None, tool_choice: str = "auto", **kwargs
+    ):
+        """
+        Asynchronously generate a response based on the given messages.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        pass
@@ -0,0 +1,272 @@
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Set while a cached call runs, so a provider calling `super().generate_response` is not looked up twice
+_IN_CACHED_CALL = contextvars.ContextVar("mem0_llm_in_cached_call", default=False)
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count of a prompt or response (about four characters per token)."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return max(1, len(text) // 4)
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache of LLM responses with an in-memory LRU tier and an optional SQLite tier.
+
+    A response is stored under the hash of the provider, the model, the sampling parameters and the
+    hashes of the messages, tools and response format of the call, so only an identical request can
+    hit. Entries expire after `ttl` seconds in memory and `persistent_ttl` seconds on disk; the disk
+    tier survives restarts, which lets retried and replayed requests skip the LLM entirely.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: Optional[float] = 3600.0,
+        path: Optional[str] = None,
+        persistent_ttl: Optional[float] = 7 * 24 * 3600.0,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.persistent_ttl = persistent_ttl
+        self._lock = threading.Lock()
+        # key -> (response, estimated tokens, stored at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._tokens_saved = 0
+
+        self.connection = None
+        if path:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            with self._lock:
+                self.connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key        TEXT PRIMARY KEY,
+                        response   TEXT,
+                        tokens     INTEGER,
+                        created_at REAL
+                    )
+                """
+                )
+                self.connection.commit()
+
+    @classmethod
+    def from_config(cls, config) -> "LLMResponseCache":
+        return cls(
+            max_size=config.max_size, ttl=config.ttl, path=config.path, persistent_ttl=config.persistent_ttl
+        )
+
+    @staticmethod
+    def key(provider: str, model: Any, messages: Any, tools: Any, response_format: Any, params: Dict[str, Any]) -> str:
+        return _digest(
+            {
+                "provider": provider,
+                "model": model,
+                "params": params,
+                "messages": _digest(messages),
+                "tools": _digest(tools),
+                "response_format": _digest(response_format),
+            }
+        )
+
+    def get(self, key: str) -> Any:
+        """Return a copy of the cached response for `key`, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, tokens, stored_at = entry
+                if self.ttl is None or now - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    self._tokens_saved += tokens
+                    # Callers may change the response they get, which must not change the cached one
+                    return copy.deepcopy(response)
+                del self._entries[key]
+
+            if self.connection is not None:
+                row = self.connection.execute(
+                    "SELECT response, tokens, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if self.persistent_ttl is None or now - row[2] <= self.persistent_ttl:
+                        response, tokens = json.loads(row[0]), row[1]
+                        self._remember(key, response, tokens, now)
+                        self._hits += 1
+                        self._persistent_hits += 1
+                        self._tokens_saved += tokens
+                        return copy.deepcopy(response)
+                    self.connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self.connection.commit()
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, response: Any, tokens: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, copy.deepcopy(response), tokens, now)
+            if self.connection is None:
+                return
+            try:
+                serialized = json.dumps(response)
+            except (TypeError, ValueError):
+                # Responses with provider objects (e.g. tool calls) stay in the memory tier only
+                return
+            self.connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, tokens, created_at) VALUES (?, ?, ?, ?)",
+                (key, serialized, tokens, now),
+            )
+            self.connection.commit()
+
+    def _remember(self, key: str, response: Any, tokens: int, stored_at: float) -> None:
+        self._entries[key] = (response, tokens, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counters since creation (or the last `clear`).
+
+        `tokens_saved` adds up the estimated prompt and completion tokens of the requests served from the cache.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "tokens_saved": self._tokens_saved,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._persistent_hits = self._misses = self._tokens_saved = 0
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM llm_cache")
+                self.connection.commit()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def _accepts(validator: Optional[Callable[[Any], Any]], response: Any) -> bool:
+    """Whether a fresh response may be cached: it is not None and `validator` neither raises nor returns False."""
+    if response is None:
+        return False
+    if validator is None:
+        return True
+    try:
+        return validator(response) is not False
+    except Exception:
+        return False
+
+
+def _cache_lookup(llm, func, args, kwargs):
+    """Return (cache key, estimated tokens) of a cacheable call, or None if the call must not be cached."""
+    cacheable = kwargs.pop("cacheable", None)
+    if llm.response_cache is None or _IN_CACHED_CALL.get():
+        return None
+
+    arguments = inspect.signature(func).bind(llm, *args, **kwargs).arguments
+    arguments.pop("self", None)
+    for name, parameter in inspect.signature(func).parameters.items():
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.update(arguments.pop(name, {}))
+
+    temperature = arguments.get("temperature", getattr(llm.config, "temperature", None))
+    if cacheable is False or (cacheable is None and temperature != 0):
+        return None
+
+    messages = arguments.pop("messages", None)
+    tools = arguments.pop("tools", None)
+    response_format = arguments.pop("response_format", None)
+    params = {
+        "temperature": temperature,
+        "max_tokens": getattr(llm.config, "max_tokens", None),
+        "top_p": getattr(llm.config, "top_p", None),
+        **arguments,
+    }
+    provider = f"{type(llm).__module__}.{type(llm).__qualname__}"
+    key = LLMResponseCache.key(provider, getattr(llm.config, "model", None), messages, tools, response_format, params)
+    return key, estimate_tokens(messages)
+
+
+def cached_generate_response(func):
+    """
+    Serve `generate_response` from the LLM's `response_cache` for temperature-0 or `cacheable=True` calls.
+
+    A caller that parses the response passes `cache_validator=parse`; a fresh response is then only cached
+    if `parse(response)` neither raises nor returns False, so a malformed reply is asked for again next time.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        validator = kwargs.pop("cache_validator", None)
+        lookup = _cache_lookup(self, func, args, kwargs)
+        if lookup is None:
+            return func(self, *args, **kwargs)
+        key, prompt_tokens = lookup
+        response = self.response_cache.get(key)
+        if response is not None:
+            return response
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            response = func(self, *args, **kwargs)
+        finally:
+            _IN_CACHED_CALL.reset(token)
+        if _accepts(validator, response):
+            self.response_cache.put(key, response, prompt_tokens + estimate_tokens(response))
+        return response
+
+    return wrapper
+
+
+def cached_agenerate_response(func):
+    """Async counterpart of `cached_generate_response` for `agenerate_response`."""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        validator = kwargs.pop("cache_validator", None)
+        lookup = _cache_lookup(self, func, args, kwargs)
+        if lookup is None:
+            return await func(self, *args, **kwargs)
+        key, prompt_tokens = lookup
+        response = self.response_cache.get(key)
+        if response is not None:
+            return response
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            response = await func(self, *args, **kwargs)
+        finally:
+            _IN_CACHED_CALL.reset(token)
+        if _accepts(validator, response):
+            self.response_cache.put(key, response, prompt_tokens + estimate_tokens(response))
+        return response
+
+    return wrapper
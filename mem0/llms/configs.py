@@ -3,9 +3,23 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+class LlmCacheConfig(BaseModel):
+    max_size: int = Field(description="Number of responses kept in the in-memory LRU tier", default=1000)
+    ttl: Optional[float] = Field(description="Seconds a response stays in the in-memory tier", default=3600.0)
+    path: Optional[str] = Field(
+        description="SQLite file of the persistent tier, None to keep responses in memory only", default=None
+    )
+    persistent_ttl: Optional[float] = Field(
+        description="Seconds a response stays in the persistent tier", default=7 * 24 * 3600.0
+    )
+
+
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: Optional[LlmCacheConfig] = Field(
+        description="Cache of deterministic LLM responses, disabled when None", default=None
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
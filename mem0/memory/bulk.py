@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mem0.exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+def conversation_scope(filters: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the (user_id, agent_id, run_id) scope whose memories a conversation may change."""
+    return filters.get("user_id"), filters.get("agent_id"), filters.get("run_id")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether `error` is a provider telling us to slow down (HTTP 429 or a `*RateLimit*` error type)."""
+    if isinstance(error, RateLimitError):
+        return True
+    if getattr(error, "status_code", None) == 429 or getattr(error, "status", None) == 429:
+        return True
+    return "ratelimit" in type(error).__name__.lower()
+
+
+def call_with_backoff(fn: Callable[[], Any], max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+    """Call `fn`, retrying with exponential backoff and jitter while the provider rate limits it."""
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_retries or not is_rate_limit_error(e):
+                raise
+            delay = min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.0)
+            logger.warning(f"Rate limited ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+async def acall_with_backoff(fn, max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+    """Await `fn()`, retrying with exponential backoff and jitter while the provider rate limits it."""
+    for attempt in range(max_retries + 1):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == max_retries or not is_rate_limit_error(e):
+                raise
+            delay = min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.0)
+            logger.warning(f"Rate limited ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def scope_waves(items: List[Any], scope_of: Callable[[Any], Any]) -> List[List[Any]]:
+    """
+    Split `items` into waves that each hold at most one item per scope, keeping the input order per scope.
+
+    Items of a wave can be applied concurrently; the waves themselves run one after the other.
+    """
+    waves: List[List[Any]] = []
+    seen: Dict[Any, int] = {}
+    for item in items:
+        scope = scope_of(item)
+        wave = seen.get(scope, 0)
+        seen[scope] = wave + 1
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(item)
+    return waves
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BulkJob:
+    """One conversation of an `add_many` run and the state it collects on its way through the stages."""
+
+    def __init__(self, conversation_id: str, messages: list, metadata: Dict[str, Any], filters: Dict[str, Any]):
+        self.id = conversation_id
+        self.messages = messages
+        self.metadata = metadata
+        self.filters = filters
+        self.scope = conversation_scope(filters)
+        self.facts: List[str] = []
+        self.relations = None
+
+
+class Checkpoint:
+    """
+    Append-only file of the conversation IDs that `add_many` has finished.
+
+    Each finished ID is written on its own line and flushed right away, so a crashed or interrupted
+    backfill resumes after the last conversation it completed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.done = {line.rstrip("\n") for line in f if line.strip()}
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return conversation_id in self.done
+
+    def mark_done(self, conversation_ids: Iterable[str]) -> None:
+        with self._lock:
+            for conversation_id in conversation_ids:
+                if conversation_id not in self.done:
+                    self.done.add(conversation_id)
+                    self._file.write(f"{conversation_id}\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class BulkStats:
+    """Counters of an `add_many` run, reported as its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.conversations = 0
+        self.skipped = 0
+        self.failed = 0
+        self.graph_failed = 0
+        self.events = {"ADD": 0, "UPDATE": 0, "DELETE": 0}
+        self.errors: List[Dict[str, str]] = []
+
+    def record(self, results: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.conversations += 1
+            for item in results:
+                if item.get("event") in self.events:
+                    self.events[item["event"]] += 1
+
+    def record_failure(self, conversation_id: str, error: Exception) -> None:
+        with self._lock:
+            self.failed += 1
+            self.errors.append({"id": conversation_id, "error": str(error)})
+
+    def record_graph_failure(self, conversation_id: str, error: Exception) -> None:
+        """Count a conversation whose memories were stored but whose graph relations were not."""
+        with self._lock:
+            self.graph_failed += 1
+            self.errors.append({"id": conversation_id, "error": str(error), "stage": "graph"})
+
+    def record_skipped(self, count: int = 1) -> None:
+        with self._lock:
+            self.skipped += count
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._started
+        with self._lock:
+            return {
+                "conversations": self.conversations,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "graph_failed": self.graph_failed,
+                "events": dict(self.events),
+                "seconds": elapsed,
+                "conversations_per_second": self.conversations / elapsed if elapsed > 0 else 0.0,
+                "errors": list(self.errors),
+            }
+
@@ -0,0 +1,180 @@
+import logging
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Session identifiers stored alongside each document so lexical lookups stay scoped like vector searches.
+SCOPE_KEYS = ("user_id", "agent_id", "run_id", "actor_id")
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class LexicalIndex:
+    """
+    Incrementally maintained BM25 index over memory text, backed by SQLite FTS5.
+
+    One index table is shared per database file and partitioned by collection name, so several
+    `Memory` instances can point at the same history database without seeing each other's data.
+    """
+
+    def __init__(self, db_path: str = ":memory:", collection_name: str = "mem0"):
+        self.db_path = db_path
+        self.collection_name = collection_name
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._create_index_table()
+
+    def _create_index_table(self) -> None:
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+                        content,
+                        memory_id UNINDEXED,
+                        collection UNINDEXED,
+                        user_id UNINDEXED,
+                        agent_id UNINDEXED,
+                        run_id UNINDEXED,
+                        actor_id UNINDEXED
+                    )
+                """
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to create lexical index table: {e}")
+                raise
+
+    def upsert(self, memory_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Index (or re-index) the text of a memory together with its session identifiers."""
+        metadata = metadata or {}
+        scope_values = [metadata.get(key) for key in SCOPE_KEYS]
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    "DELETE FROM memory_fts WHERE memory_id = ? AND collection = ?",
+                    (memory_id, self.collection_name),
+                )
+                self.connection.execute(
+                    """
+                    INSERT INTO memory_fts (content, memory_id, collection, user_id, agent_id, run_id, actor_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (text, memory_id, self.collection_name, *scope_values),
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to index memory {memory_id}: {e}")
+                raise
+
+    def delete(self, memory_id: str) -> None:
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    "DELETE FROM memory_fts WHERE memory_id = ? AND collection = ?",
+                    (memory_id, self.collection_name),
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to remove memory {memory_id} from lexical index: {e}")
+                raise
+
+    def search(self, query: str, filters: Optional[Dict[str, Any]] = None, limit: int = 100) -> List[Tuple[str, float]]:
+        """
+        Return `(memory_id, bm25_score)` pairs for the query, best match first.
+
+        Only the session identifiers in `filters` are applied here; callers are responsible for
+        checking any other filter keys against the stored payloads.
+        """
+        tokens = _TOKEN_PATTERN.findall(query or "")
+        if not tokens:
+            return []
+
+        # Quote every token so user input can never be parsed as FTS5 query syntax
+        match_expression = " OR ".join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+
+        conditions = ["memory_fts MATCH ?", "collection = ?"]
+        params: List[Any] = [match_expression, self.collection_name]
+        for key in SCOPE_KEYS:
+            value = (filters or {}).get(key)
+            if isinstance(value, str):
+                conditions.append(f"{key} = ?")
+                params.append(value)
+        params.append(limit)
+
+        with self._lock:
+            cur = self.connection.execute(
+                f"""
+                SELECT memory_id, bm25(memory_fts) AS rank
+                FROM memory_fts
+                WHERE {" AND ".join(conditions)}
+                ORDER BY rank
+                LIMIT ?
+            """,
+                params,
+            )
+            rows = cur.fetchall()
+
+        # FTS5 bm25() is negated so that smaller is better; flip it back to a conventional score
+        return [(row[0], -row[1]) for row in rows]
+
+    def reset(self) -> None:
+        """Drop every document that belongs to this collection."""
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute("DELETE FROM memory_fts WHERE collection = ?", (self.collection_name,))
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to reset lexical index: {e}")
+                raise
+
+    def close(self) -> None:
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def __del__(self):
+        self.close()
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse several ranked id lists with reciprocal rank fusion.
+
+    Each id scores `sum(1 / (k + rank))` over the lists it appears in (ranks start at 1), which
+    rewards ids ranked highly by any retriever without having to calibrate their raw scores.
+
+    Returns:
+        List of `(id, fused_score)` pairs sorted by descending fused score.
+    """
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            fused[item_id] = fused.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+def payload_matches_filters(payload: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check a stored payload against simple equality filters.
+
+    Operator filters (`{"key": {"gte": ...}}`, wildcards, `$or`/`$not`) cannot be evaluated here and
+    therefore never match, so lexical-only hits are dropped instead of leaking past such filters.
+    """
+    for key, value in (filters or {}).items():
+        if isinstance(value, dict) or value == "*" or key.startswith("$"):
+            return False
+        if payload.get(key) != value:
+            return False
+    return True
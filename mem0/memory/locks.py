@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Hashable, List
+
+
+class _Entry:
+    def __init__(self, lock):
+        self.lock = lock
+        # Callers holding or waiting for the lock; the entry is dropped when it reaches zero
+        self.users = 0
+
+
+class ScopeLocks:
+    """
+    Locks keyed by memory scope, e.g. the (user_id, agent_id, run_id) of an `add` call.
+
+    Holding a scope serialises the read-decide-write sequences that target it, while calls for other
+    scopes proceed in parallel. Locks are created on first use and dropped once nobody holds or waits
+    for them, so the registry stays as small as the number of scopes being written to right now.
+    """
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+
+    def _join(self, scopes) -> List[Any]:
+        with self._guard:
+            entries = []
+            # A fixed order keeps two callers holding overlapping sets of scopes from deadlocking
+            for scope in sorted(set(scopes), key=repr):
+                entry = self._entries.get(scope)
+                if entry is None:
+                    entry = self._entries[scope] = _Entry(self._new_lock())
+                entry.users += 1
+                entries.append((scope, entry))
+            return entries
+
+    def _leave(self, entries) -> None:
+        with self._guard:
+            for scope, entry in entries:
+                entry.users -= 1
+                if entry.users == 0:
+                    del self._entries[scope]
+
+    def _new_lock(self):
+        return threading.Lock()
+
+    @contextmanager
+    def hold(self, *scopes: Hashable):
+        """Hold the locks of all `scopes` for the duration of the block."""
+        entries = self._join(scopes)
+        acquired = []
+        try:
+            for _, entry in entries:
+                entry.lock.acquire()
+                acquired.append(entry)
+            yield
+        finally:
+            for entry in reversed(acquired):
+                entry.lock.release()
+            self._leave(entries)
+
+    def __len__(self) -> int:
+        with self._guard:
+            return len(self._entries)
+
+
+class AsyncScopeLocks(ScopeLocks):
+    """`ScopeLocks` for coroutines: waiting for a busy scope yields to the event loop instead of blocking it."""
+
+    def _new_lock(self):
+        return asyncio.Lock()
+
+    @asynccontextmanager
+    async def hold(self, *scopes: Hashable):
+        """Hold the locks of all `scopes` for the duration of the block."""
+        entries = self._join(scopes)
+        acquired = []
+        try:
+            for _, entry in entries:
+                await entry.lock.acquire()
+                acquired.append(entry)
+            yield
+        finally:
+            for entry in reversed(acquired):
+                entry.lock.release()
+            self._leave(entries)
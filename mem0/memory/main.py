@@ -9,8 +9,9 @@ import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
+import numpy as np
 import pytz
 from pydantic import ValidationError
 
@@ -20,8 +21,23 @@ from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
     get_update_memory_messages,
 )
+from mem0.embeddings.base import AsyncEmbeddingBase
 from mem0.exceptions import ValidationError as Mem0ValidationError
+from mem0.llms.base import AsyncLLMBase
+from mem0.llms.cache import LLMResponseCache
 from mem0.memory.base import MemoryBase
+from mem0.memory.bulk import (
+    BulkJob,
+    BulkStats,
+    Checkpoint,
+    acall_with_backoff,
+    call_with_backoff,
+    chunked,
+    conversation_scope,
+    scope_waves,
+)
+from mem0.memory.lexical_index import LexicalIndex, payload_matches_filters, reciprocal_rank_fusion
+from mem0.memory.locks import AsyncScopeLocks, ScopeLocks
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
@@ -40,6 +56,7 @@ from mem0.utils.factory import (
     VectorStoreFactory,
     RerankerFactory,
 )
+from mem0.vector_stores.base import AsyncVectorStoreBase
 
 # Suppress SWIG deprecation warnings globally
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*SwigPy.*")
@@ -165,6 +182,166 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+# Payload keys surfaced at the top level of each search result next to the MemoryItem fields.
+_PROMOTED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+_CORE_AND_PROMOTED_KEYS = frozenset({"data", "hash", "created_at", "updated_at", "id", *_PROMOTED_PAYLOAD_KEYS})
+
+
+def _format_search_result(mem) -> Dict[str, Any]:
+    """
+    Build the result dict for a single vector store hit.
+
+    Produces the same shape as ``MemoryItem(...).model_dump()`` plus the promoted payload keys, but
+    without a pydantic validation and dump round trip per hit, which dominates CPU for large limits.
+    """
+    payload = mem.payload or {}
+    # Records loaded by ID (e.g. lexical-only hybrid hits) carry no similarity score
+    score = getattr(mem, "score", None)
+    result_item = {
+        "id": mem.id,
+        "memory": payload.get("data", ""),
+        "hash": payload.get("hash"),
+        "metadata": None,
+        "score": float(score) if score is not None else None,
+        "created_at": payload.get("created_at"),
+        "updated_at": payload.get("updated_at"),
+    }
+
+    for key in _PROMOTED_PAYLOAD_KEYS:
+        if key in payload:
+            result_item[key] = payload[key]
+
+    additional_metadata = {k: v for k, v in payload.items() if k not in _CORE_AND_PROMOTED_KEYS}
+    if additional_metadata:
+        result_item["metadata"] = additional_metadata
+
+    return result_item
+
+
+def _fuse_lexical_results(memories, lexical_hits, filters, limit, get_memories) -> list:
+    """
+    Merge vector hits with lexical index hits through reciprocal rank fusion.
+
+    Memories only found lexically are loaded in one `get_memories` call and checked against `filters`,
+    since the lexical index only knows the session identifiers. The `score` of each result is the fused score.
+    """
+    hits_by_id = {str(mem.id): mem for mem in memories}
+    fused = reciprocal_rank_fusion([list(hits_by_id), [memory_id for memory_id, _ in lexical_hits]])
+
+    lexical_only = [memory_id for memory_id, _ in fused if memory_id not in hits_by_id]
+    loaded = {}
+    if lexical_only:
+        try:
+            loaded = dict(zip(lexical_only, get_memories(lexical_only)))
+        except Exception as e:
+            logger.debug(f"Skipping lexical hits that could not be loaded: {e}")
+
+    results = []
+    for memory_id, fused_score in fused:
+        mem = hits_by_id.get(memory_id)
+        if mem is None:
+            mem = loaded.get(memory_id)
+            if mem is None or not payload_matches_filters(mem.payload or {}, filters):
+                continue
+
+        result_item = _format_search_result(mem)
+        result_item["score"] = fused_score
+        results.append(result_item)
+        if len(results) >= limit:
+            break
+
+    return results
+
+
+def _normalize_messages(messages) -> list:
+    """Turn the `messages` argument of `add` into a list of message dicts."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    if isinstance(messages, dict):
+        return [messages]
+    if not isinstance(messages, list):
+        raise Mem0ValidationError(
+            message="messages must be str, dict, or list[dict]",
+            error_code="VALIDATION_003",
+            details={"provided_type": type(messages).__name__, "valid_types": ["str", "dict", "list[dict]"]},
+            suggestion="Convert your input to a string, dictionary, or list of dictionaries."
+        )
+    return messages
+
+
+def _search_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Session identifiers of `filters`, which scope the search for memories related to new facts."""
+    return {key: filters[key] for key in ("user_id", "agent_id", "run_id") if filters.get(key)}
+
+
+def _load_facts(response) -> list:
+    """Parse the facts of a fact extraction reply, raising if the reply has none."""
+    response = remove_code_blocks(response)
+    try:
+        # First try direct JSON parsing
+        return json.loads(response)["facts"]
+    except json.JSONDecodeError:
+        # Try extracting JSON from response using built-in function
+        extracted_json = extract_json(response)
+        return json.loads(extracted_json)["facts"]
+
+
+def _parse_facts(response) -> list:
+    try:
+        if not remove_code_blocks(response).strip():
+            return []
+        return _load_facts(response)
+    except Exception as e:
+        logger.error(f"Error in new_retrieved_facts: {e}")
+        return []
+
+
+def _is_memory_actions_reply(response) -> bool:
+    """Whether an update decision reply parses as the JSON object of memory actions."""
+    return "memory" in json.loads(remove_code_blocks(response))
+
+
+def _new_memory_metadata(data, metadata=None) -> Dict[str, Any]:
+    """Payload of a memory created from `data`, extending `metadata` in place."""
+    metadata = metadata or {}
+    metadata["data"] = data
+    metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
+    metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    return metadata
+
+
+def _updated_memory_metadata(existing_memory, data, metadata=None) -> Dict[str, Any]:
+    """Payload of `existing_memory` after its text is replaced by `data`."""
+    new_metadata = deepcopy(metadata) if metadata is not None else {}
+
+    new_metadata["data"] = data
+    new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
+    new_metadata["created_at"] = existing_memory.payload.get("created_at")
+    new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+
+    # Preserve session identifiers from existing memory only if not provided in new metadata
+    for key in ("user_id", "agent_id", "run_id", "actor_id", "role"):
+        if key not in new_metadata and key in existing_memory.payload:
+            new_metadata[key] = existing_memory.payload[key]
+    return new_metadata
+
+
+def _has_native_async(component, interface) -> bool:
+    """Whether `component` implements the optional async `interface` with a usable async client."""
+    return isinstance(component, interface) and component.native_async is True
+
+
+def _cacheable(llm, validator: Optional[Callable[[Any], Any]] = None) -> Dict[str, Any]:
+    """
+    Mark a call as cacheable when the LLM has a response cache; extraction and update prompts are deterministic.
+
+    Only replies accepted by `validator` are cached, so a malformed reply is not served again.
+    """
+    if isinstance(getattr(llm, "response_cache", None), LLMResponseCache):
+        return {"cacheable": True, "cache_validator": validator}
+    return {}
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -184,9 +361,19 @@ class Memory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        if self.config.llm.cache is not None:
+            self.llm.response_cache = LLMResponseCache.from_config(self.config.llm.cache)
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.lexical_index = None
+        if self.config.enable_hybrid_search:
+            self.lexical_index = LexicalIndex(self.config.history_db_path, self.collection_name)
         self.api_version = self.config.version
+        # Bounded pool shared by all calls for the per-fact and per-action provider requests of `add`
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="mem0"
+        )
+        self._scope_locks = ScopeLocks()
         
         # Initialize reranker if configured
         self.reranker = None
@@ -257,6 +444,20 @@ class Memory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
+    def _embed(self, text, memory_action):
+        """Embed text in the form the vector store takes: float32 arrays where supported, lists otherwise."""
+        # Compared with `is True` so mocked or third-party stores without the attribute keep getting lists
+        if getattr(self.vector_store, "accepts_numpy_vectors", False) is True:
+            return self.embedding_model.embed_array(text, memory_action)
+        return self.embedding_model.embed(text, memory_action)
+
+    def _embed_batch(self, texts, memory_action):
+        """Embed several texts at once, in the form `_embed` returns them."""
+        embeddings = self.embedding_model.embed_batch(texts, memory_action) if texts else []
+        if getattr(self.vector_store, "accepts_numpy_vectors", False) is True:
+            return [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+        return embeddings
+
     def _should_use_agent_memory_extraction(self, messages, metadata):
         """Determine whether to use agent memory extraction based on the logic:
         - If agent_id is present and messages contain assistant role -> True
@@ -343,19 +544,7 @@ class Memory(MemoryBase):
                 suggestion=f"Use '{MemoryType.PROCEDURAL.value}' to create procedural memories."
             )
 
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        elif isinstance(messages, dict):
-            messages = [messages]
-
-        elif not isinstance(messages, list):
-            raise Mem0ValidationError(
-                message="messages must be str, dict, or list[dict]",
-                error_code="VALIDATION_003",
-                details={"provided_type": type(messages).__name__, "valid_types": ["str", "dict", "list[dict]"]},
-                suggestion="Convert your input to a string, dictionary, or list of dictionaries."
-            )
+        messages = _normalize_messages(messages)
 
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
@@ -383,43 +572,312 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    def add_many(
+        self,
+        conversations,
+        *,
+        concurrency: int = 8,
+        batch_size: int = 64,
+        infer: bool = True,
+        checkpoint_path: Optional[str] = None,
+        max_retries: int = 5,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add memories from many conversations, e.g. to backfill historical transcripts.
+
+        Conversations are read from `conversations` lazily, `batch_size` at a time. The fact extraction
+        and update decision LLM calls of a batch run concurrently on `concurrency` threads and are retried
+        with backoff when the provider rate limits them. The new facts of all conversations in a batch are
+        embedded with `embed_batch` and searched with `batch_search`. Conversations of different
+        (user_id, agent_id, run_id) scopes are applied concurrently; conversations of the same scope are
+        applied one after the other, in input order, so each one sees the memories of the previous one.
+
+        Args:
+            conversations (Iterable[dict]): Conversations, each with `messages` (as taken by `add`), at least
+                one of `user_id`, `agent_id` or `run_id`, and optionally `metadata` and a stable `id`.
+            concurrency (int, optional): Maximum number of LLM calls in flight. Defaults to 8.
+            batch_size (int, optional): Number of conversations processed together. Defaults to 64.
+            infer (bool, optional): Whether to extract facts with the LLM, as in `add`. Defaults to True.
+            checkpoint_path (str, optional): File recording finished conversations. Conversations recorded in it
+                are skipped, so an interrupted run resumes where it stopped. Conversations without an `id` are
+                identified by their position in `conversations`. Defaults to None.
+            max_retries (int, optional): Retries of a rate-limited LLM or embedding call. Defaults to 5.
+            on_result (callable, optional): Called with the conversation ID and the result `add` would have
+                returned, once the conversation is stored. Defaults to None.
+
+        Returns:
+            dict: Throughput report with the number of conversations added, skipped and failed, the
+                ADD/UPDATE/DELETE event counts, the elapsed seconds, conversations per second and the errors.
+                A conversation whose memories were stored but whose graph update failed still counts as added
+                (and is checkpointed); it is counted in `graph_failed` and its error has `"stage": "graph"`.
+        """
+        checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+        stats = BulkStats()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mem0-bulk") as pool:
+                for chunk in chunked(enumerate(conversations), batch_size):
+                    jobs = []
+                    for idx, conversation in chunk:
+                        conversation_id = str(conversation.get("id", idx))
+                        if checkpoint is not None and conversation_id in checkpoint:
+                            stats.record_skipped()
+                            continue
+                        try:
+                            jobs.append(self._prepare_bulk_job(conversation_id, conversation))
+                        except Exception as e:
+                            stats.record_failure(conversation_id, e)
+                    done = self._add_bulk_jobs(jobs, pool, infer, max_retries, stats, on_result)
+                    if checkpoint is not None:
+                        checkpoint.mark_done(done)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        report = stats.report()
+        capture_event(
+            "mem0.add_many",
+            self,
+            {"version": self.api_version, "conversations": report["conversations"], "sync_type": "sync"},
+        )
+        return report
+
+    def _prepare_bulk_job(self, conversation_id, conversation):
+        metadata, filters = _build_filters_and_metadata(
+            user_id=conversation.get("user_id"),
+            agent_id=conversation.get("agent_id"),
+            run_id=conversation.get("run_id"),
+            input_metadata=conversation.get("metadata"),
+        )
+        messages = _normalize_messages(conversation["messages"])
+        if self.config.llm.config.get("enable_vision"):
+            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        else:
+            messages = parse_vision_messages(messages)
+        return BulkJob(conversation_id, messages, metadata, filters)
+
+    def _add_bulk_jobs(self, jobs, pool, infer, max_retries, stats, on_result):
+        """Run the `add_many` stages over one batch of conversations; returns the IDs of those that finished."""
+        failed = set()
+
+        def fail(job, error):
+            logger.error(f"Error adding conversation {job.id}: {error}")
+            failed.add(job.id)
+            stats.record_failure(job.id, error)
+
+        graph_futures = {}
+        if self.enable_graph:
+            graph_futures = {job.id: pool.submit(self._add_to_graph, job.messages, job.filters) for job in jobs}
+
+        if infer:
+            fact_futures = [
+                (job, pool.submit(self._extract_facts, job.messages, job.metadata, max_retries)) for job in jobs
+            ]
+            for job, future in fact_futures:
+                try:
+                    job.facts = future.result()
+                except Exception as e:
+                    fail(job, e)
+
+        done = []
+        for wave in scope_waves([job for job in jobs if job.id not in failed], lambda job: job.scope):
+            if infer:
+                # Also keeps concurrent `add` calls for these scopes out until the wave is written
+                with self._scope_locks.hold(*(job.scope for job in wave)):
+                    results = self._apply_bulk_wave(wave, pool, max_retries, fail)
+            else:
+                futures = [
+                    (job, pool.submit(self._add_to_vector_store, job.messages, job.metadata, job.filters, False))
+                    for job in wave
+                ]
+                results = {}
+                for job, future in futures:
+                    try:
+                        results[job.id] = future.result()
+                    except Exception as e:
+                        fail(job, e)
+
+            for job in wave:
+                if job.id not in results:
+                    continue
+                result = {"results": results[job.id]}
+                if self.enable_graph:
+                    try:
+                        result["relations"] = graph_futures[job.id].result()
+                    except Exception as e:
+                        # The memories are stored already, failing the conversation would add them again on a rerun
+                        logger.error(f"Error adding conversation {job.id} to the graph: {e}")
+                        stats.record_graph_failure(job.id, e)
+                        result["relations"] = []
+                stats.record(result["results"])
+                if on_result is not None:
+                    on_result(job.id, result)
+                done.append(job.id)
+        return done
+
+    def _apply_bulk_wave(self, wave, pool, max_retries, fail):
+        """Embed, search, decide and apply the facts of conversations that belong to different scopes."""
+        queries, owners = [], []
+        for job in wave:
+            for fact in job.facts:
+                queries.append(fact)
+                owners.append(job)
+
+        try:
+            vectors = call_with_backoff(lambda: self._embed_batch(queries, "add"), max_retries=max_retries)
+            hits = self.vector_store.batch_search(
+                queries, vectors, limit=5, filters=[_search_filters(job.filters) for job in owners]
+            )
+        except Exception as e:
+            for job in wave:
+                fail(job, e)
+            return {}
+
+        embeddings = {job.id: {} for job in wave}
+        old_memories = {job.id: [] for job in wave}
+        existing_hashes = {job.id: set() for job in wave}
+        for job, fact, fact_vectors, fact_hits in zip(owners, queries, vectors, hits):
+            embeddings[job.id][fact] = fact_vectors
+            old_memories[job.id].extend({"id": mem.id, "text": mem.payload.get("data", "")} for mem in fact_hits)
+            existing_hashes[job.id].update(mem.payload.get("hash") for mem in fact_hits)
+
+        def apply(job):
+            new_memories_with_actions, temp_uuid_mapping = self._decide_memory_actions(
+                job.facts, old_memories[job.id], max_retries
+            )
+            return self._apply_memory_actions(
+                new_memories_with_actions.get("memory", []),
+                temp_uuid_mapping,
+                embeddings[job.id],
+                job.metadata,
+                existing_hashes[job.id],
+            )
+
+        results = {}
+        for job, future in [(job, pool.submit(apply, job)) for job in wave]:
+            try:
+                results[job.id] = future.result()
+            except Exception as e:
+                fail(job, e)
+        return results
+
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format: {message_dict}")
-                    continue
+            if not self.config.skip_duplicate_memories:
+                return self._add_raw_messages(messages, metadata, filters)
+            # Deduplication reads the store before writing to it, so nobody else may write to the scope in between
+            with self._scope_locks.hold(conversation_scope(filters)):
+                return self._add_raw_messages(messages, metadata, filters)
 
-                if message_dict["role"] == "system":
-                    continue
+        new_retrieved_facts = self._extract_facts(messages, metadata)
 
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+        # Searching, deciding and writing must not interleave with another add to the same scope, or both
+        # calls miss each other's new memories and store the same fact twice
+        with self._scope_locks.hold(conversation_scope(filters)):
+            returned_memories = self._add_facts(new_retrieved_facts, metadata, filters)
+
+        keys, encoded_ids = process_telemetry_filters(filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        )
+        return returned_memories
+
+    def _add_facts(self, new_retrieved_facts, metadata, filters):
+        """Search the memories related to the new facts, let the LLM decide how they change, and apply it."""
+        search_filters = _search_filters(filters)
+
+        def search_fact(new_mem):
+            messages_embeddings = self._embed(new_mem, "add")
+            existing_memories = self.vector_store.search(
+                query=new_mem,
+                vectors=messages_embeddings,
+                limit=5,
+                filters=search_filters,
+            )
+            return new_mem, messages_embeddings, existing_memories
+
+        retrieved_old_memory = []
+        new_message_embeddings = {}
+        existing_hashes = set()
+        for new_mem, messages_embeddings, existing_memories in self._executor.map(search_fact, new_retrieved_facts):
+            new_message_embeddings[new_mem] = messages_embeddings
+            for mem in existing_memories:
+                retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
+                existing_hashes.add(mem.payload.get("hash"))
+
+        new_memories_with_actions, temp_uuid_mapping = self._decide_memory_actions(
+            new_retrieved_facts, retrieved_old_memory
+        )
+
+        returned_memories = []
+        try:
+            returned_memories = self._apply_memory_actions(
+                new_memories_with_actions.get("memory", []),
+                temp_uuid_mapping,
+                new_message_embeddings,
+                metadata,
+                existing_hashes,
+            )
+        except Exception as e:
+            logger.error(f"Error iterating new_memories_with_actions: {e}")
+        return returned_memories
 
+    def _add_raw_messages(self, messages, metadata, filters):
+        """Store every non-system message as a memory, without inferring facts."""
+        returned_memories = []
+        added_hashes = set()
+        for message_dict in messages:
+            if (
+                not isinstance(message_dict, dict)
+                or message_dict.get("role") is None
+                or message_dict.get("content") is None
+            ):
+                logger.warning(f"Skipping invalid message format: {message_dict}")
+                continue
+
+            if message_dict["role"] == "system":
+                continue
+
+            per_msg_meta = deepcopy(metadata)
+            per_msg_meta["role"] = message_dict["role"]
+
+            actor_name = message_dict.get("name")
+            if actor_name:
+                per_msg_meta["actor_id"] = actor_name
+
+            msg_content = message_dict["content"]
+            msg_embeddings = self._embed(msg_content, "add")
+            if self.config.skip_duplicate_memories:
+                if self._is_duplicate(msg_content, msg_embeddings, filters, added_hashes):
+                    logger.info(f"Skipping duplicate memory: {msg_content}")
+                    continue
+                added_hashes.add(hashlib.md5(msg_content.encode()).hexdigest())
+            mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+
+            returned_memories.append(
+                {
+                    "id": mem_id,
+                    "memory": msg_content,
+                    "event": "ADD",
+                    "actor_id": actor_name if actor_name else None,
+                    "role": message_dict["role"],
+                }
+            )
+        return returned_memories
+
+    def _is_duplicate(self, data, embeddings, filters, added_hashes):
+        """Whether a memory with the hash of `data` was just added or is stored in the session scope of `filters`."""
+        memory_hash = hashlib.md5(data.encode()).hexdigest()
+        if memory_hash in added_hashes:
+            return True
+        # A stored copy of `data` has the same embedding, so it is among the nearest neighbours
+        nearest = self.vector_store.search(query=data, vectors=embeddings, limit=5, filters=_search_filters(filters))
+        return any(mem.payload.get("hash") == memory_hash for mem in nearest)
+
+    def _extract_facts(self, messages, metadata, llm_retries=0):
+        """Ask the LLM for the facts worth remembering in `messages`."""
         parsed_messages = parse_messages(messages)
 
         if self.config.custom_fact_extraction_prompt:
@@ -431,60 +889,34 @@ class Memory(MemoryBase):
             is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
+        response = call_with_backoff(
+            lambda: self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+                **_cacheable(self.llm, _load_facts),
+            ),
+            max_retries=llm_retries,
         )
 
-        try:
-            response = remove_code_blocks(response)
-            if not response.strip():
-                new_retrieved_facts = []
-            else:
-                try:
-                    # First try direct JSON parsing
-                    new_retrieved_facts = json.loads(response)["facts"]
-                except json.JSONDecodeError:
-                    # Try extracting JSON from response using built-in function
-                    extracted_json = extract_json(response)
-                    new_retrieved_facts = json.loads(extracted_json)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
+        new_retrieved_facts = _parse_facts(response)
         if not new_retrieved_facts:
             logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+        return new_retrieved_facts
 
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        # Search for existing memories using the provided session identifiers
-        # Use all available session identifiers for accurate memory retrieval
-        search_filters = {}
-        if filters.get("user_id"):
-            search_filters["user_id"] = filters["user_id"]
-        if filters.get("agent_id"):
-            search_filters["agent_id"] = filters["agent_id"]
-        if filters.get("run_id"):
-            search_filters["run_id"] = filters["run_id"]
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=search_filters,
-            )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
+    def _decide_memory_actions(self, new_retrieved_facts, retrieved_old_memory, llm_retries=0):
+        """
+        Ask the LLM how the new facts change the related existing memories.
 
+        Returns:
+            tuple: The parsed LLM decision and the mapping from the integer IDs shown to the LLM to memory IDs.
+        """
         unique_data = {}
         for item in retrieved_old_memory:
             unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
+        retrieved_old_memory = [dict(item) for item in unique_data.values()]
         logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
 
         # mapping UUIDs with integers for handling UUID hallucinations
@@ -493,107 +925,221 @@ class Memory(MemoryBase):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
+        if not new_retrieved_facts:
+            return {}, temp_uuid_mapping
 
-            try:
-                response: str = self.llm.generate_response(
+        function_calling_prompt = get_update_memory_messages(
+            retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+        )
+
+        try:
+            response: str = call_with_backoff(
+                lambda: self.llm.generate_response(
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
-                )
+                    **_cacheable(self.llm, _is_memory_actions_reply),
+                ),
+                max_retries=llm_retries,
+            )
+        except Exception as e:
+            logger.error(f"Error in new memory actions response: {e}")
+            response = ""
+
+        try:
+            if not response or not response.strip():
+                logger.warning("Empty response from LLM, no memories to extract")
+                new_memories_with_actions = {}
+            else:
+                response = remove_code_blocks(response)
+                new_memories_with_actions = json.loads(response)
+        except Exception as e:
+            logger.error(f"Invalid JSON response: {e}")
+            new_memories_with_actions = {}
+        return new_memories_with_actions, temp_uuid_mapping
+
+    def _apply_memory_actions(self, actions, temp_uuid_mapping, existing_embeddings, metadata, existing_hashes=None):
+        """
+        Apply the ADD, UPDATE, DELETE and NONE events decided by the LLM.
+
+        The memories touched by the events are loaded with one `batch_get` and missing embeddings are
+        computed concurrently on the shared executor. Then all inserts, updates and deletes are written
+        with one vector store call each, and the history records in one transaction. Events that cannot
+        be prepared are logged and skipped; if a batched write fails, its events are left out of the result.
+
+        Returns:
+            list: The applied events, in the order the LLM returned them.
+        """
+        planned = []
+        for resp in actions:
+            logger.info(resp)
+            action_text = resp.get("text")
+            if not action_text:
+                logger.info("Skipping memory entry because of empty `text` field.")
+                continue
+
+            event_type = resp.get("event")
+            if event_type == "ADD":
+                if self.config.skip_duplicate_memories and existing_hashes is not None:
+                    memory_hash = hashlib.md5(action_text.encode()).hexdigest()
+                    if memory_hash in existing_hashes:
+                        logger.info(f"Skipping duplicate memory: {action_text}")
+                        continue
+                    existing_hashes.add(memory_hash)
+                planned.append(("ADD", resp, str(uuid.uuid4())))
+            elif event_type in ("UPDATE", "DELETE"):
+                memory_id = temp_uuid_mapping.get(resp.get("id"))
+                if memory_id is None:
+                    logger.error(f"Error processing memory action: {resp}, Error: unknown memory id")
+                    continue
+                planned.append((event_type, resp, memory_id))
+            elif event_type == "NONE":
+                # Even if content doesn't need updating, update session IDs if provided
+                memory_id = temp_uuid_mapping.get(resp.get("id"))
+                if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
+                    planned.append(("NONE", resp, memory_id))
+                else:
+                    logger.info("NOOP for Memory.")
+
+        existing_ids = list(dict.fromkeys(memory_id for event, _, memory_id in planned if event != "ADD"))
+        existing_memories = {}
+        if existing_ids:
+            try:
+                existing_memories = dict(zip(existing_ids, self.vector_store.batch_get(existing_ids)))
             except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
+                logger.error(f"Error getting memories {existing_ids}: {e}")
+
+        embedding_futures = {}
+        for event, resp, _ in planned:
+            text = resp["text"]
+            if event in ("ADD", "UPDATE") and text not in existing_embeddings and text not in embedding_futures:
+                embedding_futures[text] = self._executor.submit(self._embed, text, event.lower())
 
+        inserts, updates, deletes = [], [], []
+        for event, resp, memory_id in planned:
+            text = resp["text"]
             try:
-                if not response or not response.strip():
-                    logger.warning("Empty response from LLM, no memories to extract")
-                    new_memories_with_actions = {}
+                if event == "ADD":
+                    embeddings = existing_embeddings.get(text)
+                    if embeddings is None:
+                        embeddings = embedding_futures[text].result()
+                    inserts.append((resp, memory_id, embeddings, _new_memory_metadata(text, deepcopy(metadata))))
+                    continue
+
+                existing_memory = existing_memories.get(memory_id)
+                if existing_memory is None:
+                    raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+                if event == "UPDATE":
+                    embeddings = existing_embeddings.get(text)
+                    if embeddings is None:
+                        embeddings = embedding_futures[text].result()
+                    payload = _updated_memory_metadata(existing_memory, text, metadata)
+                    updates.append((resp, memory_id, embeddings, payload, existing_memory))
+                elif event == "DELETE":
+                    deletes.append((resp, memory_id, existing_memory))
                 else:
-                    response = remove_code_blocks(response)
-                    new_memories_with_actions = json.loads(response)
+                    payload = deepcopy(existing_memory.payload)
+                    if metadata.get("agent_id"):
+                        payload["agent_id"] = metadata["agent_id"]
+                    if metadata.get("run_id"):
+                        payload["run_id"] = metadata["run_id"]
+                    payload["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+                    # Keep same embeddings
+                    updates.append((resp, memory_id, None, payload, None))
             except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
-        else:
-            new_memories_with_actions = {}
+                logger.error(f"Error processing memory action: {resp}, Error: {e}")
 
-        returned_memories = []
-        try:
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(resp)
-                try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        logger.info("Skipping memory entry because of empty `text` field.")
+        applied = set()
+        history = []
+        if inserts:
+            try:
+                self.vector_store.insert(
+                    vectors=[embeddings for _, _, embeddings, _ in inserts],
+                    ids=[memory_id for _, memory_id, _, _ in inserts],
+                    payloads=[payload for _, _, _, payload in inserts],
+                )
+            except Exception as e:
+                logger.error(f"Error creating {len(inserts)} memories: {e}")
+            else:
+                for resp, memory_id, _, payload in inserts:
+                    applied.add(id(resp))
+                    if self.lexical_index is not None:
+                        self.lexical_index.upsert(memory_id, payload["data"], payload)
+                    history.append(
+                        {
+                            "memory_id": memory_id,
+                            "new_memory": payload["data"],
+                            "event": "ADD",
+                            "created_at": payload.get("created_at"),
+                            "actor_id": payload.get("actor_id"),
+                            "role": payload.get("role"),
+                        }
+                    )
+
+        if updates:
+            try:
+                self.vector_store.batch_update(
+                    [memory_id for _, memory_id, _, _, _ in updates],
+                    vectors=[embeddings for _, _, embeddings, _, _ in updates],
+                    payloads=[payload for _, _, _, payload, _ in updates],
+                )
+            except Exception as e:
+                logger.error(f"Error updating {len(updates)} memories: {e}")
+            else:
+                for resp, memory_id, _, payload, existing_memory in updates:
+                    applied.add(id(resp))
+                    if self.lexical_index is not None:
+                        self.lexical_index.upsert(memory_id, payload.get("data", ""), payload)
+                    if existing_memory is None:
+                        logger.info(f"Updated session IDs for memory {memory_id}")
                         continue
-
-                    event_type = resp.get("event")
-                    if event_type == "ADD":
-                        memory_id = self._create_memory(
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
-                    elif event_type == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                            }
-                        )
-                    elif event_type == "NONE":
-                        # Even if content doesn't need updating, update session IDs if provided
-                        memory_id = temp_uuid_mapping.get(resp.get("id"))
-                        if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
-                            # Update only the session identifiers, keep content the same
-                            existing_memory = self.vector_store.get(vector_id=memory_id)
-                            updated_metadata = deepcopy(existing_memory.payload)
-                            if metadata.get("agent_id"):
-                                updated_metadata["agent_id"] = metadata["agent_id"]
-                            if metadata.get("run_id"):
-                                updated_metadata["run_id"] = metadata["run_id"]
-                            updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-                            self.vector_store.update(
-                                vector_id=memory_id,
-                                vector=None,  # Keep same embeddings
-                                payload=updated_metadata,
-                            )
-                            logger.info(f"Updated session IDs for memory {memory_id}")
-                        else:
-                            logger.info("NOOP for Memory.")
-                except Exception as e:
-                    logger.error(f"Error processing memory action: {resp}, Error: {e}")
+                    history.append(
+                        {
+                            "memory_id": memory_id,
+                            "old_memory": existing_memory.payload.get("data"),
+                            "new_memory": payload["data"],
+                            "event": "UPDATE",
+                            "created_at": payload["created_at"],
+                            "updated_at": payload["updated_at"],
+                            "actor_id": payload.get("actor_id"),
+                            "role": payload.get("role"),
+                        }
+                    )
+
+        if deletes:
+            try:
+                self.vector_store.batch_delete([memory_id for _, memory_id, _ in deletes])
+            except Exception as e:
+                logger.error(f"Error deleting {len(deletes)} memories: {e}")
+            else:
+                for resp, memory_id, existing_memory in deletes:
+                    applied.add(id(resp))
+                    if self.lexical_index is not None:
+                        self.lexical_index.delete(memory_id)
+                    history.append(
+                        {
+                            "memory_id": memory_id,
+                            "old_memory": existing_memory.payload.get("data", ""),
+                            "event": "DELETE",
+                            "actor_id": existing_memory.payload.get("actor_id"),
+                            "role": existing_memory.payload.get("role"),
+                            "is_deleted": 1,
+                        }
+                    )
+
+        # The vector store changes are applied already, so a history failure must not hide them from the caller
+        try:
+            self.db.batch_add_history(history)
         except Exception as e:
-            logger.error(f"Error iterating new_memories_with_actions: {e}")
+            logger.error(f"Error recording history of {len(history)} memory changes: {e}")
 
-        keys, encoded_ids = process_telemetry_filters(filters)
-        capture_event(
-            "mem0.add",
-            self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
-        )
+        returned_memories = []
+        for event, resp, memory_id in planned:
+            if event == "NONE" or id(resp) not in applied:
+                continue
+            result = {"id": memory_id, "memory": resp["text"], "event": event}
+            if event == "UPDATE":
+                result["previous_memory"] = resp.get("old_memory")
+            returned_memories.append(result)
         return returned_memories
 
     def _add_to_graph(self, messages, filters):
@@ -777,6 +1323,8 @@ class Memory(MemoryBase):
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Legacy filters to apply to the search. Defaults to None.
             threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+                With `enable_hybrid_search`, it only applies to vector hits and the returned `score`
+                is the reciprocal-rank fusion score of the vector and BM25 rankings.
             filters (dict, optional): Enhanced metadata filtering with operators:
                 - {"key": "value"} - exact match
                 - {"key": {"eq": "value"}} - equals
@@ -845,7 +1393,10 @@ class Memory(MemoryBase):
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
             try:
-                reranked_memories = self.reranker.rerank(query, original_memories, limit)
+                # Only the strongest candidates are worth a cross-encoder or LLM pass
+                rerank_top_n = getattr(self.reranker.config, "rerank_top_n", None)
+                candidates = original_memories[:rerank_top_n] if rerank_top_n else original_memories
+                reranked_memories = self.reranker.rerank(query, candidates, limit)
                 original_memories = reranked_memories
             except Exception as e:
                 logger.warning(f"Reranking failed, using original results: {e}")
@@ -952,42 +1503,25 @@ class Memory(MemoryBase):
         return False
 
     def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = self.embedding_model.embed(query, "search")
-        memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        embeddings = self._embed(query, "search")
+        search_kwargs = {}
+        if threshold is not None and getattr(self.vector_store, "supports_score_threshold", False):
+            # Let the backend drop low-scoring hits before they are serialized and sent back
+            search_kwargs["threshold"] = threshold
+        memories = self.vector_store.search(
+            query=query, vectors=embeddings, limit=limit, filters=filters, **search_kwargs
+        )
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        # Stores without native score cutoffs (or ignoring it for their metric) are filtered here,
+        # before any result dict is built for a hit that would be discarded anyway.
+        if threshold is not None:
+            memories = [mem for mem in memories if mem.score is not None and mem.score >= threshold]
 
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
+        if self.lexical_index is not None:
+            lexical_hits = self.lexical_index.search(query, filters=filters, limit=limit)
+            return _fuse_lexical_results(memories, lexical_hits, filters, limit, self.vector_store.batch_get)
 
-        return original_memories
+        return [_format_search_result(mem) for mem in memories]
 
     def update(self, memory_id, data):
         """
@@ -1006,7 +1540,7 @@ class Memory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "sync"})
 
-        existing_embeddings = {data: self.embedding_model.embed(data, "update")}
+        existing_embeddings = {data: self._embed(data, "update")}
 
         self._update_memory(memory_id, data, existing_embeddings)
         return {"message": "Memory updated successfully!"}
@@ -1077,18 +1611,17 @@ class Memory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, memory_action="add")
+            embeddings = self._embed(data, "add")
         memory_id = str(uuid.uuid4())
-        metadata = metadata or {}
-        metadata["data"] = data
-        metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        metadata = _new_memory_metadata(data, metadata)
 
         self.vector_store.insert(
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
         )
+        if self.lexical_index is not None:
+            self.lexical_index.upsert(memory_id, data, metadata)
         self.db.add_history(
             memory_id,
             None,
@@ -1131,7 +1664,7 @@ class Memory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = self.embedding_model.embed(procedural_memory, memory_action="add")
+        embeddings = self._embed(procedural_memory, "add")
         memory_id = self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
 
@@ -1149,36 +1682,20 @@ class Memory(MemoryBase):
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
-
-        new_metadata = deepcopy(metadata) if metadata is not None else {}
-
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        # Preserve session identifiers from existing memory only if not provided in new metadata
-        if "user_id" not in new_metadata and "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" not in new_metadata and "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" not in new_metadata and "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-        if "actor_id" not in new_metadata and "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" not in new_metadata and "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        new_metadata = _updated_memory_metadata(existing_memory, data, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, "update")
+            embeddings = self._embed(data, "update")
 
         self.vector_store.update(
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
         )
+        if self.lexical_index is not None:
+            self.lexical_index.upsert(memory_id, data, new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
         self.db.add_history(
@@ -1198,6 +1715,8 @@ class Memory(MemoryBase):
         existing_memory = self.vector_store.get(vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
         self.vector_store.delete(vector_id=memory_id)
+        if self.lexical_index is not None:
+            self.lexical_index.delete(memory_id)
         self.db.add_history(
             memory_id,
             prev_value,
@@ -1224,6 +1743,9 @@ class Memory(MemoryBase):
 
         self.db = SQLiteManager(self.config.history_db_path)
 
+        if self.lexical_index is not None:
+            self.lexical_index.reset()
+
         if hasattr(self.vector_store, "reset"):
             self.vector_store = VectorStoreFactory.reset(self.vector_store)
         else:
@@ -1234,6 +1756,19 @@ class Memory(MemoryBase):
             )
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
+    def close(self):
+        """
+        Release the resources held by this instance:
+            Waits for and stops the worker threads of `add`
+            Closes the vector store clients, the history database and the lexical index
+        """
+        self._executor.shutdown(wait=True)
+        self.vector_store.close()
+        self._telemetry_vector_store.close()
+        self.db.close()
+        if self.lexical_index is not None:
+            self.lexical_index.close()
+
     def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
 
@@ -1251,9 +1786,15 @@ class AsyncMemory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        if self.config.llm.cache is not None:
+            self.llm.response_cache = LLMResponseCache.from_config(self.config.llm.cache)
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.lexical_index = None
+        if self.config.enable_hybrid_search:
+            self.lexical_index = LexicalIndex(self.config.history_db_path, self.collection_name)
         self.api_version = self.config.version
+        self._scope_locks = AsyncScopeLocks()
         
         # Initialize reranker if configured
         self.reranker = None
@@ -1307,6 +1848,40 @@ class AsyncMemory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
+    def _embed(self, text, memory_action):
+        """Embed text in the form the vector store takes: float32 arrays where supported, lists otherwise."""
+        # Compared with `is True` so mocked or third-party stores without the attribute keep getting lists
+        if getattr(self.vector_store, "accepts_numpy_vectors", False) is True:
+            return self.embedding_model.embed_array(text, memory_action)
+        return self.embedding_model.embed(text, memory_action)
+
+    def _embed_batch(self, texts, memory_action):
+        """Embed several texts at once, in the form `_embed` returns them."""
+        embeddings = self.embedding_model.embed_batch(texts, memory_action) if texts else []
+        if getattr(self.vector_store, "accepts_numpy_vectors", False) is True:
+            return [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+        return embeddings
+
+    async def _aembed(self, text, memory_action):
+        """Embed text with the embedder's native async client, or with `_embed` in a worker thread."""
+        if not _has_native_async(self.embedding_model, AsyncEmbeddingBase):
+            return await asyncio.to_thread(self._embed, text, memory_action)
+        if getattr(self.vector_store, "accepts_numpy_vectors", False) is True:
+            return await self.embedding_model.aembed_array(text, memory_action)
+        return await self.embedding_model.aembed(text, memory_action)
+
+    async def _agenerate_response(self, **kwargs):
+        """Call the LLM through its native async client, or `generate_response` in a worker thread."""
+        if _has_native_async(self.llm, AsyncLLMBase):
+            return await self.llm.agenerate_response(**kwargs)
+        return await asyncio.to_thread(self.llm.generate_response, **kwargs)
+
+    async def _avector_store(self, method, **kwargs):
+        """Call `method` of the vector store through its native async client, or in a worker thread."""
+        if _has_native_async(self.vector_store, AsyncVectorStoreBase):
+            return await getattr(self.vector_store, f"a{method}")(**kwargs)
+        return await asyncio.to_thread(getattr(self.vector_store, method), **kwargs)
+
     def _should_use_agent_memory_extraction(self, messages, metadata):
         """Determine whether to use agent memory extraction based on the logic:
         - If agent_id is present and messages contain assistant role -> True
@@ -1367,19 +1942,7 @@ class AsyncMemory(MemoryBase):
                 f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
             )
 
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        elif isinstance(messages, dict):
-            messages = [messages]
-
-        elif not isinstance(messages, list):
-            raise Mem0ValidationError(
-                message="messages must be str, dict, or list[dict]",
-                error_code="VALIDATION_003",
-                details={"provided_type": type(messages).__name__, "valid_types": ["str", "dict", "list[dict]"]},
-                suggestion="Convert your input to a string, dictionary, or list of dictionaries."
-            )
+        messages = _normalize_messages(messages)
 
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = await self._create_procedural_memory(
@@ -1407,6 +1970,216 @@ class AsyncMemory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    async def add_many(
+        self,
+        conversations,
+        *,
+        concurrency: int = 8,
+        batch_size: int = 64,
+        infer: bool = True,
+        checkpoint_path: Optional[str] = None,
+        max_retries: int = 5,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add memories from many conversations asynchronously, e.g. to backfill historical transcripts.
+
+        Conversations are read from `conversations` lazily, `batch_size` at a time. The fact extraction
+        and update decision LLM calls of a batch run concurrently, at most `concurrency` at once, and are
+        retried with backoff when the provider rate limits them. The new facts of all conversations in a
+        batch are embedded with `embed_batch` and searched with `batch_search`. Conversations of different
+        (user_id, agent_id, run_id) scopes are applied concurrently; conversations of the same scope are
+        applied one after the other, in input order, so each one sees the memories of the previous one.
+
+        Args:
+            conversations (Iterable[dict]): Conversations, each with `messages` (as taken by `add`), at least
+                one of `user_id`, `agent_id` or `run_id`, and optionally `metadata` and a stable `id`.
+            concurrency (int, optional): Maximum number of LLM calls in flight. Defaults to 8.
+            batch_size (int, optional): Number of conversations processed together. Defaults to 64.
+            infer (bool, optional): Whether to extract facts with the LLM, as in `add`. Defaults to True.
+            checkpoint_path (str, optional): File recording finished conversations. Conversations recorded in it
+                are skipped, so an interrupted run resumes where it stopped. Conversations without an `id` are
+                identified by their position in `conversations`. Defaults to None.
+            max_retries (int, optional): Retries of a rate-limited LLM or embedding call. Defaults to 5.
+            on_result (callable, optional): Called with the conversation ID and the result `add` would have
+                returned, once the conversation is stored. Defaults to None.
+
+        Returns:
+            dict: Throughput report with the number of conversations added, skipped and failed, the
+                ADD/UPDATE/DELETE event counts, the elapsed seconds, conversations per second and the errors.
+                A conversation whose memories were stored but whose graph update failed still counts as added
+                (and is checkpointed); it is counted in `graph_failed` and its error has `"stage": "graph"`.
+        """
+        checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+        stats = BulkStats()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        try:
+            for chunk in chunked(enumerate(conversations), batch_size):
+                jobs = []
+                for idx, conversation in chunk:
+                    conversation_id = str(conversation.get("id", idx))
+                    if checkpoint is not None and conversation_id in checkpoint:
+                        stats.record_skipped()
+                        continue
+                    try:
+                        jobs.append(self._prepare_bulk_job(conversation_id, conversation))
+                    except Exception as e:
+                        stats.record_failure(conversation_id, e)
+                done = await self._add_bulk_jobs(jobs, bounded, infer, max_retries, stats, on_result)
+                if checkpoint is not None:
+                    checkpoint.mark_done(done)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        report = stats.report()
+        capture_event(
+            "mem0.add_many",
+            self,
+            {"version": self.api_version, "conversations": report["conversations"], "sync_type": "async"},
+        )
+        return report
+
+    def _prepare_bulk_job(self, conversation_id, conversation):
+        metadata, filters = _build_filters_and_metadata(
+            user_id=conversation.get("user_id"),
+            agent_id=conversation.get("agent_id"),
+            run_id=conversation.get("run_id"),
+            input_metadata=conversation.get("metadata"),
+        )
+        messages = _normalize_messages(conversation["messages"])
+        if self.config.llm.config.get("enable_vision"):
+            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        else:
+            messages = parse_vision_messages(messages)
+        return BulkJob(conversation_id, messages, metadata, filters)
+
+    async def _add_bulk_jobs(self, jobs, bounded, infer, max_retries, stats, on_result):
+        """Run the `add_many` stages over one batch of conversations; returns the IDs of those that finished."""
+        failed = set()
+
+        def fail(job, error):
+            logger.error(f"Error adding conversation {job.id}: {error}")
+            failed.add(job.id)
+            stats.record_failure(job.id, error)
+
+        graph_tasks = {}
+        if self.enable_graph:
+            graph_tasks = {
+                job.id: asyncio.create_task(bounded(self._add_to_graph(job.messages, job.filters))) for job in jobs
+            }
+
+        if infer:
+            extracted = await asyncio.gather(
+                *(bounded(self._extract_facts(job.messages, job.metadata, max_retries)) for job in jobs),
+                return_exceptions=True,
+            )
+            for job, facts in zip(jobs, extracted):
+                if isinstance(facts, Exception):
+                    fail(job, facts)
+                else:
+                    job.facts = facts
+
+        done = []
+        for wave in scope_waves([job for job in jobs if job.id not in failed], lambda job: job.scope):
+            if infer:
+                # Also keeps concurrent `add` calls for these scopes out until the wave is written
+                async with self._scope_locks.hold(*(job.scope for job in wave)):
+                    results = await self._apply_bulk_wave(wave, bounded, max_retries, fail)
+            else:
+                stored = await asyncio.gather(
+                    *(
+                        bounded(self._add_to_vector_store(job.messages, job.metadata, job.filters, False))
+                        for job in wave
+                    ),
+                    return_exceptions=True,
+                )
+                results = {}
+                for job, memories in zip(wave, stored):
+                    if isinstance(memories, Exception):
+                        fail(job, memories)
+                    else:
+                        results[job.id] = memories
+
+            for job in wave:
+                if job.id not in results:
+                    continue
+                result = {"results": results[job.id]}
+                if self.enable_graph:
+                    try:
+                        result["relations"] = await graph_tasks[job.id]
+                    except Exception as e:
+                        # The memories are stored already, failing the conversation would add them again on a rerun
+                        logger.error(f"Error adding conversation {job.id} to the graph: {e}")
+                        stats.record_graph_failure(job.id, e)
+                        result["relations"] = []
+                stats.record(result["results"])
+                if on_result is not None:
+                    on_result(job.id, result)
+                done.append(job.id)
+
+        # The graph updates of failed conversations still run to completion, as in the sync pipeline
+        await asyncio.gather(*graph_tasks.values(), return_exceptions=True)
+        return done
+
+    async def _apply_bulk_wave(self, wave, bounded, max_retries, fail):
+        """Embed, search, decide and apply the facts of conversations that belong to different scopes."""
+        queries, owners = [], []
+        for job in wave:
+            for fact in job.facts:
+                queries.append(fact)
+                owners.append(job)
+
+        try:
+            vectors = await acall_with_backoff(
+                lambda: asyncio.to_thread(self._embed_batch, queries, "add"), max_retries=max_retries
+            )
+            hits = await asyncio.to_thread(
+                self.vector_store.batch_search,
+                queries,
+                vectors,
+                limit=5,
+                filters=[_search_filters(job.filters) for job in owners],
+            )
+        except Exception as e:
+            for job in wave:
+                fail(job, e)
+            return {}
+
+        embeddings = {job.id: {} for job in wave}
+        old_memories = {job.id: [] for job in wave}
+        existing_hashes = {job.id: set() for job in wave}
+        for job, fact, fact_vectors, fact_hits in zip(owners, queries, vectors, hits):
+            embeddings[job.id][fact] = fact_vectors
+            old_memories[job.id].extend({"id": mem.id, "text": mem.payload.get("data", "")} for mem in fact_hits)
+            existing_hashes[job.id].update(mem.payload.get("hash") for mem in fact_hits)
+
+        async def apply(job):
+            new_memories_with_actions, temp_uuid_mapping = await self._decide_memory_actions(
+                job.facts, old_memories[job.id], max_retries
+            )
+            return await self._apply_memory_actions(
+                new_memories_with_actions.get("memory", []),
+                temp_uuid_mapping,
+                embeddings[job.id],
+                job.metadata,
+                existing_hashes[job.id],
+            )
+
+        applied = await asyncio.gather(*(bounded(apply(job)) for job in wave), return_exceptions=True)
+        results = {}
+        for job, memories in zip(wave, applied):
+            if isinstance(memories, Exception):
+                fail(job, memories)
+            else:
+                results[job.id] = memories
+        return results
+
     async def _add_to_vector_store(
         self,
         messages: list,
@@ -1415,77 +2188,32 @@ class AsyncMemory(MemoryBase):
         infer: bool,
     ):
         if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format (async): {message_dict}")
-                    continue
+            if not self.config.skip_duplicate_memories:
+                return await self._add_raw_messages(messages, metadata, effective_filters)
+            # Deduplication reads the store before writing to it, so nobody else may write to the scope in between
+            async with self._scope_locks.hold(conversation_scope(effective_filters)):
+                return await self._add_raw_messages(messages, metadata, effective_filters)
 
-                if message_dict["role"] == "system":
-                    continue
-
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+        new_retrieved_facts = await self._extract_facts(messages, metadata)
 
-        parsed_messages = parse_messages(messages)
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
-        else:
-            # Determine if this should use agent memory extraction based on agent_id presence
-            # and role types in messages
-            is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
+        # Searching, deciding and writing must not interleave with another add to the same scope, or both
+        # calls miss each other's new memories and store the same fact twice
+        async with self._scope_locks.hold(conversation_scope(effective_filters)):
+            returned_memories = await self._add_facts(new_retrieved_facts, metadata, effective_filters)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
         )
-        try:
-            response = remove_code_blocks(response)
-            if not response.strip():
-                new_retrieved_facts = []
-            else:
-                try:
-                    # First try direct JSON parsing
-                    new_retrieved_facts = json.loads(response)["facts"]
-                except json.JSONDecodeError:
-                    # Try extracting JSON from response using built-in function
-                    extracted_json = extract_json(response)
-                    new_retrieved_facts = json.loads(extracted_json)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+        return returned_memories
 
+    async def _add_facts(self, new_retrieved_facts, metadata, effective_filters):
+        """Search the memories related to the new facts, let the LLM decide how they change, and apply it."""
         retrieved_old_memory = []
         new_message_embeddings = {}
+        existing_hashes = set()
         # Search for existing memories using the provided session identifiers
         # Use all available session identifiers for accurate memory retrieval
         search_filters = {}
@@ -1497,15 +2225,16 @@ class AsyncMemory(MemoryBase):
             search_filters["run_id"] = effective_filters["run_id"]
 
         async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            embeddings = await self._aembed(new_mem_content, "add")
             new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
+            existing_mems = await self._avector_store(
+                "search",
                 query=new_mem_content,
                 vectors=embeddings,
                 limit=5,
                 filters=search_filters,
             )
+            existing_hashes.update(mem.payload.get("hash") for mem in existing_mems)
             return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
 
         search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
@@ -1513,46 +2242,106 @@ class AsyncMemory(MemoryBase):
         for result_group in search_results_list:
             retrieved_old_memory.extend(result_group)
 
+        new_memories_with_actions, temp_uuid_mapping = await self._decide_memory_actions(
+            new_retrieved_facts, retrieved_old_memory
+        )
+        return await self._apply_memory_actions(
+            new_memories_with_actions.get("memory", []),
+            temp_uuid_mapping,
+            new_message_embeddings,
+            metadata,
+            existing_hashes,
+        )
+
+    async def _extract_facts(self, messages, metadata, llm_retries=0):
+        """Ask the LLM for the facts worth remembering in `messages`."""
+        parsed_messages = parse_messages(messages)
+
+        if self.config.custom_fact_extraction_prompt:
+            system_prompt = self.config.custom_fact_extraction_prompt
+            user_prompt = f"Input:\n{parsed_messages}"
+        else:
+            # Determine if this should use agent memory extraction based on agent_id presence
+            # and role types in messages
+            is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
+            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
+
+        response = await acall_with_backoff(
+            lambda: self._agenerate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+                **_cacheable(self.llm, _load_facts),
+            ),
+            max_retries=llm_retries,
+        )
+
+        new_retrieved_facts = _parse_facts(response)
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+        return new_retrieved_facts
+
+    async def _decide_memory_actions(self, new_retrieved_facts, retrieved_old_memory, llm_retries=0):
+        """
+        Ask the LLM how the new facts change the related existing memories.
+
+        Returns:
+            tuple: The parsed LLM decision and the mapping from the integer IDs shown to the LLM to memory IDs.
+        """
         unique_data = {}
         for item in retrieved_old_memory:
             unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
+        retrieved_old_memory = [dict(item) for item in unique_data.values()]
         logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+        # mapping UUIDs with integers for handling UUID hallucinations
         temp_uuid_mapping = {}
         for idx, item in enumerate(retrieved_old_memory):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
-            try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
+        if not new_retrieved_facts:
+            return {}, temp_uuid_mapping
+
+        function_calling_prompt = get_update_memory_messages(
+            retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+        )
+
+        try:
+            response = await acall_with_backoff(
+                lambda: self._agenerate_response(
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-            try:
-                if not response or not response.strip():
-                    logger.warning("Empty response from LLM, no memories to extract")
-                    new_memories_with_actions = {}
-                else:
-                    response = remove_code_blocks(response)
-                    new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
+                    **_cacheable(self.llm, _is_memory_actions_reply),
+                ),
+                max_retries=llm_retries,
+            )
+        except Exception as e:
+            logger.error(f"Error in new memory actions response: {e}")
+            response = ""
+
+        try:
+            if not response or not response.strip():
+                logger.warning("Empty response from LLM, no memories to extract")
                 new_memories_with_actions = {}
-        else:
+            else:
+                response = remove_code_blocks(response)
+                new_memories_with_actions = json.loads(response)
+        except Exception as e:
+            logger.error(f"Invalid JSON response: {e}")
             new_memories_with_actions = {}
+        return new_memories_with_actions, temp_uuid_mapping
 
+    async def _apply_memory_actions(
+        self, actions, temp_uuid_mapping, new_message_embeddings, metadata, existing_hashes
+    ):
+        """Apply the ADD, UPDATE, DELETE and NONE events decided by the LLM, each as its own task."""
         returned_memories = []
         try:
             memory_tasks = []
-            for resp in new_memories_with_actions.get("memory", []):
+            for resp in actions:
                 logger.info(resp)
                 try:
                     action_text = resp.get("text")
@@ -1561,6 +2350,12 @@ class AsyncMemory(MemoryBase):
                     event_type = resp.get("event")
 
                     if event_type == "ADD":
+                        if self.config.skip_duplicate_memories:
+                            memory_hash = hashlib.md5(action_text.encode()).hexdigest()
+                            if memory_hash in existing_hashes:
+                                logger.info(f"Skipping duplicate memory (async): {action_text}")
+                                continue
+                            existing_hashes.add(memory_hash)
                         task = asyncio.create_task(
                             self._create_memory(
                                 data=action_text,
@@ -1588,7 +2383,7 @@ class AsyncMemory(MemoryBase):
                         if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
                             # Create async task to update only the session identifiers
                             async def update_session_ids(mem_id, meta):
-                                existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=mem_id)
+                                existing_memory = await self._avector_store("get", vector_id=mem_id)
                                 updated_metadata = deepcopy(existing_memory.payload)
                                 if meta.get("agent_id"):
                                     updated_metadata["agent_id"] = meta["agent_id"]
@@ -1596,12 +2391,19 @@ class AsyncMemory(MemoryBase):
                                     updated_metadata["run_id"] = meta["run_id"]
                                 updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-                                await asyncio.to_thread(
-                                    self.vector_store.update,
+                                await self._avector_store(
+                                    "update",
                                     vector_id=mem_id,
                                     vector=None,  # Keep same embeddings
                                     payload=updated_metadata,
                                 )
+                                if self.lexical_index is not None:
+                                    await asyncio.to_thread(
+                                        self.lexical_index.upsert,
+                                        mem_id,
+                                        updated_metadata.get("data", ""),
+                                        updated_metadata,
+                                    )
                                 logger.info(f"Updated session IDs for memory {mem_id} (async)")
 
                             task = asyncio.create_task(update_session_ids(memory_id, metadata))
@@ -1631,15 +2433,62 @@ class AsyncMemory(MemoryBase):
                     logger.error(f"Error awaiting memory task (async): {e}")
         except Exception as e:
             logger.error(f"Error in memory processing loop (async): {e}")
+        return returned_memories
 
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
-        capture_event(
-            "mem0.add",
-            self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
-        )
+    async def _add_raw_messages(self, messages, metadata, effective_filters):
+        """Store every non-system message as a memory, without inferring facts."""
+        returned_memories = []
+        added_hashes = set()
+        for message_dict in messages:
+            if (
+                not isinstance(message_dict, dict)
+                or message_dict.get("role") is None
+                or message_dict.get("content") is None
+            ):
+                logger.warning(f"Skipping invalid message format (async): {message_dict}")
+                continue
+
+            if message_dict["role"] == "system":
+                continue
+
+            per_msg_meta = deepcopy(metadata)
+            per_msg_meta["role"] = message_dict["role"]
+
+            actor_name = message_dict.get("name")
+            if actor_name:
+                per_msg_meta["actor_id"] = actor_name
+
+            msg_content = message_dict["content"]
+            msg_embeddings = await self._aembed(msg_content, "add")
+            if self.config.skip_duplicate_memories:
+                if await self._is_duplicate(msg_content, msg_embeddings, effective_filters, added_hashes):
+                    logger.info(f"Skipping duplicate memory (async): {msg_content}")
+                    continue
+                added_hashes.add(hashlib.md5(msg_content.encode()).hexdigest())
+            mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+
+            returned_memories.append(
+                {
+                    "id": mem_id,
+                    "memory": msg_content,
+                    "event": "ADD",
+                    "actor_id": actor_name if actor_name else None,
+                    "role": message_dict["role"],
+                }
+            )
         return returned_memories
 
+    async def _is_duplicate(self, data, embeddings, filters, added_hashes):
+        """Whether a memory with the hash of `data` was just added or is stored in the session scope of `filters`."""
+        memory_hash = hashlib.md5(data.encode()).hexdigest()
+        if memory_hash in added_hashes:
+            return True
+        # A stored copy of `data` has the same embedding, so it is among the nearest neighbours
+        nearest = await self._avector_store(
+            "search", query=data, vectors=embeddings, limit=5, filters=_search_filters(filters)
+        )
+        return any(mem.payload.get("hash") == memory_hash for mem in nearest)
+
     async def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -1662,7 +2511,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await self._avector_store("get", vector_id=memory_id)
         if not memory:
             return None
 
@@ -1758,7 +2607,7 @@ class AsyncMemory(MemoryBase):
         return results_dict
 
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await self._avector_store("list", filters=filters, limit=limit)
 
         # Handle different vector store return formats by inspecting first element
         if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
@@ -1827,6 +2676,8 @@ class AsyncMemory(MemoryBase):
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Legacy filters to apply to the search. Defaults to None.
             threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+                With `enable_hybrid_search`, it only applies to vector hits and the returned `score`
+                is the reciprocal-rank fusion score of the vector and BM25 rankings.
             filters (dict, optional): Enhanced metadata filtering with operators:
                 - {"key": "value"} - exact match
                 - {"key": {"eq": "value"}} - equals
@@ -1898,9 +2749,12 @@ class AsyncMemory(MemoryBase):
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
             try:
+                # Only the strongest candidates are worth a cross-encoder or LLM pass
+                rerank_top_n = getattr(self.reranker.config, "rerank_top_n", None)
+                candidates = original_memories[:rerank_top_n] if rerank_top_n else original_memories
                 # Run reranking in thread pool to avoid blocking async loop
                 reranked_memories = await asyncio.to_thread(
-                    self.reranker.rerank, query, original_memories, limit
+                    self.reranker.rerank, query, candidates, limit
                 )
                 original_memories = reranked_memories
             except Exception as e:
@@ -2008,44 +2862,27 @@ class AsyncMemory(MemoryBase):
         return False
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        embeddings = await self._aembed(query, "search")
+        search_kwargs = {}
+        if threshold is not None and getattr(self.vector_store, "supports_score_threshold", False):
+            # Let the backend drop low-scoring hits before they are serialized and sent back
+            search_kwargs["threshold"] = threshold
+        memories = await self._avector_store(
+            "search", query=query, vectors=embeddings, limit=limit, filters=filters, **search_kwargs
         )
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        # Stores without native score cutoffs (or ignoring it for their metric) are filtered here,
+        # before any result dict is built for a hit that would be discarded anyway.
+        if threshold is not None:
+            memories = [mem for mem in memories if mem.score is not None and mem.score >= threshold]
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
+        if self.lexical_index is not None:
+            lexical_hits = await asyncio.to_thread(self.lexical_index.search, query, filters=filters, limit=limit)
+            return await asyncio.to_thread(
+                _fuse_lexical_results, memories, lexical_hits, filters, limit, self.vector_store.batch_get
+            )
 
-        return original_memories
+        return [_format_search_result(mem) for mem in memories]
 
     async def update(self, memory_id, data):
         """
@@ -2064,7 +2901,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await self._aembed(data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -2105,7 +2942,7 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        memories = await self._avector_store("list", filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -2138,7 +2975,7 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await self._aembed(data, "add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -2146,12 +2983,14 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        await self._avector_store(
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
         )
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.upsert, memory_id, data, metadata)
 
         await asyncio.to_thread(
             self.db.add_history,
@@ -2200,7 +3039,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await self._agenerate_response(messages=parsed_messages)
                 procedural_memory = remove_code_blocks(procedural_memory)
         
         except Exception as e:
@@ -2211,7 +3050,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await self._aembed(procedural_memory, "add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -2223,44 +3062,28 @@ class AsyncMemory(MemoryBase):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+            existing_memory = await self._avector_store("get", vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
 
-        new_metadata = deepcopy(metadata) if metadata is not None else {}
-
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        # Preserve session identifiers from existing memory only if not provided in new metadata
-        if "user_id" not in new_metadata and "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" not in new_metadata and "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" not in new_metadata and "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-
-        if "actor_id" not in new_metadata and "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" not in new_metadata and "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        new_metadata = _updated_memory_metadata(existing_memory, data, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await self._aembed(data, "update")
 
-        await asyncio.to_thread(
-            self.vector_store.update,
+        await self._avector_store(
+            "update",
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
         )
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.upsert, memory_id, data, new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
         await asyncio.to_thread(
@@ -2278,10 +3101,12 @@ class AsyncMemory(MemoryBase):
 
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        existing_memory = await self._avector_store("get", vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+        await self._avector_store("delete", vector_id=memory_id)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.delete, memory_id)
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
@@ -2316,10 +3141,26 @@ class AsyncMemory(MemoryBase):
 
         self.db = SQLiteManager(self.config.history_db_path)
 
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.reset)
+
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
+    async def close(self):
+        """
+        Release the resources held by this instance asynchronously:
+            Closes the vector store clients, the history database and the lexical index
+        """
+        if _has_native_async(self.vector_store, AsyncVectorStoreBase):
+            await self.vector_store.aclose()
+        await asyncio.to_thread(self.vector_store.close)
+        await asyncio.to_thread(self._telemetry_vector_store.close)
+        await asyncio.to_thread(self.db.close)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.close)
+
     async def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
@@ -2,6 +2,8 @@ import logging
 import os
 import platform
 import sys
+import threading
+import weakref
 
 from posthog import Posthog
 
@@ -34,7 +36,22 @@ class AnonymousTelemetry:
     def capture_event(self, event_name, properties=None, user_email=None):
         if properties is None:
             properties = {}
-        properties = {
+        properties = {**_system_properties(), **properties}
+        distinct_id = self.user_id if user_email is None else user_email
+        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
+
+    def close(self):
+        self.posthog.shutdown()
+
+
+_SYSTEM_PROPERTIES = None
+
+
+def _system_properties():
+    """Static platform details sent with every event; `platform.version()` and friends are slow to query."""
+    global _SYSTEM_PROPERTIES
+    if _SYSTEM_PROPERTIES is None:
+        _SYSTEM_PROPERTIES = {
             "client_source": "python",
             "client_version": mem0.__version__,
             "python_version": sys.version,
@@ -43,24 +60,33 @@ class AnonymousTelemetry:
             "os_release": platform.release(),
             "processor": platform.processor(),
             "machine": platform.machine(),
-            **properties,
         }
-        distinct_id = self.user_id if user_email is None else user_email
-        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
-
-    def close(self):
-        self.posthog.shutdown()
+    return _SYSTEM_PROPERTIES
 
 
 client_telemetry = AnonymousTelemetry()
 
+# One telemetry client per memory instance: every Posthog client starts its own consumer thread, so
+# creating one per event piles up threads under concurrent load.
+_oss_telemetry = weakref.WeakKeyDictionary()
+_oss_telemetry_lock = threading.Lock()
+
+
+def _get_oss_telemetry(memory_instance):
+    with _oss_telemetry_lock:
+        oss_telemetry = _oss_telemetry.get(memory_instance)
+        if oss_telemetry is None:
+            oss_telemetry = AnonymousTelemetry(
+                vector_store=memory_instance._telemetry_vector_store
+                if hasattr(memory_instance, "_telemetry_vector_store")
+                else None,
+            )
+            _oss_telemetry[memory_instance] = oss_telemetry
+        return oss_telemetry
+
 
 def capture_event(event_name, memory_instance, additional_data=None):
-    oss_telemetry = AnonymousTelemetry(
-        vector_store=memory_instance._telemetry_vector_store
-        if hasattr(memory_instance, "_telemetry_vector_store")
-        else None,
-    )
+    oss_telemetry = _get_oss_telemetry(memory_instance)
 
     event_data = {
         "collection": memory_instance.collection_name,
@@ -0,0 +1,230 @@
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+_live_queues: "weakref.WeakSet[AddQueue]" = weakref.WeakSet()
+
+
+def _flush_live_queues() -> None:
+    for add_queue in list(_live_queues):
+        add_queue.close()
+
+
+atexit.register(_flush_live_queues)
+
+
+def _scope_key(kwargs: Dict[str, Any]) -> tuple:
+    return (
+        kwargs.get("user_id"),
+        kwargs.get("agent_id"),
+        kwargs.get("run_id"),
+        repr(kwargs.get("metadata")),
+        repr(kwargs.get("filters")),
+    )
+
+
+def _merge_messages(turns: List[List[dict]]) -> List[dict]:
+    """
+    Merge the message lists of consecutive turns of one conversation.
+
+    Chat clients usually resend the whole history, so a later turn that starts with the earlier one
+    replaces it; otherwise the turns are concatenated.
+    """
+    merged: List[dict] = []
+    for messages in turns:
+        if merged == messages[: len(merged)]:
+            merged = list(messages)
+        else:
+            merged.extend(messages)
+    return merged
+
+
+class AddQueue:
+    """
+    Bounded background queue for `add()` calls made on behalf of chat completions.
+
+    A fixed pool of worker threads drains the queue. Turns that are waiting for the same scope
+    (user/agent/run plus metadata and filters) are coalesced into a single `add()`, and a scope is
+    never processed by two workers at once, so its adds keep their order. When the queue is full,
+    `overflow_policy` decides what happens to a new turn:
+
+    * ``"block"``: wait up to `block_timeout` seconds (forever if None) for room, then drop it.
+    * ``"drop_newest"``: drop the new turn.
+    * ``"drop_oldest"``: drop the oldest queued turn to make room.
+
+    Queued turns are flushed when the interpreter exits; call `flush()` to wait for them explicitly.
+    """
+
+    def __init__(
+        self,
+        add_fn: Callable[..., Any],
+        max_queue_size: int = 1000,
+        num_workers: int = 2,
+        overflow_policy: str = "block",
+        block_timeout: Optional[float] = None,
+        name: str = "mem0-add-queue",
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got '{overflow_policy}'")
+        self.add_fn = add_fn
+        self.max_queue_size = max_queue_size
+        self.num_workers = num_workers
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.name = name
+
+        # scope key -> queued turns as (sequence, enqueued_at, add kwargs), oldest first
+        self._pending: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+        self._depth = 0
+        self._sequence = 0
+        self._in_flight: set = set()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+        # Counters behind `stats()`, guarded by `_cond`
+        self._enqueued = 0
+        self._dropped = 0
+        self._adds = 0
+        self._served = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._add_seconds = 0.0
+        self._max_add_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+
+        _live_queues.add(self)
+
+    def submit(self, **add_kwargs) -> bool:
+        """Queue an `add()` call; returns False if the turn was dropped because the queue is full."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if self._depth >= self.max_queue_size and not self._make_room():
+                self._dropped += 1
+                logger.warning(f"{self.name} is full ({self.max_queue_size} turns), dropping a memory add")
+                return False
+
+            self._sequence += 1
+            key = _scope_key(add_kwargs)
+            self._pending.setdefault(key, []).append((self._sequence, time.perf_counter(), add_kwargs))
+            self._depth += 1
+            self._enqueued += 1
+            self._ensure_workers()
+            self._cond.notify_all()
+            return True
+
+    def _make_room(self) -> bool:
+        if self.overflow_policy == "drop_newest":
+            return False
+        if self.overflow_policy == "drop_oldest":
+            oldest_key = min(self._pending, key=lambda key: self._pending[key][0][0])
+            self._pending[oldest_key].pop(0)
+            if not self._pending[oldest_key]:
+                del self._pending[oldest_key]
+            self._depth -= 1
+            self._dropped += 1
+            logger.warning(f"{self.name} is full ({self.max_queue_size} turns), dropped the oldest memory add")
+            return True
+        has_room = self._cond.wait_for(lambda: self._depth < self.max_queue_size or self._closed, self.block_timeout)
+        return has_room and not self._closed
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.num_workers:
+            worker = threading.Thread(target=self._run, name=f"{self.name}-{len(self._workers)}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_scope(self) -> Optional[tuple]:
+        for key in self._pending:
+            if key not in self._in_flight:
+                return key
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._next_scope() is not None or (self._closed and not self._depth))
+                key = self._next_scope()
+                if key is None:
+                    return
+                turns = self._pending.pop(key)
+                self._depth -= len(turns)
+                self._in_flight.add(key)
+                # Room was freed for blocked producers
+                self._cond.notify_all()
+
+            started = time.perf_counter()
+            failed = False
+            try:
+                self._add(turns)
+            except Exception as e:
+                failed = True
+                logger.error(f"{self.name} failed to add {len(turns)} turn(s) to memory: {e}")
+            elapsed = time.perf_counter() - started
+
+            with self._cond:
+                self._in_flight.discard(key)
+                self._adds += 1
+                self._served += len(turns)
+                self._coalesced += len(turns) - 1
+                self._failed += int(failed)
+                self._add_seconds += elapsed
+                self._max_add_seconds = max(self._max_add_seconds, elapsed)
+                self._queue_wait_seconds += sum(started - enqueued_at for _, enqueued_at, _ in turns)
+                self._cond.notify_all()
+
+    def _add(self, turns: List[tuple]) -> None:
+        add_kwargs = dict(turns[-1][2])
+        if len(turns) > 1:
+            add_kwargs["messages"] = _merge_messages([kwargs["messages"] for _, _, kwargs in turns])
+        self.add_fn(**add_kwargs)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued turn has been added; returns False if `timeout` passed first."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._depth and not self._in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting turns and let the workers finish the ones already queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            workers = list(self._workers)
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for worker in workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return queue depth and add metrics collected since creation.
+
+        `coalesced` counts turns merged into another turn's `add()`. Add latency is the duration of
+        the `add()` call; queue wait is the time a turn spent queued before its `add()` started.
+        """
+        with self._cond:
+            return {
+                "queue_depth": self._depth,
+                "in_flight": len(self._in_flight),
+                "enqueued": self._enqueued,
+                "dropped": self._dropped,
+                "adds": self._adds,
+                "coalesced": self._coalesced,
+                "failed": self._failed,
+                "avg_add_latency_ms": 1000.0 * self._add_seconds / self._adds if self._adds else 0.0,
+                "max_add_latency_ms": 1000.0 * self._max_add_seconds,
+                "avg_queue_wait_ms": 1000.0 * self._queue_wait_seconds / self._served if self._served else 0.0,
+            }
@@ -1,7 +1,6 @@
 import logging
 import subprocess
 import sys
-import threading
 from typing import List, Optional, Union
 
 import httpx
@@ -21,6 +20,7 @@ except ImportError:
 from mem0 import Memory, MemoryClient
 from mem0.configs.prompts import MEMORY_ANSWER_PROMPT
 from mem0.memory.telemetry import capture_client_event, capture_event
+from mem0.proxy.add_queue import AddQueue
 
 logger = logging.getLogger(__name__)
 
@@ -31,23 +31,34 @@ class Mem0:
         config: Optional[dict] = None,
         api_key: Optional[str] = None,
         host: Optional[str] = None,
+        add_queue_config: Optional[dict] = None,
     ):
+        """
+        Args:
+            add_queue_config (dict, optional): Keyword arguments for the `AddQueue` that stores chat
+                turns in the background, e.g. `max_queue_size`, `num_workers`, `overflow_policy`.
+        """
         if api_key:
             self.mem0_client = MemoryClient(api_key, host)
         else:
             self.mem0_client = Memory.from_config(config) if config else Memory()
 
-        self.chat = Chat(self.mem0_client)
+        self.chat = Chat(self.mem0_client, add_queue_config)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every chat turn queued for memory has been added."""
+        return self.chat.completions.flush(timeout)
 
 
 class Chat:
-    def __init__(self, mem0_client):
-        self.completions = Completions(mem0_client)
+    def __init__(self, mem0_client, add_queue_config: Optional[dict] = None):
+        self.completions = Completions(mem0_client, add_queue_config)
 
 
 class Completions:
-    def __init__(self, mem0_client):
+    def __init__(self, mem0_client, add_queue_config: Optional[dict] = None):
         self.mem0_client = mem0_client
+        self.add_queue = AddQueue(self.mem0_client.add, **(add_queue_config or {}))
 
     def create(
         self,
@@ -150,18 +161,23 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
-        def add_task():
-            logger.debug("Adding to memory asynchronously")
-            self.mem0_client.add(
-                messages=messages,
-                user_id=user_id,
-                agent_id=agent_id,
-                run_id=run_id,
-                metadata=metadata,
-                filters=filters,
-            )
+        logger.debug("Queueing memory add")
+        self.add_queue.submit(
+            messages=messages,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            metadata=metadata,
+            filters=filters,
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued memory add has finished; returns False if `timeout` passed first."""
+        return self.add_queue.flush(timeout)
 
-        threading.Thread(target=add_task, daemon=True).start()
+    def stats(self) -> dict:
+        """Queue depth and add-latency metrics of the background add queue."""
+        return self.add_queue.stats()
 
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
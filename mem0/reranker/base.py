@@ -1,20 +1,105 @@
+import hashlib
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class RerankScoreCache:
+    """Thread-safe LRU cache of relevance scores keyed on (model, query hash, document hash)."""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._scores: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[float]:
+        with self._lock:
+            score = self._scores.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def set(self, key: Tuple[str, str, str], score: float) -> None:
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
 
 class BaseReranker(ABC):
     """Abstract base class for all rerankers."""
-    
+
+    score_cache: Optional[RerankScoreCache] = None
+
     @abstractmethod
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents based on relevance to the query.
-        
+
         Args:
             query: The search query
-            documents: List of documents to rerank, each with 'memory' field  
+            documents: List of documents to rerank, each with 'memory' field
             top_k: Number of top documents to return (None = return all)
-            
+
         Returns:
             List of reranked documents with added 'rerank_score' field
         """
-        pass
\ No newline at end of file
+        pass
+
+    @staticmethod
+    def _document_text(doc: Dict[str, Any]) -> str:
+        """Extract the text to score from a search result."""
+        if 'memory' in doc:
+            return doc['memory']
+        elif 'text' in doc:
+            return doc['text']
+        elif 'content' in doc:
+            return doc['content']
+        return str(doc)
+
+    def _cached_scores(
+        self,
+        query: str,
+        documents: List[Dict[str, Any]],
+        doc_texts: List[str],
+        score_pairs: Callable[[List[List[str]]], List[float]],
+    ) -> List[float]:
+        """
+        Score (query, document) pairs, only calling `score_pairs` for pairs missing from the score cache.
+
+        Documents are identified by the `hash` already stored with each memory, falling back to an MD5 of
+        the text, so an edited memory never reuses the score of its previous content. A None score from
+        `score_pairs` is returned as is and not cached.
+        """
+        if self.score_cache is None:
+            return list(score_pairs([[query, text] for text in doc_texts]))
+
+        model = str(getattr(self.config, "model", None) or type(self).__name__)
+        query_hash = hashlib.md5(query.encode()).hexdigest()
+        keys = [
+            (model, query_hash, doc.get("hash") or hashlib.md5(text.encode()).hexdigest())
+            for doc, text in zip(documents, doc_texts)
+        ]
+
+        scores: List[Optional[float]] = [self.score_cache.get(key) for key in keys]
+        missing = [idx for idx, score in enumerate(scores) if score is None]
+        if missing:
+            computed = score_pairs([[query, doc_texts[idx]] for idx in missing])
+            for idx, score in zip(missing, computed):
+                if score is None:
+                    # The scorer could not produce a score; the caller picks a fallback that is not cached
+                    continue
+                scores[idx] = float(score)
+                self.score_cache.set(keys[idx], float(score))
+        return scores
@@ -1,9 +1,10 @@
 from typing import List, Dict, Any, Union
 import numpy as np
 
-from mem0.reranker.base import BaseReranker
+from mem0.reranker.base import BaseReranker, RerankScoreCache
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.huggingface import HuggingFaceRerankerConfig
+from mem0.utils.batching import MicroBatcher
 
 try:
     from transformers import AutoTokenizer, AutoModelForSequenceClassification
@@ -56,6 +57,52 @@ class HuggingFaceReranker(BaseReranker):
         self.model.to(self.device)
         self.model.eval()
 
+        self.score_cache = RerankScoreCache(self.config.score_cache_size) if self.config.score_cache_size else None
+
+        # Optionally share forward passes between concurrent searches
+        self._batcher = None
+        if self.config.micro_batch_wait_ms is not None:
+            self._batcher = MicroBatcher(
+                self._predict,
+                max_batch_size=self.config.batch_size,
+                max_wait_ms=self.config.micro_batch_wait_ms,
+                name="mem0-huggingface-reranker",
+            )
+
+    def _predict(self, pairs: List[List[str]]) -> List[float]:
+        """Return raw cross-encoder logits for query-document pairs, processed in batches."""
+        scores = []
+        for i in range(0, len(pairs), self.config.batch_size):
+            batch_pairs = pairs[i:i + self.config.batch_size]
+
+            # Tokenize batch
+            inputs = self.tokenizer(
+                batch_pairs,
+                padding=True,
+                truncation=True,
+                max_length=self.config.max_length,
+                return_tensors="pt"
+            ).to(self.device)
+
+            # Get scores
+            with torch.no_grad():
+                outputs = self.model(**inputs)
+                batch_scores = outputs.logits.squeeze(-1).cpu().numpy()
+
+                # Handle single item case
+                if batch_scores.ndim == 0:
+                    batch_scores = [float(batch_scores)]
+                else:
+                    batch_scores = batch_scores.tolist()
+
+                scores.extend(batch_scores)
+        return scores
+
+    def _score_pairs(self, pairs: List[List[str]]) -> List[float]:
+        if self._batcher is not None:
+            return self._batcher.submit(pairs)
+        return self._predict(pairs)
+
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents using HuggingFace cross-encoder model.
@@ -72,46 +119,11 @@ class HuggingFaceReranker(BaseReranker):
             return documents
 
         # Extract text content for reranking
-        doc_texts = []
-        for doc in documents:
-            if 'memory' in doc:
-                doc_texts.append(doc['memory'])
-            elif 'text' in doc:
-                doc_texts.append(doc['text'])
-            elif 'content' in doc:
-                doc_texts.append(doc['content'])
-            else:
-                doc_texts.append(str(doc))
+        doc_texts = [self._document_text(doc) for doc in documents]
 
         try:
-            scores = []
-
-            # Process documents in batches
-            for i in range(0, len(doc_texts), self.config.batch_size):
-                batch_docs = doc_texts[i:i + self.config.batch_size]
-                batch_pairs = [[query, doc] for doc in batch_docs]
-
-                # Tokenize batch
-                inputs = self.tokenizer(
-                    batch_pairs,
-                    padding=True,
-                    truncation=True,
-                    max_length=self.config.max_length,
-                    return_tensors="pt"
-                ).to(self.device)
-
-                # Get scores
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    batch_scores = outputs.logits.squeeze(-1).cpu().numpy()
-
-                    # Handle single item case
-                    if batch_scores.ndim == 0:
-                        batch_scores = [float(batch_scores)]
-                    else:
-                        batch_scores = batch_scores.tolist()
-
-                    scores.extend(batch_scores)
+            # Raw logits are cached; normalization depends on the candidate set so it happens afterwards
+            scores = self._cached_scores(query, documents, doc_texts, self._score_pairs)
 
             # Normalize scores if requested
             if self.config.normalize:
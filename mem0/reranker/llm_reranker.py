@@ -1,7 +1,7 @@
 import re
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 
-from mem0.reranker.base import BaseReranker
+from mem0.reranker.base import BaseReranker, RerankScoreCache
 from mem0.utils.factory import LlmFactory
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.llm import LLMRerankerConfig
@@ -49,6 +49,9 @@ class LLMReranker(BaseReranker):
 
         # Default scoring prompt
         self.scoring_prompt = getattr(self.config, 'scoring_prompt', None) or self._get_default_prompt()
+
+        # Scores only depend on (model, query, memory), so repeated searches can skip the LLM call
+        self.score_cache = RerankScoreCache(self.config.score_cache_size) if self.config.score_cache_size else None
         
     def _get_default_prompt(self) -> str:
         """Get the default scoring prompt template."""
@@ -66,8 +69,8 @@ Document: "{document}"
 
 Provide only a single numerical score between 0.0 and 1.0. Do not include any explanation or additional text."""
 
-    def _extract_score(self, response_text: str) -> float:
-        """Extract numerical score from LLM response."""
+    def _extract_score(self, response_text: str) -> Optional[float]:
+        """Extract numerical score from LLM response, or None if it contains no valid score."""
         # Look for decimal numbers between 0.0 and 1.0
         pattern = r'\b([01](?:\.\d+)?)\b'
         matches = re.findall(pattern, response_text)
@@ -76,9 +79,24 @@ Provide only a single numerical score between 0.0 and 1.0. Do not include any ex
             score = float(matches[0])
             return min(max(score, 0.0), 1.0)  # Clamp between 0.0 and 1.0
         
-        # Fallback: return 0.5 if no valid score found
-        return 0.5
+        return None
     
+    def _score_pairs(self, pairs: List[List[str]]) -> List[Optional[float]]:
+        """Ask the LLM for a relevance score for each (query, document) pair."""
+        scores = []
+        for query, doc_text in pairs:
+            # Generate scoring prompt
+            prompt = self.scoring_prompt.format(query=query, document=doc_text)
+
+            # Get LLM response
+            response = self.llm.generate_response(
+                messages=[{"role": "user", "content": prompt}]
+            )
+
+            # Extract score from response
+            scores.append(self._extract_score(response))
+        return scores
+
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents using LLM scoring.
@@ -98,27 +116,15 @@ Provide only a single numerical score between 0.0 and 1.0. Do not include any ex
         
         for doc in documents:
             # Extract text content
-            if 'memory' in doc:
-                doc_text = doc['memory']
-            elif 'text' in doc:
-                doc_text = doc['text']  
-            elif 'content' in doc:
-                doc_text = doc['content']
-            else:
-                doc_text = str(doc)
-            
+            doc_text = self._document_text(doc)
+
             try:
-                # Generate scoring prompt
-                prompt = self.scoring_prompt.format(query=query, document=doc_text)
-                
-                # Get LLM response
-                response = self.llm.generate_response(
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                # Extract score from response
-                score = self._extract_score(response)
-                
+                # Only ask the LLM for pairs that are not cached yet
+                score = self._cached_scores(query, [doc], [doc_text], self._score_pairs)[0]
+                if score is None:
+                    # Unparseable reply: neutral score, left out of the cache so the next search asks again
+                    score = 0.5
+
                 # Create scored document
                 scored_doc = doc.copy()
                 scored_doc['rerank_score'] = score
@@ -129,7 +135,7 @@ Provide only a single numerical score between 0.0 and 1.0. Do not include any ex
                 scored_doc = doc.copy()
                 scored_doc['rerank_score'] = 0.5
                 scored_docs.append(scored_doc)
-        
+
         # Sort by relevance score in descending order
         scored_docs.sort(key=lambda x: x['rerank_score'], reverse=True)
         
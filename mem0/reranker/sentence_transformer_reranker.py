@@ -1,9 +1,10 @@
 from typing import List, Dict, Any, Union
 import numpy as np
 
-from mem0.reranker.base import BaseReranker
+from mem0.reranker.base import BaseReranker, RerankScoreCache
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.sentence_transformer import SentenceTransformerRerankerConfig
+from mem0.utils.batching import MicroBatcher
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -42,7 +43,30 @@ class SentenceTransformerReranker(BaseReranker):
 
         self.config = config
         self.model = SentenceTransformer(self.config.model, device=self.config.device)
-        
+        self.score_cache = RerankScoreCache(self.config.score_cache_size) if self.config.score_cache_size else None
+
+        # Optionally share forward passes between concurrent searches
+        self._batcher = None
+        if self.config.micro_batch_wait_ms is not None:
+            self._batcher = MicroBatcher(
+                self._predict,
+                max_batch_size=self.config.batch_size,
+                max_wait_ms=self.config.micro_batch_wait_ms,
+                name="mem0-sentence-transformer-reranker",
+            )
+
+    def _predict(self, pairs: List[List[str]]) -> List[float]:
+        """Score query-document pairs with the cross-encoder."""
+        scores = self.model.predict(pairs)
+        if isinstance(scores, np.ndarray):
+            scores = scores.tolist()
+        return scores
+
+    def _score_pairs(self, pairs: List[List[str]]) -> List[float]:
+        if self._batcher is not None:
+            return self._batcher.submit(pairs)
+        return self._predict(pairs)
+
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents using sentence transformer cross-encoder.
@@ -59,26 +83,12 @@ class SentenceTransformerReranker(BaseReranker):
             return documents
             
         # Extract text content for reranking
-        doc_texts = []
-        for doc in documents:
-            if 'memory' in doc:
-                doc_texts.append(doc['memory'])
-            elif 'text' in doc:
-                doc_texts.append(doc['text'])  
-            elif 'content' in doc:
-                doc_texts.append(doc['content'])
-            else:
-                doc_texts.append(str(doc))
-        
+        doc_texts = [self._document_text(doc) for doc in documents]
+
         try:
-            # Create query-document pairs
-            pairs = [[query, doc_text] for doc_text in doc_texts]
-            
-            # Get similarity scores
-            scores = self.model.predict(pairs)
-            if isinstance(scores, np.ndarray):
-                scores = scores.tolist()
-            
+            # Get similarity scores, reusing cached scores for pairs seen before
+            scores = self._cached_scores(query, documents, doc_texts, self._score_pairs)
+
             # Combine documents with scores
             doc_score_pairs = list(zip(documents, scores))
             
@@ -0,0 +1,155 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent calls into batched calls of a single processing function.
+
+    Callers hand over a list of items with `submit` and block until their results are ready. A worker
+    thread gathers requests until `max_batch_size` items are pending or `max_wait_ms` has passed since
+    the first one arrived, runs `process_batch` once over all of them and hands each caller its slice.
+    This lets many threads share one forward pass of a local model instead of running one each.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "mem0-micro-batcher",
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Counters behind `stats()`; only the worker thread writes them
+        self._batches = 0
+        self._requests = 0
+        self._items = 0
+        self._busy_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+        self._max_queue_wait_seconds = 0.0
+
+    def submit(self, items: List[Any]) -> List[Any]:
+        """Process `items` as part of a shared batch and return their results in order."""
+        if not items:
+            return []
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((list(items), future, time.perf_counter()))
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+
+            batch = [request]
+            pending = len(request[0])
+            deadline = time.perf_counter() + self.max_wait
+            while pending < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    # Finish the requests already taken, then stop
+                    self._queue.put(None)
+                    break
+                batch.append(request)
+                pending += len(request[0])
+
+            self._process(batch)
+
+    def _process(self, batch: List[tuple]) -> None:
+        items = [item for request_items, _, _ in batch for item in request_items]
+        started = time.perf_counter()
+        waits = [started - enqueued_at for _, _, enqueued_at in batch]
+        try:
+            results = list(self.process_batch(items))
+            if len(results) != len(items):
+                raise ValueError(f"process_batch returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            logger.error(f"{self.name} failed to process a batch of {len(items)} items: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        finally:
+            self._record(len(batch), len(items), time.perf_counter() - started, waits)
+
+        offset = 0
+        for request_items, future, _ in batch:
+            future.set_result(results[offset : offset + len(request_items)])
+            offset += len(request_items)
+
+    def _record(self, requests: int, items: int, busy_seconds: float, waits: List[float]) -> None:
+        with self._lock:
+            self._batches += 1
+            self._requests += requests
+            self._items += items
+            self._busy_seconds += busy_seconds
+            self._queue_wait_seconds += sum(waits)
+            self._max_queue_wait_seconds = max(self._max_queue_wait_seconds, max(waits))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return throughput and queue-wait metrics collected since creation (or the last `reset_stats`).
+
+        `items_per_second` is measured over the time spent inside `process_batch`, so it reflects the
+        throughput of the batched function rather than how busy the callers kept it. Queue wait is the
+        time between `submit` and the start of the batch that served the request.
+        """
+        with self._lock:
+            batches, requests, items = self._batches, self._requests, self._items
+            busy, wait, max_wait = self._busy_seconds, self._queue_wait_seconds, self._max_queue_wait_seconds
+        return {
+            "batches": batches,
+            "requests": requests,
+            "items": items,
+            "avg_batch_size": items / batches if batches else 0.0,
+            "items_per_second": items / busy if busy > 0 else 0.0,
+            "avg_queue_wait_ms": 1000.0 * wait / requests if requests else 0.0,
+            "max_queue_wait_ms": 1000.0 * max_wait,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._batches = self._requests = self._items = 0
+            self._busy_seconds = self._queue_wait_seconds = self._max_queue_wait_seconds = 0.0
+
+    def close(self) -> None:
+        """Stop the worker once the requests already queued have been processed."""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
@@ -2,6 +2,13 @@ from abc import ABC, abstractmethod
 
 
 class VectorStoreBase(ABC):
+    # Stores that set this accept a ``threshold`` keyword in ``search`` and apply the
+    # minimum score cutoff natively, so low-scoring hits never leave the backend.
+    supports_score_threshold = False
+    # Stores that set this take float32 numpy arrays wherever they take vectors, so `Memory` can
+    # hand over embeddings without round-tripping them through Python lists.
+    accepts_numpy_vectors = False
+
     @abstractmethod
     def create_col(self, name, vector_size, distance):
         """Create a new collection."""
@@ -56,3 +63,84 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    def close(self):
+        """Close the client of the store. Stores that hold other connections, such as a pool, override this."""
+        close = getattr(getattr(self, "client", None), "close", None)
+        if callable(close):
+            close()
+
+    # The batch methods below fall back to one call per ID. Stores that can do the work in a single
+    # round trip override them; `Memory.add` applies all of its updates and deletes through them and
+    # `Memory.add_many` runs the searches of many conversations with `batch_search`.
+
+    def batch_search(self, queries, vectors, limit=5, filters=None):
+        """Run several searches; `filters` holds one filter dict per query. Returns one result list per query."""
+        return [
+            self.search(query=query, vectors=query_vectors, limit=limit, filters=filters[idx] if filters else None)
+            for idx, (query, query_vectors) in enumerate(zip(queries, vectors))
+        ]
+
+    def batch_get(self, vector_ids):
+        """Retrieve vectors by ID, in the order of `vector_ids`, with None for missing IDs."""
+        return [self.get(vector_id=vector_id) for vector_id in vector_ids]
+
+    def batch_update(self, vector_ids, vectors=None, payloads=None):
+        """Update vectors and their payloads; a None entry in `vectors` keeps the stored vector."""
+        for idx, vector_id in enumerate(vector_ids):
+            self.update(
+                vector_id=vector_id,
+                vector=vectors[idx] if vectors else None,
+                payload=payloads[idx] if payloads else None,
+            )
+
+    def batch_delete(self, vector_ids):
+        """Delete vectors by ID."""
+        for vector_id in vector_ids:
+            self.delete(vector_id=vector_id)
+
+
+class AsyncVectorStoreBase(ABC):
+    """
+    Optional interface of vector stores with a native asyncio client.
+
+    Covers the calls `AsyncMemory` makes per request; collection management stays synchronous. The
+    methods take the same arguments and return the same results as their synchronous counterparts.
+    """
+
+    # Stores whose async client cannot be built for the current configuration turn this off
+    native_async = True
+
+    async def aclose(self):
+        """Close the async client of the store."""
+        pass
+
+    @abstractmethod
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Insert vectors into a collection."""
+        pass
+
+    @abstractmethod
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        """Search for similar vectors."""
+        pass
+
+    @abstractmethod
+    async def adelete(self, vector_id):
+        """Delete a vector by ID."""
+        pass
+
+    @abstractmethod
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Update a vector and its payload."""
+        pass
+
+    @abstractmethod
+    async def aget(self, vector_id):
+        """Retrieve a vector by ID."""
+        pass
+
+    @abstractmethod
+    async def alist(self, filters=None, limit=None):
+        """List all memories."""
+        pass
@@ -22,6 +22,8 @@ class OutputData(BaseModel):
 
 
 class ElasticsearchDB(VectorStoreBase):
+    supports_score_threshold = True
+
     def __init__(self, **kwargs):
         config = ElasticsearchConfig(**kwargs)
 
@@ -129,12 +131,20 @@ class ElasticsearchDB(VectorStoreBase):
         return results
 
     def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+        self,
+        query: str,
+        vectors: List[float],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        threshold: Optional[float] = None,
     ) -> List[OutputData]:
         """
         Search with two options:
         1. Use custom search query if provided
         2. Use KNN search on vectors with pre-filtering if no custom search query is provided
+
+        A ``threshold`` on the returned score is pushed into the KNN query as a ``similarity`` cutoff.
+        It is not applied to custom search queries.
         """
         if self.custom_search_query:
             search_query = self.custom_search_query(vectors, limit, filters)
@@ -142,6 +152,9 @@ class ElasticsearchDB(VectorStoreBase):
             search_query = {
                 "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
             }
+            if threshold is not None:
+                # For cosine fields _score is (1 + cosine) / 2, while `similarity` is on the raw cosine
+                search_query["knn"]["similarity"] = 2 * threshold - 1
             if filters:
                 filter_conditions = []
                 for key, value in filters.items():
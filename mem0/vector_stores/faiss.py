@@ -38,6 +38,8 @@ class OutputData(BaseModel):
 
 
 class FAISS(VectorStoreBase):
+    accepts_numpy_vectors = True
+
     def __init__(
         self,
         collection_name: str,
@@ -208,9 +210,11 @@ class FAISS(VectorStoreBase):
         if len(vectors) != len(ids) or len(vectors) != len(payloads):
             raise ValueError("Vectors, payloads, and IDs must have the same length")
 
-        vectors_np = np.array(vectors, dtype=np.float32)
+        # normalize_L2 works in place, so only copy when the caller's arrays would otherwise be modified
+        normalize = self.normalize_L2 and self.distance_strategy.lower() == "euclidean"
+        vectors_np = np.array(vectors, dtype=np.float32) if normalize else np.asarray(vectors, dtype=np.float32)
 
-        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+        if normalize:
             faiss.normalize_L2(vectors_np)
 
         self.index.add(vectors_np)
@@ -242,12 +246,13 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        query_vectors = np.array(vectors, dtype=np.float32)
+        normalize = self.normalize_L2 and self.distance_strategy.lower() == "euclidean"
+        query_vectors = np.array(vectors, dtype=np.float32) if normalize else np.asarray(vectors, dtype=np.float32)
 
         if len(query_vectors.shape) == 1:
             query_vectors = query_vectors.reshape(1, -1)
 
-        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+        if normalize:
             faiss.normalize_L2(query_vectors)
 
         fetch_k = limit * 2 if filters else limit
@@ -23,6 +23,8 @@ class OutputData(BaseModel):
 
 
 class MilvusDB(VectorStoreBase):
+    supports_score_threshold = True
+
     def __init__(
         self,
         url: str,
@@ -139,7 +141,9 @@ class MilvusDB(VectorStoreBase):
 
         return memory
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+    def search(
+        self, query: str, vectors: list, limit: int = 5, filters: dict = None, threshold: float = None
+    ) -> list:
         """
         Search for similar vectors.
 
@@ -148,17 +152,23 @@ class MilvusDB(VectorStoreBase):
             vectors (List[float]): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Dict, optional): Filters to apply to the search. Defaults to None.
+            threshold (float, optional): Minimum similarity for a hit to be returned. Only applied as a
+                range search radius for COSINE and IP metrics, where higher scores are better. Defaults to None.
 
         Returns:
             list: Search results.
         """
         query_filter = self._create_filter(filters) if filters else None
+        search_kwargs = {}
+        if threshold is not None and self.metric_type in (MetricType.COSINE, MetricType.IP):
+            search_kwargs["search_params"] = {"params": {"radius": threshold}}
         hits = self.client.search(
             collection_name=self.collection_name,
             data=[vectors],
             limit=limit,
             filter=query_filter,
             output_fields=["*"],
+            **search_kwargs,
         )
         result = self._parse_output(data=hits[0])
         return result
@@ -309,6 +309,64 @@ class PGVector(VectorStoreBase):
                 return None
             return OutputData(id=str(result[0]), score=None, payload=result[2])
 
+    def batch_get(self, vector_ids: List[str]) -> List[Optional[OutputData]]:
+        """
+        Retrieve vectors by ID with a single query.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[Optional[OutputData]]: Retrieved vectors in the order of `vector_ids`, None for missing IDs.
+        """
+        with self._get_cursor() as cur:
+            cur.execute(
+                f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
+            )
+            results = cur.fetchall()
+        found = {str(r[0]): OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results}
+        return [found.get(str(vector_id)) for vector_id in vector_ids]
+
+    def batch_update(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[Optional[list[float]]]] = None,
+        payloads: Optional[List[dict]] = None,
+    ) -> None:
+        """
+        Update vectors and their payloads in a single transaction.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors; None entries keep the stored vector.
+            payloads (List[Dict], optional): Updated payloads.
+        """
+        vector_rows = [
+            (vectors[idx], vector_id) for idx, vector_id in enumerate(vector_ids) if vectors and vectors[idx]
+        ]
+        payload_rows = [
+            (Json(payloads[idx]), vector_id) for idx, vector_id in enumerate(vector_ids) if payloads and payloads[idx]
+        ]
+        with self._get_cursor(commit=True) as cur:
+            if vector_rows:
+                cur.executemany(f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s", vector_rows)
+            if payload_rows:
+                cur.executemany(f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s", payload_rows)
+
+    def batch_delete(self, vector_ids: List[str]) -> None:
+        """
+        Delete vectors by ID with a single query.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(
+                f"DELETE FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
+            )
+
     def list_cols(self) -> List[str]:
         """
         List all collections.
@@ -384,16 +442,21 @@ class PGVector(VectorStoreBase):
             results = cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def close(self) -> None:
+        """
+        Close the database connection pool.
+        """
+        if PSYCOPG_VERSION == 3:
+            self.connection_pool.close()
+        else:
+            self.connection_pool.closeall()
+
     def __del__(self) -> None:
         """
         Close the database connection pool when the object is deleted.
         """
         try:
-            # Close pool appropriately
-            if PSYCOPG_VERSION == 3:
-                self.connection_pool.close()
-            else:
-                self.connection_pool.closeall()
+            self.close()
         except Exception:
             pass
 
@@ -2,24 +2,31 @@ import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
+    OverwritePayloadOperation,
     PointIdsList,
+    PointsList,
     PointStruct,
+    QueryRequest,
     Range,
+    SetPayload,
+    UpsertOperation,
     VectorParams,
 )
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
 
-class Qdrant(VectorStoreBase):
+class Qdrant(VectorStoreBase, AsyncVectorStoreBase):
+    supports_score_threshold = True
+
     def __init__(
         self,
         collection_name: str,
@@ -31,6 +38,7 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        async_client: AsyncQdrantClient = None,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +53,11 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            async_client (AsyncQdrantClient, optional): Existing async Qdrant client instance. Defaults to None.
         """
+        self._async_client = async_client
+        # Connection settings of the async client, which is only created on the first async call
+        self._async_params = None
         if client:
             self.client = client
             self.is_local = False
@@ -67,6 +79,8 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                # A local database is locked by the client that opened it, so only servers get an async client
+                self._async_params = params
 
             self.client = QdrantClient(**params)
 
@@ -138,6 +152,26 @@ class Qdrant(VectorStoreBase):
         ]
         self.client.upsert(collection_name=self.collection_name, points=points)
 
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Insert vectors into a collection using the async client.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        points = [
+            PointStruct(
+                id=idx if ids is None else ids[idx],
+                vector=vector,
+                payload=payloads[idx] if payloads else {},
+            )
+            for idx, vector in enumerate(vectors)
+        ]
+        await self.async_client.upsert(collection_name=self.collection_name, points=points)
+
     def _create_filter(self, filters: dict) -> Filter:
         """
         Create a Filter object from the provided filters.
@@ -159,7 +193,9 @@ class Qdrant(VectorStoreBase):
                 conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
         return Filter(must=conditions) if conditions else None
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+    def search(
+        self, query: str, vectors: list, limit: int = 5, filters: dict = None, threshold: float = None
+    ) -> list:
         """
         Search for similar vectors.
 
@@ -168,16 +204,77 @@ class Qdrant(VectorStoreBase):
             vectors (list): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (dict, optional): Filters to apply to the search. Defaults to None.
+            threshold (float, optional): Minimum score for a point to be returned. Defaults to None.
 
         Returns:
             list: Search results.
         """
         query_filter = self._create_filter(filters) if filters else None
+        search_params = {}
+        if threshold is not None:
+            search_params["score_threshold"] = threshold
         hits = self.client.query_points(
             collection_name=self.collection_name,
             query=vectors,
             query_filter=query_filter,
             limit=limit,
+            **search_params,
+        )
+        return hits.points
+
+    def batch_search(self, queries: list, vectors: list, limit: int = 5, filters: list = None) -> list:
+        """
+        Run several searches in a single request.
+
+        Args:
+            queries (list): Queries.
+            vectors (list): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (list, optional): Filters to apply, one dict per query. Defaults to None.
+
+        Returns:
+            list: Search results, one list per query.
+        """
+        if not vectors:
+            return []
+        requests = [
+            QueryRequest(
+                query=query_vectors,
+                filter=self._create_filter(filters[idx]) if filters and filters[idx] else None,
+                limit=limit,
+                with_payload=True,
+            )
+            for idx, query_vectors in enumerate(vectors)
+        ]
+        responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [response.points for response in responses]
+
+    async def asearch(
+        self, query: str, vectors: list, limit: int = 5, filters: dict = None, threshold: float = None
+    ) -> list:
+        """
+        Search for similar vectors using the async client.
+
+        Args:
+            query (str): Query.
+            vectors (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+            threshold (float, optional): Minimum score for a point to be returned. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        search_params = {}
+        if threshold is not None:
+            search_params["score_threshold"] = threshold
+        hits = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            limit=limit,
+            **search_params,
         )
         return hits.points
 
@@ -195,6 +292,20 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    async def adelete(self, vector_id: int):
+        """
+        Delete a vector by ID using the async client.
+
+        Args:
+            vector_id (int): ID of the vector to delete.
+        """
+        await self.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(
+                points=[vector_id],
+            ),
+        )
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
@@ -207,6 +318,18 @@ class Qdrant(VectorStoreBase):
         point = PointStruct(id=vector_id, vector=vector, payload=payload)
         self.client.upsert(collection_name=self.collection_name, points=[point])
 
+    async def aupdate(self, vector_id: int, vector: list = None, payload: dict = None):
+        """
+        Update a vector and its payload using the async client.
+
+        Args:
+            vector_id (int): ID of the vector to update.
+            vector (list, optional): Updated vector. Defaults to None.
+            payload (dict, optional): Updated payload. Defaults to None.
+        """
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await self.async_client.upsert(collection_name=self.collection_name, points=[point])
+
     def get(self, vector_id: int) -> dict:
         """
         Retrieve a vector by ID.
@@ -220,6 +343,72 @@ class Qdrant(VectorStoreBase):
         result = self.client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
         return result[0] if result else None
 
+    async def aget(self, vector_id: int) -> dict:
+        """
+        Retrieve a vector by ID using the async client.
+
+        Args:
+            vector_id (int): ID of the vector to retrieve.
+
+        Returns:
+            dict: Retrieved vector.
+        """
+        result = await self.async_client.retrieve(
+            collection_name=self.collection_name, ids=[vector_id], with_payload=True
+        )
+        return result[0] if result else None
+
+    def batch_get(self, vector_ids: list) -> list:
+        """
+        Retrieve vectors by ID in a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to retrieve.
+
+        Returns:
+            list: Retrieved vectors in the order of `vector_ids`, None for missing IDs.
+        """
+        result = self.client.retrieve(collection_name=self.collection_name, ids=list(vector_ids), with_payload=True)
+        points = {str(point.id): point for point in result}
+        return [points.get(str(vector_id)) for vector_id in vector_ids]
+
+    def batch_update(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update vectors and their payloads in a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors; None entries keep the stored vector. Defaults to None.
+            payloads (list, optional): Updated payloads. Defaults to None.
+        """
+        points = []
+        operations = []
+        for idx, vector_id in enumerate(vector_ids):
+            vector = vectors[idx] if vectors else None
+            payload = payloads[idx] if payloads else None
+            if vector is None:
+                operations.append(
+                    OverwritePayloadOperation(overwrite_payload=SetPayload(payload=payload or {}, points=[vector_id]))
+                )
+            else:
+                points.append(PointStruct(id=vector_id, vector=vector, payload=payload))
+        if points:
+            operations.insert(0, UpsertOperation(upsert=PointsList(points=points)))
+        if operations:
+            self.client.batch_update_points(collection_name=self.collection_name, update_operations=operations)
+
+    def batch_delete(self, vector_ids: list):
+        """
+        Delete vectors by ID in a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=list(vector_ids)),
+        )
+
     def list_cols(self) -> list:
         """
         List all collections.
@@ -263,6 +452,42 @@ class Qdrant(VectorStoreBase):
         )
         return result
 
+    async def alist(self, filters: dict = None, limit: int = 100) -> list:
+        """
+        List all vectors in a collection using the async client.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            list: List of vectors.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        result = await self.async_client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return result
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        if self._async_client is None and self._async_params is not None:
+            self._async_client = AsyncQdrantClient(**self._async_params)
+        return self._async_client
+
+    @property
+    def native_async(self) -> bool:
+        return self._async_client is not None or self._async_params is not None
+
+    async def aclose(self):
+        """Close the async client, if it was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -46,6 +46,8 @@ class MemoryResult:
 
 
 class RedisDB(VectorStoreBase):
+    accepts_numpy_vectors = True
+
     def __init__(
         self,
         redis_url: str,
@@ -128,7 +130,7 @@ class RedisDB(VectorStoreBase):
                 "hash": payload["hash"],
                 "memory": payload["data"],
                 "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
+                "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
             }
 
             # Conditionally add optional fields
@@ -147,7 +149,7 @@ class RedisDB(VectorStoreBase):
         filter = reduce(lambda x, y: x & y, conditions)
 
         v = VectorQuery(
-            vector=np.array(vectors, dtype=np.float32).tobytes(),
+            vector=np.asarray(vectors, dtype=np.float32).tobytes(),
             vector_field_name="embedding",
             return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
             filter_expression=filter,
@@ -192,7 +194,7 @@ class RedisDB(VectorStoreBase):
             "memory": payload["data"],
             "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
             "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
-            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+            "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
         }
 
         for field in ["agent_id", "run_id", "user_id"]:
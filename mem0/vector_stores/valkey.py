@@ -42,6 +42,8 @@ class OutputData(BaseModel):
 
 
 class ValkeyDB(VectorStoreBase):
+    accepts_numpy_vectors = True
+
     def __init__(
         self,
         valkey_url: str,
@@ -294,7 +296,7 @@ class ValkeyDB(VectorStoreBase):
                     "hash": payload.get("hash", f"hash_{id}"),  # Use a default hash if not provided
                     "memory": payload.get("data", f"data_{id}"),  # Use a default data if not provided
                     "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                    "embedding": np.array(vector, dtype=np.float32).tobytes(),
+                    "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
                 }
 
                 # Add optional fields
@@ -425,7 +427,7 @@ class ValkeyDB(VectorStoreBase):
             list: List of OutputData objects.
         """
         # Convert the vector to bytes
-        vector_bytes = np.array(vectors, dtype=np.float32).tobytes()
+        vector_bytes = np.asarray(vectors, dtype=np.float32).tobytes()
 
         # Build the KNN part with optional EF_RUNTIME for HNSW
         if self.index_type == "hnsw" and ef_runtime is not None:
@@ -491,7 +493,7 @@ class ValkeyDB(VectorStoreBase):
                 "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
                 "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
                 "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
+                "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
             }
 
             # Add updated_at if available
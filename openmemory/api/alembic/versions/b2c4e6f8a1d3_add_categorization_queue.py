@@ -0,0 +1,45 @@
+"""add_categorization_queue
+
+Revision ID: b2c4e6f8a1d3
+Revises: afd00efbd06b
+Create Date: 2025-07-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c4e6f8a1d3'
+down_revision: Union[str, None] = 'afd00efbd06b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'categorization_queue',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('memory_id', sa.UUID(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('available_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['memory_id'], ['memories.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_categorization_queue_memory_id'), 'categorization_queue', ['memory_id'], unique=False)
+    op.create_index(op.f('ix_categorization_queue_created_at'), 'categorization_queue', ['created_at'], unique=False)
+    op.create_index(op.f('ix_categorization_queue_available_at'), 'categorization_queue', ['available_at'], unique=False)
+    op.create_index('idx_categorization_queue_ready', 'categorization_queue', ['attempts', 'available_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_categorization_queue_ready', table_name='categorization_queue')
+    op.drop_index(op.f('ix_categorization_queue_available_at'), table_name='categorization_queue')
+    op.drop_index(op.f('ix_categorization_queue_created_at'), table_name='categorization_queue')
+    op.drop_index(op.f('ix_categorization_queue_memory_id'), table_name='categorization_queue')
+    op.drop_table('categorization_queue')
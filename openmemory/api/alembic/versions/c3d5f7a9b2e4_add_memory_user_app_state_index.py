@@ -0,0 +1,26 @@
+"""add_memory_user_app_state_index
+
+Revision ID: c3d5f7a9b2e4
+Revises: b2c4e6f8a1d3
+Create Date: 2025-07-08 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d5f7a9b2e4'
+down_revision: Union[str, None] = 'b2c4e6f8a1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_memory_user_app_state', 'memories', ['user_id', 'app_id', 'state'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_memory_user_app_state', table_name='memories')
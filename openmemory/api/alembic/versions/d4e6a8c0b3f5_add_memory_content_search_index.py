@@ -0,0 +1,55 @@
+"""add_memory_content_search_index
+
+Revision ID: d4e6a8c0b3f5
+Revises: c3d5f7a9b2e4
+Create Date: 2025-07-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e6a8c0b3f5'
+down_revision: Union[str, None] = 'c3d5f7a9b2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5("
+            "content, content='memories', content_rowid='rowid', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN "
+            "INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN "
+            "INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE OF content ON memories BEGIN "
+            "INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content); "
+            "INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content); END"
+        )
+        op.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS idx_memory_content_trgm ON memories USING gin (content gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_insert")
+        op.execute("DROP TABLE IF EXISTS memories_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_memory_content_trgm")
@@ -0,0 +1,81 @@
+"""key_memory_search_index_by_memory_id
+
+Revision ID: e5f7a9b1c3d6
+Revises: d4e6a8c0b3f5
+Create Date: 2025-07-24 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f7a9b1c3d6'
+down_revision: Union[str, None] = 'd4e6a8c0b3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_sqlite_index() -> None:
+    op.execute("DROP TRIGGER IF EXISTS memories_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS memories_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS memories_fts_insert")
+    op.execute("DROP TABLE IF EXISTS memories_fts")
+    op.execute("DROP TABLE IF EXISTS memories_fts_ids")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    # The rowid of `memories` is not stable across VACUUM, key the FTS rows by memories.id instead
+    _drop_sqlite_index()
+    op.execute("CREATE TABLE memories_fts_ids (id INTEGER PRIMARY KEY, memory_id TEXT NOT NULL UNIQUE)")
+    op.execute("CREATE VIRTUAL TABLE memories_fts USING fts5(content, tokenize='trigram')")
+    op.execute(
+        "CREATE TRIGGER memories_fts_insert AFTER INSERT ON memories BEGIN "
+        "INSERT INTO memories_fts_ids(memory_id) VALUES (new.id); "
+        "INSERT INTO memories_fts(rowid, content) "
+        "VALUES ((SELECT id FROM memories_fts_ids WHERE memory_id = new.id), new.content); END"
+    )
+    op.execute(
+        "CREATE TRIGGER memories_fts_delete AFTER DELETE ON memories BEGIN "
+        "DELETE FROM memories_fts WHERE rowid = (SELECT id FROM memories_fts_ids WHERE memory_id = old.id); "
+        "DELETE FROM memories_fts_ids WHERE memory_id = old.id; END"
+    )
+    op.execute(
+        "CREATE TRIGGER memories_fts_update AFTER UPDATE OF content ON memories BEGIN "
+        "UPDATE memories_fts SET content = new.content "
+        "WHERE rowid = (SELECT id FROM memories_fts_ids WHERE memory_id = new.id); END"
+    )
+    op.execute("INSERT INTO memories_fts_ids(memory_id) SELECT id FROM memories")
+    op.execute(
+        "INSERT INTO memories_fts(rowid, content) "
+        "SELECT memories_fts_ids.id, memories.content FROM memories_fts_ids "
+        "JOIN memories ON memories.id = memories_fts_ids.memory_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _drop_sqlite_index()
+    op.execute(
+        "CREATE VIRTUAL TABLE memories_fts USING fts5("
+        "content, content='memories', content_rowid='rowid', tokenize='trigram')"
+    )
+    op.execute(
+        "CREATE TRIGGER memories_fts_insert AFTER INSERT ON memories BEGIN "
+        "INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content); END"
+    )
+    op.execute(
+        "CREATE TRIGGER memories_fts_delete AFTER DELETE ON memories BEGIN "
+        "INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content); END"
+    )
+    op.execute(
+        "CREATE TRIGGER memories_fts_update AFTER UPDATE OF content ON memories BEGIN "
+        "INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content); "
+        "INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content); END"
+    )
+    op.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
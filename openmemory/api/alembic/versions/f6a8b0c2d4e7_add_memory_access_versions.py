@@ -0,0 +1,32 @@
+"""add_memory_access_versions
+
+Revision ID: f6a8b0c2d4e7
+Revises: e5f7a9b1c3d6
+Create Date: 2025-07-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a8b0c2d4e7'
+down_revision: Union[str, None] = 'e5f7a9b1c3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'memory_access_versions',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('memory_access_versions')
@@ -1,4 +1,21 @@
 import os
 
 USER_ID = os.getenv("USER", "default_user")
-DEFAULT_APP_ID = "openmemory"
\ No newline at end of file
+DEFAULT_APP_ID = "openmemory"
+# Background categorization worker
+CATEGORIZATION_BATCH_SIZE = int(os.getenv("CATEGORIZATION_BATCH_SIZE", "20"))
+CATEGORIZATION_POLL_INTERVAL = float(os.getenv("CATEGORIZATION_POLL_INTERVAL", "2.0"))
+# How long a worker process holds the tasks it took before another one may take them over
+CATEGORIZATION_LEASE_SECONDS = float(os.getenv("CATEGORIZATION_LEASE_SECONDS", "300"))
+
+# MCP tool execution: blocking memory work runs on a bounded pool, with a per-user cap on running calls
+MCP_TOOL_WORKERS = int(os.getenv("MCP_TOOL_WORKERS", "16"))
+MCP_PER_USER_CONCURRENCY = int(os.getenv("MCP_PER_USER_CONCURRENCY", "4"))
+
+# How long dashboard aggregates (stats, category lists) may be served from cache; memory writes invalidate them sooner
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "30"))
+
+# Memory client registry: replaced clients are closed after this delay so in-flight requests can finish,
+# and the config row is polled to pick up changes saved by other worker processes
+MEMORY_CLIENT_CLOSE_DELAY = float(os.getenv("MEMORY_CLIENT_CLOSE_DELAY", "60"))
+MEMORY_CONFIG_POLL_INTERVAL = float(os.getenv("MEMORY_CONFIG_POLL_INTERVAL", "30"))
@@ -1,8 +1,10 @@
 import os
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # load .env file (make sure you have DATABASE_URL set)
 load_dotenv()
@@ -11,11 +13,78 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./openmemory.db")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in environment")
 
+# Connection pool sizing. The MCP tool pool and the categorization worker each hold a session while
+# they run, so the pool should cover MCP_TOOL_WORKERS plus request handlers.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# How long a SQLite writer waits for the lock before failing with "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def _is_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite"
+
+
+def _is_sqlite_memory(url) -> bool:
+    return _is_sqlite(url) and url.database in (None, "", ":memory:")
+
+
+def engine_options(database_url: str) -> dict:
+    """Keyword arguments for `create_engine` tuned for the URL's dialect."""
+    url = make_url(database_url)
+    if _is_sqlite(url):
+        options = {
+            # Needed for SQLite: sessions move between the event loop and worker threads
+            "connect_args": {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        }
+        if not _is_sqlite_memory(url):
+            options.update(
+                poolclass=QueuePool,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+            )
+        return options
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+def configure_sqlite_pragmas(engine) -> None:
+    """
+    Switch SQLite to WAL on every new connection.
+
+    With the default rollback journal a writer blocks all readers and concurrent writers fail fast
+    with "database is locked". WAL lets readers proceed during a write, busy_timeout makes writers
+    queue instead of failing, and synchronous=NORMAL is durable across application crashes in WAL
+    mode while avoiding an fsync per commit.
+    """
+    url = engine.url
+    if not _is_sqlite(url):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if not _is_sqlite_memory(url):
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        finally:
+            cursor.close()
+
+
 # SQLAlchemy engine & session
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+configure_sqlite_pragmas(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
@@ -28,3 +97,63 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async drivers used for the optional async engine, keyed by the sync backend name
+ASYNC_DRIVERS = {
+    "sqlite": ("sqlite+aiosqlite", "aiosqlite"),
+    "postgresql": ("postgresql+asyncpg", "asyncpg"),
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """
+    Lazily build an AsyncEngine for DATABASE_URL with the same pool and pragma settings.
+
+    Requires `aiosqlite` (SQLite) or `asyncpg` (PostgreSQL).
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        url = make_url(DATABASE_URL)
+        backend = url.get_backend_name()
+        if backend not in ASYNC_DRIVERS:
+            raise RuntimeError(f"No async driver configured for database backend '{backend}'")
+        drivername, package = ASYNC_DRIVERS[backend]
+        try:
+            __import__(package)
+        except ImportError:
+            raise ImportError(
+                f"The '{package}' library is required for the async database engine. "
+                f"Please install it using 'pip install {package}'."
+            )
+
+        async_url = url.set(drivername=drivername)
+        options = engine_options(DATABASE_URL)
+        if _is_sqlite(url):
+            # aiosqlite runs each connection on its own thread, check_same_thread does not apply
+            options["connect_args"] = {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+            # Async engines pick their asyncio-compatible queue pool themselves
+            options.pop("poolclass", None)
+        _async_engine = create_async_engine(async_url, **options)
+        configure_sqlite_pragmas(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_session_factory():
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _async_session_factory = async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_factory
+
+
+# Async dependency for FastAPI
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
@@ -23,9 +23,10 @@ import uuid
 
 from app.database import SessionLocal
 from app.models import Memory, MemoryAccessLog, MemoryState, MemoryStatusHistory
+from app.utils.concurrency import tool_executor
 from app.utils.db import get_user_and_app
 from app.utils.memory import get_memory_client
-from app.utils.permissions import check_memory_access_permissions
+from app.utils.permissions import get_accessible_memory_set
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.routing import APIRouter
@@ -51,6 +52,10 @@ def get_memory_client_safe():
 user_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("user_id")
 client_name_var: contextvars.ContextVar[str] = contextvars.ContextVar("client_name")
 
+# Number of results returned by search_memory, and how far beyond it the vector search may widen
+SEARCH_RESULT_LIMIT = 10
+SEARCH_MAX_OVERFETCH = 16
+
 # Create a router for MCP endpoints
 mcp_router = APIRouter(prefix="/mcp")
 
@@ -67,6 +72,10 @@ async def add_memories(text: str) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await tool_executor.run(uid, "add_memories", _add_memories, uid, client_name, text)
+
+
+def _add_memories(uid: str, client_name: str, text: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -150,6 +159,10 @@ async def search_memory(query: str) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await tool_executor.run(uid, "search_memory", _search_memory, uid, client_name, query)
+
+
+def _search_memory(uid: str, client_name: str, query: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -161,9 +174,10 @@ async def search_memory(query: str) -> str:
             # Get or create user and app
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
-            # Get accessible memory IDs based on ACL
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            # Cached set of the memories this app may read, computed without loading Memory rows
+            accessible_memory_ids = get_accessible_memory_set(db, user.id, app.id)
+            if not accessible_memory_ids:
+                return json.dumps({"results": []}, indent=2)
 
             filters = {
                 "user_id": uid
@@ -171,22 +185,29 @@ async def search_memory(query: str) -> str:
 
             embeddings = memory_client.embedding_model.embed(query, "search")
 
-            hits = memory_client.vector_store.search(
-                query=query, 
-                vectors=embeddings, 
-                limit=10, 
-                filters=filters,
-            )
-
-            allowed = set(str(mid) for mid in accessible_memory_ids) if accessible_memory_ids else None
+            # Widen the search until enough readable hits are found, so hits the app may not read
+            # do not eat into the result budget
+            fetch_limit = SEARCH_RESULT_LIMIT
+            while True:
+                hits = memory_client.vector_store.search(
+                    query=query,
+                    vectors=embeddings,
+                    limit=fetch_limit,
+                    filters=filters,
+                )
+                allowed_hits = [h for h in hits if h.id is not None and str(h.id) in accessible_memory_ids]
+                if (
+                    len(allowed_hits) >= SEARCH_RESULT_LIMIT
+                    or len(hits) < fetch_limit
+                    or fetch_limit >= SEARCH_RESULT_LIMIT * SEARCH_MAX_OVERFETCH
+                ):
+                    break
+                fetch_limit *= 4
 
             results = []
-            for h in hits:
+            for h in allowed_hits[:SEARCH_RESULT_LIMIT]:
                 # All vector db search functions return OutputData class
                 id, score, payload = h.id, h.score, h.payload
-                if allowed and h.id is None or h.id not in allowed: 
-                    continue
-                
                 results.append({
                     "id": id, 
                     "memory": payload.get("data"), 
@@ -228,6 +249,10 @@ async def list_memories() -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await tool_executor.run(uid, "list_memories", _list_memories, uid, client_name)
+
+
+def _list_memories(uid: str, client_name: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -244,13 +269,12 @@ async def list_memories() -> str:
             filtered_memories = []
 
             # Filter memories based on permissions
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = get_accessible_memory_set(db, user.id, app.id)
             if isinstance(memories, dict) and 'results' in memories:
                 for memory_data in memories['results']:
                     if 'id' in memory_data:
                         memory_id = uuid.UUID(memory_data['id'])
-                        if memory_id in accessible_memory_ids:
+                        if str(memory_id) in accessible_memory_ids:
                             # Create access log entry
                             access_log = MemoryAccessLog(
                                 memory_id=memory_id,
@@ -266,8 +290,7 @@ async def list_memories() -> str:
             else:
                 for memory in memories:
                     memory_id = uuid.UUID(memory['id'])
-                    memory_obj = db.query(Memory).filter(Memory.id == memory_id).first()
-                    if memory_obj and check_memory_access_permissions(db, memory_obj, app.id):
+                    if str(memory_id) in accessible_memory_ids:
                         # Create access log entry
                         access_log = MemoryAccessLog(
                             memory_id=memory_id,
@@ -297,6 +320,10 @@ async def delete_memories(memory_ids: list[str]) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await tool_executor.run(uid, "delete_memories", _delete_memories, uid, client_name, memory_ids)
+
+
+def _delete_memories(uid: str, client_name: str, memory_ids: list[str]) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -310,11 +337,10 @@ async def delete_memories(memory_ids: list[str]) -> str:
 
             # Convert string IDs to UUIDs and filter accessible ones
             requested_ids = [uuid.UUID(mid) for mid in memory_ids]
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = get_accessible_memory_set(db, user.id, app.id)
 
             # Only delete memories that are both requested and accessible
-            ids_to_delete = [mid for mid in requested_ids if mid in accessible_memory_ids]
+            ids_to_delete = [mid for mid in requested_ids if str(mid) in accessible_memory_ids]
 
             if not ids_to_delete:
                 return "Error: No accessible memories found with provided IDs"
@@ -371,6 +397,10 @@ async def delete_all_memories() -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await tool_executor.run(uid, "delete_all_memories", _delete_all_memories, uid, client_name)
+
+
+def _delete_all_memories(uid: str, client_name: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -382,8 +412,7 @@ async def delete_all_memories() -> str:
             # Get or create user and app
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = [uuid.UUID(mid) for mid in get_accessible_memory_set(db, user.id, app.id)]
 
             # delete the accessible memories only
             for memory_id in accessible_memory_ids:
@@ -427,6 +456,12 @@ async def delete_all_memories() -> str:
         return f"Error deleting memories: {e}"
 
 
+@mcp_router.get("/stats")
+async def get_tool_stats():
+    """Queue-wait and run-time metrics of the MCP tool executor"""
+    return tool_executor.stats()
+
+
 @mcp_router.get("/{client_name}/sse/{user_id}")
 async def handle_sse(request: Request):
     """Handle SSE connections for a specific user and client"""
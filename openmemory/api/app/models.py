@@ -4,7 +4,6 @@ import uuid
 
 import sqlalchemy as sa
 from app.database import Base
-from app.utils.categorization import get_categories_for_memory
 from sqlalchemy import (
     JSON,
     UUID,
@@ -19,7 +18,7 @@ from sqlalchemy import (
     Table,
     event,
 )
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.orm import relationship
 
 
 def get_current_utc_time():
@@ -106,6 +105,7 @@ class Memory(Base):
         Index('idx_memory_user_state', 'user_id', 'state'),
         Index('idx_memory_app_state', 'app_id', 'state'),
         Index('idx_memory_user_app', 'user_id', 'app_id'),
+        Index('idx_memory_user_app_state', 'user_id', 'app_id', 'state'),
     )
 
 
@@ -187,57 +187,43 @@ class MemoryAccessLog(Base):
         Index('idx_access_app_time', 'app_id', 'accessed_at'),
     )
 
-def categorize_memory(memory: Memory, db: Session) -> None:
-    """Categorize a memory using OpenAI and store the categories in the database."""
-    try:
-        # Get categories from OpenAI
-        categories = get_categories_for_memory(memory.content)
-
-        # Get or create categories in the database
-        for category_name in categories:
-            category = db.query(Category).filter(Category.name == category_name).first()
-            if not category:
-                category = Category(
-                    name=category_name,
-                    description=f"Automatically created category for {category_name}"
-                )
-                db.add(category)
-                db.flush()  # Flush to get the category ID
-
-            # Check if the memory-category association already exists
-            existing = db.execute(
-                memory_categories.select().where(
-                    (memory_categories.c.memory_id == memory.id) &
-                    (memory_categories.c.category_id == category.id)
-                )
-            ).first()
-
-            if not existing:
-                # Create the association
-                db.execute(
-                    memory_categories.insert().values(
-                        memory_id=memory.id,
-                        category_id=category.id
-                    )
-                )
-
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        print(f"Error categorizing memory: {e}")
+class CategorizationTask(Base):
+    """Outbox row asking the categorization worker to (re)categorize a memory."""
+    __tablename__ = "categorization_queue"
+    id = Column(UUID, primary_key=True, default=lambda: uuid.uuid4())
+    memory_id = Column(UUID, ForeignKey("memories.id"), nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=get_current_utc_time, index=True)
+    available_at = Column(DateTime, default=get_current_utc_time, index=True)
+
+    __table_args__ = (
+        Index('idx_categorization_queue_ready', 'attempts', 'available_at'),
+    )
+
+
+class MemoryAccessVersion(Base):
+    """Per-user counter bumped by every commit that changes which of the user's memories their apps may read."""
+    __tablename__ = "memory_access_versions"
+    user_id = Column(UUID, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def enqueue_categorization(connection, memory_id) -> None:
+    """Queue a memory for categorization as part of the current transaction."""
+    connection.execute(
+        CategorizationTask.__table__.insert().values(memory_id=memory_id)
+    )
 
 
 @event.listens_for(Memory, 'after_insert')
 def after_memory_insert(mapper, connection, target):
-    """Trigger categorization after a memory is inserted."""
-    db = Session(bind=connection)
-    categorize_memory(target, db)
-    db.close()
+    """Queue categorization of a new memory; the LLM call happens in the categorization worker."""
+    enqueue_categorization(connection, target.id)
 
 
 @event.listens_for(Memory, 'after_update')
 def after_memory_update(mapper, connection, target):
-    """Trigger categorization after a memory is updated."""
-    db = Session(bind=connection)
-    categorize_memory(target, db)
-    db.close()
+    """Queue re-categorization only when the content of a memory changed."""
+    if sa.inspect(target).attrs.content.history.has_changes():
+        enqueue_categorization(connection, target.id)
@@ -2,27 +2,35 @@ from datetime import UTC, datetime
 import io 
 import json 
 import gzip 
+import logging
 import zipfile
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Form
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, selectinload
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models import (
     User, App, Memory, MemoryState, Category, memory_categories, 
     MemoryStatusHistory, AccessControl
 )
-from app.utils.memory import get_memory_client
+from app.utils.memory import memory_client_lease
 
 from uuid import uuid4
 
 router = APIRouter(prefix="/api/v1/backup", tags=["backup"])
 
+# Rows fetched per round trip while exporting, and records written per transaction while importing
+EXPORT_BATCH_SIZE = 500
+IMPORT_BATCH_SIZE = 200
+# Concurrent embedding calls while re-embedding imported memories
+IMPORT_EMBED_WORKERS = 8
+
 class ExportRequest(BaseModel):
     user_id: str
     app_id: Optional[UUID] = None
@@ -49,44 +57,67 @@ def _parse_iso(dt: Optional[str]) -> Optional[datetime]:
         except Exception:
             return None
 
-def _export_sqlite(db: Session, req: ExportRequest) -> Dict[str, Any]: 
-    user = db.query(User).filter(User.user_id == req.user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    time_filters = []
-    if req.from_date: 
-        time_filters.append(Memory.created_at >= datetime.fromtimestamp(req.from_date, tz=UTC))
-    if req.to_date: 
-        time_filters.append(Memory.created_at <= datetime.fromtimestamp(req.to_date, tz=UTC))
-
-    mem_q = (
-        db.query(Memory)
-        .options(joinedload(Memory.categories), joinedload(Memory.app))
-        .filter(
-            Memory.user_id == user.id, 
-            *(time_filters or []), 
-            * ( [Memory.app_id == req.app_id] if req.app_id else [] ),
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _embedding_model_name(memory_client) -> Optional[str]:
+    embedding_model = getattr(memory_client, "embedding_model", None) if memory_client else None
+    return getattr(getattr(embedding_model, "config", None), "model", None)
+
+def _fetch_vectors(vector_store, ids: List[str]) -> Dict[str, List[float]]:
+    """Read the stored vectors for `ids` from vector stores that expose them (Qdrant's `retrieve`)."""
+    client = getattr(vector_store, "client", None)
+    if client is None or not hasattr(client, "retrieve"):
+        return {}
+    try:
+        points = client.retrieve(
+            collection_name=vector_store.collection_name, ids=ids, with_payload=False, with_vectors=True
         )
-    )
+    except Exception as e:
+        logging.warning(f"Could not read vectors for export: {e}")
+        return {}
+    return {str(p.id): list(p.vector) for p in points if isinstance(p.vector, list)}
+
+def _memory_filters(user: User, app_id: Optional[UUID], from_date: Optional[int], to_date: Optional[int]) -> list:
+    filters = [Memory.user_id == user.id]
+    if from_date:
+        filters.append(Memory.created_at >= datetime.fromtimestamp(from_date, tz=UTC))
+    if to_date:
+        filters.append(Memory.created_at <= datetime.fromtimestamp(to_date, tz=UTC))
+    if app_id:
+        filters.append(Memory.app_id == app_id)
+    return filters
 
-    memories = mem_q.all()
-    memory_ids = [m.id for m in memories]
+def _export_sqlite(db: Session, user: User, req: ExportRequest, embedding_model: Optional[str]) -> Dict[str, Any]:
+    """
+    Export the rows that are bounded by the number of apps and categories. Memories and status history
+    can be arbitrarily large and are streamed to their own JSONL members instead (export version 2).
+    """
+    filters = _memory_filters(user, req.app_id, req.from_date, req.to_date)
 
-    app_ids = sorted({m.app_id for m in memories if m.app_id})
+    app_ids = sorted(app_id for (app_id,) in db.query(Memory.app_id).filter(*filters).distinct() if app_id)
     apps = db.query(App).filter(App.id.in_(app_ids)).all() if app_ids else []
 
-    cats = sorted({c for m in memories for c in m.categories}, key = lambda c: str(c.id))
-
-    mc_rows = db.execute(
-        memory_categories.select().where(memory_categories.c.memory_id.in_(memory_ids))
-    ).fetchall() if memory_ids else []
-
-    history = db.query(MemoryStatusHistory).filter(MemoryStatusHistory.memory_id.in_(memory_ids)).all() if memory_ids else []
+    cats = (
+        db.query(Category)
+        .join(memory_categories, memory_categories.c.category_id == Category.id)
+        .join(Memory, Memory.id == memory_categories.c.memory_id)
+        .filter(*filters)
+        .distinct()
+        .order_by(Category.id)
+        .all()
+    )
 
     acls = db.query(AccessControl).filter(
-        AccessControl.subject_type == "app", 
-        AccessControl.subject_id.in_(app_ids) if app_ids else False
+        AccessControl.subject_type == "app",
+        AccessControl.subject_id.in_(app_ids)
     ).all() if app_ids else []
 
     return {
@@ -122,37 +153,6 @@ def _export_sqlite(db: Session, req: ExportRequest) -> Dict[str, Any]:
             }
             for c in cats
         ], 
-        "memories": [
-            {
-                "id": str(m.id), 
-                "user_id": str(m.user_id), 
-                "app_id": str(m.app_id) if m.app_id else None, 
-                "content": m.content, 
-                "metadata": m.metadata_, 
-                "state": m.state.value,
-                "created_at": _iso(m.created_at), 
-                "updated_at": _iso(m.updated_at), 
-                "archived_at": _iso(m.archived_at), 
-                "deleted_at": _iso(m.deleted_at), 
-                "category_ids": [str(c.id) for c in m.categories], #TODO: figure out a way to add category names simply to this
-            }
-            for m in memories
-        ], 
-        "memory_categories": [
-            {"memory_id": str(r.memory_id), "category_id": str(r.category_id)}
-            for r in mc_rows
-        ], 
-        "status_history": [
-            {
-                "id": str(h.id), 
-                "memory_id": str(h.memory_id), 
-                "changed_by": str(h.changed_by), 
-                "old_state": h.old_state.value, 
-                "new_state": h.new_state.value, 
-                "changed_at": _iso(h.changed_at), 
-            }
-            for h in history
-        ], 
         "access_controls": [
             {
                 "id": str(ac.id), 
@@ -169,233 +169,260 @@ def _export_sqlite(db: Session, req: ExportRequest) -> Dict[str, Any]:
             "app_id_filter": str(req.app_id) if req.app_id else None,
             "from_date": req.from_date,
             "to_date": req.to_date,
-            "version": "1",
+            "version": "2",
+            "embedding_model": embedding_model if req.include_vectors else None,
             "generated_at": datetime.now(UTC).isoformat(),
         },
     }
 
-def _export_logical_memories_gz(
-        db: Session, 
-        *, 
-        user_id: str, 
-        app_id: Optional[UUID] = None, 
-        from_date: Optional[int] = None, 
-        to_date: Optional[int] = None
-) -> bytes: 
+def _iter_memory_records(db: Session, user: User, req: ExportRequest, vector_store=None) -> Iterator[Dict[str, Any]]:
     """
-    Export a provider-agnostic backup of memories so they can be restored to any vector DB
-    by re-embedding content. One JSON object per line, gzip-compressed.
+    Yield one provider-agnostic record per memory, reading `EXPORT_BATCH_SIZE` rows at a time.
 
-    Schema (per line):
+    Schema (per line of memories.jsonl.gz):
     {
       "id": "<uuid>",
+      "user_id": "<uuid>",
+      "app_id": "<uuid or null>",
+      "app": "<app name or null>",
       "content": "<text>",
       "metadata": {...},
+      "state": "active|paused|archived|deleted",
       "created_at": "<iso8601 or null>",
       "updated_at": "<iso8601 or null>",
-      "state": "active|paused|archived|deleted",
-      "app": "<app name or null>",
-      "categories": ["catA", "catB", ...]
+      "archived_at": "<iso8601 or null>",
+      "deleted_at": "<iso8601 or null>",
+      "category_ids": ["<uuid>", ...],
+      "categories": ["catA", "catB", ...],
+      "vector": [...]            # only when vectors were requested and the vector store exposes them
     }
     """
-
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    time_filters = []
-    if from_date: 
-        time_filters.append(Memory.created_at >= datetime.fromtimestamp(from_date, tz=UTC))
-    if to_date: 
-        time_filters.append(Memory.created_at <= datetime.fromtimestamp(to_date, tz=UTC))
-    
     q = (
         db.query(Memory)
-        .options(joinedload(Memory.categories), joinedload(Memory.app))
-        .filter(
-            Memory.user_id == user.id,
-            *(time_filters or []),
-        )
+        .options(selectinload(Memory.categories), selectinload(Memory.app))
+        .filter(*_memory_filters(user, req.app_id, req.from_date, req.to_date))
+        .order_by(Memory.id)
+        .yield_per(EXPORT_BATCH_SIZE)
     )
-    if app_id:
-        q = q.filter(Memory.app_id == app_id)
 
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb") as gz: 
-        for m in q.all(): 
+    for memories in _batched(q, EXPORT_BATCH_SIZE):
+        vectors = _fetch_vectors(vector_store, [str(m.id) for m in memories]) if vector_store is not None else {}
+        for m in memories:
             record = {
                 "id": str(m.id),
+                "user_id": str(m.user_id),
+                "app_id": str(m.app_id) if m.app_id else None,
+                "app": m.app.name if m.app else None,
                 "content": m.content,
                 "metadata": m.metadata_ or {},
+                "state": m.state.value,
                 "created_at": _iso(m.created_at),
                 "updated_at": _iso(m.updated_at),
-                "state": m.state.value,
-                "app": m.app.name if m.app else None,
+                "archived_at": _iso(m.archived_at),
+                "deleted_at": _iso(m.deleted_at),
+                "category_ids": [str(c.id) for c in m.categories],
                 "categories": [c.name for c in m.categories],
             }
-            gz.write((json.dumps(record) + "\n").encode("utf-8"))
-    return buf.getvalue()
-
-@router.post("/export")
-async def export_backup(req: ExportRequest, db: Session = Depends(get_db)): 
-    sqlite_payload = _export_sqlite(db=db, req=req)
-    memories_blob = _export_logical_memories_gz(
-        db=db, 
-        user_id=req.user_id, 
-        app_id=req.app_id, 
-        from_date=req.from_date, 
-        to_date=req.to_date,
-
+            if str(m.id) in vectors:
+                record["vector"] = vectors[str(m.id)]
+            yield record
+            # Drop processed rows from the identity map so memory use stays flat
+            db.expunge(m)
+
+def _iter_status_history(db: Session, user: User, req: ExportRequest) -> Iterator[Dict[str, Any]]:
+    memory_ids = db.query(Memory.id).filter(*_memory_filters(user, req.app_id, req.from_date, req.to_date))
+    q = (
+        db.query(MemoryStatusHistory)
+        .filter(MemoryStatusHistory.memory_id.in_(memory_ids.scalar_subquery()))
+        .order_by(MemoryStatusHistory.id)
+        .yield_per(EXPORT_BATCH_SIZE)
     )
+    for h in q:
+        yield {
+            "id": str(h.id),
+            "memory_id": str(h.memory_id),
+            "changed_by": str(h.changed_by),
+            "old_state": h.old_state.value,
+            "new_state": h.new_state.value,
+            "changed_at": _iso(h.changed_at),
+        }
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable file object that collects bytes until the response generator drains them."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        if chunks:
+            yield b"".join(chunks)
+
+def _write_jsonl_gz(zf: zipfile.ZipFile, sink: _ChunkSink, name: str, records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    # Already gzip-compressed, so store it as is instead of deflating it a second time
+    info = zipfile.ZipInfo(name, date_time=datetime.now(UTC).timetuple()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    with zf.open(info, "w", force_zip64=True) as member:
+        with gzip.GzipFile(fileobj=member, mode="wb") as gz:
+            for batch in _batched(records, EXPORT_BATCH_SIZE):
+                gz.write("".join(json.dumps(record) + "\n" for record in batch).encode("utf-8"))
+                yield from sink.drain()
+
+def _stream_export(req: ExportRequest, user_pk: UUID) -> Iterator[bytes]:
+    # Hold the client for the whole download, so a config change cannot close it mid-export
+    with memory_client_lease() if req.include_vectors else nullcontext() as memory_client:
+        yield from _write_export(req, user_pk, memory_client)
+
+def _write_export(req: ExportRequest, user_pk: UUID, memory_client) -> Iterator[bytes]:
+    """Build the backup zip incrementally, yielding compressed bytes as soon as they are produced."""
+    vector_store = getattr(memory_client, "vector_store", None) if memory_client else None
 
-    #TODO: add vector store specific exports in future for speed 
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_pk).one()
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            sqlite_payload = _export_sqlite(db, user, req, _embedding_model_name(memory_client))
+            zf.writestr("memories.json", json.dumps(sqlite_payload, indent=2))
+            yield from sink.drain()
+
+            yield from _write_jsonl_gz(zf, sink, "memories.jsonl.gz", _iter_memory_records(db, user, req, vector_store))
+            yield from _write_jsonl_gz(zf, sink, "status_history.jsonl.gz", _iter_status_history(db, user, req))
+        yield from sink.drain()
+    finally:
+        db.close()
+
+@router.post("/export")
+def export_backup(req: ExportRequest, db: Session = Depends(get_db)):
+    user = db.query(User).filter(User.user_id == req.user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as zf: 
-        zf.writestr("memories.json", json.dumps(sqlite_payload, indent=2))
-        zf.writestr("memories.jsonl.gz", memories_blob)
-        
-    zip_buf.seek(0)
     return StreamingResponse(
-        zip_buf, 
-        media_type="application/zip", 
+        _stream_export(req, user.id),
+        media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="memories_export_{req.user_id}.zip"'},
     )
 
-@router.post("/import")
-async def import_backup(
-    file: UploadFile = File(..., description="Zip with memories.json and memories.jsonl.gz"), 
-    user_id: str = Form(..., description="Import memories into this user_id"),
-    mode: str = Query("overwrite"), 
-    db: Session = Depends(get_db)
-): 
-    if not file.filename.endswith(".zip"): 
-        raise HTTPException(status_code=400, detail="Expected a zip file.")
-    
-    if mode not in {"skip", "overwrite"}:
-        raise HTTPException(status_code=400, detail="Invalid mode. Must be 'skip' or 'overwrite'.")
-    
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
-
-    content = await file.read()
-    try:
-        with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-            names = zf.namelist()
-
-            def find_member(filename: str) -> Optional[str]:
-                for name in names:
-                    # Skip directory entries
-                    if name.endswith('/'):
-                        continue
-                    if name.rsplit('/', 1)[-1] == filename:
-                        return name
-                return None
-
-            sqlite_member = find_member("memories.json")
-            if not sqlite_member:
-                raise HTTPException(status_code=400, detail="memories.json missing in zip")
-
-            memories_member = find_member("memories.jsonl.gz")
-
-            sqlite_data = json.loads(zf.read(sqlite_member))
-            memories_blob = zf.read(memories_member) if memories_member else None
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid zip file")
-
-    default_app = db.query(App).filter(App.owner_id == user.id, App.name == "openmemory").first()
-    if not default_app: 
-        default_app = App(owner_id=user.id, name="openmemory", is_active=True, metadata_={})
-        db.add(default_app)
-        db.commit()
-        db.refresh(default_app)
-
-    cat_id_map: Dict[str, UUID] = {}
-    for c in sqlite_data.get("categories", []): 
-        cat = db.query(Category).filter(Category.name == c["name"]).first()
-        if not cat: 
-            cat = Category(name=c["name"], description=c.get("description"))
-            db.add(cat)
-            db.commit()
-            db.refresh(cat)
-        cat_id_map[c["id"]] = cat.id
+def _iter_jsonl_gz(zf: zipfile.ZipFile, member: Optional[str]) -> Iterator[Dict[str, Any]]:
+    if not member:
+        return
+    with zf.open(member) as raw:
+        with gzip.GzipFile(fileobj=raw, mode="rb") as gz:
+            for line in gz:
+                if line.strip():
+                    yield json.loads(line.decode("utf-8"))
+
+def _apply_memory(existing: Optional[Memory], m: Dict[str, Any], target_id: UUID, user: User, app: App) -> Optional[Memory]:
+    """Create or overwrite the database row for one imported memory record."""
+    if existing is not None:
+        # Same-user collision in overwrite mode: treat import as ground truth
+        incoming_state = m.get("state", "active")
+        existing.user_id = user.id
+        existing.app_id = app.id
+        existing.content = m.get("content") or ""
+        existing.metadata_ = m.get("metadata") or {}
+        try:
+            existing.state = MemoryState(incoming_state)
+        except Exception:
+            existing.state = MemoryState.active
+        # Update state-related timestamps from import (ground truth)
+        existing.archived_at = _parse_iso(m.get("archived_at"))
+        existing.deleted_at = _parse_iso(m.get("deleted_at"))
+        existing.created_at = _parse_iso(m.get("created_at")) or existing.created_at
+        existing.updated_at = _parse_iso(m.get("updated_at")) or existing.updated_at
+        return existing
+
+    return Memory(
+        id=target_id,
+        user_id=user.id,
+        app_id=app.id,
+        content=m.get("content") or "",
+        metadata_=m.get("metadata") or {},
+        state=MemoryState(m.get("state", "active")) if m.get("state") else MemoryState.active,
+        created_at=_parse_iso(m.get("created_at")) or datetime.now(UTC),
+        updated_at=_parse_iso(m.get("updated_at")) or datetime.now(UTC),
+        archived_at=_parse_iso(m.get("archived_at")),
+        deleted_at=_parse_iso(m.get("deleted_at")),
+    )
 
-    old_to_new_id: Dict[str, UUID] = {}
-    for m in sqlite_data.get("memories", []): 
-        incoming_id = UUID(m["id"])
-        existing = db.query(Memory).filter(Memory.id == incoming_id).first()
+def _link_categories(db: Session, links: set) -> None:
+    """Insert the (memory_id, category_id) pairs that do not exist yet."""
+    if not links:
+        return
+    memory_ids = {mid for mid, _ in links}
+    existing = {
+        tuple(row)
+        for row in db.execute(memory_categories.select().where(memory_categories.c.memory_id.in_(memory_ids)))
+    }
+    new_links = [{"memory_id": mid, "category_id": cid} for mid, cid in links if (mid, cid) not in existing]
+    if new_links:
+        db.execute(memory_categories.insert(), new_links)
+
+def _import_memory_batch(
+    db: Session,
+    records: List[Dict[str, Any]],
+    user: User,
+    app: App,
+    mode: str,
+    cat_id_map: Dict[str, UUID],
+    remapped_ids: Dict[str, UUID],
+) -> List[tuple]:
+    """Write one batch of memory rows in a single transaction; returns `(record, target_id)` pairs."""
+    incoming_ids = [UUID(m["id"]) for m in records]
+    existing_by_id = {mem.id: mem for mem in db.query(Memory).filter(Memory.id.in_(incoming_ids))}
+
+    written = []
+    links = set()
+    for m, incoming_id in zip(records, incoming_ids):
+        existing = existing_by_id.get(incoming_id)
 
         # Cross-user collision: always mint a new UUID and import as a new memory
         if existing and existing.user_id != user.id:
             target_id = uuid4()
+            remapped_ids[m["id"]] = target_id
+            existing = None
         else:
             target_id = incoming_id
-
-        old_to_new_id[m["id"]] = target_id
+        written.append((m, target_id))
+        # Missing links are added in both modes, as version 1 backups do with their memory_categories list
+        for cid in m.get("category_ids") or []:
+            if cid in cat_id_map:
+                links.add((target_id, cat_id_map[cid]))
 
         # Same-user collision + skip mode: leave existing row untouched
-        if existing and (existing.user_id == user.id) and mode == "skip": 
-            continue 
-        
-        # Same-user collision + overwrite mode: treat import as ground truth
-        if existing and (existing.user_id == user.id) and mode == "overwrite": 
-            incoming_state = m.get("state", "active")
-            existing.user_id = user.id 
-            existing.app_id = default_app.id
-            existing.content = m.get("content") or ""
-            existing.metadata_ = m.get("metadata") or {}
-            try: 
-                existing.state = MemoryState(incoming_state)
-            except Exception: 
-                existing.state = MemoryState.active
-            # Update state-related timestamps from import (ground truth)
-            existing.archived_at = _parse_iso(m.get("archived_at"))
-            existing.deleted_at = _parse_iso(m.get("deleted_at"))
-            existing.created_at = _parse_iso(m.get("created_at")) or existing.created_at
-            existing.updated_at = _parse_iso(m.get("updated_at")) or existing.updated_at
-            db.add(existing)
-            db.commit()
+        if existing and mode == "skip":
             continue
 
-        new_mem = Memory(
-            id=target_id,
-            user_id=user.id,
-            app_id=default_app.id,
-            content=m.get("content") or "",
-            metadata_=m.get("metadata") or {},
-            state=MemoryState(m.get("state", "active")) if m.get("state") else MemoryState.active,
-            created_at=_parse_iso(m.get("created_at")) or datetime.now(UTC),
-            updated_at=_parse_iso(m.get("updated_at")) or datetime.now(UTC),
-            archived_at=_parse_iso(m.get("archived_at")),
-            deleted_at=_parse_iso(m.get("deleted_at")),
-        )
-        db.add(new_mem)
-        db.commit()
+        db.add(_apply_memory(existing, m, target_id, user, app))
 
-    for link in sqlite_data.get("memory_categories", []): 
-        mid = old_to_new_id.get(link["memory_id"])
-        cid = cat_id_map.get(link["category_id"])
-        if not (mid and cid): 
-            continue
-        exists = db.execute(
-            memory_categories.select().where(
-                (memory_categories.c.memory_id == mid) & (memory_categories.c.category_id == cid)
-            )
-        ).first()
-
-        if not exists: 
-            db.execute(memory_categories.insert().values(memory_id=mid, category_id=cid))
-            db.commit()
+    db.flush()
+    _link_categories(db, links)
+    db.commit()
+    return written
 
-    for h in sqlite_data.get("status_history", []): 
-        hid = UUID(h["id"])
-        mem_id = old_to_new_id.get(h["memory_id"], UUID(h["memory_id"]))
-        exists = db.query(MemoryStatusHistory).filter(MemoryStatusHistory.id == hid).first()
+def _import_history_batch(db: Session, rows: List[Dict[str, Any]], user: User, mode: str, remapped_ids: Dict[str, UUID]) -> None:
+    history_ids = [UUID(h["id"]) for h in rows]
+    existing_by_id = {
+        rec.id: rec for rec in db.query(MemoryStatusHistory).filter(MemoryStatusHistory.id.in_(history_ids))
+    }
+    for h, hid in zip(rows, history_ids):
+        memory_id = remapped_ids.get(h["memory_id"], UUID(h["memory_id"]))
+        exists = existing_by_id.get(hid)
+        if exists and exists.memory_id != memory_id:
+            # History of a memory that was imported under a new id: leave the other user's row alone
+            exists, hid = None, uuid4()
         if exists and mode == "skip":
             continue
         rec = exists if exists else MemoryStatusHistory(id=hid)
-        rec.memory_id = mem_id
+        rec.memory_id = memory_id
         rec.changed_by = user.id
         try:
             rec.old_state = MemoryState(h.get("old_state", "active"))
@@ -405,61 +432,174 @@ async def import_backup(
             rec.new_state = MemoryState.active
         rec.changed_at = _parse_iso(h.get("changed_at")) or datetime.now(UTC)
         db.add(rec)
-        db.commit()
+    db.commit()
+
+def _upsert_vectors(
+    memory_client,
+    written: List[tuple],
+    user_id: str,
+    mode: str,
+    use_backup_vectors: bool,
+    embed_pool: ThreadPoolExecutor,
+) -> None:
+    """Insert one batch into the vector store, reusing backed-up vectors and embedding the rest concurrently."""
+    vector_store = memory_client.vector_store
+    expected_dims = getattr(getattr(memory_client.embedding_model, "config", None), "embedding_dims", None)
+
+    ids, payloads, vectors, to_embed = [], [], [], []
+    for rec, new_id in written:
+        if mode == "skip":
+            try:
+                get_fn = getattr(vector_store, "get", None)
+                if callable(get_fn) and vector_store.get(str(new_id)):
+                    continue
+            except Exception:
+                pass
+
+        content = rec.get("content") or ""
+        payload = dict(rec.get("metadata") or {})
+        payload["data"] = content
+        if rec.get("created_at"):
+            payload["created_at"] = rec["created_at"]
+        if rec.get("updated_at"):
+            payload["updated_at"] = rec["updated_at"]
+        payload["user_id"] = user_id
+        payload.setdefault("source_app", "openmemory")
+
+        vector = rec.get("vector") if use_backup_vectors else None
+        if vector is not None and expected_dims and len(vector) != expected_dims:
+            vector = None
+        if vector is None:
+            to_embed.append((len(ids), content))
+
+        ids.append(str(new_id))
+        payloads.append(payload)
+        vectors.append(vector)
+
+    if not ids:
+        return
+
+    futures = [(idx, embed_pool.submit(memory_client.embedding_model.embed, content, "add")) for idx, content in to_embed]
+    failed = set()
+    for idx, future in futures:
+        try:
+            vectors[idx] = future.result()
+        except Exception as e:
+            logging.warning(f"Embedding failed for memory {ids[idx]}: {e}")
+            failed.add(idx)
 
-    memory_client = get_memory_client()
-    vector_store = getattr(memory_client, "vector_store", None) if memory_client else None
+    keep = [i for i in range(len(ids)) if i not in failed]
+    try:
+        vector_store.insert(
+            vectors=[vectors[i] for i in keep], payloads=[payloads[i] for i in keep], ids=[ids[i] for i in keep]
+        )
+    except Exception as e:
+        # Fall back to single inserts so one bad record does not drop the whole batch
+        logging.warning(f"Batched vector upsert failed, retrying one by one: {e}")
+        for i in keep:
+            try:
+                vector_store.insert(vectors=[vectors[i]], payloads=[payloads[i]], ids=[ids[i]])
+            except Exception as single_error:
+                logging.warning(f"Vector upsert failed for memory {ids[i]}: {single_error}")
 
-    if vector_store and memory_client and hasattr(memory_client, "embedding_model"):
-        def iter_logical_records():
-            if memories_blob:
-                gz_buf = io.BytesIO(memories_blob)
-                with gzip.GzipFile(fileobj=gz_buf, mode="rb") as gz:
-                    for raw in gz:
-                        yield json.loads(raw.decode("utf-8"))
-            else:
-                for m in sqlite_data.get("memories", []):
-                    yield {
-                        "id": m["id"],
-                        "content": m.get("content"),
-                        "metadata": m.get("metadata") or {},
-                        "created_at": m.get("created_at"),
-                        "updated_at": m.get("updated_at"),
-                    }
-
-        for rec in iter_logical_records():
-            old_id = rec["id"]
-            new_id = old_to_new_id.get(old_id, UUID(old_id))
-            content = rec.get("content") or ""
-            metadata = rec.get("metadata") or {}
-            created_at = rec.get("created_at")
-            updated_at = rec.get("updated_at")
-
-            if mode == "skip":
-                try:
-                    get_fn = getattr(vector_store, "get", None)
-                    if callable(get_fn) and vector_store.get(str(new_id)):
-                        continue
-                except Exception:
-                    pass
-
-            payload = dict(metadata)
-            payload["data"] = content
-            if created_at:
-                payload["created_at"] = created_at
-            if updated_at:
-                payload["updated_at"] = updated_at
-            payload["user_id"] = user_id
-            payload.setdefault("source_app", "openmemory")
+@router.post("/import")
+def import_backup(
+    file: UploadFile = File(..., description="Zip with memories.json and memories.jsonl.gz"),
+    user_id: str = Form(..., description="Import memories into this user_id"),
+    mode: str = Query("overwrite"),
+    use_backup_vectors: bool = Query(True, description="Reuse vectors stored in the backup instead of re-embedding"),
+    db: Session = Depends(get_db)
+):
+    if not file.filename.endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Expected a zip file.")
+    
+    if mode not in {"skip", "overwrite"}:
+        raise HTTPException(status_code=400, detail="Invalid mode. Must be 'skip' or 'overwrite'.")
+    
+    user = db.query(User).filter(User.user_id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
-            try:
-                vec = memory_client.embedding_model.embed(content, "add")
-                vector_store.insert(vectors=[vec], payloads=[payload], ids=[str(new_id)])
-            except Exception as e:
-                print(f"Vector upsert failed for memory {new_id}: {e}")
-                continue
+    # The upload is spooled to a temporary file, so read the zip from it instead of loading it into memory
+    try:
+        zf = zipfile.ZipFile(file.file, "r")
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid zip file")
+
+    with zf:
+        names = zf.namelist()
+
+        def find_member(filename: str) -> Optional[str]:
+            for name in names:
+                # Skip directory entries
+                if name.endswith('/'):
+                    continue
+                if name.rsplit('/', 1)[-1] == filename:
+                    return name
+            return None
+
+        sqlite_member = find_member("memories.json")
+        if not sqlite_member:
+            raise HTTPException(status_code=400, detail="memories.json missing in zip")
+        try:
+            sqlite_data = json.loads(zf.read(sqlite_member))
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid zip file")
+
+        # Version 1 backups keep memory rows and history inside memories.json; version 2 streams them as JSONL
+        if "memories" in sqlite_data:
+            memory_records = iter(sqlite_data.get("memories", []))
+            history_records = iter(sqlite_data.get("status_history", []))
+        else:
+            memory_records = _iter_jsonl_gz(zf, find_member("memories.jsonl.gz"))
+            history_records = _iter_jsonl_gz(zf, find_member("status_history.jsonl.gz"))
+
+        default_app = db.query(App).filter(App.owner_id == user.id, App.name == "openmemory").first()
+        if not default_app:
+            default_app = App(owner_id=user.id, name="openmemory", is_active=True, metadata_={})
+            db.add(default_app)
+            db.commit()
+            db.refresh(default_app)
+
+        cat_id_map: Dict[str, UUID] = {}
+        for c in sqlite_data.get("categories", []):
+            cat = db.query(Category).filter(Category.name == c["name"]).first()
+            if not cat:
+                cat = Category(name=c["name"], description=c.get("description"))
+                db.add(cat)
+                db.flush()
+            cat_id_map[c["id"]] = cat.id
+        db.commit()
+
+        # Held until every batch is written, so a config change cannot close the client mid-import
+        with memory_client_lease() as memory_client:
+            vector_store = getattr(memory_client, "vector_store", None) if memory_client else None
+            sync_vectors = bool(vector_store and memory_client and hasattr(memory_client, "embedding_model"))
+
+            # Backed-up vectors are only valid for the embedding model that produced them
+            backup_model = (sqlite_data.get("export_meta") or {}).get("embedding_model")
+            current_model = _embedding_model_name(memory_client)
+            use_backup_vectors = use_backup_vectors and (not backup_model or not current_model or backup_model == current_model)
+
+            # Only ids that had to change are remembered, so bookkeeping does not grow with the backup size
+            remapped_ids: Dict[str, UUID] = {}
+            with ThreadPoolExecutor(max_workers=IMPORT_EMBED_WORKERS) as embed_pool:
+                for records in _batched(memory_records, IMPORT_BATCH_SIZE):
+                    written = _import_memory_batch(db, records, user, default_app, mode, cat_id_map, remapped_ids)
+                    if sync_vectors:
+                        _upsert_vectors(memory_client, written, user_id, mode, use_backup_vectors, embed_pool)
+
+        # Links listed separately by version 1 backups (version 2 carries them as category_ids)
+        for links in _batched(sqlite_data.get("memory_categories", []), IMPORT_BATCH_SIZE):
+            _link_categories(db, {
+                (remapped_ids.get(link["memory_id"], UUID(link["memory_id"])), cat_id_map[link["category_id"]])
+                for link in links
+                if link["category_id"] in cat_id_map
+            })
+            db.commit()
 
-        return {"message": f'Import completed into user "{user_id}"'}
+        for rows in _batched(history_records, IMPORT_BATCH_SIZE):
+            _import_history_batch(db, rows, user, mode, remapped_ids)
 
     return {"message": f'Import completed into user "{user_id}"'}
 
@@ -1,6 +1,6 @@
 import logging
 from datetime import UTC, datetime
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Union
 from uuid import UUID
 
 from app.database import get_db
@@ -13,16 +13,19 @@ from app.models import (
     MemoryState,
     MemoryStatusHistory,
     User,
+    memory_categories,
 )
-from app.schemas import MemoryResponse
+from app.schemas import CursorPaginatedMemoryResponse, MemoryResponse
 from app.utils.memory import get_memory_client
 from app.utils.permissions import check_memory_access_permissions
+from app.utils.search import KEYSET_SORT_COLUMNS, keyset_page, memory_search_filter
+from app.utils.stats import get_user_categories
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
 from pydantic import BaseModel
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 router = APIRouter(prefix="/api/v1/memories", tags=["memories"])
 
@@ -97,8 +100,21 @@ def get_accessible_memory_ids(db: Session, app_id: UUID) -> Set[UUID]:
     return allowed_memory_ids
 
 
+def _memory_response(memory: Memory) -> MemoryResponse:
+    return MemoryResponse(
+        id=memory.id,
+        content=memory.content,
+        created_at=memory.created_at,
+        state=memory.state.value,
+        app_id=memory.app_id,
+        app_name=memory.app.name if memory.app else None,
+        categories=[category.name for category in memory.categories],
+        metadata_=memory.metadata_
+    )
+
+
 # List all memories with filtering
-@router.get("/", response_model=Page[MemoryResponse])
+@router.get("/", response_model=Union[Page[MemoryResponse], CursorPaginatedMemoryResponse])
 async def list_memories(
     user_id: str,
     app_id: Optional[UUID] = None,
@@ -117,6 +133,10 @@ async def list_memories(
     search_query: Optional[str] = None,
     sort_column: Optional[str] = Query(None, description="Column to sort by (memory, categories, app_name, created_at)"),
     sort_direction: Optional[str] = Query(None, description="Sort direction (asc or desc)"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Use keyset pagination: pass an empty value for the first page, then the returned next_cursor"
+    ),
     db: Session = Depends(get_db)
 ):
     user = db.query(User).filter(User.user_id == user_id).first()
@@ -128,8 +148,9 @@ async def list_memories(
         Memory.user_id == user.id,
         Memory.state != MemoryState.deleted,
         Memory.state != MemoryState.archived,
-        Memory.content.ilike(f"%{search_query}%") if search_query else True
     )
+    if search_query:
+        query = query.filter(memory_search_filter(db, search_query))
 
     # Apply filters
     if app_id:
@@ -143,14 +164,33 @@ async def list_memories(
         to_datetime = datetime.fromtimestamp(to_date, tz=UTC)
         query = query.filter(Memory.created_at <= to_datetime)
 
-    # Add joins for app and categories after filtering
-    query = query.outerjoin(App, Memory.app_id == App.id)
-    query = query.outerjoin(Memory.categories)
-
-    # Apply category filter if provided
+    # Apply category filter if provided; a subquery keeps one row per memory, so no DISTINCT is needed
     if categories:
         category_list = [c.strip() for c in categories.split(",")]
-        query = query.filter(Category.name.in_(category_list))
+        query = query.filter(Memory.id.in_(
+            db.query(memory_categories.c.memory_id)
+            .join(Category, Category.id == memory_categories.c.category_id)
+            .filter(Category.name.in_(category_list))
+        ))
+
+    # Add eager loading for app and categories
+    query = query.options(
+        selectinload(Memory.app),
+        selectinload(Memory.categories)
+    )
+
+    if cursor is not None:
+        column = sort_column if sort_column in KEYSET_SORT_COLUMNS else "created_at"
+        descending = sort_direction == "desc" if sort_column in KEYSET_SORT_COLUMNS else True
+        try:
+            items, next_cursor = keyset_page(query, column, descending, cursor, params.size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return CursorPaginatedMemoryResponse(
+            items=[_memory_response(memory) for memory in items if check_memory_access_permissions(db, memory, app_id)],
+            size=params.size,
+            next_cursor=next_cursor,
+        )
 
     # Apply sorting if specified
     if sort_column:
@@ -158,27 +198,12 @@ async def list_memories(
         if sort_field:
             query = query.order_by(sort_field.desc()) if sort_direction == "desc" else query.order_by(sort_field.asc())
 
-    # Add eager loading for app and categories
-    query = query.options(
-        joinedload(Memory.app),
-        joinedload(Memory.categories)
-    ).distinct(Memory.id)
-
     # Get paginated results with transformer
     return sqlalchemy_paginate(
         query,
         params,
         transformer=lambda items: [
-            MemoryResponse(
-                id=memory.id,
-                content=memory.content,
-                created_at=memory.created_at,
-                state=memory.state.value,
-                app_id=memory.app_id,
-                app_name=memory.app.name if memory.app else None,
-                categories=[category.name for category in memory.categories],
-                metadata_=memory.metadata_
-            )
+            _memory_response(memory)
             for memory in items
             if check_memory_access_permissions(db, memory, app_id)
         ]
@@ -195,13 +220,7 @@ async def get_categories(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get unique categories associated with the user's memories
-    # Get all memories
-    memories = db.query(Memory).filter(Memory.user_id == user.id, Memory.state != MemoryState.deleted, Memory.state != MemoryState.archived).all()
-    # Get all categories from memories
-    categories = [category for memory in memories for category in memory.categories]
-    # Get unique categories
-    unique_categories = list(set(categories))
+    unique_categories = get_user_categories(db, user.id)
 
     return {
         "categories": unique_categories,
@@ -541,8 +560,10 @@ class FilterMemoriesRequest(BaseModel):
     from_date: Optional[int] = None
     to_date: Optional[int] = None
     show_archived: Optional[bool] = False
+    # Set (empty for the first page) to switch from page numbers to keyset pagination
+    cursor: Optional[str] = None
 
-@router.post("/filter", response_model=Page[MemoryResponse])
+@router.post("/filter", response_model=Union[Page[MemoryResponse], CursorPaginatedMemoryResponse])
 async def filter_memories(
     request: FilterMemoriesRequest,
     db: Session = Depends(get_db)
@@ -563,20 +584,17 @@ async def filter_memories(
 
     # Apply search filter
     if request.search_query:
-        query = query.filter(Memory.content.ilike(f"%{request.search_query}%"))
+        query = query.filter(memory_search_filter(db, request.search_query))
 
     # Apply app filter
     if request.app_ids:
         query = query.filter(Memory.app_id.in_(request.app_ids))
 
-    # Add joins for app and categories
-    query = query.outerjoin(App, Memory.app_id == App.id)
-
-    # Apply category filter
+    # Apply category filter; a subquery keeps one row per memory, so no DISTINCT is needed
     if request.category_ids:
-        query = query.join(Memory.categories).filter(Category.id.in_(request.category_ids))
-    else:
-        query = query.outerjoin(Memory.categories)
+        query = query.filter(Memory.id.in_(
+            db.query(memory_categories.c.memory_id).filter(memory_categories.c.category_id.in_(request.category_ids))
+        ))
 
     # Apply date filters
     if request.from_date:
@@ -587,52 +605,45 @@ async def filter_memories(
         to_datetime = datetime.fromtimestamp(request.to_date, tz=UTC)
         query = query.filter(Memory.created_at <= to_datetime)
 
-    # Apply sorting
+    # Validate sorting
+    sort_column, sort_direction = "created_at", "desc"
     if request.sort_column and request.sort_direction:
         sort_direction = request.sort_direction.lower()
         if sort_direction not in ['asc', 'desc']:
             raise HTTPException(status_code=400, detail="Invalid sort direction")
 
-        sort_mapping = {
-            'memory': Memory.content,
-            'app_name': App.name,
-            'created_at': Memory.created_at
-        }
-
-        if request.sort_column not in sort_mapping:
+        if request.sort_column not in KEYSET_SORT_COLUMNS:
             raise HTTPException(status_code=400, detail="Invalid sort column")
+        sort_column = request.sort_column
 
-        sort_field = sort_mapping[request.sort_column]
-        if sort_direction == 'desc':
-            query = query.order_by(sort_field.desc())
-        else:
-            query = query.order_by(sort_field.asc())
-    else:
-        # Default sorting
-        query = query.order_by(Memory.created_at.desc())
-
-    # Add eager loading for categories and make the query distinct
+    # Add eager loading for app and categories
     query = query.options(
-        joinedload(Memory.categories)
-    ).distinct(Memory.id)
+        selectinload(Memory.app),
+        selectinload(Memory.categories)
+    )
+
+    if request.cursor is not None:
+        try:
+            items, next_cursor = keyset_page(query, sort_column, sort_direction == "desc", request.cursor, request.size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return CursorPaginatedMemoryResponse(
+            items=[_memory_response(memory) for memory in items],
+            size=request.size,
+            next_cursor=next_cursor,
+        )
+
+    # Apply sorting
+    sort_field = KEYSET_SORT_COLUMNS[sort_column][0]
+    if sort_column == "app_name":
+        query = query.join(App, Memory.app_id == App.id)
+    query = query.order_by(sort_field.desc() if sort_direction == "desc" else sort_field.asc(), Memory.id)
 
     # Use fastapi-pagination's paginate function
     return sqlalchemy_paginate(
         query,
         Params(page=request.page, size=request.size),
-        transformer=lambda items: [
-            MemoryResponse(
-                id=memory.id,
-                content=memory.content,
-                created_at=memory.created_at,
-                state=memory.state.value,
-                app_id=memory.app_id,
-                app_name=memory.app.name if memory.app else None,
-                categories=[category.name for category in memory.categories],
-                metadata_=memory.metadata_
-            )
-            for memory in items
-        ]
+        transformer=lambda items: [_memory_response(memory) for memory in items]
     )
 
 
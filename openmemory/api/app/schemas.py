@@ -63,3 +63,8 @@ class PaginatedMemoryResponse(BaseModel):
     page: int
     size: int
     pages: int
+
+class CursorPaginatedMemoryResponse(BaseModel):
+    items: List[MemoryResponse]
+    size: int
+    next_cursor: Optional[str] = None
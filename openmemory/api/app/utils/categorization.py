@@ -1,7 +1,15 @@
+import datetime
+import hashlib
 import logging
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
-from app.utils.prompts import MEMORY_CATEGORIZATION_PROMPT
+from app.config import CATEGORIZATION_BATCH_SIZE, CATEGORIZATION_LEASE_SECONDS, CATEGORIZATION_POLL_INTERVAL
+from app.database import SessionLocal
+from app.models import CategorizationTask, Category, Memory, memory_categories
+from app.utils.prompts import BATCH_MEMORY_CATEGORIZATION_PROMPT, MEMORY_CATEGORIZATION_PROMPT
+from app.utils.stats import user_stats_cache
 from dotenv import load_dotenv
 from openai import OpenAI
 from pydantic import BaseModel
@@ -15,6 +23,15 @@ class MemoryCategories(BaseModel):
     categories: List[str]
 
 
+class MemoryCategoryAssignment(BaseModel):
+    index: int
+    categories: List[str]
+
+
+class BatchMemoryCategories(BaseModel):
+    results: List[MemoryCategoryAssignment]
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
 def get_categories_for_memory(memory: str) -> List[str]:
     try:
@@ -41,3 +58,213 @@ def get_categories_for_memory(memory: str) -> List[str]:
         except Exception as debug_e:
             logging.debug(f"[DEBUG] Could not extract raw response: {debug_e}")
         raise
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
+def get_categories_for_memories(memories: List[str]) -> List[List[str]]:
+    """Categorize several memories with one structured LLM call; results are in input order."""
+    if len(memories) == 1:
+        return [get_categories_for_memory(memories[0])]
+
+    messages = [
+        {"role": "system", "content": BATCH_MEMORY_CATEGORIZATION_PROMPT},
+        {"role": "user", "content": "\n".join(f"[{idx}] {memory}" for idx, memory in enumerate(memories))}
+    ]
+    completion = openai_client.beta.chat.completions.parse(
+        model="gpt-4o-mini",
+        messages=messages,
+        response_format=BatchMemoryCategories,
+        temperature=0
+    )
+    parsed: BatchMemoryCategories = completion.choices[0].message.parsed
+
+    by_index = {
+        result.index: [cat.strip().lower() for cat in result.categories]
+        for result in parsed.results
+        if 0 <= result.index < len(memories)
+    }
+    # The model occasionally skips an entry; categorize those on their own rather than guessing
+    return [by_index[idx] if idx in by_index else get_categories_for_memory(memory)
+            for idx, memory in enumerate(memories)]
+
+
+class CategorizationWorker:
+    """
+    Drain the categorization outbox in the background.
+
+    Memory writes only insert a `CategorizationTask` row in their own transaction. This worker picks up
+    ready tasks in batches, categorizes all their memories with a single LLM call (skipping contents it
+    has already categorized), bulk-inserts the missing categories and associations, and deletes the
+    tasks. Failed batches are retried with exponential backoff until `max_attempts` is reached, after
+    which the tasks stay in the table with their last error for inspection.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = CATEGORIZATION_BATCH_SIZE,
+        poll_interval: float = CATEGORIZATION_POLL_INTERVAL,
+        max_attempts: int = 5,
+        cache_size: int = 10000,
+        lease_seconds: float = CATEGORIZATION_LEASE_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="openmemory-categorization", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                logging.exception(f"Categorization worker failed: {e}")
+                processed = 0
+            # Keep draining while there is a backlog, otherwise poll
+            if processed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def run_once(self) -> int:
+        """Process one batch of ready tasks and return how many tasks were taken."""
+        db = self.session_factory()
+        try:
+            tasks = self._claim(db)
+            if not tasks:
+                return 0
+
+            memory_ids = {task.memory_id for task in tasks}
+            rows = db.query(Memory.id, Memory.user_id, Memory.content).filter(Memory.id.in_(memory_ids)).all()
+            contents = {memory_id: content for memory_id, _, content in rows}
+
+            try:
+                categories_by_memory = self._categorize(contents)
+                self._store_categories(db, categories_by_memory)
+            except Exception as e:
+                db.rollback()
+                self._retry_later(db, tasks, e)
+                return len(tasks)
+
+            for task in tasks:
+                db.delete(task)
+            db.commit()
+            # Links are written with core inserts, so the ORM listeners do not see them
+            user_stats_cache.invalidate({user_id for _, user_id, _ in rows})
+            return len(tasks)
+        finally:
+            db.close()
+
+    def _claim(self, db) -> List[CategorizationTask]:
+        """
+        Take up to `batch_size` ready tasks for this worker.
+
+        Every API worker process runs its own worker on the same queue, and SQLite has no row locks to
+        skip. Each task is therefore taken with an UPDATE that moves its `available_at` to the end of
+        the lease, guarded by the task still being ready: only the worker whose UPDATE changed the row
+        processes it. Tasks of a worker that died become ready again when the lease runs out.
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        ready_ids = [
+            task_id
+            for (task_id,) in db.query(CategorizationTask.id)
+            .filter(CategorizationTask.attempts < self.max_attempts, CategorizationTask.available_at <= now)
+            .order_by(CategorizationTask.created_at)
+            .limit(self.batch_size)
+        ]
+        queue = CategorizationTask.__table__
+        lease_end = now + datetime.timedelta(seconds=self.lease_seconds)
+        claimed_ids = []
+        for task_id in ready_ids:
+            result = db.execute(
+                queue.update()
+                .where(queue.c.id == task_id, queue.c.available_at <= now)
+                .values(available_at=lease_end)
+            )
+            if result.rowcount == 1:
+                claimed_ids.append(task_id)
+        # Commit the claims before the LLM call, so other workers see them and SQLite's write lock is released
+        db.commit()
+        if not claimed_ids:
+            return []
+        return db.query(CategorizationTask).filter(CategorizationTask.id.in_(claimed_ids)).all()
+
+    def _categorize(self, contents: Dict) -> Dict:
+        """Map memory ids to categories, calling the LLM once for all contents not seen before."""
+        hashes = {memory_id: hashlib.md5(content.encode()).hexdigest() for memory_id, content in contents.items()}
+        uncached = {}
+        for memory_id, content_hash in hashes.items():
+            if content_hash not in self._cache and content_hash not in uncached:
+                uncached[content_hash] = contents[memory_id]
+
+        if uncached:
+            results = get_categories_for_memories(list(uncached.values()))
+            for content_hash, categories in zip(uncached, results):
+                self._cache[content_hash] = categories
+                self._cache.move_to_end(content_hash)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return {memory_id: self._cache.get(content_hash, []) for memory_id, content_hash in hashes.items()}
+
+    @staticmethod
+    def _store_categories(db, categories_by_memory: Dict) -> None:
+        """Create missing categories and memory-category links with a fixed number of statements."""
+        names = {name for categories in categories_by_memory.values() for name in categories}
+        if not names:
+            return
+
+        category_ids = dict(db.query(Category.name, Category.id).filter(Category.name.in_(names)))
+        new_categories = [
+            Category(name=name, description=f"Automatically created category for {name}")
+            for name in names - category_ids.keys()
+        ]
+        if new_categories:
+            db.add_all(new_categories)
+            db.flush()
+            category_ids.update({category.name: category.id for category in new_categories})
+
+        existing_links = {
+            tuple(row)
+            for row in db.execute(
+                memory_categories.select().where(memory_categories.c.memory_id.in_(categories_by_memory.keys()))
+            )
+        }
+        new_links = [
+            {"memory_id": memory_id, "category_id": category_ids[name]}
+            for memory_id, categories in categories_by_memory.items()
+            for name in set(categories)
+            if (memory_id, category_ids[name]) not in existing_links
+        ]
+        if new_links:
+            db.execute(memory_categories.insert(), new_links)
+
+    def _retry_later(self, db, tasks: List[CategorizationTask], error: Exception) -> None:
+        logging.error(f"Error categorizing {len(tasks)} memories: {error}")
+        now = datetime.datetime.now(datetime.UTC)
+        for task in tasks:
+            task.attempts += 1
+            task.last_error = str(error)[:1000]
+            task.available_at = now + datetime.timedelta(seconds=self.poll_interval * 2 ** task.attempts)
+            if task.attempts >= self.max_attempts:
+                logging.error(f"Giving up on categorizing memory {task.memory_id} after {task.attempts} attempts")
+        db.commit()
+
+
+categorization_worker = CategorizationWorker()
@@ -0,0 +1,105 @@
+"""
+Bounded execution of blocking MCP tool work.
+
+The memory client, embedder, vector store and SQLAlchemy sessions are all synchronous. Running them
+directly inside the MCP tool coroutines blocks the event loop that serves every SSE connection, so a
+single slow LLM extraction stalls all clients. `ToolExecutor` moves that work onto a fixed-size
+thread pool, caps how many calls a single user can have running at once, and records how long calls
+wait before they start.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict
+
+from app.config import MCP_PER_USER_CONCURRENCY, MCP_TOOL_WORKERS
+
+# Number of most recent calls per tool kept for percentile calculation
+_LATENCY_WINDOW = 1000
+
+
+def _percentile(samples, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ToolExecutor:
+    def __init__(self, max_workers: int = MCP_TOOL_WORKERS, per_user_limit: int = MCP_PER_USER_CONCURRENCY):
+        self.max_workers = max_workers
+        self.per_user_limit = per_user_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="openmemory-mcp")
+        # Semaphores of users with running or waiting calls; dropped once a user has none, so the map stays bounded
+        self._user_slots: Dict[str, asyncio.Semaphore] = {}
+        self._slot_holders: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._queue_waits: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=_LATENCY_WINDOW))
+        self._run_times: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    async def run(self, user_id: str, tool_name: str, func: Callable[..., Any], *args) -> Any:
+        """Run `func(*args)` on the worker pool once the user has a free slot, without blocking the loop."""
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            slot = self._user_slots.setdefault(user_id, asyncio.Semaphore(self.per_user_limit))
+        self._slot_holders[user_id] = self._slot_holders.get(user_id, 0) + 1
+
+        submitted = time.perf_counter()
+        started = None
+
+        def timed_call():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args)
+
+        try:
+            async with slot:
+                with self._stats_lock:
+                    self._in_flight[tool_name] += 1
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(self._executor, timed_call)
+                finally:
+                    finished = time.perf_counter()
+                    with self._stats_lock:
+                        self._in_flight[tool_name] -= 1
+                        self._calls[tool_name] += 1
+                        if started is not None:
+                            self._queue_waits[tool_name].append(started - submitted)
+                            self._run_times[tool_name].append(finished - started)
+        finally:
+            self._release_slot(user_id)
+
+    def _release_slot(self, user_id: str) -> None:
+        holders = self._slot_holders[user_id] - 1
+        if holders:
+            self._slot_holders[user_id] = holders
+        else:
+            del self._slot_holders[user_id]
+            del self._user_slots[user_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-tool call counts and queue-wait / run-time percentiles (milliseconds) over recent calls."""
+        with self._stats_lock:
+            tools = {
+                name: {
+                    "calls": self._calls[name],
+                    "in_flight": self._in_flight[name],
+                    "queue_wait_p50_ms": 1000 * _percentile(self._queue_waits[name], 0.50),
+                    "queue_wait_p99_ms": 1000 * _percentile(self._queue_waits[name], 0.99),
+                    "run_time_p50_ms": 1000 * _percentile(self._run_times[name], 0.50),
+                    "run_time_p99_ms": 1000 * _percentile(self._run_times[name], 0.99),
+                }
+                for name in set(self._calls) | set(self._in_flight)
+            }
+        return {"max_workers": self.max_workers, "per_user_limit": self.per_user_limit, "tools": tools}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+tool_executor = ToolExecutor()
@@ -31,15 +31,18 @@ import hashlib
 import json
 import os
 import socket
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 
+from app.config import MEMORY_CLIENT_CLOSE_DELAY, MEMORY_CONFIG_POLL_INTERVAL
 from app.database import SessionLocal
 from app.models import Config as ConfigModel
 
 from mem0 import Memory
 
-_memory_client = None
-_config_hash = None
-
 
 def _get_config_hash(config_dict):
     """Generate a hash of the config to detect changes."""
@@ -127,10 +130,8 @@ def _fix_ollama_urls(config_section):
 
 
 def reset_memory_client():
-    """Reset the global memory client to force reinitialization with new config."""
-    global _memory_client, _config_hash
-    _memory_client = None
-    _config_hash = None
+    """Force the next get_memory_client call to reload the configuration (e.g. after it was saved)."""
+    memory_client_registry.notify_config_changed()
 
 
 def get_default_memory_config():
@@ -286,6 +287,285 @@ def _parse_environment_variables(config_dict):
     return config_dict
 
 
+def _load_memory_config(custom_instructions: str = None):
+    """Build the Mem0 config from the defaults, the database and the environment."""
+    # Start with default configuration
+    config = get_default_memory_config()
+
+    # Variable to track custom instructions
+    db_custom_instructions = None
+
+    # Load configuration from database
+    try:
+        db = SessionLocal()
+        db_config = db.query(ConfigModel).filter(ConfigModel.key == "main").first()
+
+        if db_config:
+            json_config = db_config.value
+
+            # Extract custom instructions from openmemory settings
+            if "openmemory" in json_config and "custom_instructions" in json_config["openmemory"]:
+                db_custom_instructions = json_config["openmemory"]["custom_instructions"]
+
+            # Override defaults with configurations from the database
+            if "mem0" in json_config:
+                mem0_config = json_config["mem0"]
+
+                # Update LLM configuration if available
+                if "llm" in mem0_config and mem0_config["llm"] is not None:
+                    config["llm"] = mem0_config["llm"]
+
+                    # Fix Ollama URLs for Docker if needed
+                    if config["llm"].get("provider") == "ollama":
+                        config["llm"] = _fix_ollama_urls(config["llm"])
+
+                # Update Embedder configuration if available
+                if "embedder" in mem0_config and mem0_config["embedder"] is not None:
+                    config["embedder"] = mem0_config["embedder"]
+
+                    # Fix Ollama URLs for Docker if needed
+                    if config["embedder"].get("provider") == "ollama":
+                        config["embedder"] = _fix_ollama_urls(config["embedder"])
+
+                if "vector_store" in mem0_config and mem0_config["vector_store"] is not None:
+                    config["vector_store"] = mem0_config["vector_store"]
+        else:
+            print("No configuration found in database, using defaults")
+
+        db.close()
+
+    except Exception as e:
+        print(f"Warning: Error loading configuration from database: {e}")
+        print("Using default configuration")
+        # Continue with default configuration if database config can't be loaded
+
+    # Use custom_instructions parameter first, then fall back to database value
+    instructions_to_use = custom_instructions or db_custom_instructions
+    if instructions_to_use:
+        config["custom_fact_extraction_prompt"] = instructions_to_use
+
+    # ALWAYS parse environment variables in the final config
+    # This ensures that even default config values like "env:OPENAI_API_KEY" get parsed
+    print("Parsing environment variables in final config...")
+    return _parse_environment_variables(config)
+
+
+def _close_memory_client(client) -> None:
+    """Release the resources held by a retired Memory instance."""
+    try:
+        client.close()
+    except Exception as e:
+        print(f"Warning: Error closing memory client: {e}")
+
+
+class _RegisteredClient:
+    """A registry client and the requests currently leasing it."""
+
+    def __init__(self, client: Memory):
+        self.client = client
+        self.leases = 0
+        self.retired = False
+        # Set once callers that did not take a lease have had `close_delay` seconds to finish
+        self.grace_over = False
+        self.closed = False
+
+
+class MemoryClientRegistry:
+    """
+    Process-wide registry of Mem0 clients keyed by config hash.
+
+    The resolved config hash is cached, so the hot path is two dictionary lookups with no database
+    access and no locking. The config is re-read only after `notify_config_changed`, which the config
+    endpoints call in this process and a background watcher calls when another worker updated the
+    config row. Concurrent callers that need the same new client wait for a single build instead of
+    each creating one.
+
+    When the config behind a `custom_instructions` key changes, the client it used is retired unless
+    another key still resolves to it. A retired client is closed once no request holds it through
+    `acquire` and at least `close_delay` seconds have passed, which covers callers of plain `get`.
+    """
+
+    def __init__(self, close_delay: float = MEMORY_CLIENT_CLOSE_DELAY, poll_interval: float = MEMORY_CONFIG_POLL_INTERVAL):
+        self.close_delay = close_delay
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # custom_instructions -> config hash of the client serving it, cleared on config changes
+        self._resolved: Dict[Optional[str], str] = {}
+        # custom_instructions -> config hash it resolved to last, kept across config changes
+        self._last_resolved: Dict[Optional[str], str] = {}
+        self._clients: Dict[str, _RegisteredClient] = {}
+        self._building: Dict[str, Future] = {}
+        self._generation = 0
+        self._watcher: Optional[threading.Thread] = None
+        # id(client) -> retired entry still waiting for its leases or grace period to end
+        self._retired: Dict[int, _RegisteredClient] = {}
+
+    def get(self, custom_instructions: str = None) -> Optional[Memory]:
+        config_hash = self._resolved.get(custom_instructions)
+        if config_hash is not None:
+            entry = self._clients.get(config_hash)
+            if entry is not None:
+                return entry.client
+        return self._resolve(custom_instructions)
+
+    def acquire(self, custom_instructions: str = None) -> Optional[Memory]:
+        """Like `get`, but the client stays open until it is handed back with `release`."""
+        while True:
+            client = self.get(custom_instructions)
+            if client is None:
+                return None
+            with self._lock:
+                entry = self._find(client)
+                # Retired and closed between the lookup and the lease: look the client up again
+                if entry is not None and not entry.closed:
+                    entry.leases += 1
+                    return client
+
+    def release(self, client: Optional[Memory]) -> None:
+        if client is None:
+            return
+        with self._lock:
+            entry = self._find(client)
+            if entry is None or entry.leases == 0:
+                return
+            entry.leases -= 1
+            close = self._should_close(entry)
+        if close:
+            _close_memory_client(entry.client)
+
+    def _find(self, client: Memory) -> Optional[_RegisteredClient]:
+        """Entry of `client`, also if it was retired in the meantime. Caller holds the lock."""
+        for entry in self._clients.values():
+            if entry.client is client:
+                return entry
+        return self._retired.get(id(client))
+
+    def _resolve(self, custom_instructions: Optional[str]) -> Optional[Memory]:
+        self._ensure_watcher()
+        with self._lock:
+            generation = self._generation
+        config = _load_memory_config(custom_instructions)
+        config_hash = _get_config_hash(config)
+
+        with self._lock:
+            entry = self._clients.get(config_hash)
+            if entry is not None:
+                retired = self._record(custom_instructions, config_hash, generation)
+            else:
+                future = self._building.get(config_hash)
+                owner = future is None
+                if owner:
+                    future = self._building[config_hash] = Future()
+        if entry is not None:
+            self._close_later(retired)
+            return entry.client
+
+        if not owner:
+            return future.result()
+
+        print(f"Initializing memory client with config hash: {config_hash}")
+        try:
+            client = Memory.from_config(config_dict=config)
+            print("Memory client initialized successfully")
+        except Exception as init_error:
+            print(f"Warning: Failed to initialize memory client: {init_error}")
+            print("Server will continue running with limited memory functionality")
+            client = None
+
+        with self._lock:
+            del self._building[config_hash]
+            if client is not None:
+                self._clients[config_hash] = _RegisteredClient(client)
+                retired = self._record(custom_instructions, config_hash, generation)
+            else:
+                retired = []
+        future.set_result(client)
+        self._close_later(retired)
+        return client
+
+    def _record(self, custom_instructions: Optional[str], config_hash: str, generation: int) -> list:
+        """
+        Point `custom_instructions` at `config_hash` and retire the client it used before, if its config
+        changed and no other key still uses that client. Caller holds the lock.
+        """
+        # A config change during the build means this config may already be stale
+        if generation == self._generation:
+            self._resolved[custom_instructions] = config_hash
+        previous = self._last_resolved.get(custom_instructions)
+        self._last_resolved[custom_instructions] = config_hash
+        if previous is None or previous == config_hash or previous in self._last_resolved.values():
+            return []
+        entry = self._clients.pop(previous, None)
+        if entry is None:
+            return []
+        entry.retired = True
+        self._retired[id(entry.client)] = entry
+        return [entry]
+
+    def _should_close(self, entry: _RegisteredClient) -> bool:
+        """Whether a retired client can be closed now; marks it closed if so. Caller holds the lock."""
+        if entry.closed or not entry.retired or not entry.grace_over or entry.leases > 0:
+            return False
+        entry.closed = True
+        self._retired.pop(id(entry.client), None)
+        return True
+
+    def _end_grace(self, entry: _RegisteredClient) -> None:
+        with self._lock:
+            entry.grace_over = True
+            close = self._should_close(entry)
+        if close:
+            _close_memory_client(entry.client)
+
+    def _close_later(self, entries: list) -> None:
+        for entry in entries:
+            timer = threading.Timer(self.close_delay, self._end_grace, args=(entry,))
+            timer.daemon = True
+            timer.start()
+
+    def notify_config_changed(self) -> None:
+        """Make the next lookup reload the config; the current clients keep serving until then."""
+        with self._lock:
+            self._generation += 1
+            self._resolved.clear()
+
+    def _config_updated_at(self):
+        db = SessionLocal()
+        try:
+            row = db.query(ConfigModel.updated_at).filter(ConfigModel.key == "main").first()
+            return row.updated_at if row else None
+        finally:
+            db.close()
+
+    def _ensure_watcher(self) -> None:
+        if self.poll_interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._watcher = threading.Thread(target=self._watch, name="openmemory-config-watcher", daemon=True)
+            self._watcher.start()
+
+    def _watch(self) -> None:
+        """Pick up config changes saved by other worker processes."""
+        try:
+            last_seen = self._config_updated_at()
+        except Exception:
+            last_seen = None
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                updated_at = self._config_updated_at()
+                if updated_at != last_seen:
+                    last_seen = updated_at
+                    self.notify_config_changed()
+            except Exception as e:
+                print(f"Warning: Could not check memory configuration for changes: {e}")
+
+
+memory_client_registry = MemoryClientRegistry()
+
+
 def get_memory_client(custom_instructions: str = None):
     """
     Get or initialize the Mem0 client.
@@ -295,96 +575,33 @@ def get_memory_client(custom_instructions: str = None):
 
     Returns:
         Initialized Mem0 client instance or None if initialization fails.
+    """
+    try:
+        return memory_client_registry.get(custom_instructions)
+    except Exception as e:
+        print(f"Warning: Exception occurred while initializing memory client: {e}")
+        print("Server will continue running with limited memory functionality")
+        return None
 
-    Raises:
-        Exception: If required API keys are not set or critical configuration is missing.
+
+@contextmanager
+def memory_client_lease(custom_instructions: str = None) -> Iterator[Optional[Memory]]:
     """
-    global _memory_client, _config_hash
+    Like `get_memory_client`, but keeps the client open until the block exits even if the config changes.
 
+    Use it for long-running work such as backup imports, which can outlive the close delay of a
+    client replaced by a config change.
+    """
     try:
-        # Start with default configuration
-        config = get_default_memory_config()
-        
-        # Variable to track custom instructions
-        db_custom_instructions = None
-        
-        # Load configuration from database
-        try:
-            db = SessionLocal()
-            db_config = db.query(ConfigModel).filter(ConfigModel.key == "main").first()
-            
-            if db_config:
-                json_config = db_config.value
-                
-                # Extract custom instructions from openmemory settings
-                if "openmemory" in json_config and "custom_instructions" in json_config["openmemory"]:
-                    db_custom_instructions = json_config["openmemory"]["custom_instructions"]
-                
-                # Override defaults with configurations from the database
-                if "mem0" in json_config:
-                    mem0_config = json_config["mem0"]
-                    
-                    # Update LLM configuration if available
-                    if "llm" in mem0_config and mem0_config["llm"] is not None:
-                        config["llm"] = mem0_config["llm"]
-                        
-                        # Fix Ollama URLs for Docker if needed
-                        if config["llm"].get("provider") == "ollama":
-                            config["llm"] = _fix_ollama_urls(config["llm"])
-                    
-                    # Update Embedder configuration if available
-                    if "embedder" in mem0_config and mem0_config["embedder"] is not None:
-                        config["embedder"] = mem0_config["embedder"]
-                        
-                        # Fix Ollama URLs for Docker if needed
-                        if config["embedder"].get("provider") == "ollama":
-                            config["embedder"] = _fix_ollama_urls(config["embedder"])
-
-                    if "vector_store" in mem0_config and mem0_config["vector_store"] is not None:
-                        config["vector_store"] = mem0_config["vector_store"]
-            else:
-                print("No configuration found in database, using defaults")
-                    
-            db.close()
-                            
-        except Exception as e:
-            print(f"Warning: Error loading configuration from database: {e}")
-            print("Using default configuration")
-            # Continue with default configuration if database config can't be loaded
-
-        # Use custom_instructions parameter first, then fall back to database value
-        instructions_to_use = custom_instructions or db_custom_instructions
-        if instructions_to_use:
-            config["custom_fact_extraction_prompt"] = instructions_to_use
-
-        # ALWAYS parse environment variables in the final config
-        # This ensures that even default config values like "env:OPENAI_API_KEY" get parsed
-        print("Parsing environment variables in final config...")
-        config = _parse_environment_variables(config)
-
-        # Check if config has changed by comparing hashes
-        current_config_hash = _get_config_hash(config)
-        
-        # Only reinitialize if config changed or client doesn't exist
-        if _memory_client is None or _config_hash != current_config_hash:
-            print(f"Initializing memory client with config hash: {current_config_hash}")
-            try:
-                _memory_client = Memory.from_config(config_dict=config)
-                _config_hash = current_config_hash
-                print("Memory client initialized successfully")
-            except Exception as init_error:
-                print(f"Warning: Failed to initialize memory client: {init_error}")
-                print("Server will continue running with limited memory functionality")
-                _memory_client = None
-                _config_hash = None
-                return None
-        
-        return _memory_client
-        
+        client = memory_client_registry.acquire(custom_instructions)
     except Exception as e:
         print(f"Warning: Exception occurred while initializing memory client: {e}")
         print("Server will continue running with limited memory functionality")
-        return None
+        client = None
+    try:
+        yield client
+    finally:
+        memory_client_registry.release(client)
 
 
 def get_default_user_id():
@@ -1,9 +1,19 @@
-from typing import Optional
+import threading
+import time
+from itertools import chain
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 from uuid import UUID
 
-from app.models import App, Memory, MemoryState
+import sqlalchemy as sa
+from app.models import AccessControl, App, Memory, MemoryAccessVersion, MemoryState
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
+# Upper bound on how long a cached accessible set can be served; changes made through the ORM bump the
+# user's access version and invalidate it in every worker, this only guards against writes that bypass the session.
+ACCESS_CACHE_TTL_SECONDS = 300
+
 
 def check_memory_access_permissions(
     db: Session,
@@ -51,3 +61,115 @@ def check_memory_access_permissions(
 
     # Check if memory is in the accessible set
     return memory.id in accessible_memory_ids
+
+
+class AccessibleMemoryCache:
+    """
+    Per-(user, app) cache of the ids of the memories an app may read.
+
+    Entries are tagged with the user's access version they were computed at. Every commit that touches
+    the user's memories, apps, or the apps' access controls bumps that version in the database, so an
+    entry stops being served as soon as any worker process commits such a change.
+    """
+
+    def __init__(self, ttl: float = ACCESS_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[UUID, UUID], Tuple[float, int, FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, app_id: UUID, version: int) -> Optional[FrozenSet[str]]:
+        with self._lock:
+            entry = self._entries.get((user_id, app_id))
+            if entry is None or entry[1] != version or time.monotonic() - entry[0] > self.ttl:
+                return None
+            return entry[2]
+
+    def set(self, user_id: UUID, app_id: UUID, version: int, memory_ids: FrozenSet[str]) -> None:
+        with self._lock:
+            self._entries[(user_id, app_id)] = (time.monotonic(), version, memory_ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+accessible_memory_cache = AccessibleMemoryCache()
+
+
+def get_accessible_memory_set(db: Session, user_id: UUID, app_id: UUID) -> FrozenSet[str]:
+    """
+    Get the ids of the active memories of a user that the given app may read.
+
+    Ids are returned as strings so they can be matched directly against vector store hits. The set
+    is computed with a single id-only query and cached until the user's access version changes.
+    """
+    version = db.query(MemoryAccessVersion.version).filter(MemoryAccessVersion.user_id == user_id).scalar() or 0
+    cached = accessible_memory_cache.get(user_id, app_id, version)
+    if cached is not None:
+        return cached
+
+    app = db.query(App.is_active).filter(App.id == app_id).first()
+    acl_memory_ids = None
+    if app and app.is_active:
+        from app.routers.memories import get_accessible_memory_ids
+        acl_memory_ids = get_accessible_memory_ids(db, app_id)
+
+    if not app or not app.is_active or acl_memory_ids == set():
+        accessible = frozenset()
+    else:
+        query = db.query(Memory.id).filter(Memory.user_id == user_id, Memory.state == MemoryState.active)
+        # None means the app has no restricting rules and may read every memory
+        if acl_memory_ids is not None:
+            query = query.filter(Memory.id.in_(acl_memory_ids))
+        accessible = frozenset(str(memory_id) for (memory_id,) in query)
+
+    # A set computed from this session's uncommitted changes must not be seen by other requests
+    if not db.info.get("accessible_memory_changes"):
+        accessible_memory_cache.set(user_id, app_id, version, accessible)
+    return accessible
+
+
+def _bump_access_versions(connection, user_ids: Set[UUID]) -> None:
+    """Increment the access version of each user, creating the row the first time."""
+    table = MemoryAccessVersion.__table__
+    insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(connection.dialect.name)
+    if insert is not None:
+        statement = insert(table).values([{"user_id": user_id, "version": 1} for user_id in user_ids])
+        connection.execute(
+            statement.on_conflict_do_update(index_elements=[table.c.user_id], set_={"version": table.c.version + 1})
+        )
+        return
+    for user_id in user_ids:
+        updated = connection.execute(
+            table.update().where(table.c.user_id == user_id).values(version=table.c.version + 1)
+        )
+        if updated.rowcount == 0:
+            connection.execute(table.insert().values(user_id=user_id, version=1))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_access_changes(session, flush_context):
+    """Bump the access version of the users whose memories, apps, or app access controls were changed."""
+    user_ids, app_ids = set(), set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Memory):
+            if obj in session.dirty and not sa.inspect(obj).attrs.state.history.has_changes():
+                continue
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, App):
+            user_ids.add(obj.owner_id)
+        elif isinstance(obj, AccessControl) and obj.subject_type == "app":
+            app_ids.add(obj.subject_id)
+    if app_ids:
+        owners = session.connection().execute(sa.select(App.owner_id).where(App.id.in_(app_ids)))
+        user_ids.update(owner_id for (owner_id,) in owners)
+    user_ids.discard(None)
+    if user_ids:
+        _bump_access_versions(session.connection(), user_ids)
+        session.info["accessible_memory_changes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _end_access_changes(session):
+    session.info.pop("accessible_memory_changes", None)
@@ -26,3 +26,9 @@ Guidelines:
 - If you cannot categorize the memory, return an empty list with key 'categories'.
 - Don't limit yourself to the categories listed above only. Feel free to create new categories based on the memory. Make sure that it is a single phrase.
 """
+
+BATCH_MEMORY_CATEGORIZATION_PROMPT = MEMORY_CATEGORIZATION_PROMPT + """
+You will receive several memories at once, each on its own line and prefixed with its index, e.g. "[3] ...".
+- Categorize every memory independently.
+- Return one entry per memory under the 'results' key, each with the memory's 'index' and its 'categories'.
+"""
@@ -0,0 +1,193 @@
+"""
+Text search over memory content for the list and filter endpoints.
+
+A plain `content ILIKE '%q%'` cannot use a B-tree index, so every search scans all of a user's
+memories. The index used instead depends on the database:
+
+* SQLite: an FTS5 table with the trigram tokenizer, kept in sync with `memories` by triggers. Trigram
+  matching keeps the substring semantics of ILIKE for queries of three or more characters; shorter
+  queries fall back to ILIKE. The FTS rows map to `memories.id` through the memories_fts_ids table.
+* PostgreSQL: a pg_trgm GIN index on `memories.content`, which serves the ILIKE predicate directly.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from app.models import App, Memory
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Trigram matching needs at least one full trigram
+MIN_FTS_QUERY_LENGTH = 3
+
+# FTS5 rows are keyed by an explicit INTEGER PRIMARY KEY of memories_fts_ids, which maps them to
+# `memories.id`. The implicit rowid of `memories` would not do: its primary key is a UUID, so VACUUM may
+# renumber its rowids and point the index at the wrong memories.
+SQLITE_FTS_DDL = [
+    "CREATE TABLE IF NOT EXISTS memories_fts_ids (id INTEGER PRIMARY KEY, memory_id TEXT NOT NULL UNIQUE)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(content, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN "
+    "INSERT INTO memories_fts_ids(memory_id) VALUES (new.id); "
+    "INSERT INTO memories_fts(rowid, content) "
+    "VALUES ((SELECT id FROM memories_fts_ids WHERE memory_id = new.id), new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN "
+    "DELETE FROM memories_fts WHERE rowid = (SELECT id FROM memories_fts_ids WHERE memory_id = old.id); "
+    "DELETE FROM memories_fts_ids WHERE memory_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE OF content ON memories BEGIN "
+    "UPDATE memories_fts SET content = new.content "
+    "WHERE rowid = (SELECT id FROM memories_fts_ids WHERE memory_id = new.id); END",
+]
+
+# The first version of the index was an external-content table keyed by the rowid of `memories`
+SQLITE_LEGACY_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS memories_fts_update",
+    "DROP TRIGGER IF EXISTS memories_fts_delete",
+    "DROP TRIGGER IF EXISTS memories_fts_insert",
+    "DROP TABLE IF EXISTS memories_fts",
+]
+
+SQLITE_FTS_REBUILD = [
+    "DELETE FROM memories_fts",
+    "DELETE FROM memories_fts_ids",
+    "INSERT INTO memories_fts_ids(memory_id) SELECT id FROM memories",
+    "INSERT INTO memories_fts(rowid, content) "
+    "SELECT memories_fts_ids.id, memories.content FROM memories_fts_ids "
+    "JOIN memories ON memories.id = memories_fts_ids.memory_id",
+]
+
+POSTGRES_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_memory_content_trgm ON memories USING gin (content gin_trgm_ops)",
+]
+
+# Sortable columns for keyset pagination and how to read their value back from a cursor
+KEYSET_SORT_COLUMNS = {
+    "memory": (Memory.content, str),
+    "app_name": (App.name, str),
+    "created_at": (Memory.created_at, datetime.fromisoformat),
+}
+
+_sqlite_fts_enabled = False
+
+
+def ensure_memory_search_index(engine: Engine) -> None:
+    """Create the text index for the engine's dialect if it does not exist yet."""
+    global _sqlite_fts_enabled
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == "sqlite":
+                existed = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts_ids'")
+                ).first()
+                if not existed:
+                    for statement in SQLITE_LEGACY_FTS_DROP:
+                        conn.execute(text(statement))
+                for statement in SQLITE_FTS_DDL:
+                    conn.execute(text(statement))
+                if not existed:
+                    for statement in SQLITE_FTS_REBUILD:
+                        conn.execute(text(statement))
+                _sqlite_fts_enabled = True
+            elif engine.dialect.name == "postgresql":
+                for statement in POSTGRES_TRGM_DDL:
+                    conn.execute(text(statement))
+    except Exception as e:
+        # Searching still works without the index, only slower
+        logging.warning(f"Could not create memory search index: {e}")
+
+
+def rebuild_memory_search_index(engine: Engine) -> None:
+    """Re-index every memory, for a SQLite database whose rows were changed with the triggers disabled."""
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            for statement in SQLITE_FTS_REBUILD:
+                conn.execute(text(statement))
+
+
+def memory_search_filter(db: Session, search_query: str):
+    """Filter clause matching memories whose content contains `search_query`, served by the text index."""
+    if (
+        _sqlite_fts_enabled
+        and db.get_bind().dialect.name == "sqlite"
+        and len(search_query) >= MIN_FTS_QUERY_LENGTH
+    ):
+        # Quoted as a single FTS5 string so operators in user input are matched literally
+        phrase = '"' + search_query.replace('"', '""') + '"'
+        return text(
+            "memories.id IN (SELECT memories_fts_ids.memory_id FROM memories_fts "
+            "JOIN memories_fts_ids ON memories_fts_ids.id = memories_fts.rowid "
+            "WHERE memories_fts MATCH :memory_search)"
+        ).bindparams(memory_search=phrase)
+    return Memory.content.ilike(f"%{search_query}%")
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[List[Any]]:
+    """Decode a cursor produced by `encode_cursor`; an empty cursor means the first page."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def keyset_page(query, sort_column: str, descending: bool, cursor: Optional[str], size: int) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of a Memory query ordered by `(sort_column, Memory.id)`, starting after `cursor`.
+
+    Returns the memories and the cursor of the next page, or None on the last page. Unlike OFFSET,
+    the cost of a page does not depend on how deep into the result set it is. NULL sort values (a
+    memory without an app, a row without created_at) sort after all others ascending and before them
+    descending, on every dialect, so they are paged like any other value.
+    """
+    sort_field, sort_value_type = KEYSET_SORT_COLUMNS[sort_column]
+    if sort_column == "app_name":
+        # Outer join, so memories without an app are still listed
+        query = query.outerjoin(App, Memory.app_id == App.id)
+    query = query.add_columns(sort_field)
+
+    after = decode_cursor(cursor)
+    if after is not None:
+        last_value = sort_value_type(after[0]) if after[0] is not None else None
+        last_id = UUID(after[1])
+        if descending:
+            if last_value is None:
+                query = query.filter(sort_field.isnot(None) | (sort_field.is_(None) & (Memory.id < last_id)))
+            else:
+                query = query.filter(
+                    (sort_field < last_value) | ((sort_field == last_value) & (Memory.id < last_id))
+                )
+        else:
+            if last_value is None:
+                query = query.filter(sort_field.is_(None) & (Memory.id > last_id))
+            else:
+                query = query.filter(
+                    (sort_field > last_value)
+                    | ((sort_field == last_value) & (Memory.id > last_id))
+                    | sort_field.is_(None)
+                )
+
+    if descending:
+        query = query.order_by(sort_field.desc().nulls_first(), Memory.id.desc())
+    else:
+        query = query.order_by(sort_field.asc().nulls_last(), Memory.id.asc())
+
+    rows = query.limit(size + 1).all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        memory, value = rows[-1]
+        next_cursor = encode_cursor([value, str(memory.id)])
+    return [memory for memory, _ in rows], next_cursor
@@ -0,0 +1,131 @@
+import threading
+import time
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+import sqlalchemy as sa
+from app.config import STATS_CACHE_TTL
+from app.models import App, Category, Memory, MemoryState, memory_categories
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+
+class UserStatsCache:
+    """
+    Short-lived per-user cache for dashboard aggregates.
+
+    Entries are dropped when a commit writes one of the user's memories or apps; the TTL bounds
+    staleness for writes that bypass the ORM. A generation counter keeps a reader that raced with an
+    invalidation from storing a stale result.
+    """
+
+    def __init__(self, ttl: float = STATS_CACHE_TTL):
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: Dict[Tuple[UUID, str], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, user_id: UUID, name: str, compute: Callable[[], Any]) -> Any:
+        key = (user_id, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+                return entry[1]
+            generation = self.generation
+
+        value = compute()
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        user_ids = set(user_ids)
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._entries if key[0] in user_ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+user_stats_cache = UserStatsCache()
+
+
+def get_user_categories(db: Session, user_id: UUID) -> List[Dict[str, Any]]:
+    """Categories attached to at least one of the user's active or paused memories."""
+    def compute():
+        category_ids = (
+            sa.select(memory_categories.c.category_id)
+            .join(Memory, Memory.id == memory_categories.c.memory_id)
+            .where(Memory.user_id == user_id, Memory.state.notin_([MemoryState.deleted, MemoryState.archived]))
+            .distinct()
+        )
+        rows = (
+            db.query(Category.id, Category.name, Category.description, Category.created_at, Category.updated_at)
+            .filter(Category.id.in_(category_ids))
+            .order_by(Category.name)
+        )
+        return [row._asdict() for row in rows]
+
+    return user_stats_cache.get_or_compute(user_id, "categories", compute)
+
+
+def get_user_stats(db: Session, user_id: UUID) -> Dict[str, Any]:
+    """Memory and app totals for a user, computed from one grouped count and one app query."""
+    def compute():
+        counts = (
+            db.query(Memory.app_id, Memory.state, func.count(Memory.id))
+            .filter(Memory.user_id == user_id)
+            .group_by(Memory.app_id, Memory.state)
+            .all()
+        )
+        memories_per_app: Dict[UUID, int] = {}
+        total_memories = 0
+        for app_id, state, count in counts:
+            if state == MemoryState.deleted:
+                continue
+            total_memories += count
+            memories_per_app[app_id] = memories_per_app.get(app_id, 0) + count
+
+        apps = [
+            dict(row._asdict(), total_memories=memories_per_app.get(row.id, 0))
+            for row in db.query(
+                App.id, App.owner_id, App.name, App.description, App.metadata_,
+                App.is_active, App.created_at, App.updated_at
+            ).filter(App.owner_id == user_id)
+        ]
+        return {
+            "total_memories": total_memories,
+            "total_apps": len(apps),
+            "apps": apps,
+        }
+
+    return user_stats_cache.get_or_compute(user_id, "stats", compute)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stats_changes(session, flush_context):
+    """Remember which users had memories or apps written in this transaction."""
+    user_ids = session.info.setdefault("user_stats_invalidations", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Memory):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, App):
+            user_ids.add(obj.owner_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_user_stats(session):
+    user_ids = session.info.pop("user_stats_invalidations", None)
+    if user_ids:
+        user_stats_cache.invalidate(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stats_changes(session):
+    session.info.pop("user_stats_invalidations", None)
@@ -1,4 +1,5 @@
 import datetime
+from contextlib import asynccontextmanager
 from uuid import uuid4
 
 from app.config import DEFAULT_APP_ID, USER_ID
@@ -6,11 +7,24 @@ from app.database import Base, SessionLocal, engine
 from app.mcp_server import setup_mcp_server
 from app.models import App, User
 from app.routers import apps_router, backup_router, config_router, memories_router, stats_router
+from app.utils.categorization import categorization_worker
+from app.utils.concurrency import tool_executor
+from app.utils.search import ensure_memory_search_index
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 
-app = FastAPI(title="OpenMemory API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Categorization runs off the request path, draining the queue filled by memory writes
+    categorization_worker.start()
+    yield
+    categorization_worker.stop(timeout=10)
+    tool_executor.shutdown()
+
+
+app = FastAPI(title="OpenMemory API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,6 +36,8 @@ app.add_middleware(
 
 # Create all tables
 Base.metadata.create_all(bind=engine)
+# Text index used by memory search (FTS5 on SQLite, pg_trgm on PostgreSQL)
+ensure_memory_search_index(engine)
 
 # Check for USER_ID and create default user if needed
 def create_default_user():
@@ -0,0 +1,114 @@
+"""
+Concurrent write load test for the OpenMemory database layer.
+
+Runs the same workload twice against a scratch SQLite file: once with a bare `create_engine` (the
+old defaults: rollback journal, no busy timeout) and once with the engine settings from
+`app.database` (WAL, busy_timeout, synchronous=NORMAL, sized pool). Each writer thread inserts
+memories in their own transactions while reader threads count rows, mimicking concurrent MCP clients.
+
+Usage:
+    python scripts/db_write_load_test.py --writers 16 --readers 4 --duration 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Base, configure_sqlite_pragmas, engine_options  # noqa: E402
+from app.models import App, Memory, MemoryState, User  # noqa: E402
+from sqlalchemy import create_engine, func  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+
+def build_engine(url: str, tuned: bool):
+    if not tuned:
+        return create_engine(url, connect_args={"check_same_thread": False})
+    engine = create_engine(url, **engine_options(url))
+    configure_sqlite_pragmas(engine)
+    return engine
+
+
+def run(url: str, tuned: bool, writers: int, readers: int, duration: float) -> dict:
+    engine = build_engine(url, tuned)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        user = User(user_id=f"loadtest-{uuid.uuid4()}", name="loadtest")
+        db.add(user)
+        db.flush()
+        app = App(owner_id=user.id, name=f"loadtest-{uuid.uuid4()}")
+        db.add(app)
+        db.commit()
+        user_id, app_id = user.id, app.id
+
+    counters = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def writer():
+        while time.perf_counter() < deadline:
+            try:
+                with Session() as db:
+                    db.add(Memory(user_id=user_id, app_id=app_id, content="load test memory", state=MemoryState.active))
+                    db.commit()
+                with lock:
+                    counters["writes"] += 1
+            except OperationalError:
+                with lock:
+                    counters["locked"] += 1
+
+    def reader():
+        while time.perf_counter() < deadline:
+            try:
+                with Session() as db:
+                    db.query(func.count(Memory.id)).filter(Memory.user_id == user_id).scalar()
+                with lock:
+                    counters["reads"] += 1
+            except OperationalError:
+                with lock:
+                    counters["locked"] += 1
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    return {
+        "writes_per_second": counters["writes"] / elapsed,
+        "reads_per_second": counters["reads"] / elapsed,
+        "locked_errors": counters["locked"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    args = parser.parse_args()
+
+    print(f"{'engine':<10} {'writes/s':>10} {'reads/s':>10} {'locked errors':>14}")
+    for tuned in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(f"sqlite:///{tmp}/loadtest.db", tuned, args.writers, args.readers, args.duration)
+        print(
+            f"{'tuned' if tuned else 'default':<10} {result['writes_per_second']:>10.1f} "
+            f"{result['reads_per_second']:>10.1f} {result['locked_errors']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Concurrent SSE load test for the OpenMemory MCP server.
+
+Measures search_memory latency twice: once with only searches running, then again while other
+clients keep add_memories calls (and their LLM extraction) in flight. With tool work running off the
+event loop, the search p99 of both phases should stay close.
+
+Usage:
+    python scripts/mcp_load_test.py --url http://localhost:8765 --searchers 20 --adders 5 --duration 30
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+SEARCH_QUERIES = ["what do I like to eat", "where do I work", "upcoming travel plans", "my hobbies"]
+ADD_TEXTS = [
+    "I started learning to play the cello last month",
+    "My manager asked me to lead the Q3 migration project",
+    "I am flying to Lisbon for a conference in October",
+    "I switched to a vegetarian diet this year",
+]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+async def run_client(url, client_name, user_id, tool, arguments, deadline, latencies):
+    async with sse_client(f"{url}/mcp/{client_name}/sse/{user_id}") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            for args in itertools.cycle(arguments):
+                if time.perf_counter() >= deadline:
+                    return
+                started = time.perf_counter()
+                await session.call_tool(tool, args)
+                latencies.append(time.perf_counter() - started)
+
+
+async def run_phase(args, with_adds):
+    deadline = time.perf_counter() + args.duration
+    search_latencies, add_latencies = [], []
+    clients = [
+        run_client(args.url, args.client_name, f"{args.user_prefix}-{i}", "search_memory",
+                   [{"query": q} for q in SEARCH_QUERIES], deadline, search_latencies)
+        for i in range(args.searchers)
+    ]
+    if with_adds:
+        clients += [
+            run_client(args.url, args.client_name, f"{args.user_prefix}-{i % args.searchers}", "add_memories",
+                       [{"text": t} for t in ADD_TEXTS], deadline, add_latencies)
+            for i in range(args.adders)
+        ]
+    await asyncio.gather(*clients)
+    return search_latencies, add_latencies
+
+
+def report(label, latencies):
+    if not latencies:
+        print(f"{label:<28} no calls completed")
+        return
+    print(
+        f"{label:<28} calls={len(latencies):>6} "
+        f"p50={1000 * percentile(latencies, 0.50):>8.1f}ms "
+        f"p95={1000 * percentile(latencies, 0.95):>8.1f}ms "
+        f"p99={1000 * percentile(latencies, 0.99):>8.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8765")
+    parser.add_argument("--client-name", default="loadtest")
+    parser.add_argument("--user-prefix", default="loadtest-user")
+    parser.add_argument("--searchers", type=int, default=20)
+    parser.add_argument("--adders", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per phase")
+    args = parser.parse_args()
+
+    search_only, _ = await run_phase(args, with_adds=False)
+    report("search (searches only)", search_only)
+
+    search_mixed, adds = await run_phase(args, with_adds=True)
+    report("search (adds in flight)", search_mixed)
+    report("add_memories", adds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
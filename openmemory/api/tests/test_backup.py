@@ -0,0 +1,149 @@
+import datetime
+import gzip
+import io
+import json
+import uuid
+import zipfile
+from contextlib import nullcontext
+
+import pytest
+from app.database import Base
+from app.models import App, Category, Memory, MemoryState, MemoryStatusHistory, User
+from app.routers import backup
+from app.routers.backup import ExportRequest, _write_export, import_backup
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'openmemory.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(backup, "SessionLocal", session_factory)
+    monkeypatch.setattr(backup, "memory_client_lease", nullcontext)
+    session = session_factory()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def users(db):
+    alice = User(id=uuid.uuid4(), user_id="alice")
+    bob = User(id=uuid.uuid4(), user_id="bob")
+    app = App(id=uuid.uuid4(), owner_id=alice.id, name="cursor")
+    sports, food = Category(name="sports"), Category(name="food")
+    tennis = Memory(id=uuid.uuid4(), user_id=alice.id, app_id=app.id, content="likes tennis", categories=[sports])
+    pizza = Memory(id=uuid.uuid4(), user_id=alice.id, app_id=app.id, content="likes pizza", categories=[food])
+    history = MemoryStatusHistory(
+        memory_id=pizza.id,
+        changed_by=alice.id,
+        old_state=MemoryState.active,
+        new_state=MemoryState.paused,
+        changed_at=datetime.datetime(2024, 1, 1),
+    )
+    db.add_all([alice, bob, app, sports, food, tennis, pizza])
+    db.flush()
+    db.add(history)
+    db.commit()
+    return alice, bob
+
+
+def export_archive(user):
+    return b"".join(_write_export(ExportRequest(user_id=user.user_id, include_vectors=False), user.id, None))
+
+
+def to_version_1(archive):
+    """Rewrite a version 2 archive in the version 1 layout, with every row inside memories.json."""
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        payload = json.loads(zf.read("memories.json"))
+        memories = [json.loads(line) for line in gzip.decompress(zf.read("memories.jsonl.gz")).splitlines()]
+        history = [json.loads(line) for line in gzip.decompress(zf.read("status_history.jsonl.gz")).splitlines()]
+    payload["memory_categories"] = [
+        {"memory_id": record["id"], "category_id": category_id}
+        for record in memories
+        for category_id in record.pop("category_ids")
+    ]
+    payload["memories"] = memories
+    payload["status_history"] = history
+    payload["export_meta"]["version"] = "1"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("memories.json", json.dumps(payload))
+    return buffer.getvalue()
+
+
+class Upload:
+    def __init__(self, archive):
+        self.filename = "backup.zip"
+        self.file = io.BytesIO(archive)
+
+
+def import_archive(db, archive, user, mode):
+    import_backup(file=Upload(archive), user_id=user.user_id, mode=mode, use_backup_vectors=False, db=db)
+    db.expire_all()
+
+
+def snapshot(db, user):
+    return sorted(
+        (memory.content, memory.state.value, sorted(category.name for category in memory.categories))
+        for memory in db.query(Memory).filter(Memory.user_id == user.id)
+    )
+
+
+@pytest.fixture(params=["2", "1"])
+def archive(request, users):
+    archive = export_archive(users[0])
+    return archive if request.param == "2" else to_version_1(archive)
+
+
+def test_export_is_version_2(users):
+    with zipfile.ZipFile(io.BytesIO(export_archive(users[0]))) as zf:
+        assert json.loads(zf.read("memories.json"))["export_meta"]["version"] == "2"
+        assert {"memories.jsonl.gz", "status_history.jsonl.gz"} <= set(zf.namelist())
+
+
+def test_overwrite_restores_the_backed_up_memories(db, users, archive):
+    alice, _ = users
+    before = snapshot(db, alice)
+    tennis = db.query(Memory).filter(Memory.content == "likes tennis").one()
+    tennis.content = "likes squash"
+    tennis.categories = []
+    db.commit()
+
+    import_archive(db, archive, alice, "overwrite")
+
+    assert snapshot(db, alice) == before
+
+
+def test_skip_keeps_existing_memories_and_restores_their_categories(db, users, archive):
+    alice, _ = users
+    tennis = db.query(Memory).filter(Memory.content == "likes tennis").one()
+    tennis.content = "likes squash"
+    tennis.categories = []
+    db.commit()
+
+    import_archive(db, archive, alice, "skip")
+
+    assert snapshot(db, alice) == [
+        ("likes pizza", "active", ["food"]),
+        ("likes squash", "active", ["sports"]),
+    ]
+
+
+def test_import_into_another_user_gets_new_ids(db, users, archive):
+    alice, bob = users
+    alice_before = snapshot(db, alice)
+    alice_memory_ids = {memory.id for memory in db.query(Memory).filter(Memory.user_id == alice.id)}
+
+    import_archive(db, archive, bob, "overwrite")
+
+    assert snapshot(db, bob) == alice_before
+    assert snapshot(db, alice) == alice_before
+    bob_memories = db.query(Memory).filter(Memory.user_id == bob.id).all()
+    assert not {memory.id for memory in bob_memories} & alice_memory_ids
+    # The history follows the remapped memory and alice's history row is left alone
+    pizza = next(memory for memory in bob_memories if memory.content == "likes pizza")
+    assert db.query(MemoryStatusHistory).filter(MemoryStatusHistory.memory_id == pizza.id).count() == 1
+    assert db.query(MemoryStatusHistory).filter(MemoryStatusHistory.memory_id.in_(alice_memory_ids)).count() == 1
@@ -0,0 +1,75 @@
+import os
+import threading
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import pytest  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import App, CategorizationTask, Category, Memory, User  # noqa: E402
+from app.utils import categorization  # noqa: E402
+from app.utils.categorization import CategorizationWorker  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'openmemory.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    user = User(id=uuid.uuid4(), user_id="alice")
+    app = App(id=uuid.uuid4(), owner_id=user.id, name="cursor")
+    db.add_all([user, app])
+    db.add_all([Memory(id=uuid.uuid4(), user_id=user.id, app_id=app.id, content=f"memory {idx}") for idx in range(6)])
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+def test_claimed_tasks_are_not_taken_by_another_worker(session_factory):
+    first = CategorizationWorker(session_factory=session_factory, batch_size=4)
+    second = CategorizationWorker(session_factory=session_factory, batch_size=10)
+
+    db = session_factory()
+    claimed = first._claim(db)
+    db.close()
+    db = session_factory()
+    taken_over = second._claim(db)
+    db.close()
+
+    assert len(claimed) == 4
+    assert len(taken_over) == 2
+    assert not {task.id for task in claimed} & {task.id for task in taken_over}
+
+
+def test_concurrent_workers_categorize_each_memory_once(session_factory, mocker):
+    categorized = []
+    barrier = threading.Barrier(4)
+
+    def get_categories_for_memories(contents):
+        categorized.extend(contents)
+        return [[f"topic of {content}"] for content in contents]
+
+    mocker.patch.object(categorization, "get_categories_for_memories", side_effect=get_categories_for_memories)
+    workers = [CategorizationWorker(session_factory=session_factory, batch_size=10) for _ in range(4)]
+
+    def run(worker):
+        barrier.wait()
+        worker.run_once()
+
+    threads = [threading.Thread(target=run, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(categorized) == [f"memory {idx}" for idx in range(6)]
+    db = session_factory()
+    assert db.query(CategorizationTask).count() == 0
+    assert db.query(Category).count() == 6
+    assert all([category.name for category in memory.categories] == [f"topic of {memory.content}"]
+               for memory in db.query(Memory))
+    db.close()
@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.utils import memory as memory_utils
+from app.utils.memory import MemoryClientRegistry
+
+
+@pytest.fixture
+def registry():
+    configs = {None: {"llm": "a"}, "notes": {"llm": "b"}}
+    with (
+        patch.object(memory_utils, "_load_memory_config", side_effect=lambda instructions: dict(configs[instructions])),
+        patch.object(memory_utils.Memory, "from_config", side_effect=lambda config_dict: MagicMock(name=str(config_dict))),
+        patch.object(memory_utils, "_close_memory_client") as close,
+    ):
+        registry = MemoryClientRegistry(close_delay=60, poll_interval=0)
+        registry.configs = configs
+        registry.closed = close
+        yield registry
+
+
+def test_leased_client_is_closed_only_after_release(registry):
+    client = registry.acquire()
+    registry.configs[None] = {"llm": "changed"}
+    registry.notify_config_changed()
+
+    replacement = registry.get()
+    registry._end_grace(registry._retired[id(client)])
+
+    assert replacement is not client
+    registry.closed.assert_not_called()
+    registry.release(client)
+    registry.closed.assert_called_once_with(client)
+
+
+def test_config_change_keeps_clients_whose_config_did_not_change(registry):
+    default_client = registry.get()
+    notes_client = registry.get("notes")
+    registry.configs[None] = {"llm": "changed"}
+    registry.notify_config_changed()
+
+    assert registry.get() is not default_client
+    assert registry.get("notes") is notes_client
+    assert list(registry._retired) == [id(default_client)]
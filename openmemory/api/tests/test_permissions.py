@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+from app.database import Base
+from app.models import App, Memory, User
+from app.utils.permissions import accessible_memory_cache, get_accessible_memory_set
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'openmemory.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    accessible_memory_cache.clear()
+    yield url, sessionmaker(bind=engine)
+    accessible_memory_cache.clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def alice(database):
+    _, session_factory = database
+    db = session_factory()
+    user = User(id=uuid.uuid4(), user_id="alice")
+    app = App(id=uuid.uuid4(), owner_id=user.id, name="cursor")
+    memories = [Memory(id=uuid.uuid4(), user_id=user.id, app_id=app.id, content=f"memory {idx}") for idx in range(2)]
+    db.add_all([user, app, *memories])
+    db.commit()
+    yield db, user.id, app.id, [str(memory.id) for memory in memories]
+    db.close()
+
+
+def run_in_other_worker(url, code):
+    """Run `code` in a separate process, like another uvicorn worker sharing the database."""
+    script = "import app.utils.permissions\nfrom app.database import SessionLocal\nfrom app.models import *\n" + code
+    subprocess.run(
+        [sys.executable, "-c", script], cwd=API_DIR, env={**os.environ, "DATABASE_URL": url}, check=True
+    )
+
+
+def test_accessible_set_is_cached(alice, mocker):
+    db, user_id, app_id, memory_ids = alice
+    assert get_accessible_memory_set(db, user_id, app_id) == frozenset(memory_ids)
+
+    get_accessible_memory_ids = mocker.patch("app.routers.memories.get_accessible_memory_ids")
+    assert get_accessible_memory_set(db, user_id, app_id) == frozenset(memory_ids)
+    get_accessible_memory_ids.assert_not_called()
+
+
+def test_commit_in_another_worker_invalidates_the_cached_set(database, alice):
+    url, _ = database
+    db, user_id, app_id, memory_ids = alice
+    assert get_accessible_memory_set(db, user_id, app_id) == frozenset(memory_ids)
+    db.commit()
+
+    run_in_other_worker(
+        url,
+        "import uuid\n"
+        "db = SessionLocal()\n"
+        f"db.get(Memory, uuid.UUID('{memory_ids[0]}')).state = MemoryState.deleted\n"
+        "db.commit()\n",
+    )
+    assert get_accessible_memory_set(db, user_id, app_id) == frozenset(memory_ids[1:])
+    db.commit()
+
+    run_in_other_worker(
+        url,
+        "import uuid\n"
+        "db = SessionLocal()\n"
+        f"db.get(App, uuid.UUID('{app_id}')).is_active = False\n"
+        "db.commit()\n",
+    )
+    assert get_accessible_memory_set(db, user_id, app_id) == frozenset()
+
+
+def test_uncommitted_changes_are_not_cached(alice):
+    db, user_id, app_id, memory_ids = alice
+    memory = db.get(Memory, uuid.UUID(memory_ids[0]))
+    memory.content = "edited"
+    db.flush()
+    get_accessible_memory_set(db, user_id, app_id)
+    db.rollback()
+
+    # The flush bumped the version to 2, which a later commit of another change could reuse
+    assert accessible_memory_cache.get(user_id, app_id, 2) is None
@@ -0,0 +1,112 @@
+import datetime
+import uuid
+
+import pytest
+from app.database import Base
+from app.models import App, Memory, User
+from app.utils.search import ensure_memory_search_index, keyset_page, memory_search_filter
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def memories(db):
+    user = User(id=uuid.uuid4(), user_id="alice")
+    apps = [App(id=uuid.uuid4(), owner_id=user.id, name=name) for name in ("cursor", "claude")]
+    db.add_all([user, *apps])
+    start = datetime.datetime(2024, 1, 1)
+    rows = [
+        Memory(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            app_id=apps[idx % 2].id,
+            content=f"memory {idx}",
+            created_at=start + datetime.timedelta(days=idx % 3),
+        )
+        for idx in range(6)
+    ]
+    # An app that no longer exists and a row that never got a timestamp
+    rows.append(Memory(id=uuid.uuid4(), user_id=user.id, app_id=uuid.uuid4(), content="orphan", created_at=start))
+    rows.append(Memory(id=uuid.uuid4(), user_id=user.id, app_id=apps[0].id, content="undated", created_at=None))
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def collect(db, sort_column, descending, size=3):
+    seen, cursor = [], ""
+    while cursor is not None:
+        page, cursor = keyset_page(db.query(Memory), sort_column, descending, cursor, size)
+        seen.extend(memory.content for memory in page)
+    return seen
+
+
+@pytest.mark.parametrize("sort_column", ["app_name", "created_at", "memory"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_every_memory_once(db, memories, sort_column, descending):
+    seen = collect(db, sort_column, descending)
+
+    assert sorted(seen) == sorted(memory.content for memory in memories)
+
+
+def test_memories_without_app_or_timestamp_sort_last_ascending(db, memories):
+    assert collect(db, "app_name", False)[-1] == "orphan"
+    assert collect(db, "app_name", True)[0] == "orphan"
+    assert collect(db, "created_at", False)[-1] == "undated"
+    assert collect(db, "created_at", True)[0] == "undated"
+
+
+@pytest.fixture
+def indexed_db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    ensure_memory_search_index(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def search(db, query):
+    return sorted(memory.content for memory in db.query(Memory).filter(memory_search_filter(db, query)))
+
+
+def test_search_index_follows_inserts_updates_and_deletes(indexed_db):
+    user = User(id=uuid.uuid4(), user_id="alice")
+    rows = [
+        Memory(id=uuid.uuid4(), user_id=user.id, app_id=uuid.uuid4(), content=content)
+        for content in ("likes tennis", "plays chess")
+    ]
+    indexed_db.add_all([user, *rows])
+    indexed_db.commit()
+    assert search(indexed_db, "tennis") == ["likes tennis"]
+
+    rows[0].content = "likes squash"
+    indexed_db.delete(rows[1])
+    indexed_db.commit()
+
+    assert search(indexed_db, "tennis") == []
+    assert search(indexed_db, "squash") == ["likes squash"]
+    assert search(indexed_db, "chess") == []
+
+
+def test_search_index_survives_renumbered_rowids(indexed_db):
+    user = User(id=uuid.uuid4(), user_id="alice")
+    rows = [Memory(id=uuid.uuid4(), user_id=user.id, app_id=uuid.uuid4(), content=f"memory {idx}") for idx in range(3)]
+    indexed_db.add_all([user, *rows])
+    indexed_db.commit()
+
+    # What a VACUUM may do to a table whose primary key is not an INTEGER PRIMARY KEY
+    indexed_db.execute(text("UPDATE memories SET rowid = rowid + 100"))
+    indexed_db.commit()
+
+    assert search(indexed_db, "memory 1") == ["memory 1"]
@@ -0,0 +1,185 @@
+"""
+Load test for the Mem0 REST server.
+
+By default the app from main.py runs in-process. It gets a local FAISS index, a temporary history
+database, and local stand-ins for the LLM and the embedder. The stand-ins sleep for a configurable
+latency to imitate a remote provider, so the numbers show server and concurrency overhead instead of
+provider speed. Pass --url to load an already running server instead; it then uses its own
+configuration.
+
+Usage:
+    python load_test.py --concurrency 32 --duration 15
+    python load_test.py --url http://localhost:8000 --concurrency 16
+"""
+
+import argparse
+import ast
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+os.environ.setdefault("MEM0_TELEMETRY", "False")
+
+from mem0 import AsyncMemory  # noqa: E402
+from mem0.embeddings.base import EmbeddingBase  # noqa: E402
+
+EMBEDDING_DIMS = 64
+SAMPLE_MESSAGES = [
+    "I like to go hiking on weekends",
+    "My favourite food is spicy ramen",
+    "The meeting with the design team moved to Thursday",
+    "I am allergic to peanuts",
+    "I prefer aisle seats on long flights",
+]
+SAMPLE_QUERIES = ["what food do I like", "when is the design meeting", "travel preferences", "allergies"]
+
+
+class StandInEmbedder(EmbeddingBase):
+    """Deterministic hash-based embeddings with a fixed artificial latency."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, text, memory_action=None):
+        time.sleep(self.latency)
+        seed = int.from_bytes(hashlib.md5(text.encode()).digest()[:4], "little")
+        vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIMS)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+
+class StandInLLM:
+    """Answers the fact extraction and memory update prompts with well-formed JSON after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs):
+        time.sleep(self.latency)
+        prompt = messages[-1]["content"]
+        if "new retrieved facts" in prompt:
+            facts_block = prompt.split("The new retrieved facts are mentioned")[1].split("```")[1]
+            facts = ast.literal_eval(facts_block.strip())
+            return json.dumps({"memory": [{"id": str(idx), "text": fact, "event": "ADD"} for idx, fact in enumerate(facts)]})
+        text = prompt.split("Input:")[-1].replace("user:", "").strip()
+        return json.dumps({"facts": [text[:200]]})
+
+
+def stand_in_config(workdir: str) -> dict:
+    return {
+        "vector_store": {
+            "provider": "faiss",
+            "config": {
+                "collection_name": "loadtest",
+                "path": os.path.join(workdir, "faiss"),
+                "embedding_model_dims": EMBEDDING_DIMS,
+            },
+        },
+        "llm": {"provider": "openai", "config": {"api_key": "stand-in"}},
+        "embedder": {"provider": "openai", "config": {"api_key": "stand-in", "embedding_dims": EMBEDDING_DIMS}},
+        "history_db_path": os.path.join(workdir, "history.db"),
+    }
+
+
+def stand_in_factory(llm_latency: float, embed_latency: float):
+    async def factory(config):
+        memory = await AsyncMemory.from_config(config)
+        memory.llm = StandInLLM(llm_latency)
+        memory.embedding_model = StandInEmbedder(embed_latency)
+        return memory
+
+    return factory
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+async def run_phase(client, name, make_request, concurrency, duration):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    counter = itertools.count()
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await make_request(client, next(counter))
+            if response.status_code >= 400:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<16} requests={len(latencies):>6} rps={len(latencies) / elapsed:>8.1f} "
+        f"p50={1000 * percentile(latencies, 0.50):>8.1f}ms p99={1000 * percentile(latencies, 0.99):>8.1f}ms "
+        f"errors={errors}"
+    )
+
+
+async def run_load(client, args):
+    users = [f"loadtest-user-{idx}" for idx in range(args.users)]
+
+    async def add(client, idx):
+        message = SAMPLE_MESSAGES[idx % len(SAMPLE_MESSAGES)]
+        return await client.post(
+            "/memories",
+            json={"messages": [{"role": "user", "content": f"{message} ({idx})"}], "user_id": users[idx % len(users)]},
+        )
+
+    async def search(client, idx):
+        return await client.post(
+            "/search", json={"query": SAMPLE_QUERIES[idx % len(SAMPLE_QUERIES)], "user_id": users[idx % len(users)]}
+        )
+
+    async def list_memories(client, idx):
+        return await client.get("/memories", params={"user_id": users[idx % len(users)]})
+
+    await run_phase(client, "POST /memories", add, args.concurrency, args.duration)
+    await run_phase(client, "POST /search", search, args.concurrency, args.duration)
+    await run_phase(client, "GET /memories", list_memories, args.concurrency, args.duration)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Load a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=120) as client:
+            await run_load(client, args)
+        return
+
+    import main as server
+
+    # The server logs every add at INFO, which would dominate the run
+    logging.getLogger().setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as workdir:
+        server.DEFAULT_CONFIG = stand_in_config(workdir)
+        server.memory_pool.factory = stand_in_factory(args.llm_latency_ms / 1000, args.embed_latency_ms / 1000)
+        async with server.app.router.lifespan_context(server.app):
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120) as client:
+                await run_load(client, args)
+                print()
+                print((await client.get("/metrics")).text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
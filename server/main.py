@@ -1,13 +1,18 @@
+import asyncio
+import copy
+import itertools
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from pydantic import BaseModel, Field
 
-from mem0 import Memory
+from mem0 import AsyncMemory
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -33,6 +38,11 @@ MEMGRAPH_PASSWORD = os.environ.get("MEMGRAPH_PASSWORD", "mem0graph")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 HISTORY_DB_PATH = os.environ.get("HISTORY_DB_PATH", "/app/history/history.db")
 
+# Number of AsyncMemory instances requests are spread over, and how long a reconfiguration waits for
+# requests still using the old instances before closing them anyway
+MEMORY_POOL_SIZE = int(os.environ.get("MEMORY_POOL_SIZE", "1"))
+RECONFIGURE_DRAIN_TIMEOUT = float(os.environ.get("RECONFIGURE_DRAIN_TIMEOUT", "30"))
+
 DEFAULT_CONFIG = {
     "version": "v1.1",
     "vector_store": {
@@ -56,15 +66,160 @@ DEFAULT_CONFIG = {
 }
 
 
-MEMORY_INSTANCE = Memory.from_config(DEFAULT_CONFIG)
+class _PooledInstance:
+    def __init__(self, instance: AsyncMemory):
+        self.instance = instance
+        self.in_flight = 0
+        self.retired = False
+        self.drained = asyncio.Event()
+
+
+async def _close_instance(instance: AsyncMemory) -> None:
+    """Release the resources held by a retired instance."""
+    try:
+        await instance.close()
+    except Exception:
+        logging.exception("Error closing memory instance:")
+
+
+class MemoryInstancePool:
+    """
+    AsyncMemory instances shared by all requests of this worker process.
+
+    Requests borrow an instance with `acquire()`, which tracks how many requests are using it.
+    `reconfigure()` builds the new instances first and keeps the old ones serving if that fails. It
+    then routes new requests to the new instances, waits for the requests still holding an old
+    instance to finish, and only then closes it. A request therefore never sees its instance
+    replaced or torn down mid-call.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Dict[str, Any]], Awaitable[AsyncMemory]] = AsyncMemory.from_config,
+        size: int = MEMORY_POOL_SIZE,
+        drain_timeout: float = RECONFIGURE_DRAIN_TIMEOUT,
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.drain_timeout = drain_timeout
+        self._slots: List[_PooledInstance] = []
+        self._next = itertools.count()
+        self._reconfigure_lock = asyncio.Lock()
+
+    async def _build(self, config: Dict[str, Any]) -> List[_PooledInstance]:
+        # from_config may modify the dict it is given
+        return [_PooledInstance(await self.factory(copy.deepcopy(config))) for _ in range(self.size)]
+
+    async def start(self, config: Dict[str, Any]) -> None:
+        self._slots = await self._build(config)
+
+    @asynccontextmanager
+    async def acquire(self):
+        if not self._slots:
+            raise RuntimeError("Memory is not configured.")
+        slot = self._slots[next(self._next) % len(self._slots)]
+        slot.in_flight += 1
+        try:
+            yield slot.instance
+        finally:
+            slot.in_flight -= 1
+            if slot.retired and slot.in_flight == 0:
+                slot.drained.set()
+
+    async def reconfigure(self, config: Dict[str, Any]) -> None:
+        async with self._reconfigure_lock:
+            new_slots = await self._build(config)
+            old_slots, self._slots = self._slots, new_slots
+            await self._retire(old_slots)
+
+    async def close(self) -> None:
+        async with self._reconfigure_lock:
+            old_slots, self._slots = self._slots, []
+            await self._retire(old_slots)
+
+    async def _retire(self, slots: List[_PooledInstance]) -> None:
+        for slot in slots:
+            slot.retired = True
+            if slot.in_flight == 0:
+                slot.drained.set()
+        try:
+            await asyncio.wait_for(asyncio.gather(*(slot.drained.wait() for slot in slots)), self.drain_timeout)
+        except asyncio.TimeoutError:
+            logging.warning("Timed out waiting for in-flight requests before closing the old memory instances")
+        for slot in slots:
+            await _close_instance(slot.instance)
+
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Per-endpoint request latency histogram rendered in the Prometheus text exposition format."""
+
+    def __init__(self, name: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.buckets = buckets
+        # (method, path, status) -> [bucket counts..., sum, count]
+        self._series: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def observe(self, method: str, path: str, status: int, seconds: float) -> None:
+        series = self._series.setdefault((method, path, str(status)), [0] * len(self.buckets) + [0.0, 0])
+        for idx, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                series[idx] += 1
+        series[-2] += seconds
+        series[-1] += 1
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} Request latency in seconds by endpoint.",
+            f"# TYPE {self.name} histogram",
+        ]
+        for (method, path, status), series in sorted(self._series.items()):
+            labels = f'method="{method}",path="{path}",status="{status}"'
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-2]}")
+            lines.append(f"{self.name}_count{{{labels}}} {series[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+memory_pool = MemoryInstancePool()
+request_latency = LatencyHistogram("mem0_http_request_duration_seconds")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await memory_pool.start(DEFAULT_CONFIG)
+    yield
+    await memory_pool.close()
+
 
 app = FastAPI(
     title="Mem0 REST APIs",
     description="A REST API for managing and searching memories for your AI Agents and Apps.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template so /memories/{memory_id} is one series, not one per id
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        request_latency.observe(request.method, path, status, time.perf_counter() - started)
+
+
 class Message(BaseModel):
     role: str = Field(..., description="Role of the message (user or assistant).")
     content: str = Field(..., description="Message content.")
@@ -87,22 +242,26 @@ class SearchRequest(BaseModel):
 
 
 @app.post("/configure", summary="Configure Mem0")
-def set_config(config: Dict[str, Any]):
+async def set_config(config: Dict[str, Any]):
     """Set memory configuration."""
-    global MEMORY_INSTANCE
-    MEMORY_INSTANCE = Memory.from_config(config)
+    try:
+        await memory_pool.reconfigure(config)
+    except Exception as e:
+        logging.exception("Error in set_config:")
+        raise HTTPException(status_code=400, detail=str(e))
     return {"message": "Configuration set successfully"}
 
 
 @app.post("/memories", summary="Create memories")
-def add_memory(memory_create: MemoryCreate):
+async def add_memory(memory_create: MemoryCreate):
     """Store new memories."""
     if not any([memory_create.user_id, memory_create.agent_id, memory_create.run_id]):
         raise HTTPException(status_code=400, detail="At least one identifier (user_id, agent_id, run_id) is required.")
 
     params = {k: v for k, v in memory_create.model_dump().items() if v is not None and k != "messages"}
     try:
-        response = MEMORY_INSTANCE.add(messages=[m.model_dump() for m in memory_create.messages], **params)
+        async with memory_pool.acquire() as memory:
+            response = await memory.add(messages=[m.model_dump() for m in memory_create.messages], **params)
         return JSONResponse(content=response)
     except Exception as e:
         logging.exception("Error in add_memory:")  # This will log the full traceback
@@ -110,7 +269,7 @@ def add_memory(memory_create: MemoryCreate):
 
 
 @app.get("/memories", summary="Get memories")
-def get_all_memories(
+async def get_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
@@ -122,35 +281,38 @@ def get_all_memories(
         params = {
             k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None
         }
-        return MEMORY_INSTANCE.get_all(**params)
+        async with memory_pool.acquire() as memory:
+            return await memory.get_all(**params)
     except Exception as e:
         logging.exception("Error in get_all_memories:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/memories/{memory_id}", summary="Get a memory")
-def get_memory(memory_id: str):
+async def get_memory(memory_id: str):
     """Retrieve a specific memory by ID."""
     try:
-        return MEMORY_INSTANCE.get(memory_id)
+        async with memory_pool.acquire() as memory:
+            return await memory.get(memory_id)
     except Exception as e:
         logging.exception("Error in get_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/search", summary="Search memories")
-def search_memories(search_req: SearchRequest):
+async def search_memories(search_req: SearchRequest):
     """Search for memories based on a query."""
     try:
         params = {k: v for k, v in search_req.model_dump().items() if v is not None and k != "query"}
-        return MEMORY_INSTANCE.search(query=search_req.query, **params)
+        async with memory_pool.acquire() as memory:
+            return await memory.search(query=search_req.query, **params)
     except Exception as e:
         logging.exception("Error in search_memories:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.put("/memories/{memory_id}", summary="Update a memory")
-def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
+async def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
     """Update an existing memory with new content.
     
     Args:
@@ -161,27 +323,30 @@ def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
         dict: Success message indicating the memory was updated
     """
     try:
-        return MEMORY_INSTANCE.update(memory_id=memory_id, data=updated_memory)
+        async with memory_pool.acquire() as memory:
+            return await memory.update(memory_id=memory_id, data=updated_memory)
     except Exception as e:
         logging.exception("Error in update_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/memories/{memory_id}/history", summary="Get memory history")
-def memory_history(memory_id: str):
+async def memory_history(memory_id: str):
     """Retrieve memory history."""
     try:
-        return MEMORY_INSTANCE.history(memory_id=memory_id)
+        async with memory_pool.acquire() as memory:
+            return await memory.history(memory_id=memory_id)
     except Exception as e:
         logging.exception("Error in memory_history:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/memories/{memory_id}", summary="Delete a memory")
-def delete_memory(memory_id: str):
+async def delete_memory(memory_id: str):
     """Delete a specific memory by ID."""
     try:
-        MEMORY_INSTANCE.delete(memory_id=memory_id)
+        async with memory_pool.acquire() as memory:
+            await memory.delete(memory_id=memory_id)
         return {"message": "Memory deleted successfully"}
     except Exception as e:
         logging.exception("Error in delete_memory:")
@@ -189,7 +354,7 @@ def delete_memory(memory_id: str):
 
 
 @app.delete("/memories", summary="Delete all memories")
-def delete_all_memories(
+async def delete_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
@@ -201,7 +366,8 @@ def delete_all_memories(
         params = {
             k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None
         }
-        MEMORY_INSTANCE.delete_all(**params)
+        async with memory_pool.acquire() as memory:
+            await memory.delete_all(**params)
         return {"message": "All relevant memories deleted"}
     except Exception as e:
         logging.exception("Error in delete_all_memories:")
@@ -209,17 +375,24 @@ def delete_all_memories(
 
 
 @app.post("/reset", summary="Reset all memories")
-def reset_memory():
+async def reset_memory():
     """Completely reset stored memories."""
     try:
-        MEMORY_INSTANCE.reset()
+        async with memory_pool.acquire() as memory:
+            await memory.reset()
         return {"message": "All memories reset"}
     except Exception as e:
         logging.exception("Error in reset_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics():
+    """Request latency histograms in the Prometheus text format."""
+    return PlainTextResponse(request_latency.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/", summary="Redirect to the OpenAPI documentation", include_in_schema=False)
-def home():
+async def home():
     """Redirect to the OpenAPI documentation."""
     return RedirectResponse(url="/docs")
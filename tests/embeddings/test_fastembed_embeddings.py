@@ -43,4 +43,17 @@ def test_embed_removes_newlines(mock_fastembed_client):
     embedding = embedder.embed(text_with_newlines)
     
     mock_fastembed_client.embed.assert_called_once_with("Hello world")
-    assert list(embedding) == [0.7, 0.8, 0.9]
\ No newline at end of file
+    assert list(embedding) == [0.7, 0.8, 0.9]
+
+def test_embed_with_micro_batching(mock_fastembed_client):
+    config = BaseEmbedderConfig(model="jinaai/jina-embeddings-v2-base-en", micro_batch_size=4, micro_batch_wait_ms=1)
+    embedder = FastEmbedEmbedding(config)
+    mock_fastembed_client.embed.side_effect = lambda texts, batch_size: iter(
+        [np.array([float(len(text))]) for text in texts]
+    )
+
+    embedding = embedder.embed("Hello\nworld")
+
+    mock_fastembed_client.embed.assert_called_once_with(["Hello world"], batch_size=4)
+    assert list(embedding) == [11.0]
+    assert embedder.batching_stats()["batches"] == 1
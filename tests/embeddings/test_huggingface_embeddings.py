@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -101,3 +102,48 @@ def test_embed_with_huggingface_base_url():
             truncate=True,
         )
         assert result == [0.1, 0.2, 0.3]
+
+
+def test_embed_with_micro_batching(mock_sentence_transformer):
+    config = BaseEmbedderConfig(micro_batch_size=8, micro_batch_wait_ms=50)
+    embedder = HuggingFaceEmbedding(config)
+    mock_sentence_transformer.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(text))] for text in texts]
+    )
+
+    start = threading.Barrier(4)
+    results = {}
+
+    def worker(text):
+        start.wait()
+        results[text] = embedder.embed(text)
+
+    texts = ["a", "bb", "ccc", "dddd"]
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {text: [float(len(text))] for text in texts}
+    assert mock_sentence_transformer.encode.call_count < len(texts)
+    for call in mock_sentence_transformer.encode.call_args_list:
+        assert isinstance(call.args[0], list)
+        assert call.kwargs["batch_size"] == 8
+    assert embedder.batching_stats()["items"] == len(texts)
+
+
+def test_batching_stats_disabled_by_default(mock_sentence_transformer):
+    embedder = HuggingFaceEmbedding(BaseEmbedderConfig())
+    assert embedder.batching_stats() is None
+
+
+def test_embed_array_returns_float32(mock_sentence_transformer):
+    embedder = HuggingFaceEmbedding(BaseEmbedderConfig())
+    mock_sentence_transformer.encode.return_value = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+
+    result = embedder.embed_array("Hello world")
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float32
+    assert result is mock_sentence_transformer.encode.return_value
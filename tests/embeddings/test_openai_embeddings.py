@@ -1,5 +1,7 @@
-from unittest.mock import Mock, patch
+import base64
+from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
@@ -88,3 +90,50 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_array_decodes_base64(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+    vector = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=base64.b64encode(vector.tobytes()).decode())]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_array("Hello\nworld")
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world"], model="text-embedding-3-small", dimensions=1536, encoding_format="base64"
+    )
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, vector)
+
+
+@pytest.mark.asyncio
+async def test_aembed_uses_async_client(mock_openai_client):
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        mock_response = Mock()
+        mock_response.data = [Mock(embedding=[0.1, 0.2, 0.3])]
+        mock_async_openai.return_value.embeddings.create = AsyncMock(return_value=mock_response)
+        embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="api_key"))
+
+        result = await embedder.aembed("Hello\nworld")
+
+    mock_async_openai.return_value.embeddings.create.assert_awaited_once_with(
+        input=["Hello world"], model="text-embedding-3-small", dimensions=1536
+    )
+    mock_openai_client.embeddings.create.assert_not_called()
+    assert result == [0.1, 0.2, 0.3]
+
+
+def test_embed_batch_sends_one_request(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+    mock_response = Mock()
+    mock_response.data = [Mock(index=1, embedding=[0.4]), Mock(index=0, embedding=[0.1])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Bye"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Bye"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1], [0.4]]
@@ -0,0 +1,156 @@
+import json
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mem0.configs.llms.openai import OpenAIConfig
+from mem0.llms.cache import LLMResponseCache
+from mem0.llms.openai import OpenAILLM
+
+MESSAGES = [{"role": "user", "content": "Extract the facts."}]
+
+
+@pytest.fixture
+def mock_openai_client():
+    with patch("mem0.llms.openai.OpenAI") as mock_openai:
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        yield mock_client
+
+
+def completion(content):
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content, tool_calls=None))]
+    return response
+
+
+def make_llm(temperature=0.0, cache=None):
+    llm = OpenAILLM(OpenAIConfig(model="gpt-4.1-nano-2025-04-14", temperature=temperature, api_key="api_key"))
+    llm.response_cache = cache if cache is not None else LLMResponseCache()
+    return llm
+
+
+def test_key_depends_on_every_part_of_the_request():
+    base = dict(provider="openai", model="m", messages=MESSAGES, tools=None, response_format=None, params={})
+    key = LLMResponseCache.key(**base)
+
+    assert key == LLMResponseCache.key(**base)
+    assert key != LLMResponseCache.key(**{**base, "model": "other"})
+    assert key != LLMResponseCache.key(**{**base, "messages": [{"role": "user", "content": "Other."}]})
+    assert key != LLMResponseCache.key(**{**base, "response_format": {"type": "json_object"}})
+    assert key != LLMResponseCache.key(**{**base, "params": {"temperature": 0.5}})
+
+
+def test_temperature_zero_calls_are_served_from_cache(mock_openai_client):
+    mock_openai_client.chat.completions.create.return_value = completion('{"facts": ["Likes tea"]}')
+    llm = make_llm()
+
+    first = llm.generate_response(MESSAGES, response_format={"type": "json_object"})
+    second = llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    llm.generate_response(MESSAGES)
+
+    assert first == second == '{"facts": ["Likes tea"]}'
+    assert mock_openai_client.chat.completions.create.call_count == 2
+    stats = llm.cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["hit_ratio"] == pytest.approx(1 / 3)
+    assert stats["tokens_saved"] > 0
+
+
+def test_sampled_calls_bypass_cache_unless_marked_cacheable(mock_openai_client):
+    mock_openai_client.chat.completions.create.return_value = completion("answer")
+    llm = make_llm(temperature=0.7)
+
+    llm.generate_response(MESSAGES)
+    llm.generate_response(MESSAGES)
+    assert mock_openai_client.chat.completions.create.call_count == 2
+    assert llm.cache_stats()["misses"] == 0
+
+    llm.generate_response(MESSAGES, cacheable=True)
+    llm.generate_response(MESSAGES, cacheable=True)
+    assert mock_openai_client.chat.completions.create.call_count == 3
+    assert "cacheable" not in mock_openai_client.chat.completions.create.call_args.kwargs
+
+
+def test_replies_rejected_by_the_validator_are_not_cached(mock_openai_client):
+    mock_openai_client.chat.completions.create.side_effect = [completion("not json"), completion('{"facts": []}')]
+    llm = make_llm()
+
+    def validator(response):
+        return json.loads(response)["facts"]
+
+    assert llm.generate_response(MESSAGES, cache_validator=validator) == "not json"
+    assert llm.generate_response(MESSAGES, cache_validator=validator) == '{"facts": []}'
+    assert llm.generate_response(MESSAGES, cache_validator=validator) == '{"facts": []}'
+    assert mock_openai_client.chat.completions.create.call_count == 2
+    assert "cache_validator" not in mock_openai_client.chat.completions.create.call_args.kwargs
+
+
+def test_memory_tier_returns_copies():
+    cache = LLMResponseCache()
+    response = {"content": None, "tool_calls": [{"name": "add_memory", "arguments": {"data": "Likes tea"}}]}
+    cache.put("a", response, 1)
+    response["tool_calls"].clear()
+
+    cached = cache.get("a")
+    cached["tool_calls"][0]["arguments"]["data"] = "changed"
+    assert cache.get("a")["tool_calls"] == [{"name": "add_memory", "arguments": {"data": "Likes tea"}}]
+
+
+def test_cacheable_is_dropped_without_a_cache(mock_openai_client):
+    mock_openai_client.chat.completions.create.return_value = completion("answer")
+    llm = OpenAILLM(OpenAIConfig(model="gpt-4.1-nano-2025-04-14", temperature=0.0, api_key="api_key"))
+
+    assert llm.generate_response(MESSAGES, cacheable=True) == "answer"
+    assert llm.cache_stats() is None
+    assert "cacheable" not in mock_openai_client.chat.completions.create.call_args.kwargs
+
+
+def test_persistent_tier_survives_a_new_cache(mock_openai_client, tmp_path):
+    mock_openai_client.chat.completions.create.return_value = completion("answer")
+    path = str(tmp_path / "llm_cache.db")
+    make_llm(cache=LLMResponseCache(path=path)).generate_response(MESSAGES)
+
+    llm = make_llm(cache=LLMResponseCache(path=path))
+    assert llm.generate_response(MESSAGES) == "answer"
+    assert mock_openai_client.chat.completions.create.call_count == 1
+    assert llm.cache_stats()["persistent_hits"] == 1
+
+
+def test_ttl_and_lru_eviction():
+    cache = LLMResponseCache(max_size=2, ttl=0.01)
+    cache.put("a", "A", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+    cache = LLMResponseCache(max_size=2)
+    cache.put("a", "A", 1)
+    cache.put("b", "B", 1)
+    cache.get("a")
+    cache.put("c", "C", 1)
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.stats()["size"] == 2
+
+
+def test_persistent_ttl_expires_rows(tmp_path):
+    path = str(tmp_path / "llm_cache.db")
+    LLMResponseCache(path=path).put("a", "A", 1)
+
+    cache = LLMResponseCache(path=path, persistent_ttl=0.0)
+    time.sleep(0.01)
+    assert cache.get("a") is None
+    assert cache.connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_cache(mock_openai_client):
+    mock_openai_client.chat.completions.create.return_value = completion("answer")
+    llm = make_llm()
+    llm._async_client = Mock()
+    llm._async_client.chat.completions.create = AsyncMock(return_value=completion("answer"))
+
+    assert llm.generate_response(MESSAGES) == "answer"
+    assert await llm.agenerate_response(MESSAGES) == "answer"
+    llm._async_client.chat.completions.create.assert_not_called()
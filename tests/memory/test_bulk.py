@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.exceptions import RateLimitError
+from mem0.memory.bulk import Checkpoint, call_with_backoff, chunked, is_rate_limit_error, scope_waves
+
+
+def test_scope_waves_keep_one_item_per_scope_in_input_order():
+    items = [("alice", 1), ("bob", 1), ("alice", 2), ("alice", 3), ("carol", 1), ("bob", 2)]
+
+    waves = scope_waves(items, lambda item: item[0])
+
+    assert waves == [
+        [("alice", 1), ("bob", 1), ("carol", 1)],
+        [("alice", 2), ("bob", 2)],
+        [("alice", 3)],
+    ]
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class ProviderRateLimitError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (RateLimitError("slow down", "RATE_001"), True),
+        (ProviderRateLimitError(), True),
+        (Mock(spec=Exception, status_code=429), True),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_is_rate_limit_error(error, expected):
+    assert is_rate_limit_error(error) is expected
+
+
+def test_call_with_backoff_retries_rate_limits_only():
+    fn = Mock(side_effect=[ProviderRateLimitError(), ProviderRateLimitError(), "ok"])
+    assert call_with_backoff(fn, max_retries=2, base_delay=0) == "ok"
+    assert fn.call_count == 3
+
+    fn = Mock(side_effect=ProviderRateLimitError())
+    with pytest.raises(ProviderRateLimitError):
+        call_with_backoff(fn, max_retries=1, base_delay=0)
+    assert fn.call_count == 2
+
+    fn = Mock(side_effect=ValueError("bad input"))
+    with pytest.raises(ValueError):
+        call_with_backoff(fn, max_retries=3, base_delay=0)
+    assert fn.call_count == 1
+
+
+def test_checkpoint_resumes_from_file(tmp_path):
+    path = str(tmp_path / "checkpoint.txt")
+    checkpoint = Checkpoint(path)
+    checkpoint.mark_done(["conv-1", "conv-2"])
+    checkpoint.mark_done(["conv-2"])
+    checkpoint.close()
+
+    resumed = Checkpoint(path)
+    assert "conv-1" in resumed and "conv-2" in resumed and "conv-3" not in resumed
+    resumed.close()
+    with open(path) as f:
+        assert f.read().splitlines() == ["conv-1", "conv-2"]
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mem0.memory.lexical_index import LexicalIndex, payload_matches_filters, reciprocal_rank_fusion
+from mem0.memory.main import _fuse_lexical_results
+
+
+class TestLexicalIndex:
+    @pytest.fixture
+    def index(self):
+        index = LexicalIndex(":memory:", collection_name="test")
+        yield index
+        index.close()
+
+    def test_search_ranks_exact_terms(self, index):
+        index.upsert("m1", "Ordered SKU AB-1234 last week", {"user_id": "alice"})
+        index.upsert("m2", "Likes hiking and coffee", {"user_id": "alice"})
+
+        hits = index.search("AB-1234", filters={"user_id": "alice"})
+
+        assert [memory_id for memory_id, _ in hits] == ["m1"]
+        assert hits[0][1] > 0
+
+    def test_search_is_scoped_by_session_ids_and_collection(self, tmp_path):
+        db_path = str(tmp_path / "history.db")
+        index = LexicalIndex(db_path, collection_name="test")
+        other = LexicalIndex(db_path, collection_name="other")
+        index.upsert("m1", "Favourite colour is blue", {"user_id": "alice"})
+        index.upsert("m2", "Favourite colour is green", {"user_id": "bob"})
+        other.upsert("m3", "Favourite colour is red", {"user_id": "alice"})
+
+        hits = index.search("colour", filters={"user_id": "alice"})
+
+        assert [memory_id for memory_id, _ in hits] == ["m1"]
+        index.close()
+        other.close()
+
+    def test_upsert_replaces_and_delete_removes(self, index):
+        index.upsert("m1", "Lives in Paris", {"user_id": "alice"})
+        index.upsert("m1", "Lives in Berlin", {"user_id": "alice"})
+
+        assert index.search("Paris", filters={"user_id": "alice"}) == []
+        assert [memory_id for memory_id, _ in index.search("Berlin")] == ["m1"]
+
+        index.delete("m1")
+        assert index.search("Berlin") == []
+
+    def test_query_syntax_is_escaped(self, index):
+        index.upsert("m1", 'Said "hello" AND NOT goodbye', {"user_id": "alice"})
+
+        assert [memory_id for memory_id, _ in index.search('"hello" NOT (')] == ["m1"]
+        assert index.search("   ") == []
+
+    def test_reset_only_clears_own_collection(self, index):
+        index.upsert("m1", "Plays chess", {"user_id": "alice"})
+        index.reset()
+        assert index.search("chess") == []
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a"]], k=60)
+
+    assert [item_id for item_id, _ in fused] == ["a", "c", "b"]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def test_payload_matches_filters():
+    assert payload_matches_filters({"user_id": "alice", "topic": "food"}, {"user_id": "alice", "topic": "food"})
+    assert not payload_matches_filters({"user_id": "alice"}, {"user_id": "bob"})
+    assert not payload_matches_filters({"user_id": "alice", "score": 5}, {"score": {"gte": 3}})
+
+
+def test_fuse_lexical_results_loads_and_filters_lexical_only_hits():
+    vector_hits = [SimpleNamespace(id="v1", score=0.9, payload={"data": "vector hit", "user_id": "alice"})]
+    stored = {
+        "l1": SimpleNamespace(id="l1", score=None, payload={"data": "lexical hit", "user_id": "alice"}),
+        "l2": SimpleNamespace(id="l2", score=None, payload={"data": "other user", "user_id": "bob"}),
+    }
+    get_memories = MagicMock(side_effect=lambda vector_ids: [stored.get(vector_id) for vector_id in vector_ids])
+
+    results = _fuse_lexical_results(
+        vector_hits, [("l1", 3.2), ("v1", 1.1), ("l2", 0.5), ("gone", 0.1)], {"user_id": "alice"}, 10, get_memories
+    )
+
+    get_memories.assert_called_once_with(["l1", "l2", "gone"])
+
+    assert [result["id"] for result in results] == ["v1", "l1"]
+    assert results[0]["score"] == pytest.approx(1 / 61 + 1 / 62)
+    assert results[1]["memory"] == "lexical hit"
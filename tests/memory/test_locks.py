@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mem0.memory.locks import AsyncScopeLocks, ScopeLocks
+
+
+def _run_concurrently(locks, scopes):
+    running, overlaps = set(), []
+
+    def work(scope):
+        with locks.hold(scope):
+            overlaps.append(scope in running)
+            running.add(scope)
+            time.sleep(0.02)
+            running.discard(scope)
+
+    threads = [threading.Thread(target=work, args=(scope,)) for scope in scopes]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return overlaps, time.perf_counter() - began
+
+
+def test_same_scope_is_serialised():
+    locks = ScopeLocks()
+    overlaps, elapsed = _run_concurrently(locks, [("alice", None, None)] * 4)
+
+    assert not any(overlaps)
+    assert elapsed >= 0.08
+    assert len(locks) == 0
+
+
+def test_different_scopes_run_in_parallel():
+    locks = ScopeLocks()
+    _, elapsed = _run_concurrently(locks, [(f"user-{idx}", None, None) for idx in range(4)])
+
+    assert elapsed < 0.08
+    assert len(locks) == 0
+
+
+def test_overlapping_scope_sets_do_not_deadlock():
+    locks = ScopeLocks()
+
+    def work(scopes):
+        for _ in range(50):
+            with locks.hold(*scopes):
+                pass
+
+    threads = [threading.Thread(target=work, args=(scopes,)) for scopes in (["a", "b"], ["b", "a"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+
+
+@pytest.mark.asyncio
+async def test_async_scope_locks():
+    locks = AsyncScopeLocks()
+    order = []
+
+    async def work(scope, name):
+        async with locks.hold(scope):
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+
+    await asyncio.gather(work("alice", "a1"), work("bob", "b1"), work("alice", "a2"))
+
+    assert order.index("a1 end") < order.index("a2 start")
+    assert order.index("b1 start") < order.index("a1 end")
+    assert len(locks) == 0
@@ -1,9 +1,13 @@
+import asyncio
 import logging
 from unittest.mock import MagicMock
 
 import pytest
 
+from mem0.embeddings.base import AsyncEmbeddingBase
+from mem0.llms.base import AsyncLLMBase
 from mem0.memory.main import AsyncMemory, Memory
+from mem0.vector_stores.base import AsyncVectorStoreBase
 
 
 def _setup_mocks(mocker):
@@ -127,3 +131,211 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Empty response from LLM, no memories to extract" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class _NativeAsyncEmbedder(AsyncEmbeddingBase):
+    def __init__(self):
+        self.embed = MagicMock()
+
+    async def aembed(self, text, memory_action=None):
+        return [0.1, 0.2, 0.3]
+
+
+class _NativeAsyncVectorStore(AsyncVectorStoreBase):
+    def __init__(self):
+        self.search = MagicMock()
+        self.asearch_calls = []
+
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        self.asearch_calls.append((query, vectors, limit, filters))
+        return [MagicMock(id="mem-1", score=0.9, payload={"data": "likes tennis", "user_id": "alice"})]
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        pass
+
+    async def adelete(self, vector_id):
+        pass
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        pass
+
+    async def aget(self, vector_id):
+        pass
+
+    async def alist(self, filters=None, limit=None):
+        pass
+
+
+@pytest.mark.asyncio
+class TestAsyncNativeProviders:
+    @pytest.fixture
+    def mock_async_memory(self, mocker):
+        _setup_mocks(mocker)
+        return AsyncMemory()
+
+    async def test_search_awaits_native_async_providers(self, mock_async_memory, mocker):
+        to_thread = mocker.patch("mem0.memory.main.asyncio.to_thread")
+        mock_async_memory.embedding_model = _NativeAsyncEmbedder()
+        mock_async_memory.vector_store = _NativeAsyncVectorStore()
+
+        results = await mock_async_memory._search_vector_store("tennis", {"user_id": "alice"}, limit=3)
+
+        assert mock_async_memory.vector_store.asearch_calls == [("tennis", [0.1, 0.2, 0.3], 3, {"user_id": "alice"})]
+        assert results[0]["memory"] == "likes tennis"
+        mock_async_memory.embedding_model.embed.assert_not_called()
+        mock_async_memory.vector_store.search.assert_not_called()
+        to_thread.assert_not_called()
+
+    async def test_providers_without_async_client_run_in_threads(self, mock_async_memory):
+        mock_async_memory.embedding_model = _NativeAsyncEmbedder()
+        mock_async_memory.embedding_model.native_async = False
+        mock_async_memory.embedding_model.embed.return_value = [0.4, 0.5, 0.6]
+        mock_async_memory.vector_store.search.return_value = []
+
+        await mock_async_memory._search_vector_store("tennis", {"user_id": "alice"}, limit=3)
+
+        mock_async_memory.embedding_model.embed.assert_called_once_with("tennis", "search")
+        assert mock_async_memory.vector_store.search.call_args[1]["vectors"] == [0.4, 0.5, 0.6]
+
+    async def test_llm_calls_prefer_agenerate_response(self, mock_async_memory):
+        class NativeAsyncLLM(AsyncLLMBase):
+            async def agenerate_response(self, messages, tools=None, tool_choice="auto", **kwargs):
+                return "native"
+
+        mock_async_memory.llm = NativeAsyncLLM()
+
+        assert await mock_async_memory._agenerate_response(messages=[{"role": "user", "content": "hi"}]) == "native"
+
+    async def test_close_releases_the_vector_store_clients_and_the_history_db(self, mock_async_memory, mocker):
+        mock_async_memory.vector_store = _NativeAsyncVectorStore()
+        mock_async_memory.vector_store.aclose = mocker.AsyncMock()
+        mock_async_memory.vector_store.close = MagicMock()
+        mock_async_memory.db = MagicMock()
+
+        await mock_async_memory.close()
+
+        mock_async_memory.vector_store.aclose.assert_awaited_once()
+        mock_async_memory.vector_store.close.assert_called_once()
+        mock_async_memory._telemetry_vector_store.close.assert_called_once()
+        mock_async_memory.db.close.assert_called_once()
+
+
+class TestAsyncAddMany:
+    @pytest.fixture
+    def mock_async_memory(self, mocker):
+        _setup_mocks(mocker)
+        return AsyncMemory()
+
+    @pytest.fixture
+    def scripted_memory(self, mock_async_memory):
+        async def generate(messages, response_format=None):
+            # Fact extraction sends a system and a user message, the update decision a single user message
+            if len(messages) == 2:
+                return '{"facts": ["fact from ' + messages[1]["content"].rsplit(": ", 1)[-1].strip() + '"]}'
+            return '{"memory": [{"id": "0", "text": "new fact", "event": "ADD"}]}'
+
+        mock_async_memory._agenerate_response = MagicMock(side_effect=generate)
+        mock_async_memory.embedding_model = MagicMock()
+        mock_async_memory.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.1, 0.2]] * len(texts)
+        mock_async_memory.vector_store.batch_search.side_effect = (
+            lambda queries, vectors, limit, filters: [[]] * len(queries)
+        )
+        mock_async_memory.db = MagicMock()
+        return mock_async_memory
+
+    @pytest.mark.asyncio
+    async def test_batches_embeddings_and_searches_across_conversations(self, scripted_memory, tmp_path):
+        conversations = [
+            {"id": "a1", "messages": "user: one", "user_id": "alice"},
+            {"id": "b1", "messages": "user: two", "user_id": "bob"},
+            {"id": "a2", "messages": "user: three", "user_id": "alice"},
+            {"id": "bad", "messages": "user: four"},
+        ]
+        on_result = MagicMock()
+
+        report = await scripted_memory.add_many(
+            conversations, on_result=on_result, checkpoint_path=str(tmp_path / "ckpt")
+        )
+
+        assert report["conversations"] == 3
+        assert report["failed"] == 1 and report["errors"][0]["id"] == "bad"
+        assert report["events"]["ADD"] == 3
+        # Both alice conversations cannot share a wave, so the run takes two batched rounds
+        batches = [call.args[0] for call in scripted_memory.embedding_model.embed_batch.call_args_list]
+        assert batches == [["fact from one", "fact from two"], ["fact from three"]]
+        search_filters = [call.kwargs["filters"] for call in scripted_memory.vector_store.batch_search.call_args_list]
+        assert search_filters == [[{"user_id": "alice"}, {"user_id": "bob"}], [{"user_id": "alice"}]]
+        scripted_memory.vector_store.search.assert_not_called()
+        assert [call.args[0] for call in on_result.call_args_list] == ["a1", "b1", "a2"]
+
+        scripted_memory._agenerate_response.reset_mock()
+        report = await scripted_memory.add_many(conversations[:3], checkpoint_path=str(tmp_path / "ckpt"))
+
+        assert report["skipped"] == 3 and report["conversations"] == 0
+        scripted_memory._agenerate_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_embedding_does_not_repeat_llm_calls(self, scripted_memory, mocker):
+        class RateLimitError(Exception):
+            pass
+
+        mocker.patch("mem0.memory.bulk.asyncio.sleep")
+        calls = []
+
+        def embed_batch(texts, action):
+            calls.append(texts)
+            if len(calls) == 1:
+                raise RateLimitError("slow down")
+            return [[0.1, 0.2]] * len(texts)
+
+        scripted_memory.embedding_model.embed_batch.side_effect = embed_batch
+
+        report = await scripted_memory.add_many([{"messages": "user: one", "user_id": "alice"}])
+
+        assert report["conversations"] == 1 and report["events"]["ADD"] == 1
+        assert calls == [["fact from one"], ["fact from one"]]
+        # One fact extraction and one update decision
+        assert scripted_memory._agenerate_response.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_inference_stores_raw_messages(self, scripted_memory):
+        scripted_memory.embedding_model.embed.return_value = [0.1, 0.2]
+
+        report = await scripted_memory.add_many(
+            [{"messages": [{"role": "user", "content": "hi"}], "user_id": "alice"}] * 2, infer=False
+        )
+
+        assert report["conversations"] == 2 and report["events"]["ADD"] == 2
+        scripted_memory._agenerate_response.assert_not_called()
+
+
+class TestAsyncScopeSerialisation:
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_for_the_same_user_do_not_duplicate(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        stored = {}
+
+        def search(query, vectors, limit=5, filters=None):
+            return [point for point in stored.values() if point.payload.get("user_id") == filters["user_id"]]
+
+        def insert(vectors, ids=None, payloads=None):
+            for vector_id, payload in zip(ids, payloads):
+                stored[vector_id] = MagicMock(id=vector_id, payload=payload)
+
+        async def generate(messages, response_format=None):
+            await asyncio.sleep(0.01)
+            if len(messages) == 2:
+                return '{"facts": ["Plays chess"]}'
+            event = "NONE" if "Plays chess" in messages[0]["content"] else "ADD"
+            return '{"memory": [{"id": "0", "text": "Plays chess", "event": "' + event + '"}]}'
+
+        memory.vector_store.search.side_effect = search
+        memory.vector_store.insert.side_effect = insert
+        memory._agenerate_response = generate
+        # The update prompt only shows the existing memories
+        mocker.patch("mem0.memory.main.get_update_memory_messages", side_effect=lambda old, facts, prompt: str(old))
+
+        await asyncio.gather(*(memory.add("I play chess", user_id=user_id) for user_id in ("alice", "alice", "bob")))
+
+        assert sorted(point.payload["user_id"] for point in stored.values()) == ["alice", "bob"]
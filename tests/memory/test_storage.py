@@ -248,6 +248,21 @@ class TestSQLiteManager:
             result = sqlite_manager.get_history(memory_id)
             assert len(result) == 1
 
+    def test_batch_add_history(self, sqlite_manager, sample_data):
+        """Test inserting several history records in one call."""
+        records = [
+            sample_data,
+            {"memory_id": sample_data["memory_id"], "old_memory": "New memory content", "event": "DELETE", "is_deleted": 1},
+        ]
+        sqlite_manager.batch_add_history(records)
+        sqlite_manager.batch_add_history([])
+
+        result = {row["event"]: row for row in sqlite_manager.get_history(sample_data["memory_id"])}
+        assert sorted(result) == ["ADD", "DELETE"]
+        assert result["ADD"]["actor_id"] == "test_actor"
+        assert result["DELETE"]["is_deleted"] is True
+        assert result["DELETE"]["new_memory"] is None
+
     # ========== Tests for Migration, Reset, and Close ==========
 
     def test_explicit_old_schema_migration(self, temp_db_path):
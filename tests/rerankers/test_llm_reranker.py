@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.reranker.llm_reranker import LLMReranker
+
+
+@pytest.fixture
+def mock_llm():
+    with patch("mem0.reranker.llm_reranker.LlmFactory") as mock_factory:
+        llm = MagicMock()
+        mock_factory.create.return_value = llm
+        yield llm
+
+
+def test_rerank_orders_by_llm_score(mock_llm):
+    mock_llm.generate_response.side_effect = ["0.2", "0.9"]
+    reranker = LLMReranker({"provider": "openai", "model": "gpt-4o-mini"})
+
+    results = reranker.rerank("query", [{"id": "1", "memory": "a"}, {"id": "2", "memory": "b"}])
+
+    assert [doc["id"] for doc in results] == ["2", "1"]
+    assert results[0]["rerank_score"] == 0.9
+
+
+def test_rerank_reuses_cached_scores_by_memory_hash(mock_llm):
+    mock_llm.generate_response.side_effect = ["0.4", "0.7", "0.8"]
+    reranker = LLMReranker({"provider": "openai", "model": "gpt-4o-mini"})
+    documents = [{"id": "1", "memory": "a", "hash": "h1"}, {"id": "2", "memory": "b", "hash": "h2"}]
+
+    reranker.rerank("query", documents)
+    results = reranker.rerank("query", documents + [{"id": "3", "memory": "c", "hash": "h3"}])
+
+    assert mock_llm.generate_response.call_count == 3
+    assert {doc["id"]: doc["rerank_score"] for doc in results} == {"1": 0.4, "2": 0.7, "3": 0.8}
+    assert reranker.score_cache.hits == 2
+
+
+def test_failed_scores_are_not_cached(mock_llm):
+    mock_llm.generate_response.side_effect = [Exception("rate limited"), "0.6"]
+    reranker = LLMReranker({"provider": "openai", "model": "gpt-4o-mini"})
+    documents = [{"id": "1", "memory": "a", "hash": "h1"}]
+
+    assert reranker.rerank("query", documents)[0]["rerank_score"] == 0.5
+    assert reranker.rerank("query", documents)[0]["rerank_score"] == 0.6
+
+
+def test_unparseable_scores_are_not_cached(mock_llm):
+    mock_llm.generate_response.side_effect = ["I cannot tell", "0.6"]
+    reranker = LLMReranker({"provider": "openai", "model": "gpt-4o-mini"})
+    documents = [{"id": "1", "memory": "a", "hash": "h1"}]
+
+    assert reranker.rerank("query", documents)[0]["rerank_score"] == 0.5
+    assert reranker.rerank("query", documents)[0]["rerank_score"] == 0.6
+    assert mock_llm.generate_response.call_count == 2
+
+
+def test_cache_can_be_disabled(mock_llm):
+    mock_llm.generate_response.return_value = "0.3"
+    reranker = LLMReranker({"provider": "openai", "model": "gpt-4o-mini", "score_cache_size": 0})
+    documents = [{"id": "1", "memory": "a", "hash": "h1"}]
+
+    reranker.rerank("query", documents)
+    reranker.rerank("query", documents)
+
+    assert reranker.score_cache is None
+    assert mock_llm.generate_response.call_count == 2
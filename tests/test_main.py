@@ -1,6 +1,12 @@
+import json
 import os
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from mem0.configs.base import MemoryConfig
@@ -166,6 +172,25 @@ def test_search(memory_instance, version, enable_graph):
         memory_instance.graph.search.assert_not_called()
 
 
+def test_search_reranks_only_top_n_candidates(memory_instance):
+    memory_instance.enable_graph = False
+    mock_memories = [
+        Mock(id=str(idx), payload={"data": f"Memory {idx}", "user_id": "test_user"}, score=1 - idx / 10)
+        for idx in range(5)
+    ]
+    memory_instance.vector_store.search = Mock(return_value=mock_memories)
+    memory_instance.embedding_model.embed = Mock(return_value=[0.1, 0.2, 0.3])
+    memory_instance.reranker = Mock()
+    memory_instance.reranker.config.rerank_top_n = 2
+    memory_instance.reranker.rerank.side_effect = lambda query, documents, top_k: list(reversed(documents))
+
+    result = memory_instance.search("test query", user_id="test_user", limit=5)
+
+    candidates = memory_instance.reranker.rerank.call_args[0][1]
+    assert [doc["id"] for doc in candidates] == ["0", "1"]
+    assert [doc["id"] for doc in result["results"]] == ["1", "0"]
+
+
 def test_update(memory_instance):
     memory_instance.embedding_model = Mock()
     memory_instance.embedding_model.embed = Mock(return_value=[0.1, 0.2, 0.3])
@@ -181,6 +206,20 @@ def test_update(memory_instance):
     assert result["message"] == "Memory updated successfully!"
 
 
+def test_update_passes_arrays_to_numpy_vector_stores(memory_instance):
+    embedding = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+    memory_instance.vector_store.accepts_numpy_vectors = True
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed_array = Mock(return_value=embedding)
+    memory_instance._update_memory = Mock()
+
+    memory_instance.update("test_id", "Updated memory")
+
+    memory_instance.embedding_model.embed_array.assert_called_once_with("Updated memory", "update")
+    memory_instance.embedding_model.embed.assert_not_called()
+    assert memory_instance._update_memory.call_args[0][2]["Updated memory"] is embedding
+
+
 def test_delete(memory_instance):
     memory_instance._delete_memory = Mock()
 
@@ -296,3 +335,382 @@ def test_custom_prompts(memory_custom_instance):
                 messages=[{"role": "user", "content": mock_get_update_memory_messages.return_value}],
                 response_format={"type": "json_object"},
             )
+
+
+def test_add_applies_memory_actions_in_batches(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+
+    existing = {
+        "m-1": Mock(id="m-1", payload={"data": "Likes tea", "user_id": "test_user", "created_at": "2024-01-01"}),
+        "m-2": Mock(id="m-2", payload={"data": "Lives in Paris", "user_id": "test_user"}),
+    }
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.vector_store.search.return_value = list(existing.values())
+    memory_instance.vector_store.batch_get.side_effect = lambda ids: [existing.get(memory_id) for memory_id in ids]
+    memory_instance.db = Mock()
+    memory_instance.llm.generate_response = Mock(
+        side_effect=[
+            '{"facts": ["Likes coffee", "Lives in Berlin", "Plays chess"]}',
+            '{"memory": ['
+            '{"id": "0", "text": "Likes coffee", "event": "UPDATE", "old_memory": "Likes tea"},'
+            '{"id": "1", "text": "Lives in Paris", "event": "DELETE"},'
+            '{"id": "2", "text": "Plays chess", "event": "ADD"},'
+            '{"id": "3", "text": "Speaks French", "event": "ADD"},'
+            '{"id": "9", "text": "Unknown", "event": "UPDATE"}]}',
+        ]
+    )
+
+    result = memory_instance.add(messages=[{"role": "user", "content": "Test message"}], user_id="test_user")
+
+    assert [(item["memory"], item["event"]) for item in result["results"]] == [
+        ("Likes coffee", "UPDATE"),
+        ("Lives in Paris", "DELETE"),
+        ("Plays chess", "ADD"),
+        ("Speaks French", "ADD"),
+    ]
+    assert result["results"][0] == {
+        "id": "m-1",
+        "memory": "Likes coffee",
+        "event": "UPDATE",
+        "previous_memory": "Likes tea",
+    }
+    memory_instance.vector_store.batch_get.assert_called_once_with(["m-1", "m-2"])
+
+    memory_instance.vector_store.insert.assert_called_once()
+    payloads = memory_instance.vector_store.insert.call_args.kwargs["payloads"]
+    assert [payload["data"] for payload in payloads] == ["Plays chess", "Speaks French"]
+    assert all(payload["user_id"] == "test_user" for payload in payloads)
+
+    memory_instance.vector_store.batch_update.assert_called_once()
+    update_args = memory_instance.vector_store.batch_update.call_args
+    assert update_args.args[0] == ["m-1"]
+    assert update_args.kwargs["payloads"][0]["created_at"] == "2024-01-01"
+    memory_instance.vector_store.batch_delete.assert_called_once_with(["m-2"])
+    memory_instance.vector_store.update.assert_not_called()
+    memory_instance.vector_store.delete.assert_not_called()
+
+    memory_instance.db.batch_add_history.assert_called_once()
+    history = memory_instance.db.batch_add_history.call_args.args[0]
+    assert sorted(record["event"] for record in history) == ["ADD", "ADD", "DELETE", "UPDATE"]
+
+
+def test_failed_batch_write_drops_only_its_events(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.vector_store.search.return_value = [Mock(id="m-1", payload={"data": "Likes tea"})]
+    memory_instance.vector_store.batch_get.return_value = [Mock(id="m-1", payload={"data": "Likes tea"})]
+    memory_instance.vector_store.insert.side_effect = ConnectionError("connection reset")
+    memory_instance.db = Mock()
+    memory_instance.llm.generate_response = Mock(
+        side_effect=[
+            '{"facts": ["Plays chess"]}',
+            '{"memory": [{"id": "0", "text": "Likes tea", "event": "DELETE"},'
+            '{"id": "1", "text": "Plays chess", "event": "ADD"}]}',
+        ]
+    )
+
+    result = memory_instance.add(messages=[{"role": "user", "content": "Test message"}], user_id="test_user")
+
+    assert result["results"] == [{"id": "m-1", "memory": "Likes tea", "event": "DELETE"}]
+    history = memory_instance.db.batch_add_history.call_args.args[0]
+    assert [record["event"] for record in history] == ["DELETE"]
+
+
+def test_history_failure_keeps_applied_results(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.vector_store.search.return_value = []
+    memory_instance.db = Mock()
+    memory_instance.db.batch_add_history.side_effect = sqlite3.OperationalError("database is locked")
+    memory_instance.llm.generate_response = Mock(
+        side_effect=[
+            '{"facts": ["Plays chess"]}',
+            '{"memory": [{"id": "0", "text": "Plays chess", "event": "ADD"}]}',
+        ]
+    )
+
+    result = memory_instance.add(messages=[{"role": "user", "content": "Test message"}], user_id="test_user")
+
+    assert [(item["memory"], item["event"]) for item in result["results"]] == [("Plays chess", "ADD")]
+    memory_instance.vector_store.insert.assert_called_once()
+
+
+def test_close_stops_the_worker_pool(memory_instance):
+    memory_instance.db = Mock()
+    memory_instance.close()
+
+    memory_instance.db.close.assert_called_once()
+    with pytest.raises(RuntimeError):
+        memory_instance._executor.submit(print)
+
+
+def _scripted_llm(messages, response_format=None):
+    # Fact extraction sends a system and a user message, the update decision a single user message
+    if len(messages) == 2:
+        return '{"facts": ["fact from ' + messages[1]["content"].rsplit(": ", 1)[-1].strip() + '"]}'
+    return '{"memory": [{"id": "0", "text": "new fact", "event": "ADD"}]}'
+
+
+def test_add_many_batches_embeddings_and_searches_across_conversations(memory_instance, tmp_path):
+    memory_instance.llm.generate_response = Mock(side_effect=_scripted_llm)
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.1, 0.2]] * len(texts)
+    memory_instance.vector_store.batch_search.side_effect = lambda queries, vectors, limit, filters: [[]] * len(queries)
+    memory_instance.db = Mock()
+    conversations = [
+        {"id": "a1", "messages": "user: one", "user_id": "alice"},
+        {"id": "b1", "messages": "user: two", "user_id": "bob"},
+        {"id": "a2", "messages": "user: three", "user_id": "alice"},
+        {"id": "bad", "messages": "user: four"},
+    ]
+    on_result = Mock()
+
+    report = memory_instance.add_many(conversations, on_result=on_result, checkpoint_path=str(tmp_path / "ckpt"))
+
+    assert report["conversations"] == 3
+    assert report["failed"] == 1 and report["errors"][0]["id"] == "bad"
+    assert report["events"]["ADD"] == 3
+    # Both alice conversations cannot share a wave, so the run takes two batched rounds
+    batches = [call.args[0] for call in memory_instance.embedding_model.embed_batch.call_args_list]
+    assert batches == [["fact from one", "fact from two"], ["fact from three"]]
+    search_filters = [call.kwargs["filters"] for call in memory_instance.vector_store.batch_search.call_args_list]
+    assert search_filters == [[{"user_id": "alice"}, {"user_id": "bob"}], [{"user_id": "alice"}]]
+    memory_instance.vector_store.search.assert_not_called()
+    assert [call.args[0] for call in on_result.call_args_list] == ["a1", "b1", "a2"]
+    assert on_result.call_args_list[0].args[1]["results"][0]["event"] == "ADD"
+
+    memory_instance.llm.generate_response.reset_mock()
+    report = memory_instance.add_many(conversations[:3], checkpoint_path=str(tmp_path / "ckpt"))
+
+    assert report["skipped"] == 3 and report["conversations"] == 0
+    memory_instance.llm.generate_response.assert_not_called()
+
+
+def test_add_many_checkpoints_conversations_whose_graph_update_failed(memory_instance, tmp_path):
+    memory_instance.llm.generate_response = Mock(side_effect=_scripted_llm)
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.1, 0.2]] * len(texts)
+    memory_instance.vector_store.batch_search.side_effect = lambda queries, vectors, limit, filters: [[]] * len(queries)
+    memory_instance.db = Mock()
+    memory_instance.enable_graph = True
+    memory_instance.graph.add.side_effect = ConnectionError("graph store unavailable")
+    conversations = [{"id": "a1", "messages": "user: one", "user_id": "alice"}]
+    on_result = Mock()
+
+    report = memory_instance.add_many(conversations, on_result=on_result, checkpoint_path=str(tmp_path / "ckpt"))
+
+    assert report["conversations"] == 1 and report["failed"] == 0 and report["graph_failed"] == 1
+    assert report["errors"] == [{"id": "a1", "error": "graph store unavailable", "stage": "graph"}]
+    assert on_result.call_args.args[1]["relations"] == []
+    memory_instance.vector_store.insert.assert_called_once()
+
+    # A rerun does not add the stored memories again
+    report = memory_instance.add_many(conversations, checkpoint_path=str(tmp_path / "ckpt"))
+    assert report["skipped"] == 1
+    memory_instance.vector_store.insert.assert_called_once()
+
+
+def test_add_many_without_inference_stores_raw_messages(memory_instance):
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed.return_value = [0.1, 0.2]
+    memory_instance.db = Mock()
+    memory_instance.llm.generate_response = Mock()
+
+    report = memory_instance.add_many(
+        [{"messages": [{"role": "user", "content": "hi"}], "user_id": "alice"}] * 2, infer=False
+    )
+
+    assert report["conversations"] == 2 and report["events"]["ADD"] == 2
+    memory_instance.llm.generate_response.assert_not_called()
+
+
+class _InMemoryVectorStore:
+    """Just enough of a vector store to let concurrent `add` calls observe each other's writes."""
+
+    def __init__(self):
+        self.points = {}
+        self.inserts = 0
+
+    def search(self, query, vectors, limit=5, filters=None):
+        time.sleep(0.01)
+        return [
+            point
+            for point in self.points.values()
+            if all(point.payload.get(key) == value for key, value in (filters or {}).items())
+        ][:limit]
+
+    def insert(self, vectors, payloads=None, ids=None):
+        for vector_id, payload in zip(ids, payloads):
+            self.points[vector_id] = Mock(id=vector_id, payload=payload)
+            self.inserts += 1
+
+    def batch_get(self, vector_ids):
+        return [self.points.get(vector_id) for vector_id in vector_ids]
+
+    def batch_update(self, vector_ids, vectors=None, payloads=None):
+        pass
+
+    def batch_delete(self, vector_ids):
+        pass
+
+
+def _add_unless_known_llm(messages, response_format=None):
+    if len(messages) == 2:
+        return '{"facts": ["Plays chess"]}'
+    # The update prompt is patched to be the JSON list of the existing memories
+    known = any(memory["text"] == "Plays chess" for memory in json.loads(messages[0]["content"]))
+    event = "NONE" if known else "ADD"
+    return '{"memory": [{"id": "0", "text": "Plays chess", "event": "' + event + '"}]}'
+
+
+def test_concurrent_adds_for_the_same_user_do_not_duplicate(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.vector_store = _InMemoryVectorStore()
+    memory_instance.db = Mock()
+    memory_instance.llm.generate_response = Mock(side_effect=_add_unless_known_llm)
+
+    threads = [
+        threading.Thread(target=memory_instance.add, args=("I play chess",), kwargs={"user_id": user_id})
+        for user_id in ("alice", "alice", "alice", "bob")
+    ]
+    with patch("mem0.memory.main.get_update_memory_messages", side_effect=lambda old, facts, prompt: json.dumps(old)):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stored = [point.payload["user_id"] for point in memory_instance.vector_store.points.values()]
+    assert sorted(stored) == ["alice", "bob"]
+
+
+def test_skip_duplicate_memories_checks_the_stored_hash(memory_instance):
+    import hashlib
+
+    from mem0.embeddings.mock import MockEmbeddings
+
+    chess_hash = hashlib.md5("Plays chess".encode()).hexdigest()
+    memory_instance.config.skip_duplicate_memories = True
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.vector_store.search.return_value = [
+        Mock(id="m-1", payload={"data": "Plays chess!", "hash": chess_hash, "user_id": "alice"})
+    ]
+    memory_instance.db = Mock()
+    memory_instance.llm.generate_response = Mock(
+        side_effect=[
+            '{"facts": ["Plays chess", "Likes tea"]}',
+            '{"memory": [{"id": "1", "text": "Plays chess", "event": "ADD"},'
+            '{"id": "2", "text": "Likes tea", "event": "ADD"}, {"id": "3", "text": "Likes tea", "event": "ADD"}]}',
+        ]
+    )
+
+    result = memory_instance.add("I play chess and like tea", user_id="alice")
+
+    assert [item["memory"] for item in result["results"]] == ["Likes tea"]
+
+    memory_instance.vector_store.insert.reset_mock()
+    result = memory_instance.add(
+        [{"role": "user", "content": "Plays chess"}, {"role": "user", "content": "Reads books"}],
+        user_id="alice",
+        infer=False,
+    )
+
+    assert [item["memory"] for item in result["results"]] == ["Reads books"]
+    memory_instance.vector_store.insert.assert_called_once()
+
+
+def test_llm_cache_skips_repeated_extraction_and_update_calls(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+    from mem0.llms.cache import LLMResponseCache
+    from mem0.llms.openai import OpenAILLM
+
+    replies = {
+        2: '{"facts": ["Plays chess"]}',
+        1: '{"memory": [{"id": "0", "text": "Plays chess", "event": "ADD"}]}',
+    }
+    with patch("mem0.llms.openai.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = lambda **params: Mock(
+            choices=[Mock(message=Mock(content=replies[len(params["messages"])], tool_calls=None))]
+        )
+        memory_instance.llm = OpenAILLM({"model": "gpt-4.1-nano-2025-04-14", "api_key": "api_key"})
+    memory_instance.llm.response_cache = LLMResponseCache()
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.db = Mock()
+
+    memory_instance.add("I play chess", user_id="alice")
+    memory_instance.add("I play chess", user_id="alice")
+
+    assert create.call_count == 2
+    assert "cacheable" not in create.call_args.kwargs
+    assert memory_instance.llm.cache_stats()["hits"] == 2
+
+
+def test_llm_cache_asks_again_after_an_invalid_reply(memory_instance):
+    from mem0.embeddings.mock import MockEmbeddings
+    from mem0.llms.cache import LLMResponseCache
+    from mem0.llms.openai import OpenAILLM
+
+    update_replies = ["Sorry, I cannot do that.", '{"memory": [{"id": "0", "text": "Plays chess", "event": "ADD"}]}']
+
+    def reply(**params):
+        content = '{"facts": ["Plays chess"]}' if len(params["messages"]) == 2 else update_replies.pop(0)
+        return Mock(choices=[Mock(message=Mock(content=content, tool_calls=None))])
+
+    with patch("mem0.llms.openai.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = reply
+        memory_instance.llm = OpenAILLM({"model": "gpt-4.1-nano-2025-04-14", "api_key": "api_key"})
+    memory_instance.llm.response_cache = LLMResponseCache()
+    memory_instance.embedding_model = MockEmbeddings()
+    memory_instance.db = Mock()
+
+    assert memory_instance.add("I play chess", user_id="alice")["results"] == []
+    result = memory_instance.add("I play chess", user_id="alice")
+
+    assert [item["memory"] for item in result["results"]] == ["Plays chess"]
+    assert create.call_count == 3
+    assert memory_instance.llm.cache_stats()["hits"] == 1
+
+
+@pytest.fixture
+def hybrid_memory(tmp_path):
+    with (
+        patch("mem0.utils.factory.EmbedderFactory") as mock_embedder,
+        patch("mem0.memory.main.VectorStoreFactory") as mock_vector_store,
+        patch("mem0.utils.factory.LlmFactory") as mock_llm,
+        patch("mem0.memory.telemetry.capture_event"),
+    ):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        mock_llm.create.return_value = Mock()
+        config = MemoryConfig(history_db_path=str(tmp_path / "history.db"), enable_hybrid_search=True)
+        memory = Memory(config)
+    memory.embedding_model = Mock()
+    memory.embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+    return memory
+
+
+def test_hybrid_search_fuses_vector_and_lexical_hits(hybrid_memory):
+    stored = {
+        "v1": Mock(id="v1", score=0.9, payload={"data": "Enjoys hiking in the alps", "user_id": "alice"}),
+        # Records loaded by ID have no score attribute
+        "l1": SimpleNamespace(id="l1", payload={"data": "Order number ZX-4471 shipped", "user_id": "alice"}),
+        "b1": SimpleNamespace(id="b1", payload={"data": "Order number ZX-4471 is bob's", "user_id": "bob"}),
+    }
+    for memory_id, mem in stored.items():
+        hybrid_memory.lexical_index.upsert(memory_id, mem.payload["data"], mem.payload)
+    hybrid_memory.vector_store.search.return_value = [stored["v1"]]
+    hybrid_memory.vector_store.batch_get.side_effect = lambda vector_ids: [stored.get(i) for i in vector_ids]
+    hybrid_memory.vector_store.get.reset_mock()
+
+    results = hybrid_memory.search("ZX-4471 order", user_id="alice", limit=5)["results"]
+
+    assert [item["id"] for item in results] == ["v1", "l1"]
+    assert results[0]["score"] == pytest.approx(1 / 61)
+    assert results[1]["memory"] == "Order number ZX-4471 shipped"
+    hybrid_memory.vector_store.batch_get.assert_called_once_with(["l1"])
+    hybrid_memory.vector_store.get.assert_not_called()
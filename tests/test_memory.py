@@ -141,6 +141,57 @@ def test_search_handles_incomplete_payloads(mock_sqlite, mock_llm_factory, mock_
     assert memories_by_id["mem_2"]["memory"] == "content"
 
 
+@patch('mem0.utils.factory.EmbedderFactory.create')
+@patch('mem0.utils.factory.VectorStoreFactory.create')
+@patch('mem0.utils.factory.LlmFactory.create')
+@patch('mem0.memory.storage.SQLiteManager')
+def test_search_threshold_pushdown(mock_sqlite, mock_llm_factory, mock_vector_factory, mock_embedder_factory):
+    """Test that the score threshold is passed to stores that support it and still enforced locally."""
+    mock_embedder_factory.return_value = MagicMock()
+    mock_vector_store = MagicMock()
+    mock_vector_store.supports_score_threshold = True
+    mock_vector_factory.return_value = mock_vector_store
+    mock_llm_factory.return_value = MagicMock()
+    mock_sqlite.return_value = MagicMock()
+
+    from mem0.memory.main import Memory as MemoryClass
+    memory = MemoryClass(MemoryConfig())
+    memory.embedding_model = MagicMock()
+    memory.embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+
+    mock_vector_store.search.return_value = [
+        MockVectorMemory("mem_1", {"data": "kept", "hash": "abc123", "user_id": "test", "topic": "food"}, score=0.9),
+        MockVectorMemory("mem_2", {"data": "dropped", "hash": "def456"}, score=0.2),
+    ]
+
+    result = memory._search_vector_store("test", {"user_id": "test"}, 10, threshold=0.5)
+
+    mock_vector_store.search.assert_called_once_with(
+        query="test", vectors=[0.1, 0.2, 0.3], limit=10, filters={"user_id": "test"}, threshold=0.5
+    )
+    assert result == [
+        {
+            "id": "mem_1",
+            "memory": "kept",
+            "hash": "abc123",
+            "metadata": {"topic": "food"},
+            "score": 0.9,
+            "created_at": None,
+            "updated_at": None,
+            "user_id": "test",
+        }
+    ]
+
+    mock_vector_store.search.reset_mock()
+    mock_vector_store.supports_score_threshold = False
+    result = memory._search_vector_store("test", {"user_id": "test"}, 10, threshold=0.5)
+
+    mock_vector_store.search.assert_called_once_with(
+        query="test", vectors=[0.1, 0.2, 0.3], limit=10, filters={"user_id": "test"}
+    )
+    assert [mem["id"] for mem in result] == ["mem_1"]
+
+
 @patch('mem0.utils.factory.EmbedderFactory.create')
 @patch('mem0.utils.factory.VectorStoreFactory.create')
 @patch('mem0.utils.factory.LlmFactory.create')
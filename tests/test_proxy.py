@@ -1,8 +1,10 @@
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
 from mem0 import Memory, MemoryClient
+from mem0.proxy.add_queue import AddQueue
 from mem0.proxy.main import Chat, Completions, Mem0
 
 
@@ -70,6 +72,7 @@ def test_completions_create(mock_memory_client, mock_litellm):
 
     response = completions.create(model="gpt-4.1-nano-2025-04-14", messages=messages, user_id="test_user", temperature=0.7)
 
+    assert completions.flush(timeout=5)
     mock_memory_client.add.assert_called_once()
     mock_memory_client.search.assert_called_once()
 
@@ -98,3 +101,80 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
     assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+
+def _blocking_add():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def add(**kwargs):
+        calls.append(kwargs)
+        started.set()
+        release.wait(5)
+
+    return add, started, release, calls
+
+
+def test_add_queue_coalesces_turns_of_the_same_scope():
+    add, started, release, calls = _blocking_add()
+    add_queue = AddQueue(add, num_workers=1)
+
+    first = [{"role": "user", "content": "hi"}]
+    add_queue.submit(messages=[{"role": "user", "content": "warm up"}], user_id="other")
+    assert started.wait(5)
+    add_queue.submit(messages=first, user_id="alice")
+    second = first + [{"role": "assistant", "content": "hello"}, {"role": "user", "content": "I like tea"}]
+    add_queue.submit(messages=second, user_id="alice")
+    add_queue.submit(messages=[{"role": "user", "content": "bye"}], user_id="alice")
+    release.set()
+
+    assert add_queue.flush(timeout=5)
+    assert [call["user_id"] for call in calls] == ["other", "alice"]
+    assert calls[1]["messages"] == second + [{"role": "user", "content": "bye"}]
+    stats = add_queue.stats()
+    assert stats["adds"] == 2
+    assert stats["coalesced"] == 2
+    assert stats["queue_depth"] == 0
+    add_queue.close()
+
+
+def test_add_queue_drop_policies():
+    for policy, kept in (("drop_newest", "first"), ("drop_oldest", "third")):
+        add, started, release, calls = _blocking_add()
+        add_queue = AddQueue(add, max_queue_size=1, num_workers=1, overflow_policy=policy)
+        add_queue.submit(messages=[], user_id="busy")
+        assert started.wait(5)
+
+        assert add_queue.submit(messages=[], user_id="first")
+        assert add_queue.submit(messages=[], user_id="third") is (policy == "drop_oldest")
+        release.set()
+
+        assert add_queue.flush(timeout=5)
+        assert [call["user_id"] for call in calls] == ["busy", kept]
+        assert add_queue.stats()["dropped"] == 1
+        add_queue.close()
+
+
+def test_add_queue_block_policy_times_out():
+    add, started, release, calls = _blocking_add()
+    add_queue = AddQueue(add, max_queue_size=1, num_workers=1, overflow_policy="block", block_timeout=0.05)
+    add_queue.submit(messages=[], user_id="busy")
+    assert started.wait(5)
+    add_queue.submit(messages=[], user_id="queued")
+
+    assert add_queue.submit(messages=[], user_id="late") is False
+    release.set()
+    assert add_queue.flush(timeout=5)
+    assert add_queue.stats()["dropped"] == 1
+    add_queue.close()
+
+
+def test_add_queue_counts_failures():
+    add_queue = AddQueue(Mock(side_effect=RuntimeError("boom")))
+    add_queue.submit(messages=[], user_id="alice")
+
+    assert add_queue.flush(timeout=5)
+    assert add_queue.stats()["failed"] == 1
+    add_queue.close()
+    with pytest.raises(RuntimeError):
+        add_queue.submit(messages=[], user_id="alice")
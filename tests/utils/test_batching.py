@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from mem0.utils.batching import MicroBatcher
+
+
+def test_concurrent_submits_share_a_batch():
+    batch_sizes = []
+
+    def process(items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=200)
+    start = threading.Barrier(4)
+    results = {}
+
+    def worker(idx):
+        start.wait()
+        results[idx] = batcher.submit([idx, idx + 10])
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert results == {idx: [idx * 2, (idx + 10) * 2] for idx in range(4)}
+    assert sum(batch_sizes) == 8
+    assert len(batch_sizes) < 4
+
+
+def test_errors_are_raised_in_every_caller():
+    def process(items):
+        raise RuntimeError("model crashed")
+
+    batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        batcher.submit(["a"])
+    batcher.close()
+
+
+def test_submit_after_close_raises():
+    batcher = MicroBatcher(lambda items: items, max_wait_ms=1)
+    assert batcher.submit(["a"]) == ["a"]
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(["b"])
+
+
+def test_stats_report_batches_and_queue_wait():
+    batcher = MicroBatcher(lambda items: items, max_batch_size=2, max_wait_ms=1)
+    batcher.submit(["a", "b"])
+    batcher.submit(["c"])
+    stats = batcher.stats()
+    batcher.close()
+
+    assert stats["batches"] == 2
+    assert stats["requests"] == 2
+    assert stats["items"] == 3
+    assert stats["avg_batch_size"] == 1.5
+    assert stats["avg_queue_wait_ms"] >= 0.0
+    assert stats["max_queue_wait_ms"] >= stats["avg_queue_wait_ms"]
+
+    batcher.reset_stats()
+    assert batcher.stats()["batches"] == 0
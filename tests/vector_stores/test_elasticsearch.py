@@ -212,6 +212,15 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_with_threshold(self):
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+
+        vectors = [[0.1] * 1536]
+        self.es_db.search(query="", vectors=vectors, limit=5, threshold=0.75)
+
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["knn"]["similarity"], 0.5)
+
     def test_custom_search_query(self):
         # Mock custom search query
         self.es_db.custom_search_query = Mock()
@@ -56,14 +56,14 @@ def test_insert(faiss_instance, mock_faiss_index):
     ids = ["id1", "id2"]
 
     # Mock the numpy array conversion
-    with patch("numpy.array", return_value=np.array(vectors, dtype=np.float32)) as mock_np_array:
+    with patch("numpy.asarray", return_value=np.array(vectors, dtype=np.float32)) as mock_np_array:
         # Mock index.add
         mock_faiss_index.add.return_value = None
 
         # Call insert
         faiss_instance.insert(vectors=vectors, payloads=payloads, ids=ids)
 
-        # Verify numpy.array was called
+        # Verify numpy.asarray was called
         mock_np_array.assert_called_once_with(vectors, dtype=np.float32)
 
         # Verify index.add was called
@@ -289,3 +289,23 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+def test_insert_ndarray_is_passed_without_copy(faiss_instance, mock_faiss_index):
+    vectors = [np.array([0.1, 0.2, 0.3], dtype=np.float32)]
+    matrix = np.stack(vectors)
+
+    faiss_instance.insert(vectors=matrix, ids=["id1"])
+
+    added = mock_faiss_index.add.call_args[0][0]
+    assert added is matrix
+
+
+def test_normalize_L2_does_not_modify_caller_vectors(faiss_instance, mock_faiss_index):
+    faiss_instance.normalize_L2 = True
+    vector = np.array([3.0, 4.0, 0.0], dtype=np.float32)
+
+    faiss_instance.insert(vectors=[vector], ids=["id1"])
+
+    np.testing.assert_array_equal(vector, [3.0, 4.0, 0.0])
+    np.testing.assert_allclose(mock_faiss_index.add.call_args[0][0], [[0.6, 0.8, 0.0]], rtol=1e-6)
@@ -131,6 +131,24 @@ class TestMilvusDB:
         assert results[0].id == "mem1"
         assert results[0].score == 0.8
 
+    def test_search_with_threshold_uses_radius(self, milvus_db, mock_milvus_client):
+        """Test that a score threshold is pushed down as a range search radius."""
+        mock_milvus_client.search.return_value = [[]]
+
+        milvus_db.search("test", [0.1] * 1536, filters={"user_id": "alice"}, threshold=0.6)
+
+        call_args = mock_milvus_client.search.call_args
+        assert call_args[1]["search_params"] == {"params": {"radius": 0.6}}
+
+    def test_search_with_threshold_skips_radius_for_l2(self, milvus_db, mock_milvus_client):
+        """Test that L2 collections, where lower is better, do not get a radius."""
+        milvus_db.metric_type = MetricType.L2
+        mock_milvus_client.search.return_value = [[]]
+
+        milvus_db.search("test", [0.1] * 1536, threshold=0.6)
+
+        assert "search_params" not in mock_milvus_client.search.call_args[1]
+
     def test_search_different_user_ids(self, milvus_db, mock_milvus_client):
         """Test that search works with different user_ids (reproduces reported bug)."""
         # This test validates the fix for: "Error with different user_ids"
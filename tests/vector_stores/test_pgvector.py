@@ -2225,6 +2225,50 @@ class TestPGVector(unittest.TestCase):
             # Verify pool.closeall() was called
             mock_pool.closeall.assert_called()
 
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    def test_close_psycopg3(self, mock_connection_pool):
+        """Test that close() closes the psycopg3 connection pool."""
+        mock_connection_pool.return_value = self.mock_pool_psycopg
+        self.mock_cursor.fetchall.return_value = []
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+        )
+        pgvector.close()
+
+        self.mock_pool_psycopg.close.assert_called_once()
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 2)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    def test_close_psycopg2(self, mock_connection_pool):
+        """Test that close() closes all connections of the psycopg2 connection pool."""
+        mock_connection_pool.return_value = self.mock_pool_psycopg2
+        self.mock_cursor.fetchall.return_value = []
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+        )
+        pgvector.close()
+
+        self.mock_pool_psycopg2.closeall.assert_called_once()
+
     def tearDown(self):
         """Clean up after each test."""
         pass
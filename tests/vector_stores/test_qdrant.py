@@ -1,8 +1,8 @@
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     Filter,
@@ -70,6 +70,22 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(results[0].payload, {"key": "value"})
         self.assertEqual(results[0].score, 0.95)
 
+    def test_search_with_threshold(self):
+        vectors = [[0.1, 0.2]]
+        mock_point = MagicMock(id=str(uuid.uuid4()), score=0.95, payload={"key": "value"})
+        self.client_mock.query_points.return_value = MagicMock(points=[mock_point])
+
+        results = self.qdrant.search(query="", vectors=vectors, limit=1, threshold=0.7)
+
+        self.client_mock.query_points.assert_called_once_with(
+            collection_name="test_collection",
+            query=vectors,
+            query_filter=None,
+            limit=1,
+            score_threshold=0.7,
+        )
+        self.assertEqual(len(results), 1)
+
     def test_search_with_filters(self):
         """Test search with agent_id and run_id filters."""
         vectors = [[0.1, 0.2]]
@@ -219,6 +235,52 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(result["id"], vector_id)
         self.assertEqual(result["payload"], {"key": "value"})
 
+    def test_batch_search(self):
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=["a"]), MagicMock(points=["b", "c"])]
+
+        result = self.qdrant.batch_search(
+            ["q1", "q2"], [[0.1, 0.2], [0.3, 0.4]], limit=3, filters=[{"user_id": "alice"}, None]
+        )
+
+        self.assertEqual(result, [["a"], ["b", "c"]])
+        requests = self.client_mock.query_batch_points.call_args.kwargs["requests"]
+        self.assertEqual([request.query for request in requests], [[0.1, 0.2], [0.3, 0.4]])
+        self.assertEqual(requests[0].filter.must[0].key, "user_id")
+        self.assertIsNone(requests[1].filter)
+        self.assertTrue(all(request.limit == 3 and request.with_payload for request in requests))
+
+    def test_batch_get(self):
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        self.client_mock.retrieve.return_value = [MagicMock(id=ids[2]), MagicMock(id=ids[0])]
+
+        result = self.qdrant.batch_get(ids)
+
+        self.client_mock.retrieve.assert_called_once_with(collection_name="test_collection", ids=ids, with_payload=True)
+        self.assertEqual([point.id if point else None for point in result], [ids[0], None, ids[2]])
+
+    def test_batch_update(self):
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        vectors = [[0.1, 0.2], None, [0.3, 0.4]]
+        payloads = [{"data": "a"}, {"data": "b"}, {"data": "c"}]
+
+        self.qdrant.batch_update(ids, vectors=vectors, payloads=payloads)
+
+        self.client_mock.batch_update_points.assert_called_once()
+        operations = self.client_mock.batch_update_points.call_args.kwargs["update_operations"]
+        self.assertEqual(len(operations), 2)
+        self.assertEqual([point.id for point in operations[0].upsert.points], [ids[0], ids[2]])
+        self.assertEqual(operations[1].overwrite_payload.points, [ids[1]])
+        self.assertEqual(operations[1].overwrite_payload.payload, {"data": "b"})
+        self.client_mock.upsert.assert_not_called()
+
+    def test_batch_delete(self):
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        self.qdrant.batch_delete(ids)
+
+        self.client_mock.delete.assert_called_once_with(
+            collection_name="test_collection", points_selector=PointIdsList(points=ids)
+        )
+
     def test_list_cols(self):
         self.client_mock.get_collections.return_value = MagicMock(collections=[{"name": "test_collection"}])
         result = self.qdrant.list_cols()
@@ -298,3 +360,73 @@ class TestQdrant(unittest.TestCase):
 
     def tearDown(self):
         del self.qdrant
+
+
+class TestQdrantAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client_mock = MagicMock(spec=QdrantClient)
+        self.async_client_mock = AsyncMock(spec=AsyncQdrantClient)
+        self.qdrant = Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            async_client=self.async_client_mock,
+        )
+
+    def test_native_async_requires_async_client(self):
+        self.assertTrue(self.qdrant.native_async)
+        local = Qdrant(collection_name="test_collection", embedding_model_dims=128, client=self.client_mock)
+        self.assertFalse(local.native_async)
+
+    def test_async_client_is_created_on_first_use(self):
+        with (
+            patch("mem0.vector_stores.qdrant.QdrantClient", return_value=self.client_mock),
+            patch("mem0.vector_stores.qdrant.AsyncQdrantClient") as async_client_class,
+        ):
+            remote = Qdrant(collection_name="test_collection", embedding_model_dims=128, url="http://qdrant:6333")
+            self.assertTrue(remote.native_async)
+            async_client_class.assert_not_called()
+
+            self.assertIs(remote.async_client, async_client_class.return_value)
+            self.assertIs(remote.async_client, async_client_class.return_value)
+            async_client_class.assert_called_once_with(url="http://qdrant:6333")
+
+    async def test_aclose_closes_the_async_client(self):
+        await self.qdrant.aclose()
+
+        self.async_client_mock.close.assert_awaited_once()
+
+    async def test_asearch(self):
+        mock_point = MagicMock(id=str(uuid.uuid4()), score=0.95, payload={"user_id": "alice"})
+        self.async_client_mock.query_points.return_value = MagicMock(points=[mock_point])
+
+        results = await self.qdrant.asearch(
+            query="", vectors=[0.1, 0.2], limit=1, filters={"user_id": "alice"}, threshold=0.5
+        )
+
+        call_args = self.async_client_mock.query_points.await_args[1]
+        self.assertEqual(call_args["score_threshold"], 0.5)
+        self.assertIsInstance(call_args["query_filter"], Filter)
+        self.assertEqual(results, [mock_point])
+        self.client_mock.query_points.assert_not_called()
+
+    async def test_ainsert_aupdate_adelete(self):
+        vector_id = str(uuid.uuid4())
+
+        await self.qdrant.ainsert(vectors=[[0.1, 0.2]], payloads=[{"key": "value"}], ids=[vector_id])
+        await self.qdrant.aupdate(vector_id=vector_id, vector=[0.3, 0.4], payload={"key": "new"})
+        await self.qdrant.adelete(vector_id=vector_id)
+
+        self.assertEqual(self.async_client_mock.upsert.await_count, 2)
+        self.assertEqual(self.async_client_mock.upsert.await_args[1]["points"][0].payload, {"key": "new"})
+        self.async_client_mock.delete.assert_awaited_once_with(
+            collection_name="test_collection", points_selector=PointIdsList(points=[vector_id])
+        )
+
+    async def test_aget_and_alist(self):
+        mock_point = MagicMock(id=str(uuid.uuid4()), payload={"key": "value"})
+        self.async_client_mock.retrieve.return_value = [mock_point]
+        self.async_client_mock.scroll.return_value = ([mock_point], None)
+
+        self.assertEqual(await self.qdrant.aget(vector_id=mock_point.id), mock_point)
+        self.assertEqual(await self.qdrant.alist(limit=10), ([mock_point], None))